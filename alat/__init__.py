@@ -0,0 +1,6 @@
+"""
+Paket alat bantu pengembangan.
+
+Berisi generator korpus sintetis, server LLM tiruan,
+dan alat pengukuran kinerja yang tidak dipakai saat produksi.
+"""
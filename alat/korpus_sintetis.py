@@ -0,0 +1,186 @@
+"""
+Modul generator korpus proposal sintetis.
+
+Membuat berkas PDF dan DOCX dengan jumlah halaman tertentu
+tanpa dependensi tambahan, untuk tolok ukur dan uji beban.
+"""
+
+import random
+import zipfile
+from pathlib import Path
+from typing import Union
+from xml.sax.saxutils import escape
+
+KOSAKATA: list[str] = [
+    "penelitian", "metode", "data", "analisis", "mahasiswa", "sistem",
+    "pengembangan", "pembelajaran", "teknologi", "informasi", "hasil",
+    "evaluasi", "model", "proses", "kualitas", "masyarakat", "inovasi",
+    "program", "kegiatan", "luaran", "tujuan", "masalah", "solusi",
+    "implementasi", "pengujian", "aplikasi", "digital", "pendidikan",
+]
+
+JUDUL_BAGIAN: list[str] = [
+    "BAB I PENDAHULUAN",
+    "1.1 Latar Belakang",
+    "1.2 Rumusan Masalah",
+    "1.3 Tujuan",
+    "BAB II TINJAUAN PUSTAKA",
+    "BAB III METODE PENELITIAN",
+    "BAB IV LUARAN YANG DIHARAPKAN",
+]
+
+BARIS_PER_HALAMAN = 40
+
+
+def buat_paragraf(acak: random.Random, jumlah_kata: int = 14) -> str:
+    """
+    Membuat satu baris kalimat acak yang deterministik.
+
+    Parameter:
+        acak: Generator acak (gunakan seed tetap)
+        jumlah_kata: Jumlah kata dalam kalimat
+
+    Mengembalikan:
+        String kalimat
+    """
+    kata = [acak.choice(KOSAKATA) for _ in range(jumlah_kata)]
+    return " ".join(kata).capitalize() + "."
+
+
+def buat_halaman(jumlah_halaman: int, seed: int = 42) -> list[list[str]]:
+    """
+    Membuat isi halaman proposal berupa daftar baris per halaman.
+
+    Setiap halaman memiliki header dan nomor halaman berulang
+    seperti proposal asli.
+
+    Parameter:
+        jumlah_halaman: Jumlah halaman
+        seed: Seed generator acak
+
+    Mengembalikan:
+        List halaman, masing-masing berupa list baris
+    """
+    acak = random.Random(seed)
+    halaman: list[list[str]] = []
+    for nomor in range(1, jumlah_halaman + 1):
+        baris = ["Universitas Negeri Padang - Proposal PKM"]
+        if (nomor - 1) % max(jumlah_halaman // len(JUDUL_BAGIAN), 1) == 0:
+            indeks = min((nomor - 1) // max(jumlah_halaman // len(JUDUL_BAGIAN), 1), len(JUDUL_BAGIAN) - 1)
+            baris.append(JUDUL_BAGIAN[indeks])
+        while len(baris) < BARIS_PER_HALAMAN - 1:
+            baris.append(buat_paragraf(acak))
+        baris.append(str(nomor))
+        halaman.append(baris)
+    return halaman
+
+
+def _escape_pdf(teks: str) -> str:
+    """Meng-escape karakter khusus string literal PDF."""
+    return teks.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def buat_pdf(jalur: Union[str, Path], jumlah_halaman: int, seed: int = 42) -> Path:
+    """
+    Menulis berkas PDF teks sederhana (font Helvetica standar).
+
+    Parameter:
+        jalur: Path berkas tujuan
+        jumlah_halaman: Jumlah halaman
+        seed: Seed generator acak
+
+    Mengembalikan:
+        Path berkas yang dibuat
+    """
+    jalur = Path(jalur)
+    halaman = buat_halaman(jumlah_halaman, seed)
+
+    # Objek 1: catalog, 2: pages, 3: font, lalu pasangan (page, content)
+    objek: list[bytes] = []
+    id_halaman = [4 + 2 * i for i in range(jumlah_halaman)]
+    kids = " ".join(f"{i} 0 R" for i in id_halaman)
+    objek.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objek.append(f"<< /Type /Pages /Kids [{kids}] /Count {jumlah_halaman} >>".encode())
+    objek.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for i, baris_halaman in enumerate(halaman):
+        isi = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+        for baris in baris_halaman:
+            isi.append(f"({_escape_pdf(baris)}) Tj T*")
+        isi.append("ET")
+        aliran = "\n".join(isi).encode("latin-1")
+        objek.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {id_halaman[i] + 1} 0 R >>".encode()
+        )
+        objek.append(
+            f"<< /Length {len(aliran)} >>\nstream\n".encode() + aliran + b"\nendstream"
+        )
+
+    keluaran = bytearray(b"%PDF-1.4\n")
+    offset: list[int] = []
+    for nomor, isi_objek in enumerate(objek, start=1):
+        offset.append(len(keluaran))
+        keluaran += f"{nomor} 0 obj\n".encode() + isi_objek + b"\nendobj\n"
+
+    posisi_xref = len(keluaran)
+    keluaran += f"xref\n0 {len(objek) + 1}\n0000000000 65535 f \n".encode()
+    for nilai in offset:
+        keluaran += f"{nilai:010d} 00000 n \n".encode()
+    keluaran += (
+        f"trailer\n<< /Size {len(objek) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{posisi_xref}\n%%EOF\n"
+    ).encode()
+
+    jalur.write_bytes(bytes(keluaran))
+    return jalur
+
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+
+def buat_docx(jalur: Union[str, Path], jumlah_halaman: int, seed: int = 42) -> Path:
+    """
+    Menulis berkas DOCX minimal dengan judul bagian dan pemisah halaman.
+
+    Parameter:
+        jalur: Path berkas tujuan
+        jumlah_halaman: Perkiraan jumlah halaman
+        seed: Seed generator acak
+
+    Mengembalikan:
+        Path berkas yang dibuat
+    """
+    jalur = Path(jalur)
+    paragraf: list[str] = []
+    for baris_halaman in buat_halaman(jumlah_halaman, seed):
+        # Header dan nomor halaman berada di header/footer pada DOCX asli
+        for baris in baris_halaman[1:-1]:
+            gaya = ""
+            if baris in JUDUL_BAGIAN:
+                level = 1 if baris.startswith("BAB") else 2
+                gaya = f'<w:pPr><w:pStyle w:val="Heading{level}"/></w:pPr>'
+            paragraf.append(f"<w:p>{gaya}<w:r><w:t>{escape(baris)}</w:t></w:r></w:p>")
+        paragraf.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+
+    dokumen = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        "<w:body>" + "".join(paragraf) + "</w:body></w:document>"
+    )
+
+    with zipfile.ZipFile(jalur, "w", zipfile.ZIP_DEFLATED) as arsip:
+        arsip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        arsip.writestr("_rels/.rels", _RELS)
+        arsip.writestr("word/document.xml", dokumen)
+    return jalur
@@ -0,0 +1,365 @@
+"""
+Modul server LLM tiruan (mock) yang kompatibel dengan OpenAI.
+
+Meniru endpoint chat completions Groq dengan distribusi latensi,
+injeksi galat (500) dan pembatasan laju (429), serta mode streaming
+(server-sent events), sehingga tolok ukur dan uji beban tidak
+memanggil API asli.
+
+Penggunaan:
+    python -m alat.server_llm_tiruan --port 9000 --latensi lognormal:0.8,0.4 \\
+        --laju-galat 0.01 --laju-429 0.05
+"""
+
+import argparse
+import json
+import logging
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, Union
+
+pencatat = logging.getLogger(__name__)
+
+HASIL_CONTOH: dict[str, Any] = {
+    "skor": 78,
+    "detail_skor": {
+        "latar_belakang": 16,
+        "formulasi_masalah": 15,
+        "tujuan": 17,
+        "metodologi": 14,
+        "luaran": 16
+    },
+    "daftar_kekuatan": [
+        "Latar belakang didukung data yang relevan",
+        "Tujuan penelitian terukur"
+    ],
+    "daftar_kelemahan": [
+        "Metodologi belum menjelaskan teknik sampling",
+        "Luaran belum dikaitkan dengan indikator capaian"
+    ],
+    "daftar_saran": [
+        "Tambahkan rincian instrumen penelitian",
+        "Sertakan jadwal pelaksanaan yang lebih rinci"
+    ],
+    "ringkasan": "Proposal cukup baik, perlu penguatan metodologi."
+}
+
+UKURAN_POTONGAN_STREAM = 24
+
+
+class DistribusiLatensi:
+    """
+    Distribusi latensi buatan untuk server tiruan.
+
+    Format spesifikasi:
+        "0.5" atau "tetap:0.5"        - latensi tetap (detik)
+        "seragam:0.2,1.0"             - seragam antara min dan maks
+        "lognormal:0.8,0.4"           - median dan sigma log-normal
+        "eksponensial:0.5"            - rata-rata eksponensial
+    """
+
+    JENIS_DIDUKUNG: set[str] = {"tetap", "seragam", "lognormal", "eksponensial"}
+
+    def __init__(self, spesifikasi: Union[str, float] = 0.0, seed: Optional[int] = None):
+        """
+        Inisialisasi distribusi latensi.
+
+        Parameter:
+            spesifikasi: String spesifikasi atau angka latensi tetap
+            seed: Seed generator acak (opsional)
+
+        Pengecualian:
+            ValueError: Jika spesifikasi tidak dikenali
+        """
+        teks = str(spesifikasi).strip()
+        jenis, _, parameter = teks.partition(":") if ":" in teks else ("tetap", "", teks)
+        if jenis not in self.JENIS_DIDUKUNG:
+            raise ValueError(f"Distribusi latensi tidak dikenali: {jenis}")
+
+        self.jenis = jenis
+        self.parameter = [float(p) for p in parameter.split(",") if p.strip()]
+        self._acak = random.Random(seed)
+        self._kunci = threading.Lock()
+
+    def sampel(self) -> float:
+        """
+        Mengambil satu sampel latensi.
+
+        Mengembalikan:
+            Latensi dalam detik (tidak pernah negatif)
+        """
+        with self._kunci:
+            if self.jenis == "seragam":
+                nilai = self._acak.uniform(self.parameter[0], self.parameter[1])
+            elif self.jenis == "lognormal":
+                nilai = self._acak.lognormvariate(math.log(self.parameter[0]), self.parameter[1])
+            elif self.jenis == "eksponensial":
+                nilai = self._acak.expovariate(1 / self.parameter[0]) if self.parameter[0] > 0 else 0.0
+            else:
+                nilai = self.parameter[0] if self.parameter else 0.0
+        return max(nilai, 0.0)
+
+
+class _ServerHTTP(ThreadingHTTPServer):
+    """ThreadingHTTPServer dengan backlog besar agar lonjakan koneksi tidak ditolak."""
+
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class ServerLLMTiruan:
+    """
+    Server HTTP tiruan untuk endpoint chat completions.
+
+    Berjalan di thread latar belakang; setiap permintaan dilayani
+    oleh thread terpisah sehingga latensi buatan tidak saling memblokir.
+    """
+
+    def __init__(
+        self,
+        latensi_detik: Union[str, float] = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        laju_galat: float = 0.0,
+        laju_429: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Inisialisasi server tiruan.
+
+        Parameter:
+            latensi_detik: Latensi tetap (detik) atau spesifikasi DistribusiLatensi
+            host: Alamat bind
+            port: Port bind (0 = pilih port bebas otomatis)
+            laju_galat: Proporsi permintaan yang dijawab 500 (0-1)
+            laju_429: Proporsi permintaan yang dijawab 429 (0-1)
+            seed: Seed generator acak untuk hasil yang dapat diulang
+        """
+        self.latensi = DistribusiLatensi(latensi_detik, seed)
+        self.laju_galat = laju_galat
+        self.laju_429 = laju_429
+        self.jumlah_permintaan = 0
+        self.jumlah_per_status: dict[int, int] = {}
+        self._acak = random.Random(seed)
+        self._kunci = threading.Lock()
+        self._server = _ServerHTTP((host, port), self._buat_penangan())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL endpoint chat completions milik server ini."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/openai/v1/chat/completions"
+
+    def _tentukan_status(self) -> int:
+        """Menentukan status respons berikutnya sesuai laju injeksi."""
+        with self._kunci:
+            self.jumlah_permintaan += 1
+            undian = self._acak.random()
+        if undian < self.laju_429:
+            return 429
+        if undian < self.laju_429 + self.laju_galat:
+            return 500
+        return 200
+
+    def _catat_status(self, status: int) -> None:
+        """Mencatat jumlah respons per status."""
+        with self._kunci:
+            self.jumlah_per_status[status] = self.jumlah_per_status.get(status, 0) + 1
+
+    def _buat_penangan(self) -> type[BaseHTTPRequestHandler]:
+        """Membuat kelas penangan HTTP yang terikat ke server ini."""
+        server_tiruan = self
+
+        class Penangan(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pencatat.debug(format, *args)
+
+            def _kirim_json(
+                self,
+                status: int,
+                data: dict[str, Any],
+                header_tambahan: Optional[dict[str, str]] = None
+            ) -> None:
+                badan = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(badan)))
+                for kunci, nilai in (header_tambahan or {}).items():
+                    self.send_header(kunci, nilai)
+                self.end_headers()
+                self.wfile.write(badan)
+                server_tiruan._catat_status(status)
+
+            def _kirim_stream(self, respons: dict[str, Any], jeda: float) -> None:
+                konten = respons["choices"][0]["message"]["content"]
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                potongan = [
+                    konten[i:i + UKURAN_POTONGAN_STREAM]
+                    for i in range(0, len(konten), UKURAN_POTONGAN_STREAM)
+                ]
+                for indeks, bagian in enumerate(potongan):
+                    data = {
+                        "id": respons["id"],
+                        "object": "chat.completion.chunk",
+                        "model": respons["model"],
+                        "choices": [{
+                            "index": 0,
+                            "delta": {"content": bagian},
+                            "finish_reason": "stop" if indeks == len(potongan) - 1 else None
+                        }]
+                    }
+                    if indeks == len(potongan) - 1:
+                        data["x_groq"] = {"usage": respons["usage"]}
+                    self.wfile.write(f"data: {json.dumps(data)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                    if jeda > 0:
+                        time.sleep(jeda)
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                server_tiruan._catat_status(200)
+
+            def do_GET(self) -> None:
+                if self.path.endswith("/models"):
+                    self._kirim_json(200, {"object": "list", "data": []})
+                else:
+                    self._kirim_json(404, {"error": {"message": "tidak ditemukan"}})
+
+            def do_POST(self) -> None:
+                panjang = int(self.headers.get("Content-Length") or 0)
+                permintaan = json.loads(self.rfile.read(panjang) or b"{}")
+                if not self.path.endswith("/chat/completions"):
+                    self._kirim_json(404, {"error": {"message": "tidak ditemukan"}})
+                    return
+
+                status = server_tiruan._tentukan_status()
+                if status == 429:
+                    self._kirim_json(
+                        429,
+                        {"error": {"message": "Rate limit tercapai", "type": "tokens", "code": "rate_limit_exceeded"}},
+                        {"Retry-After": "1"}
+                    )
+                    return
+
+                waktu_mulai = time.perf_counter()
+                latensi = server_tiruan.latensi.sampel()
+                stream = bool(permintaan.get("stream"))
+                if not stream and latensi > 0:
+                    time.sleep(latensi)
+
+                if status == 500:
+                    self._kirim_json(500, {"error": {"message": "Galat internal tiruan", "type": "server_error"}})
+                    return
+
+                respons = server_tiruan.buat_respons(
+                    permintaan,
+                    durasi=time.perf_counter() - waktu_mulai
+                )
+                if stream:
+                    jumlah_potongan = max(len(respons["choices"][0]["message"]["content"]) // UKURAN_POTONGAN_STREAM, 1)
+                    self._kirim_stream(respons, jeda=latensi / jumlah_potongan)
+                else:
+                    self._kirim_json(200, respons)
+
+        return Penangan
+
+    def buat_respons(self, permintaan: dict[str, Any], durasi: float) -> dict[str, Any]:
+        """
+        Membuat badan respons chat completions.
+
+        Parameter:
+            permintaan: Badan permintaan yang diterima
+            durasi: Lama pemrosesan buatan dalam detik
+
+        Mengembalikan:
+            Dictionary respons berformat OpenAI
+        """
+        konten = json.dumps(HASIL_CONTOH, ensure_ascii=False)
+        panjang_prompt = sum(len(p.get("content", "")) for p in permintaan.get("messages", []))
+        token_prompt = panjang_prompt // 4
+        token_penyelesaian = len(konten) // 4
+        return {
+            "id": f"chatcmpl-tiruan-{self.jumlah_permintaan}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": permintaan.get("model", "model-tiruan"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": konten},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": token_prompt,
+                "completion_tokens": token_penyelesaian,
+                "total_tokens": token_prompt + token_penyelesaian,
+                "queue_time": 0.0,
+                "total_time": round(durasi, 4)
+            }
+        }
+
+    def mulai(self) -> "ServerLLMTiruan":
+        """Menjalankan server di thread latar belakang."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        pencatat.info(f"Server LLM tiruan berjalan di {self.url}")
+        return self
+
+    def hentikan(self) -> None:
+        """Menghentikan server dan menutup socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "ServerLLMTiruan":
+        return self.mulai()
+
+    def __exit__(self, *args: Any) -> None:
+        self.hentikan()
+
+
+def utama() -> None:
+    """Menjalankan server tiruan dari command line."""
+    parser = argparse.ArgumentParser(description="Server LLM tiruan kompatibel OpenAI")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument(
+        "--latensi",
+        default="0",
+        help="Latensi per respons: detik, atau tetap:/seragam:/lognormal:/eksponensial:"
+    )
+    parser.add_argument("--laju-galat", type=float, default=0.0, help="Proporsi respons 500 (0-1)")
+    parser.add_argument("--laju-429", type=float, default=0.0, help="Proporsi respons 429 (0-1)")
+    parser.add_argument("--seed", type=int, default=None)
+    argumen = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    server = ServerLLMTiruan(
+        latensi_detik=argumen.latensi,
+        host=argumen.host,
+        port=argumen.port,
+        laju_galat=argumen.laju_galat,
+        laju_429=argumen.laju_429,
+        seed=argumen.seed
+    ).mulai()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pencatat.info(f"Ringkasan status: {server.jumlah_per_status}")
+        server.hentikan()
+
+
+if __name__ == "__main__":
+    utama()
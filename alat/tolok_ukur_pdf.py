@@ -0,0 +1,59 @@
+"""
+Modul tolok ukur mesin ekstraksi PDF.
+
+Melaporkan laju (halaman/detik) setiap mesin PDF yang terpasang
+pada korpus sintetis atau berkas milik sendiri.
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from alat.korpus_sintetis import buat_pdf
+from app.layanan.mesin_pdf import DAFTAR_MESIN, ukur_mesin
+
+
+def cetak_laporan(laporan: dict[str, dict[str, Any]]) -> None:
+    """Mencetak laporan laju mesin dalam bentuk tabel teks."""
+    print(f"{'mesin':<12}{'halaman':>9}{'detik':>9}{'hal/detik':>11}{'gagal':>7}")
+    for nama, data in sorted(laporan.items(), key=lambda item: -item[1]["halaman_per_detik"]):
+        print(
+            f"{nama:<12}{data['halaman']:>9}{data['detik']:>9}"
+            f"{data['halaman_per_detik']:>11}{data['gagal']:>7}"
+        )
+    tidak_terpasang = [nama for nama in DAFTAR_MESIN if nama not in laporan]
+    if tidak_terpasang:
+        print(f"tidak terpasang: {', '.join(tidak_terpasang)}")
+
+
+def utama() -> None:
+    """Menjalankan tolok ukur mesin PDF dari command line."""
+    parser = argparse.ArgumentParser(description="Tolok ukur mesin ekstraksi PDF")
+    parser.add_argument("--berkas", type=Path, nargs="*", default=None, help="Berkas PDF korpus")
+    parser.add_argument(
+        "--halaman",
+        type=int,
+        nargs="*",
+        default=[5, 50, 200],
+        help="Jumlah halaman PDF sintetis (bila --berkas kosong)"
+    )
+    parser.add_argument("--ulangan", type=int, default=3)
+    parser.add_argument("--keluaran-json", type=Path, default=None, help="Simpan laporan ke berkas JSON")
+    argumen = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as direktori:
+        daftar_berkas = argumen.berkas or [
+            buat_pdf(Path(direktori) / f"proposal_{halaman}.pdf", halaman)
+            for halaman in argumen.halaman
+        ]
+        laporan = ukur_mesin(daftar_berkas, ulangan=argumen.ulangan)
+
+    cetak_laporan(laporan)
+    if argumen.keluaran_json:
+        argumen.keluaran_json.write_text(json.dumps(laporan, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    utama()
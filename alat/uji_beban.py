@@ -0,0 +1,251 @@
+"""
+Modul generator beban untuk /api/review dan /api/riwayat.
+
+Mengirim permintaan dengan laju tetap (open-loop, sehingga antrean
+di server tidak menurunkan laju yang ditawarkan) lalu melaporkan
+throughput, persentil latensi, dan laju galat per endpoint.
+
+Penggunaan (jalankan server LLM tiruan dan aplikasi terlebih dahulu):
+    python -m alat.server_llm_tiruan --port 9000 --latensi lognormal:2,0.5
+    GROQ_API_KEY=gsk_tiruan GROQ_API_ENDPOINT=http://127.0.0.1:9000/openai/v1/chat/completions \\
+        gunicorn app.utama:aplikasi -w 4 -k uvicorn.workers.UvicornWorker
+    python -m alat.uji_beban --url http://127.0.0.1:8000 --rps 5 --durasi 60 --porsi-review 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from alat.korpus_sintetis import buat_pdf
+
+PERSENTIL: list[float] = [0.50, 0.90, 0.95, 0.99]
+
+
+@dataclass
+class CatatanPermintaan:
+    """Catatan hasil satu permintaan uji beban."""
+
+    endpoint: str
+    status: Optional[int]
+    latensi_ms: float
+    galat: Optional[str] = None
+
+
+def hitung_persentil(nilai_urut: list[float], persentil: float) -> float:
+    """
+    Menghitung persentil dengan metode nearest-rank.
+
+    Parameter:
+        nilai_urut: Daftar nilai yang sudah diurutkan
+        persentil: Persentil dalam rentang 0-1
+
+    Mengembalikan:
+        Nilai persentil (0 jika daftar kosong)
+    """
+    if not nilai_urut:
+        return 0.0
+    posisi = max(math.ceil(persentil * len(nilai_urut)) - 1, 0)
+    return nilai_urut[posisi]
+
+
+def ringkas_hasil(catatan: list[CatatanPermintaan], durasi_detik: float) -> dict[str, Any]:
+    """
+    Meringkas catatan permintaan per endpoint.
+
+    Parameter:
+        catatan: Daftar catatan permintaan
+        durasi_detik: Lama uji beban sebenarnya
+
+    Mengembalikan:
+        Dictionary ringkasan per endpoint
+    """
+    ringkasan: dict[str, Any] = {}
+    for endpoint in sorted({c.endpoint for c in catatan}):
+        milik = [c for c in catatan if c.endpoint == endpoint]
+        sukses = [c for c in milik if c.status is not None and c.status < 400]
+        latensi = sorted(c.latensi_ms for c in sukses)
+        per_status: dict[str, int] = {}
+        for c in milik:
+            kunci = str(c.status) if c.status is not None else (c.galat or "galat")
+            per_status[kunci] = per_status.get(kunci, 0) + 1
+
+        ringkasan[endpoint] = {
+            "jumlah": len(milik),
+            "sukses": len(sukses),
+            "laju_galat": round(1 - len(sukses) / len(milik), 4) if milik else 0.0,
+            "throughput_rps": round(len(sukses) / durasi_detik, 2) if durasi_detik else 0.0,
+            "latensi_ms": {
+                **{f"p{int(p * 100)}": round(hitung_persentil(latensi, p), 1) for p in PERSENTIL},
+                "maks": round(latensi[-1], 1) if latensi else 0.0
+            },
+            "per_status": per_status
+        }
+    return ringkasan
+
+
+class GeneratorBeban:
+    """Generator beban open-loop dengan laju permintaan tetap."""
+
+    def __init__(
+        self,
+        url_dasar: str,
+        rps: float,
+        durasi_detik: float,
+        porsi_review: float,
+        berkas_unggahan: Path,
+        jenis_proposal: str = "pkm",
+        batas_waktu_detik: float = 120.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Inisialisasi generator beban.
+
+        Parameter:
+            url_dasar: URL dasar aplikasi, misal http://127.0.0.1:8000
+            rps: Laju permintaan yang ditawarkan (permintaan/detik)
+            durasi_detik: Lama pengiriman permintaan
+            porsi_review: Proporsi permintaan ke /api/review (sisanya /api/riwayat)
+            berkas_unggahan: Berkas PDF/DOCX yang diunggah
+            jenis_proposal: Jenis proposal untuk /api/review
+            batas_waktu_detik: Timeout per permintaan
+            seed: Seed pemilihan endpoint
+        """
+        self.url_dasar = url_dasar.rstrip("/")
+        self.rps = rps
+        self.durasi_detik = durasi_detik
+        self.porsi_review = porsi_review
+        self.konten_unggahan = berkas_unggahan.read_bytes()
+        self.nama_unggahan = berkas_unggahan.name
+        self.jenis_proposal = jenis_proposal
+        self.batas_waktu_detik = batas_waktu_detik
+        self._acak = random.Random(seed)
+        self.catatan: list[CatatanPermintaan] = []
+
+    async def _kirim(self, klien: httpx.AsyncClient, endpoint: str) -> None:
+        """Mengirim satu permintaan dan mencatat hasilnya."""
+        mulai = time.perf_counter()
+        try:
+            if endpoint == "/api/review":
+                respons = await klien.post(
+                    endpoint,
+                    files={"berkas": (self.nama_unggahan, self.konten_unggahan)},
+                    data={"jenis_proposal": self.jenis_proposal}
+                )
+            else:
+                respons = await klien.get(endpoint, params={"limit": 50, "offset": 0})
+            status, galat = respons.status_code, None
+        except httpx.TimeoutException:
+            status, galat = None, "timeout"
+        except httpx.HTTPError as e:
+            status, galat = None, type(e).__name__
+
+        self.catatan.append(CatatanPermintaan(
+            endpoint=endpoint,
+            status=status,
+            latensi_ms=(time.perf_counter() - mulai) * 1000,
+            galat=galat
+        ))
+
+    async def jalankan(self) -> dict[str, Any]:
+        """
+        Menjalankan uji beban hingga semua permintaan selesai.
+
+        Mengembalikan:
+            Ringkasan hasil per endpoint beserta konfigurasi uji
+        """
+        jumlah_total = int(self.rps * self.durasi_detik)
+        batas = httpx.Limits(max_connections=None, max_keepalive_connections=100)
+        async with httpx.AsyncClient(
+            base_url=self.url_dasar,
+            timeout=self.batas_waktu_detik,
+            limits=batas
+        ) as klien:
+            tugas: list[asyncio.Task] = []
+            mulai = time.perf_counter()
+            for i in range(jumlah_total):
+                jeda = mulai + i / self.rps - time.perf_counter()
+                if jeda > 0:
+                    await asyncio.sleep(jeda)
+                endpoint = "/api/review" if self._acak.random() < self.porsi_review else "/api/riwayat"
+                tugas.append(asyncio.create_task(self._kirim(klien, endpoint)))
+            await asyncio.gather(*tugas)
+            durasi = time.perf_counter() - mulai
+
+        return {
+            "konfigurasi": {
+                "url": self.url_dasar,
+                "rps_target": self.rps,
+                "durasi_detik": self.durasi_detik,
+                "porsi_review": self.porsi_review,
+                "jumlah_permintaan": jumlah_total
+            },
+            "durasi_aktual_detik": round(durasi, 2),
+            "endpoint": ringkas_hasil(self.catatan, durasi)
+        }
+
+
+def cetak_ringkasan(hasil: dict[str, Any]) -> None:
+    """Mencetak ringkasan uji beban dalam bentuk tabel teks."""
+    konfigurasi = hasil["konfigurasi"]
+    print("=" * 78)
+    print(
+        f"UJI BEBAN {konfigurasi['url']} | target {konfigurasi['rps_target']} rps "
+        f"selama {konfigurasi['durasi_detik']} s | aktual {hasil['durasi_aktual_detik']} s"
+    )
+    print("=" * 78)
+    print(f"{'endpoint':<14}{'n':>6}{'rps':>8}{'galat':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'maks':>9}")
+    for endpoint, data in hasil["endpoint"].items():
+        latensi = data["latensi_ms"]
+        print(
+            f"{endpoint:<14}{data['jumlah']:>6}{data['throughput_rps']:>8}"
+            f"{data['laju_galat']:>8.1%}{latensi['p50']:>9}{latensi['p95']:>9}"
+            f"{latensi['p99']:>9}{latensi['maks']:>9}"
+        )
+        print(f"{'':<14}status: {data['per_status']}")
+
+
+def utama() -> None:
+    """Menjalankan uji beban dari command line."""
+    parser = argparse.ArgumentParser(description="Generator beban AI Proposal Reviewer")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", type=float, default=2.0, help="Laju permintaan per detik")
+    parser.add_argument("--durasi", type=float, default=30.0, help="Lama pengiriman (detik)")
+    parser.add_argument("--porsi-review", type=float, default=0.3, help="Proporsi ke /api/review")
+    parser.add_argument("--halaman", type=int, default=10, help="Jumlah halaman PDF sintetis")
+    parser.add_argument("--berkas", type=Path, default=None, help="Berkas unggahan (default: PDF sintetis)")
+    parser.add_argument("--jenis", default="pkm", choices=["pkm", "skripsi", "hibah"])
+    parser.add_argument("--batas-waktu", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--keluaran-json", type=Path, default=None, help="Simpan ringkasan ke berkas JSON")
+    argumen = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as direktori:
+        berkas = argumen.berkas or buat_pdf(Path(direktori) / "proposal_beban.pdf", argumen.halaman)
+        generator = GeneratorBeban(
+            url_dasar=argumen.url,
+            rps=argumen.rps,
+            durasi_detik=argumen.durasi,
+            porsi_review=argumen.porsi_review,
+            berkas_unggahan=berkas,
+            jenis_proposal=argumen.jenis,
+            batas_waktu_detik=argumen.batas_waktu,
+            seed=argumen.seed
+        )
+        hasil = asyncio.run(generator.jalankan())
+
+    cetak_ringkasan(hasil)
+    if argumen.keluaran_json:
+        argumen.keluaran_json.write_text(json.dumps(hasil, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    utama()
@@ -5,5 +5,10 @@ Aplikasi ini menyediakan layanan untuk meninjau
 dan mengevaluasi proposal akademik menggunakan AI.
 """
 
+import time
+
+# Titik awal pengukuran waktu startup worker (lihat app.layanan.persiapan)
+WAKTU_MULAI_IMPOR = time.perf_counter()
+
 __version__ = "1.0.0"
 __nama_aplikasi__ = "AI Proposal Reviewer"
@@ -5,16 +5,42 @@ Implementasi Agent untuk meninjau dan mengevaluasi
 proposal akademik menggunakan Groq API (Llama 3.3).
 """
 
-import json
+import asyncio
 import logging
-from typing import Any
+import statistics
+import time
+from typing import Any, Optional
 
 import httpx
 
-from app.pengecualian import GagalMemproses
+from app.agen.keluaran_terstruktur import buat_format_respons, hitung_maks_token
+from app.agen.penyedia_llm import (
+    TINGKAT_BESAR,
+    TINGKAT_CEPAT,
+    PengarahPenyedia,
+    PenyediaLLM,
+)
+from app.agen.pengurai_respons import BATAS_SKOR_ASPEK, urai_hasil_evaluasi
+from app.layanan.memori import ukur_memori
+from app.layanan.pelacakan import pelacak
+from app.layanan.tenggat import KODE_TENGGAT_HABIS, Tenggat
+from app.pengecualian import GagalMemproses, TenggatHabis
+from app.skema.model import PenggunaanLLM
 
 pencatat = logging.getLogger(__name__)
 
+MODE_LENGKAP = "lengkap"
+MODE_CEPAT = "cepat"
+MODE_KONSISTEN = "konsisten"
+# Kode galat yang memicu eskalasi dari model cepat ke model besar
+KODE_GAGAL_FORMAT: set[str] = {"FORMAT_TIDAK_VALID", "FORMAT_ERROR"}
+# Selisih maksimal skor total terhadap jumlah detail skor
+TOLERANSI_SKOR = 5
+# Perkiraan waktu sebelum token pertama (antrean penyedia + prompt)
+LATENSI_AWAL_DETIK = 1.0
+# Di bawah ini JSON hasil hampir pasti terpotong, jadi panggilan tidak dimulai
+TOKEN_MINIMUM_TENGGAT = 300
+
 
 class AgenPeninjauProposal:
     """
@@ -56,15 +82,77 @@ Berikan output dalam format JSON valid (tanpa markdown code block):
     "ringkasan": "ringkasan evaluasi secara keseluruhan"
 }}
 
+Batasan keluaran: maksimal {maks_item} butir per daftar, setiap butir
+maksimal {maks_karakter_butir} karakter, ringkasan maksimal
+{maks_karakter_ringkasan} karakter. Jangan menambahkan teks di luar JSON.
+
 Proposal:
 {teks_proposal}
+"""
+
+    TEMPLAT_PROMPT_REVISI = """
+Anda adalah peninjau proposal akademik profesional.
+
+Proposal {jenis_proposal} berikut adalah revisi dari versi yang sudah
+pernah ditinjau. Hanya bagian yang berubah yang disertakan.
+
+Skor versi sebelumnya (0-20 per aspek):
+{skor_sebelumnya}
+
+Nilai ulang HANYA aspek berikut berdasarkan bagian yang berubah:
+{aspek_berubah}. Salin skor aspek lain apa adanya.
+
+Ringkasan review sebelumnya:
+{ringkasan_sebelumnya}
+
+Kelemahan yang ditemukan sebelumnya:
+{kelemahan_sebelumnya}
+
+Perbarui daftar kekuatan, kelemahan, dan saran untuk seluruh proposal:
+pertahankan temuan sebelumnya yang tidak terkait bagian yang berubah, dan
+sebutkan kelemahan lama yang sudah diperbaiki di ringkasan.
+
+Berikan output dalam format JSON valid (tanpa markdown code block):
+{{
+    "skor": <total_skor>,
+    "detail_skor": {{
+        "latar_belakang": <skor>,
+        "formulasi_masalah": <skor>,
+        "tujuan": <skor>,
+        "metodologi": <skor>,
+        "luaran": <skor>
+    }},
+    "daftar_kekuatan": ["kekuatan 1", "kekuatan 2", ...],
+    "daftar_kelemahan": ["kelemahan 1", "kelemahan 2", ...],
+    "daftar_saran": ["saran 1", "saran 2", ...],
+    "ringkasan": "ringkasan evaluasi secara keseluruhan"
+}}
+
+Batasan keluaran: maksimal {maks_item} butir per daftar, setiap butir
+maksimal {maks_karakter_butir} karakter, ringkasan maksimal
+{maks_karakter_ringkasan} karakter. Jangan menambahkan teks di luar JSON.
+
+Bagian yang berubah:
+{teks_bagian}
 """
 
     def __init__(
         self,
         api_key: str,
         api_endpoint: str = "https://api.groq.com/openai/v1/chat/completions",
-        model: str = "llama-3.3-70b-versatile"
+        model: str = "llama-3.3-70b-versatile",
+        mode_keluaran: str = "json_object",
+        maks_item_daftar: int = 5,
+        maks_karakter_butir: int = 160,
+        maks_karakter_ringkasan: int = 600,
+        maks_token_keluaran: Optional[int] = None,
+        model_cepat: Optional[str] = None,
+        ambang_karakter_cepat: int = 0,
+        pengarah: Optional[PengarahPenyedia] = None,
+        jumlah_sampel: int = 3,
+        toleransi_sampel: int = 2,
+        tenggat: Optional[Tenggat] = None,
+        laju_token_per_detik: float = 100.0
     ):
         """
         Inisialisasi agent peninjau proposal.
@@ -73,6 +161,24 @@ Proposal:
             api_key: API key untuk Groq
             api_endpoint: Endpoint API Groq
             model: Model yang digunakan (default: llama-3.3-70b-versatile)
+            mode_keluaran: Mode keluaran terstruktur
+                ("nonaktif", "json_object", atau "json_schema")
+            maks_item_daftar: Jumlah maksimal butir per daftar
+            maks_karakter_butir: Panjang maksimal setiap butir daftar
+            maks_karakter_ringkasan: Panjang maksimal ringkasan
+            maks_token_keluaran: Batas max_tokens (None = dihitung dari batas per field)
+            model_cepat: Model kecil untuk triase (None = selalu model besar)
+            ambang_karakter_cepat: Proposal sepanjang ini atau lebih pendek
+                dikirim ke model cepat lebih dulu (0 = nonaktif)
+            pengarah: Pengarah penyedia LLM bersama (None = satu penyedia
+                dari api_key, api_endpoint, model, dan model_cepat)
+            jumlah_sampel: Jumlah sampel paralel pada mode konsisten
+            toleransi_sampel: Selisih skor per aspek antar sampel yang
+                dianggap sepakat sehingga sampel lain dibatalkan
+            tenggat: Tenggat permintaan; max_tokens dan timeout setiap
+                panggilan dipangkas agar muat dalam sisa waktunya
+            laju_token_per_detik: Perkiraan laju keluaran model untuk
+                memangkas max_tokens
         
         Pengecualian:
             ValueError: Jika API key tidak valid
@@ -83,25 +189,55 @@ Proposal:
         if not api_key.startswith("gsk_"):
             pencatat.warning("API key tidak memiliki format Groq yang benar (seharusnya dimulai dengan 'gsk_')")
         
-        self._api_key = api_key
-        self._api_endpoint = api_endpoint
         self._model = model
-        pencatat.info(f"AgenPeninjauProposal diinisialisasi dengan model: {model}")
+        self._maks_item_daftar = maks_item_daftar
+        self._maks_karakter_butir = maks_karakter_butir
+        self._maks_karakter_ringkasan = maks_karakter_ringkasan
+        self._format_respons = buat_format_respons(
+            mode_keluaran,
+            maks_item_daftar,
+            maks_karakter_butir,
+            maks_karakter_ringkasan
+        )
+        self._maks_token = maks_token_keluaran or hitung_maks_token(
+            maks_item_daftar,
+            maks_karakter_butir,
+            maks_karakter_ringkasan
+        )
+        self._pengarah = pengarah or PengarahPenyedia([
+            PenyediaLLM("utama", api_endpoint, model, api_key=api_key, model_cepat=model_cepat)
+        ])
+        self._ambang_karakter_cepat = ambang_karakter_cepat
+        self._jumlah_sampel = max(1, jumlah_sampel)
+        self._toleransi_sampel = toleransi_sampel
+        self._tenggat = tenggat
+        self._laju_token_per_detik = laju_token_per_detik
+        self.penggunaan_terakhir: Optional[PenggunaanLLM] = None
+        pencatat.info("AgenPeninjauProposal diinisialisasi dengan model: %s", model)
 
     async def tinjau(
         self,
         teks_proposal: str,
-        jenis_proposal: str
+        jenis_proposal: str,
+        mode: str = MODE_LENGKAP
     ) -> dict[str, Any]:
         """
         Meninjau proposal dan menghasilkan evaluasi terstruktur.
 
+        Proposal pendek dan mode cepat dikirim ke model cepat lebih
+        dulu; bila hasilnya rusak atau meragukan, review diulang dengan
+        model besar. Mode konsisten mengambil beberapa sampel model
+        besar sekaligus dan menggabungkan skornya.
+
         Parameter:
             teks_proposal: Teks lengkap proposal
             jenis_proposal: Jenis proposal (pkm/skripsi/hibah)
+            mode: "lengkap", "cepat" (triase dengan model kecil), atau
+                "konsisten" (beberapa sampel paralel)
 
         Mengembalikan:
-            Dict berisi hasil evaluasi
+            Dict berisi hasil evaluasi. Penggunaan token dan latensi
+            panggilan tersedia di atribut `penggunaan_terakhir`.
 
         Pengecualian:
             ValueError: Jika teks proposal kosong
@@ -110,50 +246,396 @@ Proposal:
         if not teks_proposal or not teks_proposal.strip():
             raise ValueError("Teks proposal tidak boleh kosong")
 
-        pencatat.info(f"Memulai review proposal jenis: {jenis_proposal}")
+        tingkat = self._pilih_tingkat(teks_proposal, mode)
+        pencatat.info("Memulai review proposal jenis: %s (tingkat: %s)", jenis_proposal, tingkat)
 
         # Format prompt
-        prompt = self.TEMPLAT_PROMPT.format(
+        with ukur_memori("prompt"):
+            prompt = self.TEMPLAT_PROMPT.format(
+                jenis_proposal=jenis_proposal,
+                teks_proposal=teks_proposal,
+                maks_item=self._maks_item_daftar,
+                maks_karakter_butir=self._maks_karakter_butir,
+                maks_karakter_ringkasan=self._maks_karakter_ringkasan
+            )
+        if mode == MODE_KONSISTEN:
+            return await self._tinjau_konsisten(prompt, jenis_proposal)
+        return await self._tinjau_bertingkat(prompt, jenis_proposal, tingkat)
+
+    async def tinjau_revisi(
+        self,
+        bagian_berubah: dict[str, str],
+        hasil_sebelumnya: dict[str, Any],
+        jenis_proposal: str,
+        mode: str = MODE_LENGKAP
+    ) -> dict[str, Any]:
+        """
+        Meninjau revisi proposal dengan menilai ulang aspek yang berubah saja.
+
+        Hanya teks bagian yang berubah yang dikirim ke LLM; skor aspek
+        lain diambil dari review sebelumnya dan skor total dihitung ulang.
+        Bila tidak ada bagian yang berubah, hasil sebelumnya dipakai
+        kembali tanpa memanggil LLM.
+
+        Parameter:
+            bagian_berubah: Aspek -> teks bagian yang berubah
+            hasil_sebelumnya: Review versi sebelumnya (dengan detail_skor)
+            jenis_proposal: Jenis proposal (pkm/skripsi/hibah)
+            mode: "lengkap", "cepat", atau "konsisten"
+
+        Mengembalikan:
+            Dict berisi hasil evaluasi revisi
+
+        Pengecualian:
+            GagalMemproses: Jika terjadi kesalahan saat memproses
+        """
+        skor_lama: dict[str, int] = dict(hasil_sebelumnya["detail_skor"])
+        kolom_hasil = ("daftar_kekuatan", "daftar_kelemahan", "daftar_saran", "ringkasan")
+        if not bagian_berubah:
+            pencatat.info("Tidak ada bagian yang berubah, memakai hasil review sebelumnya")
+            self.penggunaan_terakhir = PenggunaanLLM()
+            return {
+                "skor": sum(skor_lama.values()),
+                "detail_skor": skor_lama,
+                **{kolom: hasil_sebelumnya[kolom] for kolom in kolom_hasil}
+            }
+
+        teks_bagian = "\n\n".join(bagian_berubah.values())
+        tingkat = self._pilih_tingkat(teks_bagian, mode)
+        pencatat.info(
+            "Memulai review revisi proposal jenis: %s (aspek: %s; tingkat: %s)",
+            jenis_proposal, ", ".join(bagian_berubah), tingkat
+        )
+        prompt = self.TEMPLAT_PROMPT_REVISI.format(
             jenis_proposal=jenis_proposal,
-            teks_proposal=teks_proposal
+            skor_sebelumnya="\n".join(f"- {aspek}: {skor}" for aspek, skor in skor_lama.items()),
+            aspek_berubah=", ".join(bagian_berubah),
+            ringkasan_sebelumnya=hasil_sebelumnya["ringkasan"],
+            kelemahan_sebelumnya="\n".join(f"- {butir}" for butir in hasil_sebelumnya["daftar_kelemahan"]),
+            teks_bagian=teks_bagian,
+            maks_item=self._maks_item_daftar,
+            maks_karakter_butir=self._maks_karakter_butir,
+            maks_karakter_ringkasan=self._maks_karakter_ringkasan
         )
 
+        if mode == MODE_KONSISTEN:
+            hasil = await self._tinjau_konsisten(prompt, jenis_proposal)
+        else:
+            hasil = await self._tinjau_bertingkat(prompt, jenis_proposal, tingkat)
+
+        # Skor aspek yang tidak berubah selalu diambil dari review sebelumnya
+        detail = {
+            aspek: (hasil.get("detail_skor") or {}).get(aspek, skor) if aspek in bagian_berubah else skor
+            for aspek, skor in skor_lama.items()
+        }
+        hasil["detail_skor"] = detail
+        hasil["skor"] = sum(detail.values())
+        return hasil
+
+    async def _tinjau_bertingkat(self, prompt: str, jenis_proposal: str, tingkat: str) -> dict[str, Any]:
+        """
+        Menjalankan prompt pada tingkat awal dan eskalasi bila perlu.
+
+        Parameter:
+            prompt: Prompt yang sudah diformat
+            jenis_proposal: Jenis proposal (untuk atribut jejak)
+            tingkat: Tingkat model awal
+
+        Mengembalikan:
+            Dictionary hasil evaluasi
+
+        Pengecualian:
+            GagalMemproses: Jika terjadi kesalahan saat memproses
+        """
+        self.penggunaan_terakhir = None
+
+        if tingkat == TINGKAT_BESAR:
+            return await self._panggil(prompt, jenis_proposal, TINGKAT_BESAR)
+
         try:
-            # Log untuk debugging
-            pencatat.info(f"Memanggil Groq API: {self._api_endpoint}")
-            pencatat.info(f"Model: {self._model}")
-            pencatat.info(f"API Key tersedia: {bool(self._api_key and len(self._api_key) > 10)}")
-            
-            # Panggil Groq API
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    self._api_endpoint,
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self._model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "Anda adalah peninjau proposal akademik profesional. Berikan respons dalam format JSON valid."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 2000
-                    }
-                )
+            hasil = await self._panggil(prompt, jenis_proposal, TINGKAT_CEPAT)
+            alasan = self._alasan_eskalasi(hasil)
+        except GagalMemproses as e:
+            if e.kode not in KODE_GAGAL_FORMAT:
+                raise
+            alasan = e.kode
+
+        if alasan is None:
+            return hasil
+
+        pencatat.info("Hasil model cepat meragukan (%s), eskalasi ke model besar", alasan)
+        penggunaan_cepat = self.penggunaan_terakhir
+        with pelacak.rentang("llm.eskalasi", alasan=alasan):
+            hasil = await self._panggil(prompt, jenis_proposal, TINGKAT_BESAR)
+        self.penggunaan_terakhir = self._gabung_penggunaan(penggunaan_cepat, self.penggunaan_terakhir)
+        return hasil
+
+    async def _tinjau_konsisten(self, prompt: str, jenis_proposal: str) -> dict[str, Any]:
+        """
+        Mengambil beberapa sampel paralel dan menggabungkan skornya.
+
+        Semua sampel dikirim bersamaan ke model besar. Begitu minimal dua
+        sampel selesai dan skor setiap aspeknya berselisih paling banyak
+        `toleransi_sampel`, sampel yang belum selesai dibatalkan sehingga
+        latensinya mendekati satu panggilan. Token sampel yang dibatalkan
+        tidak ikut tercatat.
+
+        Parameter:
+            prompt: Prompt yang sudah diformat
+            jenis_proposal: Jenis proposal (untuk atribut jejak)
+
+        Mengembalikan:
+            Dictionary hasil evaluasi dengan skor median dan `keyakinan`
+
+        Pengecualian:
+            GagalMemproses: Jika semua sampel gagal
+        """
+        self.penggunaan_terakhir = None
+        if self._jumlah_sampel == 1:
+            return await self._panggil(prompt, jenis_proposal, TINGKAT_BESAR)
+
+        waktu_mulai = time.perf_counter()
+        with pelacak.rentang("llm.konsisten", jumlah_sampel=self._jumlah_sampel) as rentang:
+            tugas = [
+                asyncio.create_task(self._ambil_sampel(prompt, jenis_proposal))
+                for _ in range(self._jumlah_sampel)
+            ]
+            sampel: list[tuple[dict[str, Any], PenggunaanLLM]] = []
+            galat_pertama: Optional[GagalMemproses] = None
+            try:
+                for berikutnya in asyncio.as_completed(tugas):
+                    try:
+                        sampel.append(await berikutnya)
+                    except GagalMemproses as e:
+                        pencatat.warning("Sampel konsistensi gagal: %s", e.kode)
+                        galat_pertama = galat_pertama or e
+                        continue
+                    sebaran = self._sebaran_skor([hasil for hasil, _ in sampel])
+                    if len(sampel) >= 2 and sebaran and max(sebaran.values()) <= self._toleransi_sampel:
+                        break
+            finally:
+                for satu in tugas:
+                    satu.cancel()
+                await asyncio.gather(*tugas, return_exceptions=True)
+
+            if not sampel:
+                assert galat_pertama is not None
+                raise galat_pertama
+
+            hasil = self._gabung_sampel([hasil for hasil, _ in sampel])
+            penggunaan: Optional[PenggunaanLLM] = None
+            for _, penggunaan_sampel in sampel:
+                penggunaan = self._gabung_penggunaan(penggunaan, penggunaan_sampel)
+            if penggunaan is not None:
+                # Sampel berjalan paralel: latensi adalah waktu dinding, bukan jumlahnya
+                penggunaan.latensi_ms = round((time.perf_counter() - waktu_mulai) * 1000, 2)
+            self.penggunaan_terakhir = penggunaan
+
+            rentang.atur_atribut("jumlah_sampel_selesai", len(sampel))
+            rentang.atur_atribut("keyakinan", hasil.get("keyakinan"))
+        pencatat.info(
+            "Review konsisten: %s/%s sampel, keyakinan %s",
+            len(sampel), self._jumlah_sampel, hasil.get("keyakinan")
+        )
+        return hasil
+
+    async def _ambil_sampel(
+        self,
+        prompt: str,
+        jenis_proposal: str
+    ) -> tuple[dict[str, Any], PenggunaanLLM]:
+        """Satu sampel model besar beserta penggunaannya."""
+        # Penggunaan diambil dari nilai kembali panggilan ini, bukan dari
+        # penggunaan_terakhir yang ikut ditulis sampel lain secara paralel
+        return await self._panggil_llm(prompt, jenis_proposal, TINGKAT_BESAR)
+
+    @staticmethod
+    def _sebaran_skor(daftar_hasil: list[dict[str, Any]]) -> dict[str, int]:
+        """
+        Menghitung rentang (maks - min) skor tiap aspek antar sampel.
+
+        Parameter:
+            daftar_hasil: Hasil evaluasi tiap sampel
+
+        Mengembalikan:
+            Dictionary aspek -> rentang skor; kosong jika kurang dari
+            dua sampel memiliki detail skor
+        """
+        daftar_detail = [hasil["detail_skor"] for hasil in daftar_hasil if hasil.get("detail_skor")]
+        if len(daftar_detail) < 2:
+            return {}
+        return {
+            aspek: max(detail[aspek] for detail in daftar_detail) - min(detail[aspek] for detail in daftar_detail)
+            for aspek in daftar_detail[0]
+        }
+
+    @classmethod
+    def _gabung_sampel(cls, daftar_hasil: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Menggabungkan sampel menjadi satu hasil evaluasi.
+
+        Skor tiap aspek diambil mediannya; teks (kekuatan, kelemahan,
+        saran, ringkasan) diambil dari sampel yang skornya paling dekat
+        dengan median. Keyakinan = 1 - rata-rata rentang skor aspek / 20.
+
+        Parameter:
+            daftar_hasil: Hasil evaluasi tiap sampel yang berhasil
+
+        Mengembalikan:
+            Dictionary hasil evaluasi gabungan
+        """
+        daftar_detail = [hasil for hasil in daftar_hasil if hasil.get("detail_skor")]
+        if len(daftar_detail) < 2:
+            return {**(daftar_detail or daftar_hasil)[0], "keyakinan": None}
+
+        median = {
+            aspek: round(statistics.median(hasil["detail_skor"][aspek] for hasil in daftar_detail))
+            for aspek in daftar_detail[0]["detail_skor"]
+        }
+        perwakilan = min(
+            daftar_detail,
+            key=lambda hasil: sum(abs(hasil["detail_skor"][aspek] - nilai) for aspek, nilai in median.items())
+        )
+        sebaran = cls._sebaran_skor(daftar_detail)
+        keyakinan = 1 - statistics.mean(sebaran.values()) / BATAS_SKOR_ASPEK
+        return {
+            **perwakilan,
+            "skor": sum(median.values()),
+            "detail_skor": median,
+            "keyakinan": round(max(0.0, keyakinan), 2)
+        }
+
+    def _pilih_tingkat(self, teks_proposal: str, mode: str) -> str:
+        """
+        Menentukan tingkat model awal untuk sebuah review.
+
+        Parameter:
+            teks_proposal: Teks lengkap proposal
+            mode: Mode review yang diminta
+
+        Mengembalikan:
+            TINGKAT_CEPAT untuk mode cepat atau proposal pendek, selain itu TINGKAT_BESAR
+        """
+        if not self._pengarah.mendukung_tingkat_cepat or mode == MODE_KONSISTEN:
+            return TINGKAT_BESAR
+        if mode == MODE_CEPAT:
+            return TINGKAT_CEPAT
+        if self._ambang_karakter_cepat and len(teks_proposal) <= self._ambang_karakter_cepat:
+            return TINGKAT_CEPAT
+        return TINGKAT_BESAR
+
+    @staticmethod
+    def _alasan_eskalasi(hasil: dict[str, Any]) -> Optional[str]:
+        """
+        Memeriksa apakah hasil model cepat cukup meyakinkan.
+
+        Parameter:
+            hasil: Dictionary hasil evaluasi tervalidasi
+
+        Mengembalikan:
+            Alasan eskalasi, atau None jika hasil dapat dipakai
+        """
+        detail = hasil.get("detail_skor")
+        if hasil.get("skor") is None or not detail:
+            return "skor_tidak_lengkap"
+        if abs(hasil["skor"] - sum(detail.values())) > TOLERANSI_SKOR:
+            return "skor_tidak_konsisten"
+        if not all(hasil.get(kolom) for kolom in ("daftar_kekuatan", "daftar_kelemahan", "daftar_saran", "ringkasan")):
+            return "isi_tidak_lengkap"
+        return None
+
+    async def _panggil(
+        self,
+        prompt: str,
+        jenis_proposal: str,
+        tingkat: str
+    ) -> dict[str, Any]:
+        """
+        Melakukan satu panggilan LLM dan mengurai hasilnya.
+
+        Penggunaannya dibaca dari atribut `penggunaan_terakhir`, yang
+        juga terisi bila penguraian gagal (untuk penggabungan eskalasi).
+
+        Parameter:
+            prompt: Prompt yang sudah diformat
+            jenis_proposal: Jenis proposal (untuk atribut jejak)
+            tingkat: Tingkat model yang dipakai
+
+        Mengembalikan:
+            Dictionary hasil evaluasi
+
+        Pengecualian:
+            GagalMemproses: Jika terjadi kesalahan saat memproses
+            TenggatHabis: Jika sisa tenggat tidak cukup atau habis saat menunggu
+        """
+        hasil, _ = await self._panggil_llm(prompt, jenis_proposal, tingkat)
+        return hasil
+
+    async def _panggil_llm(
+        self,
+        prompt: str,
+        jenis_proposal: str,
+        tingkat: str
+    ) -> tuple[dict[str, Any], PenggunaanLLM]:
+        """
+        Melakukan satu panggilan LLM, mengurai hasilnya, dan mengembalikan penggunaannya.
+
+        Parameter:
+            prompt: Prompt yang sudah diformat
+            jenis_proposal: Jenis proposal (untuk atribut jejak)
+            tingkat: Tingkat model yang dipakai
 
-                pencatat.info(f"Groq API response status: {response.status_code}")
+        Mengembalikan:
+            Tuple (dictionary hasil evaluasi, penggunaan panggilan ini)
+
+        Pengecualian:
+            GagalMemproses: Jika terjadi kesalahan saat memproses
+            TenggatHabis: Jika sisa tenggat tidak cukup atau habis saat menunggu
+        """
+        try:
+            with pelacak.rentang(
+                "llm.tinjau",
+                tingkat=tingkat,
+                jenis_proposal=jenis_proposal,
+                jumlah_karakter_prompt=len(prompt)
+            ) as rentang:
+                maks_token, batas_waktu = self._batas_panggilan()
+                rentang.atur_atribut("max_tokens", maks_token)
+
+                # Panggil penyedia LLM (dengan failover antar penyedia)
+                waktu_mulai = time.perf_counter()
+                kirim = self._pengarah.kirim(
+                    self._buat_payload(prompt, maks_token),
+                    tingkat,
+                    batas_waktu
+                )
+                if self._tenggat is None:
+                    response, penyedia, percobaan = await kirim
+                else:
+                    response, penyedia, percobaan = await self._tenggat.batasi(kirim, "llm")
+                model = penyedia.model_untuk(tingkat)
+
+                pencatat.info("Respons penyedia '%s' (%s): status %s", penyedia.nama, model, response.status_code)
+                rentang.atur_atribut("penyedia", penyedia.nama)
+                rentang.atur_atribut("model", model)
+                rentang.atur_atribut("jumlah_percobaan", percobaan)
+                rentang.atur_atribut("status_http", response.status_code)
+
+                generasi_gagal = self._ambil_generasi_gagal(response)
+                if generasi_gagal is not None:
+                    # Keluaran ditolak validator JSON penyedia; coba urai sendiri
+                    pencatat.warning("Keluaran JSON ditolak penyedia, mencoba perbaikan lokal")
+                    rentang.atur_atribut("json_ditolak_penyedia", True)
+                    penggunaan = self._baca_penggunaan(
+                        {"model": model},
+                        latensi_ms=(time.perf_counter() - waktu_mulai) * 1000
+                    )
+                    self.penggunaan_terakhir = penggunaan
+                    return self._parse_hasil(generasi_gagal), penggunaan
 
                 if response.status_code != 200:
                     error_detail = response.text
-                    pencatat.error(f"Groq API error: {response.status_code} - {error_detail}")
+                    pencatat.error("Penyedia LLM error: %s - %s", response.status_code, error_detail)
                     raise GagalMemproses(
                         pesan=f"Gagal memanggil Groq API (status {response.status_code}). Silakan coba lagi.",
                         kode="GROQ_API_ERROR"
@@ -161,39 +643,188 @@ Proposal:
 
                 hasil_json = response.json()
                 hasil_teks = hasil_json["choices"][0]["message"]["content"]
-                pencatat.info(f"Panjang respons: {len(hasil_teks)} karakter")
+                pencatat.debug("Panjang respons: %s karakter", len(hasil_teks))
+
+                penggunaan = self._baca_penggunaan(
+                    {"model": model, **hasil_json},
+                    latensi_ms=(time.perf_counter() - waktu_mulai) * 1000
+                )
+                self.penggunaan_terakhir = penggunaan
+                rentang.atur_atribut("token_prompt", penggunaan.token_prompt)
+                rentang.atur_atribut("token_penyelesaian", penggunaan.token_penyelesaian)
+                rentang.atur_atribut("jumlah_karakter_respons", len(hasil_teks))
 
             pencatat.info("Review proposal selesai")
-            return self._parse_hasil(hasil_teks)
+            return self._parse_hasil(hasil_teks), penggunaan
 
         except httpx.TimeoutException as e:
-            pencatat.error(f"Timeout saat memanggil Groq API: {str(e)}")
+            pencatat.error("Timeout saat memanggil Groq API: %s", e)
             raise GagalMemproses(
                 pesan="Timeout saat memproses proposal. Silakan coba lagi.",
                 kode="TIMEOUT"
             )
         except httpx.HTTPError as e:
-            pencatat.error(f"HTTP error saat memanggil Groq API: {str(e)}")
+            pencatat.error("HTTP error saat memanggil Groq API: %s", e)
             raise GagalMemproses(
                 pesan="Gagal terhubung ke server AI. Periksa koneksi internet.",
                 kode="HTTP_ERROR"
             )
         except KeyError as e:
-            pencatat.error(f"Format respons tidak sesuai: {str(e)}")
+            pencatat.error("Format respons tidak sesuai: %s", e)
             raise GagalMemproses(
                 pesan="Format respons dari AI tidak valid.",
                 kode="FORMAT_ERROR"
             )
-        except GagalMemproses:
-            # Re-raise GagalMemproses
+        except (GagalMemproses, TenggatHabis):
+            # Re-raise GagalMemproses dan TenggatHabis
             raise
         except Exception as e:
-            pencatat.error(f"Gagal melakukan review: {type(e).__name__}: {str(e)}", exc_info=True)
+            pencatat.error("Gagal melakukan review: %s: %s", type(e).__name__, e, exc_info=True)
             raise GagalMemproses(
                 pesan=f"Terjadi kesalahan tidak terduga: {str(e)}",
                 kode="GAGAL_REVIEW"
             )
 
+    def _batas_panggilan(self) -> tuple[int, Optional[float]]:
+        """
+        Menyesuaikan max_tokens dan timeout dengan sisa tenggat.
+
+        Mengembalikan:
+            Tuple (max_tokens, timeout detik atau None jika tanpa tenggat)
+
+        Pengecualian:
+            TenggatHabis: Jika sisa waktu tidak cukup untuk keluaran yang utuh
+        """
+        if self._tenggat is None:
+            return self._maks_token, None
+        self._tenggat.periksa("llm")
+        sisa = self._tenggat.sisa()
+        if sisa is None:
+            return self._maks_token, None
+
+        muat = int((sisa - LATENSI_AWAL_DETIK) * self._laju_token_per_detik)
+        if muat < min(TOKEN_MINIMUM_TENGGAT, self._maks_token):
+            pencatat.warning("Sisa tenggat %.1f detik tidak cukup untuk panggilan LLM", sisa)
+            self._tenggat.batalkan(KODE_TENGGAT_HABIS)
+            self._tenggat.periksa("llm")
+        if muat < self._maks_token:
+            pencatat.info("max_tokens dipangkas ke %s agar muat dalam sisa tenggat %.1f detik", muat, sisa)
+        return min(self._maks_token, muat), sisa
+
+    def _buat_payload(self, prompt: str, maks_token: Optional[int] = None) -> dict[str, Any]:
+        """
+        Membuat badan permintaan chat completions.
+
+        Parameter:
+            prompt: Prompt pengguna yang sudah diformat
+            maks_token: max_tokens (None = batas bawaan agen)
+
+        Mengembalikan:
+            Dictionary payload permintaan
+        """
+        payload: dict[str, Any] = {
+            "model": self._model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Anda adalah peninjau proposal akademik profesional. Berikan respons dalam format JSON valid."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.3,
+            "max_tokens": maks_token or self._maks_token
+        }
+        if self._format_respons is not None:
+            payload["response_format"] = self._format_respons
+        return payload
+
+    @staticmethod
+    def _ambil_generasi_gagal(response: httpx.Response) -> Optional[str]:
+        """
+        Mengambil keluaran model dari galat `json_validate_failed`.
+
+        Groq mengembalikan 400 beserta `failed_generation` bila keluaran
+        mode JSON tidak valid; teks tersebut masih bisa diperbaiki lokal.
+
+        Parameter:
+            response: Respons HTTP dari penyedia
+
+        Mengembalikan:
+            Teks keluaran yang gagal divalidasi, atau None
+        """
+        if response.status_code != 400:
+            return None
+        try:
+            galat = response.json().get("error") or {}
+        except ValueError:
+            return None
+        if galat.get("code") != "json_validate_failed":
+            return None
+        return galat.get("failed_generation") or None
+
+    def _baca_penggunaan(
+        self,
+        hasil_json: dict[str, Any],
+        latensi_ms: float
+    ) -> PenggunaanLLM:
+        """
+        Membaca blok `usage` dari respons chat completions.
+
+        Parameter:
+            hasil_json: Respons JSON dari API
+            latensi_ms: Latensi panggilan yang diukur aplikasi
+
+        Mengembalikan:
+            Objek PenggunaanLLM (field kosong jika penyedia tidak mengirimnya)
+        """
+        penggunaan = hasil_json.get("usage") or {}
+        return PenggunaanLLM(
+            model=hasil_json.get("model") or self._model,
+            token_prompt=penggunaan.get("prompt_tokens"),
+            token_penyelesaian=penggunaan.get("completion_tokens"),
+            token_total=penggunaan.get("total_tokens"),
+            waktu_antrean_detik=penggunaan.get("queue_time"),
+            waktu_total_detik=penggunaan.get("total_time"),
+            latensi_ms=round(latensi_ms, 2)
+        )
+
+    @staticmethod
+    def _gabung_penggunaan(
+        awal: Optional[PenggunaanLLM],
+        akhir: Optional[PenggunaanLLM]
+    ) -> Optional[PenggunaanLLM]:
+        """
+        Menjumlahkan penggunaan dua panggilan (model cepat lalu eskalasi).
+
+        Parameter:
+            awal: Penggunaan panggilan model cepat
+            akhir: Penggunaan panggilan model besar
+
+        Mengembalikan:
+            Penggunaan gabungan dengan model dari panggilan terakhir
+        """
+        if awal is None or akhir is None:
+            return akhir or awal
+
+        def jumlah(a: Any, b: Any) -> Any:
+            if a is None and b is None:
+                return None
+            return (a or 0) + (b or 0)
+
+        return PenggunaanLLM(
+            model=akhir.model,
+            token_prompt=jumlah(awal.token_prompt, akhir.token_prompt),
+            token_penyelesaian=jumlah(awal.token_penyelesaian, akhir.token_penyelesaian),
+            token_total=jumlah(awal.token_total, akhir.token_total),
+            waktu_antrean_detik=jumlah(awal.waktu_antrean_detik, akhir.waktu_antrean_detik),
+            waktu_total_detik=jumlah(awal.waktu_total_detik, akhir.waktu_total_detik),
+            latensi_ms=jumlah(awal.latensi_ms, akhir.latensi_ms)
+        )
+
+    @ukur_memori("urai_respons")
     def _parse_hasil(self, hasil_mentah: str) -> dict[str, Any]:
         """
         Mengurai hasil mentah dari LLM menjadi dictionary.
@@ -202,32 +833,15 @@ Proposal:
             hasil_mentah: String hasil dari LLM
 
         Mengembalikan:
-            Dictionary hasil evaluasi
+            Dictionary hasil evaluasi yang sudah tervalidasi skema
 
         Pengecualian:
             GagalMemproses: Jika format respons tidak valid
         """
-        try:
-            # Coba parse langsung
-            return json.loads(hasil_mentah)
-        except json.JSONDecodeError:
-            # Coba ekstrak JSON dari markdown code block
-            try:
-                import re
-                json_match = re.search(r'```json?\s*([\s\S]*?)```', hasil_mentah)
-                if json_match:
-                    return json.loads(json_match.group(1))
-
-                # Coba cari object JSON dalam teks
-                json_match = re.search(r'\{[\s\S]*\}', hasil_mentah)
-                if json_match:
-                    return json.loads(json_match.group(0))
-
-            except (json.JSONDecodeError, AttributeError):
-                pass
-
-            pencatat.warning("Gagal parse JSON dari respons LLM")
-            raise GagalMemproses(
-                pesan="Format respons tidak valid dari AI",
-                kode="FORMAT_TIDAK_VALID"
-            )
+        hasil = urai_hasil_evaluasi(hasil_mentah)
+        # Batas jumlah butir juga ditegakkan untuk mode tanpa JSON schema
+        for kolom in ("daftar_kekuatan", "daftar_kelemahan", "daftar_saran"):
+            setattr(hasil, kolom, getattr(hasil, kolom)[:self._maks_item_daftar])
+        # Keyakinan dihitung dari sebaran sampel, bukan diisi LLM
+        hasil.keyakinan = None
+        return hasil.model_dump()
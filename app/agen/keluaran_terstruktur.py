@@ -0,0 +1,159 @@
+"""
+Modul keluaran terstruktur untuk panggilan LLM.
+
+Membangun parameter `response_format` (JSON object / JSON schema)
+dari model HasilEvaluasi beserta batas panjang per field, dan
+menghitung `max_tokens` yang sesuai dengan batas tersebut.
+"""
+
+import copy
+import math
+from typing import Any, Optional
+
+from app.skema.model import HasilEvaluasi
+
+MODE_KELUARAN: set[str] = {"nonaktif", "json_object", "json_schema"}
+
+# Field HasilEvaluasi yang memang diisi oleh LLM
+KOLOM_LLM: tuple[str, ...] = (
+    "skor",
+    "detail_skor",
+    "daftar_kekuatan",
+    "daftar_kelemahan",
+    "daftar_saran",
+    "ringkasan",
+)
+
+# Perkiraan konservatif untuk teks Bahasa Indonesia pada tokenizer Llama
+KARAKTER_PER_TOKEN = 3.2
+# Kerangka JSON (kunci, tanda kutip, skor) di luar isi teks
+TOKEN_KERANGKA = 120
+MARGIN_TOKEN = 1.15
+
+
+def _selesaikan_ref(skema: Any, definisi: dict[str, Any]) -> Any:
+    """Mengganti $ref dengan definisinya secara rekursif."""
+    if isinstance(skema, dict):
+        if "$ref" in skema:
+            nama = skema["$ref"].split("/")[-1]
+            return _selesaikan_ref(copy.deepcopy(definisi[nama]), definisi)
+        return {kunci: _selesaikan_ref(nilai, definisi) for kunci, nilai in skema.items()}
+    if isinstance(skema, list):
+        return [_selesaikan_ref(item, definisi) for item in skema]
+    return skema
+
+
+def _ketatkan(skema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Menyesuaikan skema agar memenuhi mode strict JSON schema.
+
+    Menghapus varian null pada anyOf, metadata yang tidak perlu,
+    serta mewajibkan semua properti tanpa properti tambahan.
+    """
+    if "anyOf" in skema:
+        varian = [v for v in skema["anyOf"] if v.get("type") != "null"]
+        if len(varian) == 1:
+            skema = {**varian[0], **{k: v for k, v in skema.items() if k not in ("anyOf", "default")}}
+
+    skema = {k: v for k, v in skema.items() if k not in ("title", "default")}
+    if skema.get("type") == "object" and "properties" in skema:
+        skema["properties"] = {k: _ketatkan(v) for k, v in skema["properties"].items()}
+        skema["required"] = list(skema["properties"])
+        skema["additionalProperties"] = False
+    if skema.get("type") == "array" and isinstance(skema.get("items"), dict):
+        skema["items"] = _ketatkan(skema["items"])
+    return skema
+
+
+def buat_skema_hasil(
+    maks_item: int,
+    maks_karakter_butir: int,
+    maks_karakter_ringkasan: int
+) -> dict[str, Any]:
+    """
+    Menurunkan JSON schema keluaran LLM dari model HasilEvaluasi.
+
+    Parameter:
+        maks_item: Jumlah maksimal butir per daftar
+        maks_karakter_butir: Panjang maksimal setiap butir daftar
+        maks_karakter_ringkasan: Panjang maksimal ringkasan
+
+    Mengembalikan:
+        Dictionary JSON schema
+    """
+    skema_model = HasilEvaluasi.model_json_schema()
+    definisi = skema_model.pop("$defs", {})
+    skema = _selesaikan_ref(skema_model, definisi)
+    skema["properties"] = {
+        kunci: nilai for kunci, nilai in skema["properties"].items() if kunci in KOLOM_LLM
+    }
+    skema = _ketatkan(skema)
+
+    for kunci, properti in skema["properties"].items():
+        if properti.get("type") == "array":
+            properti["maxItems"] = maks_item
+            properti["items"]["maxLength"] = maks_karakter_butir
+        elif properti.get("type") == "string" and kunci == "ringkasan":
+            properti["maxLength"] = maks_karakter_ringkasan
+    return skema
+
+
+def buat_format_respons(
+    mode: str,
+    maks_item: int,
+    maks_karakter_butir: int,
+    maks_karakter_ringkasan: int
+) -> Optional[dict[str, Any]]:
+    """
+    Membuat parameter `response_format` untuk chat completions.
+
+    Parameter:
+        mode: "nonaktif", "json_object", atau "json_schema"
+        maks_item: Jumlah maksimal butir per daftar
+        maks_karakter_butir: Panjang maksimal setiap butir daftar
+        maks_karakter_ringkasan: Panjang maksimal ringkasan
+
+    Mengembalikan:
+        Dictionary response_format, atau None jika mode nonaktif
+
+    Pengecualian:
+        ValueError: Jika mode tidak dikenali
+    """
+    if mode not in MODE_KELUARAN:
+        raise ValueError(f"Mode keluaran tidak dikenali: {mode}")
+    if mode == "nonaktif":
+        return None
+    if mode == "json_object":
+        return {"type": "json_object"}
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "hasil_evaluasi",
+            "strict": True,
+            "schema": buat_skema_hasil(maks_item, maks_karakter_butir, maks_karakter_ringkasan)
+        }
+    }
+
+
+def hitung_maks_token(
+    maks_item: int,
+    maks_karakter_butir: int,
+    maks_karakter_ringkasan: int
+) -> int:
+    """
+    Menghitung anggaran token keluaran yang cukup untuk batas per field.
+
+    Parameter:
+        maks_item: Jumlah maksimal butir per daftar
+        maks_karakter_butir: Panjang maksimal setiap butir daftar
+        maks_karakter_ringkasan: Panjang maksimal ringkasan
+
+    Mengembalikan:
+        Nilai max_tokens yang disarankan
+    """
+    jumlah_daftar = sum(
+        1 for kolom in KOLOM_LLM
+        if HasilEvaluasi.model_fields[kolom].annotation == list[str]
+    )
+    karakter = jumlah_daftar * maks_item * maks_karakter_butir + maks_karakter_ringkasan
+    return math.ceil((karakter / KARAKTER_PER_TOKEN + TOKEN_KERANGKA) * MARGIN_TOKEN)
@@ -0,0 +1,336 @@
+"""
+Modul pengurai respons JSON dari LLM.
+
+Mengekstrak objek JSON dari respons model (polos, dalam code block,
+atau terselip di antara prosa) dengan satu kali pemindaian,
+memperbaiki kesalahan umum LLM (koma berlebih, literal Python,
+kutip miring, keluaran terpotong), lalu memvalidasinya langsung
+menjadi HasilEvaluasi.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from app.pengecualian import GagalMemproses
+from app.skema.model import HasilEvaluasi
+
+pencatat = logging.getLogger(__name__)
+
+POLA_BLOK_KODE = re.compile(r"```(?:json)?[ \t]*\n?(.*?)(?:```|\Z)", re.DOTALL | re.IGNORECASE)
+POLA_ANGKA = re.compile(r"-?\d+(?:\.\d+)?")
+_DEKODER = json.JSONDecoder()
+
+LITERAL_PYTHON: dict[str, str] = {"True": "true", "False": "false", "None": "null"}
+KUTIP_MIRING: str = "“”„‟"
+BATAS_SKOR_ASPEK = 20
+BATAS_SKOR_TOTAL = 100
+ASPEK_SKOR: tuple[str, ...] = ("latar_belakang", "formulasi_masalah", "tujuan", "metodologi", "luaran")
+ALIAS_KUNCI: dict[str, str] = {
+    "kekuatan": "daftar_kekuatan",
+    "kelemahan": "daftar_kelemahan",
+    "saran": "daftar_saran",
+    "skor_total": "skor",
+    "total_skor": "skor",
+}
+
+
+def ekstrak_objek_json(teks: str) -> tuple[Optional[str], bool]:
+    """
+    Mengambil objek JSON pertama dari teks dengan pencocokan kurung.
+
+    Pemindaian dilakukan sekali dari kurung kurawal pertama dan
+    memperhitungkan string beserta escape, sehingga kurung di dalam
+    string tidak mengacaukan kedalaman.
+
+    Parameter:
+        teks: Teks respons LLM
+
+    Mengembalikan:
+        Tuple (fragmen JSON atau None, True jika objek tertutup lengkap)
+    """
+    awal = teks.find("{")
+    if awal == -1:
+        return None, False
+
+    kedalaman = 0
+    dalam_string = False
+    escape = False
+    for indeks in range(awal, len(teks)):
+        karakter = teks[indeks]
+        if dalam_string:
+            if escape:
+                escape = False
+            elif karakter == "\\":
+                escape = True
+            elif karakter == '"':
+                dalam_string = False
+        elif karakter == '"':
+            dalam_string = True
+        elif karakter in "{[":
+            kedalaman += 1
+        elif karakter in "}]":
+            kedalaman -= 1
+            if kedalaman == 0:
+                return teks[awal:indeks + 1], True
+
+    return teks[awal:], False
+
+
+def perbaiki_json(fragmen: str) -> str:
+    """
+    Memperbaiki kesalahan JSON yang umum pada keluaran LLM.
+
+    Menangani koma sebelum kurung tutup, literal True/False/None,
+    kutip miring di luar string, dan keluaran yang terpotong
+    (string ditutup, kunci tanpa nilai dibuang, kurung dilengkapi).
+
+    Parameter:
+        fragmen: Fragmen JSON (mungkin rusak atau terpotong)
+
+    Mengembalikan:
+        String JSON hasil perbaikan
+    """
+    keluaran: list[str] = []
+    tumpukan: list[str] = []
+    # Titik aman: posisi setelah nilai lengkap, untuk memotong sisa yang rusak
+    titik_aman: tuple[int, list[str]] = (0, [])
+    dalam_string = False
+    string_adalah_kunci = False
+    string_kutip_miring = False
+    escape = False
+    harap_kunci = False
+    token = ""
+
+    # Angka/literal hanya menjadi titik aman bila diikuti pembatas
+    def tutup_token(aman: bool = True) -> None:
+        nonlocal token, titik_aman
+        if not token:
+            return
+        nilai = LITERAL_PYTHON.get(token, token)
+        keluaran.append(nilai)
+        if aman and (nilai in ("true", "false", "null") or POLA_ANGKA.fullmatch(nilai)):
+            titik_aman = (len(keluaran), tumpukan.copy())
+        token = ""
+
+    def buang_koma_akhir() -> None:
+        while keluaran and keluaran[-1].isspace():
+            keluaran.pop()
+        if keluaran and keluaran[-1] == ",":
+            keluaran.pop()
+
+    for karakter in fragmen:
+        if dalam_string:
+            if escape:
+                escape = False
+            elif karakter == "\\":
+                escape = True
+            elif string_kutip_miring and karakter == '"':
+                karakter = '\\"'
+            elif karakter == '"' or (string_kutip_miring and karakter in KUTIP_MIRING):
+                karakter = '"'
+                dalam_string = False
+            keluaran.append(karakter)
+            if not dalam_string and not string_adalah_kunci:
+                titik_aman = (len(keluaran), tumpukan.copy())
+            continue
+
+        if karakter == '"' or karakter in KUTIP_MIRING:
+            tutup_token()
+            dalam_string = True
+            string_kutip_miring = karakter != '"'
+            string_adalah_kunci = bool(tumpukan) and tumpukan[-1] == "{" and harap_kunci
+            keluaran.append('"')
+        elif karakter in "{[":
+            tutup_token()
+            tumpukan.append(karakter)
+            harap_kunci = karakter == "{"
+            keluaran.append(karakter)
+            titik_aman = (len(keluaran), tumpukan.copy())
+        elif karakter in "}]":
+            tutup_token()
+            buang_koma_akhir()
+            if tumpukan:
+                tumpukan.pop()
+            keluaran.append(karakter)
+            harap_kunci = False
+            titik_aman = (len(keluaran), tumpukan.copy())
+            if not tumpukan:
+                break
+        elif karakter == ",":
+            tutup_token()
+            harap_kunci = bool(tumpukan) and tumpukan[-1] == "{"
+            keluaran.append(karakter)
+        elif karakter == ":":
+            tutup_token()
+            harap_kunci = False
+            keluaran.append(karakter)
+        elif karakter.isspace():
+            tutup_token()
+            keluaran.append(karakter)
+        else:
+            token += karakter
+    else:
+        # Fragmen habis sebelum objek tertutup (keluaran terpotong)
+        if dalam_string and not string_adalah_kunci:
+            if escape:
+                keluaran.pop()
+            keluaran.append('"')
+            titik_aman = (len(keluaran), tumpukan.copy())
+        else:
+            # Angka atau literal di ujung input mungkin terpotong ("7" dari "78")
+            tutup_token(aman=False)
+
+    panjang_aman, tumpukan_aman = titik_aman
+    if tumpukan_aman:
+        keluaran = keluaran[:panjang_aman]
+        buang_koma_akhir()
+        for pembuka in reversed(tumpukan_aman):
+            keluaran.append("}" if pembuka == "{" else "]")
+
+    return "".join(keluaran)
+
+
+def urai_json(teks: str) -> dict[str, Any]:
+    """
+    Mengurai respons LLM menjadi dictionary dengan beberapa strategi.
+
+    Urutan: json.loads langsung, isi code block, objek hasil
+    pencocokan kurung, lalu perbaikan JSON.
+
+    Parameter:
+        teks: Teks respons LLM
+
+    Mengembalikan:
+        Dictionary hasil parsing
+
+    Pengecualian:
+        GagalMemproses: Jika tidak ada objek JSON yang dapat diurai
+    """
+    teks = teks.strip()
+    try:
+        data = json.loads(teks)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    blok = POLA_BLOK_KODE.search(teks)
+    sumber = blok.group(1) if blok else teks
+
+    # Jalur cepat: decoder C membaca satu objek dan mengabaikan prosa sesudahnya
+    awal = sumber.find("{")
+    if awal != -1:
+        try:
+            data, _ = _DEKODER.raw_decode(sumber, awal)
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            pass
+
+    fragmen, lengkap = ekstrak_objek_json(sumber)
+    if fragmen is not None:
+        try:
+            data = json.loads(perbaiki_json(fragmen))
+            if isinstance(data, dict):
+                pencatat.info("Respons LLM diperbaiki (lengkap: %s)", lengkap)
+                return data
+        except json.JSONDecodeError:
+            pass
+
+    pencatat.warning("Gagal parse JSON dari respons LLM")
+    raise GagalMemproses(
+        pesan="Format respons tidak valid dari AI",
+        kode="FORMAT_TIDAK_VALID"
+    )
+
+
+def _ke_angka(nilai: Any, batas: int) -> Optional[int]:
+    """Mengubah nilai (angka atau teks "15/20") menjadi int dalam rentang 0-batas."""
+    if isinstance(nilai, bool):
+        return None
+    if isinstance(nilai, (int, float)):
+        angka = nilai
+    elif isinstance(nilai, str) and (cocok := POLA_ANGKA.search(nilai)):
+        angka = float(cocok.group(0))
+    else:
+        return None
+    return max(0, min(batas, int(round(angka))))
+
+
+def _ke_daftar(nilai: Any) -> list[str]:
+    """Mengubah nilai menjadi list string yang tidak kosong."""
+    if nilai is None:
+        return []
+    if isinstance(nilai, str):
+        nilai = [nilai]
+    if not isinstance(nilai, list):
+        return []
+    return [str(item).strip() for item in nilai if item is not None and str(item).strip()]
+
+
+def normalisasi_hasil(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Menyesuaikan dictionary hasil LLM dengan skema HasilEvaluasi.
+
+    Parameter:
+        data: Dictionary hasil parsing
+
+    Mengembalikan:
+        Dictionary yang siap divalidasi HasilEvaluasi
+    """
+    data = {ALIAS_KUNCI.get(kunci, kunci): nilai for kunci, nilai in data.items()}
+
+    detail = data.get("detail_skor")
+    detail_bersih: Optional[dict[str, int]] = None
+    if isinstance(detail, dict):
+        kandidat = {aspek: _ke_angka(detail.get(aspek), BATAS_SKOR_ASPEK) for aspek in ASPEK_SKOR}
+        if all(nilai is not None for nilai in kandidat.values()):
+            detail_bersih = kandidat  # type: ignore[assignment]
+
+    skor = _ke_angka(data.get("skor"), BATAS_SKOR_TOTAL)
+    if skor is None and detail_bersih is not None:
+        skor = sum(detail_bersih.values())
+
+    ringkasan = data.get("ringkasan")
+    return {
+        "skor": skor,
+        "detail_skor": detail_bersih,
+        "daftar_kekuatan": _ke_daftar(data.get("daftar_kekuatan")),
+        "daftar_kelemahan": _ke_daftar(data.get("daftar_kelemahan")),
+        "daftar_saran": _ke_daftar(data.get("daftar_saran")),
+        "ringkasan": str(ringkasan).strip() if ringkasan is not None else "",
+    }
+
+
+def urai_hasil_evaluasi(teks: str) -> HasilEvaluasi:
+    """
+    Mengurai respons LLM langsung menjadi HasilEvaluasi tervalidasi.
+
+    Parameter:
+        teks: Teks respons LLM
+
+    Mengembalikan:
+        Objek HasilEvaluasi
+
+    Pengecualian:
+        GagalMemproses: Jika respons tidak dapat diurai atau divalidasi
+    """
+    data = urai_json(teks)
+    try:
+        # Respons yang sudah sesuai skema tidak perlu dinormalisasi
+        return HasilEvaluasi.model_validate(data)
+    except ValidationError:
+        pass
+
+    try:
+        return HasilEvaluasi.model_validate(normalisasi_hasil(data))
+    except ValidationError as e:
+        pencatat.warning("Respons LLM tidak sesuai skema: %s kesalahan", e.error_count())
+        raise GagalMemproses(
+            pesan="Format respons tidak valid dari AI",
+            kode="FORMAT_TIDAK_VALID"
+        )
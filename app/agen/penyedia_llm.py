@@ -0,0 +1,475 @@
+"""
+Modul penyedia LLM dan pengarah (router) antar penyedia.
+
+Setiap penyedia adalah endpoint chat completions kompatibel OpenAI
+(Groq, server lokal llama.cpp/Ollama, dll). Pengarah mencatat latensi
+dan laju galat bergulir per penyedia, mendahulukan penyedia yang sehat,
+berpindah otomatis (failover) saat galat, dan opsional mengirim
+permintaan lindung nilai (hedged request) ke penyedia cadangan bila
+penyedia utama lambat.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Optional
+
+import httpx
+
+pencatat = logging.getLogger(__name__)
+
+# Status HTTP yang dianggap kegagalan penyedia (layak dialihkan)
+STATUS_GAGAL_PENYEDIA: set[int] = {408, 409, 429, 500, 502, 503, 504}
+
+# Tingkat model: "besar" untuk review lengkap, "cepat" untuk triase
+TINGKAT_BESAR = "besar"
+TINGKAT_CEPAT = "cepat"
+
+
+class PenyediaLLM:
+    """Satu endpoint chat completions kompatibel OpenAI."""
+
+    def __init__(
+        self,
+        nama: str,
+        api_endpoint: str,
+        model: str,
+        api_key: str = "",
+        batas_waktu_detik: float = 120.0,
+        model_cepat: Optional[str] = None
+    ):
+        """
+        Inisialisasi penyedia.
+
+        Parameter:
+            nama: Nama penyedia untuk log dan statistik
+            api_endpoint: URL endpoint chat completions
+            model: Nama model di penyedia ini (tingkat besar)
+            api_key: API key (boleh kosong untuk server lokal)
+            batas_waktu_detik: Timeout permintaan
+            model_cepat: Model kecil untuk tingkat cepat (None = pakai model)
+        """
+        self.nama = nama
+        self.api_endpoint = api_endpoint
+        self.model = model
+        self.model_cepat = model_cepat
+        self._api_key = api_key
+        self.batas_waktu_detik = batas_waktu_detik
+        # Dibuat per worker lewat buka() (setelah fork), bukan saat impor
+        self._klien: Optional[httpx.AsyncClient] = None
+
+    def model_untuk(self, tingkat: str) -> str:
+        """
+        Memilih model penyedia untuk tingkat tertentu.
+
+        Parameter:
+            tingkat: TINGKAT_BESAR atau TINGKAT_CEPAT
+
+        Mengembalikan:
+            Nama model
+        """
+        if tingkat == TINGKAT_CEPAT and self.model_cepat:
+            return self.model_cepat
+        return self.model
+
+    def _header(self) -> dict[str, str]:
+        """Header permintaan (dengan otorisasi bila ada API key)."""
+        header = {"Content-Type": "application/json"}
+        if self._api_key:
+            header["Authorization"] = f"Bearer {self._api_key}"
+        return header
+
+    async def buka(self) -> None:
+        """Membuat klien HTTP bersama agar koneksi (TLS) dipakai ulang antar permintaan."""
+        if self._klien is None:
+            self._klien = httpx.AsyncClient(timeout=self.batas_waktu_detik)
+
+    async def tutup(self) -> None:
+        """Menutup klien HTTP bersama."""
+        if self._klien is not None:
+            await self._klien.aclose()
+            self._klien = None
+
+    async def panaskan(self, batas_waktu_detik: float = 5.0) -> Optional[float]:
+        """
+        Membuka koneksi ke penyedia sebelum permintaan pertama pengguna.
+
+        Mengirim GET ke endpoint daftar model (`.../models`); status apa
+        pun dianggap berhasil karena tujuannya hanya membangun koneksi.
+
+        Parameter:
+            batas_waktu_detik: Timeout pemanasan
+
+        Mengembalikan:
+            Latensi pemanasan (ms), atau None jika gagal atau klien belum dibuka
+        """
+        if self._klien is None:
+            return None
+        url_model = self.api_endpoint.rsplit("/chat/completions", 1)[0] + "/models"
+        mulai = time.perf_counter()
+        try:
+            await self._klien.get(url_model, headers=self._header(), timeout=batas_waktu_detik)
+        except httpx.HTTPError as e:
+            pencatat.warning("Pemanasan penyedia '%s' gagal: %s", self.nama, type(e).__name__)
+            return None
+        return round((time.perf_counter() - mulai) * 1000, 2)
+
+    async def kirim(
+        self,
+        payload: dict[str, Any],
+        tingkat: str = TINGKAT_BESAR,
+        batas_waktu_detik: Optional[float] = None
+    ) -> httpx.Response:
+        """
+        Mengirim permintaan chat completions ke penyedia ini.
+
+        Parameter:
+            payload: Badan permintaan; field model diganti model penyedia
+            tingkat: Tingkat model yang dipakai
+            batas_waktu_detik: Timeout permintaan ini (None = batas_waktu_detik penyedia)
+
+        Mengembalikan:
+            Respons HTTP apa adanya (status apa pun)
+
+        Pengecualian:
+            httpx.HTTPError: Jika terjadi kesalahan jaringan atau timeout
+        """
+        badan = {**payload, "model": self.model_untuk(tingkat)}
+        batas_waktu = min(batas_waktu_detik or self.batas_waktu_detik, self.batas_waktu_detik)
+        if self._klien is not None:
+            return await self._klien.post(
+                self.api_endpoint, headers=self._header(), json=badan, timeout=batas_waktu
+            )
+
+        # Tanpa buka() (mis. skrip atau pengujian): klien sekali pakai
+        async with httpx.AsyncClient(timeout=batas_waktu) as client:
+            return await client.post(self.api_endpoint, headers=self._header(), json=badan)
+
+
+class StatistikPenyedia:
+    """Statistik latensi dan galat bergulir untuk satu penyedia."""
+
+    def __init__(self, ukuran_jendela: int = 50, jendela_detik: float = 300.0):
+        """
+        Inisialisasi statistik.
+
+        Parameter:
+            ukuran_jendela: Jumlah sampel terakhir yang disimpan
+            jendela_detik: Umur maksimal sampel yang diperhitungkan
+        """
+        self._sampel: deque[tuple[float, float, bool]] = deque(maxlen=ukuran_jendela)
+        self._jendela_detik = jendela_detik
+
+    def catat(self, latensi_ms: float, sukses: bool) -> None:
+        """
+        Mencatat hasil satu panggilan.
+
+        Parameter:
+            latensi_ms: Latensi panggilan
+            sukses: True jika penyedia menjawab dengan benar
+        """
+        self._sampel.append((time.monotonic(), latensi_ms, sukses))
+
+    def _sampel_aktif(self) -> list[tuple[float, float, bool]]:
+        """Sampel yang masih berada di dalam jendela waktu."""
+        batas = time.monotonic() - self._jendela_detik
+        return [s for s in self._sampel if s[0] >= batas]
+
+    @property
+    def jumlah(self) -> int:
+        """Jumlah sampel aktif."""
+        return len(self._sampel_aktif())
+
+    def p95_ms(self) -> Optional[float]:
+        """Persentil 95 latensi panggilan sukses (None jika belum ada)."""
+        latensi = sorted(s[1] for s in self._sampel_aktif() if s[2])
+        if not latensi:
+            return None
+        return latensi[max(math.ceil(0.95 * len(latensi)) - 1, 0)]
+
+    def laju_galat(self) -> float:
+        """Proporsi panggilan gagal di dalam jendela."""
+        sampel = self._sampel_aktif()
+        if not sampel:
+            return 0.0
+        return sum(1 for s in sampel if not s[2]) / len(sampel)
+
+
+class PengarahPenyedia:
+    """
+    Pengarah permintaan ke beberapa penyedia LLM.
+
+    Penyedia pertama adalah utama. Penyedia dianggap menurun bila p95
+    atau laju galatnya melewati ambang (dengan sampel minimum); penyedia
+    menurun dipindah ke akhir urutan sampai sampel lamanya kedaluwarsa.
+    """
+
+    def __init__(
+        self,
+        daftar_penyedia: list[PenyediaLLM],
+        ambang_p95_ms: float = 15000.0,
+        ambang_laju_galat: float = 0.5,
+        sampel_minimum: int = 5,
+        lindung_nilai_aktif: bool = False,
+        tunda_lindung_nilai_ms: float = 8000.0
+    ):
+        """
+        Inisialisasi pengarah.
+
+        Parameter:
+            daftar_penyedia: Penyedia berurutan (utama lebih dulu)
+            ambang_p95_ms: Batas p95 latensi sebelum penyedia dianggap menurun
+            ambang_laju_galat: Batas laju galat sebelum penyedia dianggap menurun
+            sampel_minimum: Jumlah sampel sebelum penilaian kesehatan berlaku
+            lindung_nilai_aktif: Kirim permintaan cadangan bila utama lambat
+            tunda_lindung_nilai_ms: Tunda minimal sebelum permintaan cadangan dikirim
+
+        Pengecualian:
+            ValueError: Jika daftar penyedia kosong
+        """
+        if not daftar_penyedia:
+            raise ValueError("Minimal satu penyedia LLM diperlukan")
+
+        self.daftar_penyedia = daftar_penyedia
+        self.statistik: dict[str, StatistikPenyedia] = {
+            p.nama: StatistikPenyedia() for p in daftar_penyedia
+        }
+        self._ambang_p95_ms = ambang_p95_ms
+        self._ambang_laju_galat = ambang_laju_galat
+        self._sampel_minimum = sampel_minimum
+        self._lindung_nilai_aktif = lindung_nilai_aktif
+        self._tunda_lindung_nilai_ms = tunda_lindung_nilai_ms
+
+    @property
+    def mendukung_tingkat_cepat(self) -> bool:
+        """True jika penyedia utama memiliki model cepat terpisah."""
+        return bool(self.daftar_penyedia[0].model_cepat)
+
+    def sehat(self, penyedia: PenyediaLLM) -> bool:
+        """
+        Menilai apakah penyedia sedang sehat.
+
+        Parameter:
+            penyedia: Penyedia yang dinilai
+
+        Mengembalikan:
+            True jika p95 dan laju galat di bawah ambang
+        """
+        statistik = self.statistik[penyedia.nama]
+        if statistik.jumlah < self._sampel_minimum:
+            return True
+        p95 = statistik.p95_ms()
+        if p95 is not None and p95 > self._ambang_p95_ms:
+            return False
+        return statistik.laju_galat() <= self._ambang_laju_galat
+
+    def urutan(self) -> list[PenyediaLLM]:
+        """Urutan penyedia yang dicoba: yang sehat lebih dulu, urutan asli dipertahankan."""
+        return sorted(self.daftar_penyedia, key=lambda p: not self.sehat(p))
+
+    def _catat(self, penyedia: PenyediaLLM, latensi_ms: float, sukses: bool) -> None:
+        """Mencatat hasil panggilan ke statistik penyedia."""
+        self.statistik[penyedia.nama].catat(latensi_ms, sukses)
+
+    async def _coba(
+        self,
+        penyedia: PenyediaLLM,
+        payload: dict[str, Any],
+        tingkat: str,
+        batas_waktu_detik: Optional[float] = None
+    ) -> tuple[PenyediaLLM, httpx.Response]:
+        """
+        Memanggil satu penyedia dan mencatat statistiknya.
+
+        Mengembalikan:
+            Tuple (penyedia, respons)
+
+        Pengecualian:
+            httpx.HTTPError: Diteruskan setelah dicatat sebagai galat
+        """
+        mulai = time.perf_counter()
+        try:
+            respons = await penyedia.kirim(payload, tingkat, batas_waktu_detik)
+        except httpx.HTTPError:
+            self._catat(penyedia, (time.perf_counter() - mulai) * 1000, sukses=False)
+            raise
+        sukses = respons.status_code not in STATUS_GAGAL_PENYEDIA
+        self._catat(penyedia, (time.perf_counter() - mulai) * 1000, sukses=sukses)
+        return penyedia, respons
+
+    def _tunda_lindung_nilai(self, penyedia: PenyediaLLM) -> float:
+        """Tunda (detik) sebelum permintaan cadangan: maks(tunda minimal, p95 utama)."""
+        p95 = self.statistik[penyedia.nama].p95_ms() or 0.0
+        return max(self._tunda_lindung_nilai_ms, p95) / 1000
+
+    @staticmethod
+    def _berhasil(tugas: asyncio.Task) -> bool:
+        """True jika tugas _coba selesai dengan respons yang bukan kegagalan penyedia."""
+        return tugas.exception() is None and tugas.result()[1].status_code not in STATUS_GAGAL_PENYEDIA
+
+    async def _kirim_lindung_nilai(
+        self,
+        utama: PenyediaLLM,
+        cadangan: PenyediaLLM,
+        payload: dict[str, Any],
+        tingkat: str,
+        batas_waktu_detik: Optional[float] = None
+    ) -> tuple[PenyediaLLM, httpx.Response, int]:
+        """
+        Mengirim ke utama, lalu ke cadangan bila utama belum menjawab.
+
+        Bila utama sudah gagal sebelum tunda lindung nilai habis,
+        cadangan langsung dikirim seperti failover biasa.
+
+        Mengembalikan:
+            Tuple (penyedia, respons, jumlah percobaan); respons sukses
+            pertama, atau respons gagal terakhir jika keduanya gagal
+
+        Pengecualian:
+            httpx.HTTPError: Jika keduanya gagal di tingkat jaringan
+        """
+        tugas_utama = asyncio.create_task(self._coba(utama, payload, tingkat, batas_waktu_detik))
+        tertunda: set[asyncio.Task] = {tugas_utama}
+        galat_terakhir: Optional[BaseException] = None
+        respons_terakhir: Optional[tuple[PenyediaLLM, httpx.Response]] = None
+        # Pemanggil dapat dibatalkan (tenggat, klien terputus) di kedua
+        # penantian; tugas yang masih berjalan selalu ikut dibatalkan
+        try:
+            selesai, tertunda = await asyncio.wait(tertunda, timeout=self._tunda_lindung_nilai(utama))
+            if selesai and self._berhasil(tugas_utama):
+                penyedia, respons = tugas_utama.result()
+                return penyedia, respons, 1
+
+            if selesai:
+                pencatat.warning("Utama '%s' gagal, langsung beralih ke '%s'", utama.nama, cadangan.nama)
+            else:
+                pencatat.info("Utama '%s' lambat, mengirim lindung nilai ke '%s'", utama.nama, cadangan.nama)
+            tugas_cadangan = asyncio.create_task(self._coba(cadangan, payload, tingkat, batas_waktu_detik))
+            tertunda = {tugas_utama, tugas_cadangan}
+
+            while tertunda:
+                selesai, tertunda = await asyncio.wait(tertunda, return_when=asyncio.FIRST_COMPLETED)
+                for tugas in selesai:
+                    if tugas.exception() is not None:
+                        galat_terakhir = tugas.exception()
+                        continue
+                    penyedia, respons = tugas.result()
+                    if respons.status_code not in STATUS_GAGAL_PENYEDIA:
+                        return penyedia, respons, 2
+                    respons_terakhir = (penyedia, respons)
+        finally:
+            for tugas in tertunda:
+                tugas.cancel()
+            await asyncio.gather(*tertunda, return_exceptions=True)
+
+        if respons_terakhir is not None:
+            penyedia, respons = respons_terakhir
+            return penyedia, respons, 2
+        assert galat_terakhir is not None
+        raise galat_terakhir
+
+    async def kirim(
+        self,
+        payload: dict[str, Any],
+        tingkat: str = TINGKAT_BESAR,
+        batas_waktu_detik: Optional[float] = None
+    ) -> tuple[httpx.Response, PenyediaLLM, int]:
+        """
+        Mengirim permintaan dengan failover antar penyedia.
+
+        Parameter:
+            payload: Badan permintaan chat completions
+            tingkat: Tingkat model (TINGKAT_BESAR atau TINGKAT_CEPAT)
+            batas_waktu_detik: Timeout per percobaan (mis. sisa tenggat permintaan)
+
+        Mengembalikan:
+            Tuple (respons, penyedia yang menjawab, jumlah percobaan)
+
+        Pengecualian:
+            httpx.HTTPError: Jika semua penyedia gagal di tingkat jaringan
+        """
+        urutan = self.urutan()
+        percobaan = 0
+        galat_terakhir: Optional[httpx.HTTPError] = None
+        respons_terakhir: Optional[tuple[httpx.Response, PenyediaLLM]] = None
+
+        if self._lindung_nilai_aktif and len(urutan) > 1:
+            try:
+                penyedia, respons, percobaan = await self._kirim_lindung_nilai(
+                    urutan[0], urutan[1], payload, tingkat, batas_waktu_detik
+                )
+            except httpx.HTTPError as e:
+                pencatat.warning(
+                    "Penyedia '%s' dan '%s' gagal: %s", urutan[0].nama, urutan[1].nama, type(e).__name__
+                )
+                galat_terakhir = e
+                percobaan = 2
+            else:
+                if respons.status_code not in STATUS_GAGAL_PENYEDIA:
+                    return respons, penyedia, percobaan
+                respons_terakhir = (respons, penyedia)
+            urutan = urutan[2:]
+
+        for penyedia in urutan:
+            percobaan += 1
+            try:
+                _, respons = await self._coba(penyedia, payload, tingkat, batas_waktu_detik)
+            except httpx.HTTPError as e:
+                pencatat.warning("Penyedia '%s' gagal: %s", penyedia.nama, type(e).__name__)
+                galat_terakhir = e
+                continue
+
+            if respons.status_code in STATUS_GAGAL_PENYEDIA:
+                pencatat.warning("Penyedia '%s' menjawab status %s", penyedia.nama, respons.status_code)
+                respons_terakhir = (respons, penyedia)
+                continue
+            return respons, penyedia, percobaan
+
+        if respons_terakhir is not None:
+            respons, penyedia = respons_terakhir
+            return respons, penyedia, percobaan
+        if galat_terakhir is not None:
+            raise galat_terakhir
+        raise httpx.TransportError("Tidak ada penyedia LLM yang dapat dihubungi")
+
+    async def buka(self) -> None:
+        """Membuat klien HTTP bersama untuk setiap penyedia."""
+        for penyedia in self.daftar_penyedia:
+            await penyedia.buka()
+
+    async def tutup(self) -> None:
+        """Menutup klien HTTP bersama setiap penyedia."""
+        for penyedia in self.daftar_penyedia:
+            await penyedia.tutup()
+
+    async def panaskan(self) -> dict[str, Optional[float]]:
+        """
+        Memanaskan koneksi ke semua penyedia secara paralel.
+
+        Mengembalikan:
+            Dictionary nama penyedia -> latensi pemanasan (ms) atau None
+        """
+        hasil = await asyncio.gather(*(penyedia.panaskan() for penyedia in self.daftar_penyedia))
+        return {penyedia.nama: latensi for penyedia, latensi in zip(self.daftar_penyedia, hasil)}
+
+    def status(self) -> list[dict[str, Any]]:
+        """
+        Ringkasan kesehatan setiap penyedia.
+
+        Mengembalikan:
+            List dictionary berisi nama, model, p95, laju galat, dan status sehat
+        """
+        return [
+            {
+                "nama": p.nama,
+                "model": p.model,
+                "model_cepat": p.model_cepat,
+                "sampel": self.statistik[p.nama].jumlah,
+                "p95_ms": round(self.statistik[p.nama].p95_ms() or 0.0, 1),
+                "laju_galat": round(self.statistik[p.nama].laju_galat(), 3),
+                "sehat": self.sehat(p)
+            }
+            for p in self.daftar_penyedia
+        ]
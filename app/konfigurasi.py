@@ -15,10 +15,80 @@ class Pengaturan(BaseSettings):
     groq_api_key: str = ""
     groq_api_endpoint: str = "https://api.groq.com/openai/v1/chat/completions"
     groq_model: str = "llama-3.3-70b-versatile"
+    groq_model_cepat: str = "llama-3.1-8b-instant"  # kosong = selalu model besar
+    ambang_karakter_cepat: int = 6000  # 0 = hanya mode cepat yang memakai model kecil
+    jumlah_sampel_konsisten: int = 3
+    toleransi_sampel_konsisten: int = 2  # selisih skor per aspek yang dianggap sepakat
+
+    # Penyedia LLM cadangan (endpoint kompatibel OpenAI, mis. llama.cpp/Ollama)
+    llm_cadangan_endpoint: str = ""
+    llm_cadangan_api_key: str = ""
+    llm_cadangan_model: str = ""
+
+    # Pengaturan Pengarah Penyedia LLM
+    ambang_p95_penyedia_ms: float = 15000.0
+    ambang_laju_galat_penyedia: float = 0.5
+    lindung_nilai_aktif: bool = False
+    tunda_lindung_nilai_ms: float = 8000.0
+    pemanasan_penyedia_aktif: bool = True
+
+    # Pengaturan Keluaran LLM
+    mode_keluaran_llm: str = "json_object"
+    maks_item_daftar: int = 5
+    maks_karakter_butir: int = 160
+    maks_karakter_ringkasan: int = 600
+    maks_token_keluaran: int = 0  # 0 = dihitung otomatis dari batas per field
+    laju_token_keluaran_per_detik: float = 100.0  # untuk memangkas max_tokens ke sisa tenggat
 
     # Pengaturan Aplikasi
     ukuran_maks_berkas_mb: int = 10
+    normalisasi_teks_aktif: bool = True
+    mesin_pdf: str = "otomatis"  # otomatis, pypdfium2, pypdf, atau pdfminer
+    inspeksi_awal_aktif: bool = True
+    maks_halaman_dokumen: int = 300  # 0 = tanpa batas
+    deteksi_duplikat_aktif: bool = True
+    ambang_duplikat: float = 0.8
+    ambang_pakai_ulang_duplikat: float = 0.0  # 0 = hasil lama tidak dipakai ulang
+    # Ditambah MAKS_TUNGGU_ANTREAN_DETIK harus <= proxy_read_timeout nginx (60 s); 0 = tanpa batas
+    tenggat_review_detik: float = 50.0
     mode_debug: bool = False
+    ukuran_min_kompresi_byte: int = 1000  # respons lebih kecil tidak di-gzip; 0 = tanpa kompresi
+
+    # Pengaturan Kontrol Penerimaan Review
+    maks_review_aktif_per_worker: int = 4
+    maks_antrean_review: int = 8
+    maks_tunggu_antrean_detik: float = 10.0
+    maks_byte_tertunda_mb: int = 40
+    maks_review_aktif_global: int = 0  # 0 = tanpa batas lintas worker
+    maks_byte_tertunda_global_mb: int = 0  # 0 = tanpa batas lintas worker
+    direktori_slot_review: str = "data/slot_review"
+    # Harus lebih kecil dari --graceful-timeout gunicorn dan TimeoutStopSec systemd
+    batas_kuras_detik: float = 60.0
+
+    # Pengaturan Memori Worker
+    tracemalloc_aktif: bool = False  # akuntansi alokasi per tahap; memperlambat alokasi
+    batas_rss_mb: int = 0  # worker didaur ulang (SIGTERM) bila RSS melewati batas; 0 = nonaktif
+
+    # Pengaturan Penjadwal Panggilan LLM
+    maks_llm_bersamaan_per_worker: int = 2
+    batas_penuaan_antrean_detik: float = 30.0
+
+    # Pengaturan Pelacakan (tracing)
+    jejak_aktif: bool = False
+    jalur_berkas_jejak: str = "data/jejak.jsonl"
+
+    # Pengaturan Profiling (aktif untuk mode_debug atau header X-Profil berisi rahasia)
+    rahasia_profil: str = ""
+    ambang_profil_ms: float = 5000.0
+    direktori_profil: str = "data/profil"
+    maks_profil: int = 20
+    maks_profil_mb: int = 50
+
+    # Pengaturan Logging
+    level_log: str = "INFO"
+    level_log_modul: str = ""  # mis. "httpx=WARNING,app.layanan.penjadwal=DEBUG"
+    format_log: str = "json"  # json atau teks
+    sampel_log_debug: int = 10  # catat 1 dari N record DEBUG per baris; 1 = semua
 
     class Config:
         """Konfigurasi untuk Pydantic."""
@@ -0,0 +1,149 @@
+"""
+Modul validasi cache HTTP.
+
+Berisi pembuatan ETag dari penghitung perubahan riwayat, pencocokan
+If-None-Match / If-Modified-Since, dan URL aset statis bersidik isi
+agar aset dapat di-cache tanpa batas waktu.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+# Respons API boleh disimpan browser, tetapi selalu divalidasi ulang
+CACHE_CONTROL_API = "no-cache"
+# Aset dengan sidik isi di URL tidak pernah berubah
+CACHE_CONTROL_ASET_BERSIDIK = "public, max-age=31536000, immutable"
+PARAMETER_SIDIK = "v"
+
+
+def buat_etag(*bagian: object) -> str:
+    """
+    Membuat ETag lemah dari bagian-bagian kunci.
+
+    ETag lemah dipakai karena body yang sama dapat dikirim terkompresi
+    atau tidak (GZipMiddleware).
+
+    Parameter:
+        bagian: Nilai yang menentukan isi respons (versi riwayat, parameter)
+
+    Mengembalikan:
+        ETag, mis. W/"3f2a..."
+    """
+    sidik = hashlib.sha1("|".join(map(str, bagian)).encode()).hexdigest()[:20]
+    return f'W/"{sidik}"'
+
+
+def etag_cocok(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Memeriksa header If-None-Match dengan perbandingan lemah.
+
+    Parameter:
+        if_none_match: Nilai header If-None-Match (boleh None)
+        etag: ETag respons saat ini
+
+    Mengembalikan:
+        True jika klien sudah memiliki representasi terbaru
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tanpa_awalan = etag.removeprefix("W/")
+    return any(
+        calon.strip().removeprefix("W/") == tanpa_awalan
+        for calon in if_none_match.split(",")
+    )
+
+
+def format_waktu_http(waktu_sqlite: str) -> str:
+    """
+    Mengubah CURRENT_TIMESTAMP SQLite (UTC) ke format tanggal HTTP.
+
+    Parameter:
+        waktu_sqlite: Waktu berformat "YYYY-MM-DD HH:MM:SS"
+
+    Mengembalikan:
+        Tanggal HTTP, mis. "Mon, 19 Oct 2026 10:00:00 GMT"
+    """
+    waktu = datetime.strptime(waktu_sqlite, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    return format_datetime(waktu, usegmt=True)
+
+
+def waktu_http_stabil(waktu_sqlite: str, sekarang: Optional[datetime] = None) -> Optional[str]:
+    """
+    Membuat Last-Modified hanya bila detik perubahannya sudah lewat.
+
+    CURRENT_TIMESTAMP SQLite beresolusi satu detik. Perubahan kedua pada
+    detik yang sama tidak mengubah Last-Modified, sehingga klien yang
+    hanya mengirim If-Modified-Since akan menerima 304 yang basi. Selama
+    detik itu belum lewat, validasi cukup lewat ETag.
+
+    Parameter:
+        waktu_sqlite: Waktu perubahan terakhir berformat "YYYY-MM-DD HH:MM:SS" (UTC)
+        sekarang: Waktu saat ini (None = jam sistem)
+
+    Mengembalikan:
+        Tanggal HTTP, atau None bila perubahan terjadi pada detik ini
+    """
+    waktu = datetime.strptime(waktu_sqlite, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    sekarang = sekarang or datetime.now(timezone.utc)
+    if waktu >= sekarang.replace(microsecond=0):
+        return None
+    return format_datetime(waktu, usegmt=True)
+
+
+def belum_diubah_sejak(if_modified_since: Optional[str], last_modified: str) -> bool:
+    """
+    Memeriksa header If-Modified-Since terhadap Last-Modified.
+
+    Parameter:
+        if_modified_since: Nilai header If-Modified-Since (boleh None)
+        last_modified: Last-Modified respons saat ini (tanggal HTTP)
+
+    Mengembalikan:
+        True jika sumber tidak berubah sejak waktu yang dikirim klien
+    """
+    if not if_modified_since:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+class PetaAset:
+    """URL aset statis dengan sidik isi berkas sebagai parameter versi."""
+
+    def __init__(self, direktori: Path, prefiks_url: str = "/statis"):
+        """
+        Inisialisasi peta aset.
+
+        Parameter:
+            direktori: Direktori aset statis
+            prefiks_url: Prefiks URL tempat direktori dipasang
+        """
+        self.direktori = direktori
+        self.prefiks_url = prefiks_url.rstrip("/")
+        self._sidik: dict[str, str] = {}
+
+    def url(self, jalur: str) -> str:
+        """
+        Membuat URL aset bersidik isi.
+
+        Sidik dihitung sekali per proses; aset berubah hanya saat deploy,
+        yang selalu me-restart worker.
+
+        Parameter:
+            jalur: Jalur relatif terhadap direktori aset, mis. "css/gaya_utama.css"
+
+        Mengembalikan:
+            URL, mis. "/statis/css/gaya_utama.css?v=1a2b3c4d5e6f"
+        """
+        sidik = self._sidik.get(jalur)
+        if sidik is None:
+            sidik = hashlib.sha256((self.direktori / jalur).read_bytes()).hexdigest()[:12]
+            self._sidik[jalur] = sidik
+        return f"{self.prefiks_url}/{jalur}?{PARAMETER_SIDIK}={sidik}"
@@ -6,12 +6,20 @@ Menggunakan SQLite untuk penyimpanan lokal.
 
 import json
 import logging
+import math
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from app.skema.model import HasilEvaluasi, JenisProposal
+from app.layanan.indeks_duplikat import (
+    bytes_ke_tanda,
+    kunci_pita,
+    perkirakan_kemiripan,
+    tanda_ke_bytes,
+)
+from app.layanan.pelacakan import dilacak
+from app.skema.model import HasilEvaluasi, JenisProposal, PenggunaanLLM
 
 pencatat = logging.getLogger(__name__)
 
@@ -19,19 +27,86 @@ pencatat = logging.getLogger(__name__)
 class DatabaseRiwayat:
     """Database untuk menyimpan riwayat review proposal."""
 
-    def __init__(self, jalur_db: str = "data/riwayat_review.db"):
+    # Kolom tambahan yang ditambahkan lewat migrasi (nama, definisi SQL).
+    # Tambahkan kolom baru di akhir daftar; jangan ubah urutan yang ada.
+    KOLOM_MIGRASI: list[tuple[str, str]] = [
+        ("model", "TEXT"),
+        ("token_prompt", "INTEGER"),
+        ("token_penyelesaian", "INTEGER"),
+        ("token_total", "INTEGER"),
+        ("waktu_antrean_detik", "REAL"),
+        ("waktu_total_detik", "REAL"),
+        ("latensi_ms", "REAL"),
+    ]
+
+    # Versi migrasi data (PRAGMA user_version); migrasi data berjalan sekali
+    # per database, berbeda dengan penambahan kolom yang idempoten
+    VERSI_SKEMA = 1
+
+    # Checkpoint review yang terputus saat worker dikuras disimpan selama ini
+    UMUR_MAKS_CHECKPOINT_JAM = 24
+
+    # Satu baris riwayat_review sebagai objek JSON, disusun oleh SQLite.
+    # Kolom JSON disisipkan lewat json() tanpa diurai di Python.
+    # Bentuknya harus sama dengan _baris_ke_dict.
+    SQL_BARIS_JSON = """
+        json_object(
+            'id', id,
+            'nama_berkas', nama_berkas,
+            'jenis_proposal', jenis_proposal,
+            'skor', skor,
+            'detail_skor', json(detail_skor),
+            'daftar_kekuatan', json(daftar_kekuatan),
+            'daftar_kelemahan', json(daftar_kelemahan),
+            'daftar_saran', json(daftar_saran),
+            'ringkasan', ringkasan,
+            'tanggal_review', tanggal_review,
+            'ukuran_berkas', ukuran_berkas,
+            'penggunaan', json_object(
+                'model', model,
+                'token_prompt', token_prompt,
+                'token_penyelesaian', token_penyelesaian,
+                'token_total', token_total,
+                'waktu_antrean_detik', waktu_antrean_detik,
+                'waktu_total_detik', waktu_total_detik,
+                'latensi_ms', latensi_ms
+            )
+        )
+    """
+
+    def __init__(self, jalur_db: str = "data/riwayat_review.db", siapkan: bool = True):
         """
         Inisialisasi database.
 
         Parameter:
             jalur_db: Path ke file database SQLite
+            siapkan: Buat direktori dan tabel sekarang; False menundanya ke
+                siapkan() atau kueri pertama (aman untuk impor sebelum fork)
         """
-        # Pastikan direktori data ada
-        Path(jalur_db).parent.mkdir(parents=True, exist_ok=True)
-        
         self.jalur_db = jalur_db
+        self._siap = False
+        if siapkan:
+            self.siapkan()
+
+    def siapkan(self):
+        """Membuat direktori data dan tabel bila belum (idempoten)."""
+        if self._siap:
+            return
+        # Pastikan direktori data ada
+        Path(self.jalur_db).parent.mkdir(parents=True, exist_ok=True)
         self._buat_tabel()
-        pencatat.info(f"Database riwayat diinisialisasi: {jalur_db}")
+        self._siap = True
+        pencatat.info("Database riwayat diinisialisasi: %s", self.jalur_db)
+
+    def _sambung(self) -> sqlite3.Connection:
+        """
+        Membuka koneksi baru; skema disiapkan dulu bila belum.
+
+        Koneksi tidak disimpan di objek sehingga tidak pernah diwarisi
+        proses anak setelah fork.
+        """
+        self.siapkan()
+        return sqlite3.connect(self.jalur_db)
 
     def _buat_tabel(self):
         """Membuat tabel jika belum ada."""
@@ -52,15 +127,164 @@ class DatabaseRiwayat:
                     ukuran_berkas INTEGER
                 )
             """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS versi_proposal (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kunci_proposal TEXT NOT NULL,
+                    versi INTEGER NOT NULL,
+                    review_id INTEGER NOT NULL,
+                    sidik_bagian TEXT NOT NULL,
+                    tanggal TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (kunci_proposal, versi)
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS minhash_review (
+                    review_id INTEGER PRIMARY KEY,
+                    tanda BLOB NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS lsh_review (
+                    pita INTEGER NOT NULL,
+                    kunci INTEGER NOT NULL,
+                    review_id INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lsh_pita_kunci
+                ON lsh_review (pita, kunci)
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS checkpoint_review (
+                    id TEXT PRIMARY KEY,
+                    nama_berkas TEXT NOT NULL,
+                    teks TEXT NOT NULL,
+                    ukuran_berkas INTEGER,
+                    dibuat_pada TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            self._migrasi_skema(conn)
+            self._buat_penghitung_perubahan(conn)
             conn.commit()
             pencatat.info("Tabel riwayat_review siap")
 
+    @staticmethod
+    def _buat_penghitung_perubahan(conn: sqlite3.Connection):
+        """
+        Membuat penghitung perubahan riwayat_review beserta trigger-nya.
+
+        Penghitung dinaikkan oleh SQLite pada setiap INSERT, UPDATE, dan
+        DELETE, sehingga perubahan dari worker mana pun ikut terhitung.
+
+        Parameter:
+            conn: Koneksi SQLite yang sedang terbuka
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS penghitung_perubahan (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                versi INTEGER NOT NULL,
+                diubah_pada TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("INSERT OR IGNORE INTO penghitung_perubahan (id, versi) VALUES (1, 0)")
+        for peristiwa in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_riwayat_{peristiwa.lower()}
+                AFTER {peristiwa} ON riwayat_review
+                BEGIN
+                    UPDATE penghitung_perubahan
+                    SET versi = versi + 1, diubah_pada = CURRENT_TIMESTAMP
+                    WHERE id = 1;
+                END
+            """)
+
+    def _migrasi_skema(self, conn: sqlite3.Connection):
+        """
+        Menambahkan kolom yang belum ada pada tabel lama, lalu menjalankan
+        migrasi data yang belum tercatat di PRAGMA user_version.
+
+        Parameter:
+            conn: Koneksi SQLite yang sedang terbuka
+        """
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(riwayat_review)")
+        kolom_ada = {row[1] for row in cursor.fetchall()}
+
+        for nama_kolom, definisi in self.KOLOM_MIGRASI:
+            if nama_kolom not in kolom_ada:
+                cursor.execute(
+                    f"ALTER TABLE riwayat_review ADD COLUMN {nama_kolom} {definisi}"
+                )
+                pencatat.info("Migrasi: kolom %s ditambahkan", nama_kolom)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_riwayat_latensi
+            ON riwayat_review (latensi_ms)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_riwayat_jenis_latensi
+            ON riwayat_review (jenis_proposal, latensi_ms)
+        """)
+
+        cursor.execute("PRAGMA user_version")
+        versi = cursor.fetchone()[0]
+        if versi < 1:
+            # Review tanpa panggilan LLM (pakai ulang duplikat, revisi tanpa
+            # perubahan) dulu disimpan dengan token 0; tokennya tidak diketahui
+            cursor.execute("""
+                UPDATE riwayat_review
+                SET token_prompt = NULL, token_penyelesaian = NULL, token_total = NULL
+                WHERE token_total = 0
+            """)
+            if cursor.rowcount > 0:
+                pencatat.info("Migrasi: %s review tanpa panggilan LLM diberi token NULL", cursor.rowcount)
+        if versi < self.VERSI_SKEMA:
+            cursor.execute(f"PRAGMA user_version = {self.VERSI_SKEMA}")
+
+    @staticmethod
+    def _baris_ke_dict(row: sqlite3.Row) -> dict:
+        """
+        Mengubah baris riwayat_review menjadi dictionary.
+
+        Parameter:
+            row: Baris hasil query
+
+        Mengembalikan:
+            Dictionary berisi data review
+        """
+        return {
+            "id": row["id"],
+            "nama_berkas": row["nama_berkas"],
+            "jenis_proposal": row["jenis_proposal"],
+            "skor": row["skor"],
+            "detail_skor": json.loads(row["detail_skor"]),
+            "daftar_kekuatan": json.loads(row["daftar_kekuatan"]),
+            "daftar_kelemahan": json.loads(row["daftar_kelemahan"]),
+            "daftar_saran": json.loads(row["daftar_saran"]),
+            "ringkasan": row["ringkasan"],
+            "tanggal_review": row["tanggal_review"],
+            "ukuran_berkas": row["ukuran_berkas"],
+            "penggunaan": {
+                "model": row["model"],
+                "token_prompt": row["token_prompt"],
+                "token_penyelesaian": row["token_penyelesaian"],
+                "token_total": row["token_total"],
+                "waktu_antrean_detik": row["waktu_antrean_detik"],
+                "waktu_total_detik": row["waktu_total_detik"],
+                "latensi_ms": row["latensi_ms"]
+            }
+        }
+
+    @dilacak("db.simpan_review")
     def simpan_review(
         self,
         nama_berkas: str,
         jenis_proposal: str,
         hasil: HasilEvaluasi,
-        ukuran_berkas: Optional[int] = None
+        ukuran_berkas: Optional[int] = None,
+        penggunaan: Optional[PenggunaanLLM] = None
     ) -> int:
         """
         Menyimpan hasil review ke database.
@@ -70,11 +294,13 @@ class DatabaseRiwayat:
             jenis_proposal: Jenis proposal (pkm/skripsi/hibah)
             hasil: Hasil evaluasi
             ukuran_berkas: Ukuran file dalam bytes
+            penggunaan: Penggunaan token dan latensi LLM (opsional)
 
         Mengembalikan:
             ID review yang baru disimpan
         """
-        with sqlite3.connect(self.jalur_db) as conn:
+        penggunaan = penggunaan or PenggunaanLLM()
+        with self._sambung() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO riwayat_review (
@@ -86,24 +312,173 @@ class DatabaseRiwayat:
                     daftar_kelemahan,
                     daftar_saran,
                     ringkasan,
-                    ukuran_berkas
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ukuran_berkas,
+                    model,
+                    token_prompt,
+                    token_penyelesaian,
+                    token_total,
+                    waktu_antrean_detik,
+                    waktu_total_detik,
+                    latensi_ms
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 nama_berkas,
                 jenis_proposal,
                 hasil.skor,
-                json.dumps(hasil.detail_skor if hasattr(hasil, 'detail_skor') else {}),
+                json.dumps(hasil.detail_skor.model_dump() if hasil.detail_skor else {}),
                 json.dumps(hasil.daftar_kekuatan),
                 json.dumps(hasil.daftar_kelemahan),
                 json.dumps(hasil.daftar_saran),
                 hasil.ringkasan,
-                ukuran_berkas
+                ukuran_berkas,
+                penggunaan.model,
+                penggunaan.token_prompt,
+                penggunaan.token_penyelesaian,
+                penggunaan.token_total,
+                penggunaan.waktu_antrean_detik,
+                penggunaan.waktu_total_detik,
+                penggunaan.latensi_ms
             ))
             conn.commit()
             review_id = cursor.lastrowid
-            pencatat.info(f"Review disimpan dengan ID: {review_id}")
+            pencatat.info("Review disimpan dengan ID: %s", review_id)
             return review_id # pyright: ignore[reportReturnType]
 
+    @dilacak("db.simpan_versi_proposal")
+    def simpan_versi_proposal(
+        self,
+        kunci_proposal: str,
+        review_id: int,
+        sidik_bagian: dict[str, str]
+    ) -> int:
+        """
+        Mencatat review sebagai versi berikutnya dari sebuah proposal.
+
+        Parameter:
+            kunci_proposal: Kunci yang menghubungkan revisi proposal yang sama
+            review_id: ID review untuk versi ini
+            sidik_bagian: Sidik (hash) tiap bagian proposal
+
+        Mengembalikan:
+            Nomor versi yang baru disimpan
+        """
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO versi_proposal (kunci_proposal, versi, review_id, sidik_bagian)
+                SELECT ?, COALESCE(MAX(versi), 0) + 1, ?, ?
+                FROM versi_proposal WHERE kunci_proposal = ?
+            """, (kunci_proposal, review_id, json.dumps(sidik_bagian), kunci_proposal))
+            conn.commit()
+            cursor.execute("SELECT versi FROM versi_proposal WHERE id = ?", (cursor.lastrowid,))
+            versi = cursor.fetchone()[0]
+            pencatat.info("Proposal '%s' versi %s -> review ID %s", kunci_proposal, versi, review_id)
+            return versi
+
+    @dilacak("db.ambil_versi_terakhir")
+    def ambil_versi_terakhir(self, kunci_proposal: str) -> Optional[dict]:
+        """
+        Mengambil versi terakhir sebuah proposal beserta review-nya.
+
+        Versi yang review-nya sudah dihapus dilewati.
+
+        Parameter:
+            kunci_proposal: Kunci proposal
+
+        Mengembalikan:
+            Dictionary berisi versi, review_id, sidik_bagian, dan review; atau None
+        """
+        with self._sambung() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT v.versi, v.review_id, v.sidik_bagian, r.*
+                FROM versi_proposal v
+                JOIN riwayat_review r ON r.id = v.review_id
+                WHERE v.kunci_proposal = ?
+                ORDER BY v.versi DESC
+                LIMIT 1
+            """, (kunci_proposal,))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {
+                "versi": row["versi"],
+                "review_id": row["review_id"],
+                "sidik_bagian": json.loads(row["sidik_bagian"]),
+                "review": self._baris_ke_dict(row)
+            }
+
+    @dilacak("db.simpan_tanda_minhash")
+    def simpan_tanda_minhash(self, review_id: int, tanda: list[int]):
+        """
+        Menyimpan tanda MinHash sebuah review beserta kunci pita LSH-nya.
+
+        Parameter:
+            review_id: ID review
+            tanda: Tanda MinHash teks proposal
+        """
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO minhash_review (review_id, tanda) VALUES (?, ?)
+            """, (review_id, tanda_ke_bytes(tanda)))
+            cursor.execute("DELETE FROM lsh_review WHERE review_id = ?", (review_id,))
+            cursor.executemany("""
+                INSERT INTO lsh_review (pita, kunci, review_id) VALUES (?, ?, ?)
+            """, [(pita, kunci, review_id) for pita, kunci in enumerate(kunci_pita(tanda))])
+            conn.commit()
+
+    @dilacak("db.cari_review_mirip")
+    def cari_review_mirip(
+        self,
+        tanda: list[int],
+        ambang: float,
+        limit: int = 5
+    ) -> List[dict]:
+        """
+        Mencari review lama yang teksnya hampir identik.
+
+        Kandidat diambil dari indeks pita LSH, lalu kemiripannya
+        diperkirakan dari tanda MinHash yang tersimpan.
+
+        Parameter:
+            tanda: Tanda MinHash teks proposal baru
+            ambang: Kemiripan minimal (0-1)
+            limit: Jumlah maksimal hasil
+
+        Mengembalikan:
+            List dictionary berisi review_id, nama_berkas, jenis_proposal,
+            dan kemiripan; urut dari yang paling mirip
+        """
+        daftar_pita = list(enumerate(kunci_pita(tanda)))
+        nilai = ", ".join(["(?, ?)"] * len(daftar_pita))
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                WITH dicari (pita, kunci) AS (VALUES {nilai})
+                SELECT DISTINCT r.id, r.nama_berkas, r.jenis_proposal, m.tanda
+                FROM dicari d
+                JOIN lsh_review l ON l.pita = d.pita AND l.kunci = d.kunci
+                JOIN minhash_review m ON m.review_id = l.review_id
+                JOIN riwayat_review r ON r.id = l.review_id
+            """, [bagian for pasangan in daftar_pita for bagian in pasangan])
+
+            hasil = []
+            for review_id, nama_berkas, jenis_proposal, tanda_lama in cursor.fetchall():
+                kemiripan = perkirakan_kemiripan(tanda, bytes_ke_tanda(tanda_lama))
+                if kemiripan >= ambang:
+                    hasil.append({
+                        "review_id": review_id,
+                        "nama_berkas": nama_berkas,
+                        "jenis_proposal": jenis_proposal,
+                        "kemiripan": kemiripan
+                    })
+        hasil.sort(key=lambda item: (-item["kemiripan"], -item["review_id"]))
+        return hasil[:limit]
+
+    @dilacak("db.ambil_semua_riwayat")
     def ambil_semua_riwayat(
         self,
         limit: int = 50,
@@ -119,7 +494,7 @@ class DatabaseRiwayat:
         Mengembalikan:
             List dictionary berisi riwayat review
         """
-        with sqlite3.connect(self.jalur_db) as conn:
+        with self._sambung() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -128,24 +503,53 @@ class DatabaseRiwayat:
                 LIMIT ? OFFSET ?
             """, (limit, offset))
             
-            hasil = []
-            for row in cursor.fetchall():
-                hasil.append({
-                    "id": row["id"],
-                    "nama_berkas": row["nama_berkas"],
-                    "jenis_proposal": row["jenis_proposal"],
-                    "skor": row["skor"],
-                    "detail_skor": json.loads(row["detail_skor"]),
-                    "daftar_kekuatan": json.loads(row["daftar_kekuatan"]),
-                    "daftar_kelemahan": json.loads(row["daftar_kelemahan"]),
-                    "daftar_saran": json.loads(row["daftar_saran"]),
-                    "ringkasan": row["ringkasan"],
-                    "tanggal_review": row["tanggal_review"],
-                    "ukuran_berkas": row["ukuran_berkas"]
-                })
-            
-            return hasil
+            return [self._baris_ke_dict(row) for row in cursor.fetchall()]
+
+    @dilacak("db.ambil_riwayat_json")
+    def ambil_riwayat_json(self, limit: int = 50, offset: int = 0) -> str:
+        """
+        Mengambil satu halaman riwayat sebagai array JSON siap kirim.
+
+        Isinya sama dengan ambil_semua_riwayat, tetapi setiap baris sudah
+        diserialisasi oleh SQLite. Endpoint dapat meneruskannya apa adanya
+        (JsonMentah).
+
+        Parameter:
+            limit: Jumlah maksimal record
+            offset: Offset untuk pagination
+
+        Mengembalikan:
+            Teks array JSON berisi riwayat review
+        """
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self.SQL_BARIS_JSON} FROM riwayat_review
+                ORDER BY tanggal_review DESC
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+            return "[" + ",".join(baris for (baris,) in cursor.fetchall()) + "]"
+
+    @dilacak("db.ambil_review_json")
+    def ambil_review_json(self, review_id: int) -> Optional[str]:
+        """
+        Mengambil review berdasarkan ID sebagai objek JSON siap kirim.
+
+        Parameter:
+            review_id: ID review
 
+        Mengembalikan:
+            Teks objek JSON berisi data review atau None
+        """
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self.SQL_BARIS_JSON} FROM riwayat_review WHERE id = ?
+            """, (review_id,))
+            baris = cursor.fetchone()
+            return baris[0] if baris else None
+
+    @dilacak("db.ambil_review_berdasarkan_id")
     def ambil_review_berdasarkan_id(self, review_id: int) -> Optional[dict]:
         """
         Mengambil review berdasarkan ID.
@@ -156,7 +560,7 @@ class DatabaseRiwayat:
         Mengembalikan:
             Dictionary berisi data review atau None
         """
-        with sqlite3.connect(self.jalur_db) as conn:
+        with self._sambung() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -165,21 +569,10 @@ class DatabaseRiwayat:
             
             row = cursor.fetchone()
             if row:
-                return {
-                    "id": row["id"],
-                    "nama_berkas": row["nama_berkas"],
-                    "jenis_proposal": row["jenis_proposal"],
-                    "skor": row["skor"],
-                    "detail_skor": json.loads(row["detail_skor"]),
-                    "daftar_kekuatan": json.loads(row["daftar_kekuatan"]),
-                    "daftar_kelemahan": json.loads(row["daftar_kelemahan"]),
-                    "daftar_saran": json.loads(row["daftar_saran"]),
-                    "ringkasan": row["ringkasan"],
-                    "tanggal_review": row["tanggal_review"],
-                    "ukuran_berkas": row["ukuran_berkas"]
-                }
+                return self._baris_ke_dict(row)
             return None
 
+    @dilacak("db.hapus_review")
     def hapus_review(self, review_id: int) -> bool:
         """
         Menghapus review berdasarkan ID.
@@ -190,17 +583,104 @@ class DatabaseRiwayat:
         Mengembalikan:
             True jika berhasil dihapus
         """
-        with sqlite3.connect(self.jalur_db) as conn:
+        with self._sambung() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM riwayat_review WHERE id = ?
             """, (review_id,))
-            conn.commit()
             berhasil = cursor.rowcount > 0
+            cursor.execute("DELETE FROM minhash_review WHERE review_id = ?", (review_id,))
+            cursor.execute("DELETE FROM lsh_review WHERE review_id = ?", (review_id,))
+            conn.commit()
             if berhasil:
-                pencatat.info(f"Review ID {review_id} berhasil dihapus")
+                pencatat.info("Review ID %s berhasil dihapus", review_id)
             return berhasil
 
+    @dilacak("db.simpan_checkpoint")
+    def simpan_checkpoint(
+        self,
+        id_checkpoint: str,
+        nama_berkas: str,
+        teks: str,
+        ukuran_berkas: Optional[int] = None
+    ):
+        """
+        Menyimpan teks hasil ekstraksi review yang belum selesai.
+
+        Checkpoint yang lebih tua dari UMUR_MAKS_CHECKPOINT_JAM ikut dibuang.
+
+        Parameter:
+            id_checkpoint: ID checkpoint yang dikembalikan ke klien
+            nama_berkas: Nama file asli
+            teks: Teks proposal hasil ekstraksi
+            ukuran_berkas: Ukuran file dalam bytes
+        """
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM checkpoint_review WHERE dibuat_pada < datetime('now', ?)
+            """, (f"-{self.UMUR_MAKS_CHECKPOINT_JAM} hours",))
+            cursor.execute("""
+                INSERT OR REPLACE INTO checkpoint_review
+                (id, nama_berkas, teks, ukuran_berkas)
+                VALUES (?, ?, ?, ?)
+            """, (id_checkpoint, nama_berkas, teks, ukuran_berkas))
+            conn.commit()
+            pencatat.info("Checkpoint review %s disimpan (%s karakter)", id_checkpoint, len(teks))
+
+    @dilacak("db.ambil_checkpoint")
+    def ambil_checkpoint(self, id_checkpoint: str) -> Optional[dict]:
+        """
+        Mengambil checkpoint review.
+
+        Parameter:
+            id_checkpoint: ID checkpoint
+
+        Mengembalikan:
+            Dictionary berisi nama_berkas, teks, dan ukuran_berkas;
+            atau None jika tidak ada / sudah kedaluwarsa
+        """
+        with self._sambung() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT nama_berkas, teks, ukuran_berkas
+                FROM checkpoint_review
+                WHERE id = ? AND dibuat_pada >= datetime('now', ?)
+            """, (id_checkpoint, f"-{self.UMUR_MAKS_CHECKPOINT_JAM} hours"))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    @dilacak("db.hapus_checkpoint")
+    def hapus_checkpoint(self, id_checkpoint: str):
+        """
+        Menghapus checkpoint setelah review dilanjutkan sampai selesai.
+
+        Parameter:
+            id_checkpoint: ID checkpoint
+        """
+        with self._sambung() as conn:
+            conn.execute("DELETE FROM checkpoint_review WHERE id = ?", (id_checkpoint,))
+            conn.commit()
+
+    @dilacak("db.ambil_versi_riwayat")
+    def ambil_versi_riwayat(self) -> tuple[int, str]:
+        """
+        Mengambil penghitung perubahan riwayat review.
+
+        Nilainya berubah setiap kali review disimpan, diubah, atau dihapus,
+        sehingga dapat dipakai sebagai validator cache (ETag).
+
+        Mengembalikan:
+            Tuple (versi, waktu perubahan terakhir dalam UTC)
+        """
+        with self._sambung() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT versi, diubah_pada FROM penghitung_perubahan WHERE id = 1")
+            versi, diubah_pada = cursor.fetchone()
+            return versi, diubah_pada
+
+    @dilacak("db.hitung_total_review")
     def hitung_total_review(self) -> int:
         """
         Menghitung total jumlah review.
@@ -208,11 +688,12 @@ class DatabaseRiwayat:
         Mengembalikan:
             Jumlah total review
         """
-        with sqlite3.connect(self.jalur_db) as conn:
+        with self._sambung() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM riwayat_review")
             return cursor.fetchone()[0]
 
+    @dilacak("db.ambil_statistik")
     def ambil_statistik(self) -> dict:
         """
         Mengambil statistik review.
@@ -220,7 +701,7 @@ class DatabaseRiwayat:
         Mengembalikan:
             Dictionary berisi statistik
         """
-        with sqlite3.connect(self.jalur_db) as conn:
+        with self._sambung() as conn:
             cursor = conn.cursor()
             
             # Total review
@@ -246,11 +727,90 @@ class DatabaseRiwayat:
                 GROUP BY jenis_proposal
             """)
             per_jenis = {row[0]: row[1] for row in cursor.fetchall()}
-            
+
+            # Latensi LLM (p50/p95), keseluruhan dan per jenis
+            latensi = {
+                "p50_ms": self._persentil_latensi(cursor, 0.50),
+                "p95_ms": self._persentil_latensi(cursor, 0.95)
+            }
+            latensi_per_jenis = {
+                jenis: {
+                    "p50_ms": self._persentil_latensi(cursor, 0.50, jenis),
+                    "p95_ms": self._persentil_latensi(cursor, 0.95, jenis)
+                }
+                for jenis in per_jenis
+            }
+
+            # Token per review per jenis
+            cursor.execute("""
+                SELECT
+                    jenis_proposal,
+                    COUNT(token_total),
+                    AVG(token_prompt),
+                    AVG(token_penyelesaian),
+                    AVG(token_total),
+                    SUM(token_total)
+                FROM riwayat_review
+                WHERE token_total IS NOT NULL
+                GROUP BY jenis_proposal
+            """)
+            token_per_jenis = {
+                row[0]: {
+                    "jumlah_review": row[1],
+                    "rata_rata_token_prompt": round(row[2] or 0, 1),
+                    "rata_rata_token_penyelesaian": round(row[3] or 0, 1),
+                    "rata_rata_token_total": round(row[4] or 0, 1),
+                    "total_token": row[5] or 0
+                }
+                for row in cursor.fetchall()
+            }
+
             return {
                 "total_review": total,
                 "rata_rata_skor": round(rata_rata, 2),
                 "skor_tertinggi": tertinggi,
                 "skor_terendah": terendah,
-                "review_per_jenis": per_jenis
+                "review_per_jenis": per_jenis,
+                "latensi_llm": latensi,
+                "latensi_llm_per_jenis": latensi_per_jenis,
+                "token_per_jenis": token_per_jenis
             }
+
+    @staticmethod
+    def _persentil_latensi(
+        cursor: sqlite3.Cursor,
+        persentil: float,
+        jenis_proposal: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Menghitung persentil latensi LLM (metode nearest-rank).
+
+        Memanfaatkan indeks pada kolom latensi_ms (atau jenis_proposal,
+        latensi_ms) sehingga tidak perlu memuat seluruh nilai ke memori.
+
+        Parameter:
+            cursor: Cursor SQLite yang sedang terbuka
+            persentil: Persentil dalam rentang 0-1
+            jenis_proposal: Batasi ke satu jenis proposal (None = semua)
+
+        Mengembalikan:
+            Nilai latensi dalam milidetik, atau None jika belum ada data
+        """
+        filter_jenis = "" if jenis_proposal is None else "AND jenis_proposal = ?"
+        parameter: tuple = () if jenis_proposal is None else (jenis_proposal,)
+        cursor.execute(
+            f"SELECT COUNT(latensi_ms) FROM riwayat_review WHERE latensi_ms IS NOT NULL {filter_jenis}",
+            parameter
+        )
+        jumlah = cursor.fetchone()[0]
+        if not jumlah:
+            return None
+
+        posisi = max(math.ceil(persentil * jumlah) - 1, 0)
+        cursor.execute(f"""
+            SELECT latensi_ms FROM riwayat_review
+            WHERE latensi_ms IS NOT NULL {filter_jenis}
+            ORDER BY latensi_ms
+            LIMIT 1 OFFSET ?
+        """, (*parameter, posisi))
+        return round(cursor.fetchone()[0], 2)
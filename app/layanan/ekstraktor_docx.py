@@ -0,0 +1,242 @@
+"""
+Modul ekstraktor DOCX berbasis XML streaming.
+
+Membaca `word/document.xml` langsung dari arsip zip dengan iterparse
+sehingga memori tetap terbatas pada satu elemen tingkat atas (paragraf
+atau tabel) sekaligus. Struktur dokumen dipertahankan sebagai markup
+ringan bergaya Markdown:
+- judul (Heading 1-6 / outline level) menjadi "#", "##", dst.,
+- butir daftar bernomor/berpoin menjadi "- " dengan indentasi level,
+- tabel menjadi baris "| sel | sel |".
+
+Paragraf bersarang (mis. isi kotak teks `w:txbxContent`) diratakan ke
+dalam paragraf induknya sehingga teks induk tidak hilang.
+"""
+
+import logging
+import re
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+from xml.etree import ElementTree
+
+pencatat = logging.getLogger(__name__)
+
+NS_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Tag yang ditangani (nama lengkap dengan namespace)
+W_BODY = f"{NS_W}body"
+W_P = f"{NS_W}p"
+W_PPR = f"{NS_W}pPr"
+W_T = f"{NS_W}t"
+W_TAB = f"{NS_W}tab"
+W_BR = f"{NS_W}br"
+W_CR = f"{NS_W}cr"
+W_PSTYLE = f"{NS_W}pStyle"
+W_OUTLINE = f"{NS_W}outlineLvl"
+W_NUMPR = f"{NS_W}numPr"
+W_ILVL = f"{NS_W}ilvl"
+W_TBL = f"{NS_W}tbl"
+W_TR = f"{NS_W}tr"
+W_TC = f"{NS_W}tc"
+W_STYLE = f"{NS_W}style"
+W_NAME = f"{NS_W}name"
+W_VAL = f"{NS_W}val"
+W_TYPE = f"{NS_W}type"
+W_STYLE_ID = f"{NS_W}styleId"
+
+POLA_GAYA_JUDUL = re.compile(r"^(?:heading|judul)\s*([1-6])$", re.IGNORECASE)
+GAYA_JUDUL_DOKUMEN = {"title", "judul"}
+MAKS_LEVEL_JUDUL = 6
+
+
+def _level_judul_gaya(nama: str) -> Optional[int]:
+    """Level judul dari nama/ID gaya ("Heading2" -> 2, "Title" -> 1)."""
+    nama = nama.strip()
+    if nama.lower() in GAYA_JUDUL_DOKUMEN:
+        return 1
+    cocok = POLA_GAYA_JUDUL.match(nama)
+    return int(cocok.group(1)) if cocok else None
+
+
+def _baca_gaya_judul(arsip: zipfile.ZipFile) -> dict[str, int]:
+    """
+    Memetakan styleId ke level judul dari `word/styles.xml`.
+
+    Gaya judul dikenali dari namanya ("heading 1") atau outline level
+    pada properti paragrafnya, sehingga gaya kustom/terlokalisasi ikut
+    terdeteksi.
+
+    Parameter:
+        arsip: Arsip DOCX yang sudah dibuka
+
+    Mengembalikan:
+        Dictionary styleId -> level judul (1-6)
+    """
+    try:
+        data = arsip.read("word/styles.xml")
+    except KeyError:
+        return {}
+
+    peta: dict[str, int] = {}
+    for gaya in ElementTree.fromstring(data).iter(W_STYLE):
+        id_gaya = gaya.get(W_STYLE_ID)
+        if not id_gaya:
+            continue
+        nama = gaya.find(W_NAME)
+        level = _level_judul_gaya(nama.get(W_VAL, "")) if nama is not None else None
+        outline = gaya.find(f"{NS_W}pPr/{W_OUTLINE}")
+        if level is None and outline is not None:
+            level = int(outline.get(W_VAL, "9")) + 1
+        if level is not None and level <= MAKS_LEVEL_JUDUL:
+            peta[id_gaya] = level
+    return peta
+
+
+@dataclass(slots=True)
+class _Paragraf:
+    """Status satu paragraf yang sedang diurai."""
+
+    kedalaman_tabel: int
+    potongan: list[str] = field(default_factory=list)
+    level_judul: Optional[int] = None
+    level_daftar: Optional[int] = None
+
+
+def _format_tabel(baris_tabel: list[list[str]]) -> str:
+    """Mengubah baris tabel menjadi markup "| a | b |"."""
+    return "\n".join("| " + " | ".join(sel) + " |" for sel in baris_tabel if any(sel))
+
+
+def ekstrak_docx(jalur_berkas: Union[str, Path]) -> str:
+    """
+    Mengekstrak teks terstruktur dari berkas DOCX secara streaming.
+
+    Parameter:
+        jalur_berkas: Path ke berkas DOCX
+
+    Mengembalikan:
+        Teks dengan markup ringan untuk judul, daftar, dan tabel
+
+    Pengecualian:
+        KeyError: Jika arsip tidak memiliki word/document.xml
+        zipfile.BadZipFile: Jika berkas bukan arsip zip
+        ElementTree.ParseError: Jika XML dokumen rusak
+    """
+    with zipfile.ZipFile(jalur_berkas) as arsip:
+        gaya_judul = _baca_gaya_judul(arsip)
+        with arsip.open("word/document.xml") as aliran:
+            return _urai_dokumen(aliran, gaya_judul)
+
+
+def _urai_dokumen(aliran, gaya_judul: dict[str, int]) -> str:
+    """
+    Mengurai aliran document.xml menjadi teks terstruktur.
+
+    Parameter:
+        aliran: Objek file biner berisi document.xml
+        gaya_judul: Peta styleId -> level judul
+
+    Mengembalikan:
+        Teks hasil ekstraksi
+    """
+    keluaran: list[str] = []
+    body: Optional[ElementTree.Element] = None
+
+    # Tumpukan paragraf (paragraf bersarang di kotak teks) dan kedalaman
+    # w:pPr; w:tab di dalam w:pPr/w:tabs adalah definisi tab stop, bukan isi
+    tumpukan_paragraf: list[_Paragraf] = []
+    kedalaman_ppr = 0
+
+    # Tumpukan tabel (tabel bersarang): tiap entri berisi baris, baris aktif, isi sel aktif
+    tumpukan_tabel: list[tuple[list[list[str]], list[str], list[str]]] = []
+
+    for peristiwa, elemen in ElementTree.iterparse(aliran, events=("start", "end")):
+        tag = elemen.tag
+        if peristiwa == "start":
+            if tag == W_P:
+                tumpukan_paragraf.append(_Paragraf(len(tumpukan_tabel)))
+            elif tag == W_PPR:
+                kedalaman_ppr += 1
+            elif tag == W_TBL:
+                tumpukan_tabel.append(([], [], []))
+            elif tag == W_BODY:
+                body = elemen
+            continue
+
+        paragraf = tumpukan_paragraf[-1] if tumpukan_paragraf else None
+        if tag == W_PPR:
+            kedalaman_ppr -= 1
+        elif paragraf is None:
+            pass
+        elif tag == W_T:
+            if elemen.text:
+                paragraf.potongan.append(elemen.text)
+        elif tag == W_TAB:
+            if not kedalaman_ppr:
+                paragraf.potongan.append("\t")
+        elif tag == W_BR or tag == W_CR:
+            if elemen.get(W_TYPE) != "page":
+                paragraf.potongan.append("\n")
+        elif tag == W_PSTYLE:
+            paragraf.level_judul = (
+                gaya_judul.get(elemen.get(W_VAL, "")) or _level_judul_gaya(elemen.get(W_VAL, ""))
+            )
+        elif tag == W_OUTLINE:
+            level = int(elemen.get(W_VAL, "9")) + 1
+            if level <= MAKS_LEVEL_JUDUL:
+                paragraf.level_judul = level
+        elif tag == W_ILVL:
+            paragraf.level_daftar = int(elemen.get(W_VAL, "0"))
+        elif tag == W_NUMPR:
+            if paragraf.level_daftar is None:
+                paragraf.level_daftar = 0
+
+        if tag == W_P:
+            paragraf = tumpukan_paragraf.pop()
+            teks = "".join(paragraf.potongan).strip()
+            induk = tumpukan_paragraf[-1] if tumpukan_paragraf else None
+            if induk is not None and induk.kedalaman_tabel == len(tumpukan_tabel):
+                # Paragraf bersarang (kotak teks) diratakan ke paragraf induknya
+                if teks:
+                    induk.potongan.append(f"\n{teks}\n")
+            elif tumpukan_tabel:
+                if teks:
+                    tumpukan_tabel[-1][2].append(teks)
+            elif teks:
+                if paragraf.level_judul:
+                    keluaran.append(f"\n{'#' * paragraf.level_judul} {teks}")
+                elif paragraf.level_daftar is not None:
+                    keluaran.append(f"{'  ' * paragraf.level_daftar}- {teks}")
+                else:
+                    keluaran.append(teks)
+            if not tumpukan_tabel and not tumpukan_paragraf and body is not None:
+                # Paragraf tingkat atas selesai: lepaskan dari pohon agar memori tetap kecil
+                body.clear()
+        elif tag == W_TC:
+            _, baris, isi_sel = tumpukan_tabel[-1]
+            baris.append(" ".join(isi_sel).replace("|", "/"))
+            isi_sel.clear()
+        elif tag == W_TR:
+            daftar_baris, baris, _ = tumpukan_tabel[-1]
+            daftar_baris.append(list(baris))
+            baris.clear()
+        elif tag == W_TBL:
+            daftar_baris, _, _ = tumpukan_tabel.pop()
+            teks_tabel = _format_tabel(daftar_baris)
+            induk = tumpukan_paragraf[-1] if tumpukan_paragraf else None
+            if induk is not None and induk.kedalaman_tabel == len(tumpukan_tabel):
+                # Tabel di dalam kotak teks menjadi bagian paragraf induknya
+                if teks_tabel:
+                    induk.potongan.append(f"\n{teks_tabel}\n")
+            elif tumpukan_tabel:
+                # Tabel bersarang diratakan menjadi isi sel induknya
+                tumpukan_tabel[-1][2].append(teks_tabel.replace("\n", " "))
+            else:
+                if teks_tabel:
+                    keluaran.append(teks_tabel)
+                if body is not None:
+                    body.clear()
+
+    return "\n".join(keluaran).strip()
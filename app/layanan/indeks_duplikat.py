@@ -0,0 +1,120 @@
+"""
+Modul indeks MinHash/LSH untuk deteksi proposal hampir identik.
+
+Teks dipecah menjadi shingle 5 kata; tanda MinHash dibuat dengan
+one-permutation hashing (satu hash per shingle, nilai minimum per bin)
+sehingga murah dihitung tanpa numpy. Tanda dibagi menjadi pita LSH;
+dua proposal menjadi kandidat bila minimal satu pitanya identik, lalu
+kemiripan Jaccard diperkirakan dari proporsi bin yang sama.
+"""
+
+import logging
+import re
+import zlib
+from array import array
+from typing import Optional
+
+pencatat = logging.getLogger(__name__)
+
+JUMLAH_BIN = 128
+JUMLAH_PITA = 32
+BARIS_PER_PITA = JUMLAH_BIN // JUMLAH_PITA
+PANJANG_SHINGLE = 5
+
+_BIT_BIN = JUMLAH_BIN.bit_length() - 1
+_BIN_KOSONG = 0xFFFFFFFF
+POLA_KATA = re.compile(r"\w+")
+
+
+def buat_shingle(teks: str, panjang: int = PANJANG_SHINGLE) -> set[str]:
+    """
+    Membuat himpunan shingle kata dari teks.
+
+    Parameter:
+        teks: Teks proposal
+        panjang: Jumlah kata per shingle
+
+    Mengembalikan:
+        Himpunan shingle (huruf kecil, tanda baca diabaikan)
+    """
+    kata = POLA_KATA.findall(teks.lower())
+    if len(kata) < panjang:
+        return {" ".join(kata)} if kata else set()
+    # zip atas irisan bergeser jauh lebih cepat daripada mengiris per posisi
+    return set(map(" ".join, zip(*(kata[i:] for i in range(panjang)))))
+
+
+def buat_tanda(teks: str) -> Optional[list[int]]:
+    """
+    Membuat tanda MinHash (one-permutation hashing dengan densifikasi).
+
+    Parameter:
+        teks: Teks proposal
+
+    Mengembalikan:
+        Daftar JUMLAH_BIN nilai minimum, atau None jika teks tanpa kata
+    """
+    shingle = buat_shingle(teks)
+    if not shingle:
+        return None
+
+    tanda = [_BIN_KOSONG] * JUMLAH_BIN
+    topeng = JUMLAH_BIN - 1
+    crc32 = zlib.crc32
+    for potongan in shingle:
+        nilai = crc32(potongan.encode("utf-8"))
+        indeks = nilai & topeng
+        sisa = nilai >> _BIT_BIN
+        if sisa < tanda[indeks]:
+            tanda[indeks] = sisa
+
+    # Densifikasi: bin kosong meminjam nilai bin terisi berikutnya (melingkar)
+    if _BIN_KOSONG in tanda:
+        for indeks in range(JUMLAH_BIN):
+            langkah = 1
+            while tanda[indeks] == _BIN_KOSONG:
+                tanda[indeks] = tanda[(indeks + langkah) % JUMLAH_BIN]
+                langkah += 1
+    return tanda
+
+
+def kunci_pita(tanda: list[int]) -> list[int]:
+    """
+    Menghitung kunci LSH untuk setiap pita tanda.
+
+    Parameter:
+        tanda: Tanda MinHash
+
+    Mengembalikan:
+        Daftar JUMLAH_PITA kunci (CRC32 dari nilai-nilai dalam pita)
+    """
+    return [
+        zlib.crc32(array("I", tanda[awal:awal + BARIS_PER_PITA]).tobytes())
+        for awal in range(0, JUMLAH_BIN, BARIS_PER_PITA)
+    ]
+
+
+def perkirakan_kemiripan(tanda_a: list[int], tanda_b: list[int]) -> float:
+    """
+    Memperkirakan kemiripan Jaccard dua tanda.
+
+    Parameter:
+        tanda_a: Tanda MinHash pertama
+        tanda_b: Tanda MinHash kedua
+
+    Mengembalikan:
+        Proporsi bin yang sama (0-1)
+    """
+    return sum(a == b for a, b in zip(tanda_a, tanda_b)) / JUMLAH_BIN
+
+
+def tanda_ke_bytes(tanda: list[int]) -> bytes:
+    """Serialisasi tanda untuk disimpan sebagai BLOB."""
+    return array("I", tanda).tobytes()
+
+
+def bytes_ke_tanda(data: bytes) -> list[int]:
+    """Deserialisasi tanda dari BLOB."""
+    tanda = array("I")
+    tanda.frombytes(data)
+    return tanda.tolist()
@@ -0,0 +1,198 @@
+"""
+Modul inspeksi awal dokumen sebelum ekstraksi penuh.
+
+Membaca metadata yang murah diakses (xref dan pohon halaman PDF,
+manifest zip dan docProps DOCX) untuk melaporkan jumlah halaman,
+enkripsi, keberadaan lapisan teks, dan perkiraan ukuran teks dalam
+hitungan milidetik, sehingga dokumen yang pasti gagal atau terlalu
+besar bisa ditolak sebelum biaya ekstraksi dan panggilan LLM dibayar.
+"""
+
+import logging
+import re
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+pencatat = logging.getLogger(__name__)
+
+# Jumlah halaman PDF yang diperiksa untuk mencari font (lapisan teks)
+MAKS_HALAMAN_SAMPEL = 5
+# Kedalaman Form XObject bersarang yang ditelusuri saat mencari font
+MAKS_KEDALAMAN_XOBJECT = 3
+# Perkiraan proporsi teks terhadap ukuran document.xml keluaran Word
+RASIO_TEKS_XML_DOCX = 0.2
+# Berkas Office terenkripsi disimpan sebagai kontainer OLE, bukan zip
+TANDA_OLE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+UKURAN_POTONGAN_BACA = 64 * 1024
+
+POLA_HALAMAN_DOCX = re.compile(rb"<Pages>(\d+)</Pages>")
+POLA_KARAKTER_DOCX = re.compile(rb"<CharactersWithSpaces>(\d+)</CharactersWithSpaces>")
+
+
+@dataclass
+class HasilInspeksi:
+    """Ringkasan hasil inspeksi awal satu dokumen."""
+
+    format: str
+    jumlah_halaman: Optional[int] = None
+    terenkripsi: bool = False
+    ada_teks: Optional[bool] = None
+    perkiraan_karakter: Optional[int] = None
+    rusak: bool = False
+    durasi_ms: float = 0.0
+
+
+def inspeksi_dokumen(jalur: Path) -> HasilInspeksi:
+    """
+    Menginspeksi dokumen PDF atau DOCX tanpa ekstraksi penuh.
+
+    Nilai yang tidak dapat dipastikan dibiarkan None; berkas yang
+    strukturnya tidak terbaca ditandai `rusak` agar keputusan akhir
+    diserahkan ke ekstraksi (yang punya mesin fallback).
+
+    Parameter:
+        jalur: Path ke file dokumen
+
+    Mengembalikan:
+        HasilInspeksi
+    """
+    mulai = time.perf_counter()
+    if jalur.suffix.lower() == ".pdf":
+        hasil = _inspeksi_pdf(jalur)
+    else:
+        hasil = _inspeksi_docx(jalur)
+    hasil.durasi_ms = round((time.perf_counter() - mulai) * 1000, 2)
+    return hasil
+
+
+def _inspeksi_pdf(jalur: Path) -> HasilInspeksi:
+    """
+    Inspeksi PDF: enkripsi, jumlah halaman, dan font pada halaman sampel.
+
+    Font dicari pada resources halaman dan Form XObject di dalamnya.
+    Bila tidak ada font pada halaman sampel, `ada_teks` dibiarkan None
+    karena halaman lain bisa saja bertek; keputusan diserahkan ke
+    ekstraksi.
+
+    Parameter:
+        jalur: Path ke file PDF
+
+    Mengembalikan:
+        HasilInspeksi
+    """
+    from pypdf import PdfReader
+
+    hasil = HasilInspeksi(format="pdf")
+    try:
+        pembaca = PdfReader(str(jalur))
+        if pembaca.is_encrypted:
+            # PDF dengan kata sandi pemilik saja tetap bisa dibaca tanpa kata sandi
+            hasil.terenkripsi = not pembaca.decrypt("")
+            if hasil.terenkripsi:
+                return hasil
+
+        halaman = pembaca.pages
+        hasil.jumlah_halaman = len(halaman)
+        if not hasil.jumlah_halaman:
+            hasil.ada_teks = False
+            return hasil
+
+        langkah = max(1, hasil.jumlah_halaman // MAKS_HALAMAN_SAMPEL)
+        for indeks in range(0, hasil.jumlah_halaman, langkah)[:MAKS_HALAMAN_SAMPEL]:
+            if _ada_font(halaman[indeks].get("/Resources")):
+                # Satu halaman bertek cukup untuk memperkirakan ukuran total
+                teks = halaman[indeks].extract_text() or ""
+                hasil.ada_teks = True
+                hasil.perkiraan_karakter = len(teks) * hasil.jumlah_halaman
+                break
+    except Exception as e:
+        pencatat.warning("Inspeksi PDF %s gagal, diserahkan ke ekstraksi: %s", jalur.name, e)
+        hasil.rusak = True
+    return hasil
+
+
+def _ada_font(sumber, kedalaman: int = 0) -> bool:
+    """
+    Mencari /Font pada resources PDF, termasuk di dalam Form XObject.
+
+    Teks hasil "cetak ke PDF", templat, atau stempel sering diletakkan
+    di Form XObject sehingga resources halaman sendiri tanpa /Font.
+
+    Parameter:
+        sumber: Kamus /Resources (boleh objek tidak langsung atau None)
+        kedalaman: Kedalaman Form XObject saat ini
+
+    Mengembalikan:
+        True jika ditemukan font
+    """
+    sumber = sumber.get_object() if sumber is not None else None
+    if sumber is None:
+        return False
+    if "/Font" in sumber:
+        return True
+    if kedalaman >= MAKS_KEDALAMAN_XOBJECT:
+        return False
+
+    daftar_xobject = sumber.get("/XObject")
+    daftar_xobject = daftar_xobject.get_object() if daftar_xobject is not None else None
+    for acuan in (daftar_xobject or {}).values():
+        xobject = acuan.get_object()
+        if xobject.get("/Subtype") == "/Form" and _ada_font(xobject.get("/Resources"), kedalaman + 1):
+            return True
+    return False
+
+
+def _inspeksi_docx(jalur: Path) -> HasilInspeksi:
+    """
+    Inspeksi DOCX dari manifest zip dan docProps/app.xml.
+
+    Parameter:
+        jalur: Path ke file DOCX
+
+    Mengembalikan:
+        HasilInspeksi
+    """
+    hasil = HasilInspeksi(format="docx")
+    with open(jalur, "rb") as berkas:
+        if berkas.read(len(TANDA_OLE)) == TANDA_OLE:
+            hasil.terenkripsi = True
+            return hasil
+
+    try:
+        with zipfile.ZipFile(jalur) as arsip:
+            info_dokumen = arsip.getinfo("word/document.xml")
+            try:
+                properti = arsip.read("docProps/app.xml")
+            except KeyError:
+                properti = b""
+
+            cocok_halaman = POLA_HALAMAN_DOCX.search(properti)
+            cocok_karakter = POLA_KARAKTER_DOCX.search(properti)
+            if cocok_halaman:
+                hasil.jumlah_halaman = int(cocok_halaman.group(1))
+            if cocok_karakter and int(cocok_karakter.group(1)):
+                hasil.perkiraan_karakter = int(cocok_karakter.group(1))
+            else:
+                hasil.perkiraan_karakter = int(info_dokumen.file_size * RASIO_TEKS_XML_DOCX)
+
+            with arsip.open(info_dokumen) as aliran:
+                hasil.ada_teks = _ada_elemen_teks(aliran)
+    except (zipfile.BadZipFile, KeyError) as e:
+        pencatat.warning("Inspeksi DOCX %s gagal: %s", jalur.name, e)
+        hasil.rusak = True
+    return hasil
+
+
+def _ada_elemen_teks(aliran) -> bool:
+    """Mencari elemen <w:t> pertama tanpa mengurai seluruh XML."""
+    sisa = b""
+    while potongan := aliran.read(UKURAN_POTONGAN_BACA):
+        data = sisa + potongan
+        if b"<w:t>" in data or b"<w:t " in data:
+            return True
+        # Simpan ekor agar tag yang terpotong di batas potongan tetap ditemukan
+        sisa = data[-4:]
+    return False
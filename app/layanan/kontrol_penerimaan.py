@@ -0,0 +1,419 @@
+"""
+Modul kontrol penerimaan (admission control) untuk review.
+
+Membatasi jumlah review yang sedang berjalan dan total byte unggahan
+yang menunggu ekstraksi, baik per worker maupun lintas proses
+gunicorn. Permintaan yang tidak langsung mendapat tempat menunggu di
+antrean pendek berurutan (FIFO); bila antrean penuh atau waktu tunggu
+habis, permintaan ditolak cepat dengan KapasitasPenuh (503 + Retry-After).
+
+Saat worker dikuras (SIGTERM dari gunicorn/systemd), review baru ditolak
+dengan kode SEDANG_DIKURAS, sedangkan review yang sedang berjalan diberi
+waktu sampai tenggat kuras sebelum dihentikan agar dapat dilanjutkan
+worker lain.
+
+Batas lintas proses memakai slot berkas yang dikunci dengan fcntl.flock;
+kunci otomatis lepas bila proses worker mati. Pengambilan slot diserialkan
+dengan satu kunci registri.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import sys
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Optional, TypeVar
+
+from app.pengecualian import KapasitasPenuh
+
+if sys.platform != "win32":
+    import fcntl
+
+pencatat = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Jeda pemeriksaan ulang saat menunggu di antrean
+INTERVAL_POLL_DETIK = 0.02
+BATAS_COBA_LAGI_DETIK = (1, 60)
+# Worker lain biasanya sudah siap menerima review yang ditolak saat pengurasan
+COBA_LAGI_SAAT_KURAS_DETIK = 1
+
+
+class SlotGlobal:
+    """
+    Slot review lintas proses berbasis kunci berkas.
+
+    Setiap slot adalah satu berkas di direktori bersama. Slot yang sedang
+    dikunci berisi jumlah byte tertunda milik pemegangnya; slot bebas
+    kosong. Pengambilan slot diserialkan dengan satu kunci registri,
+    sehingga pemeriksaan anggaran byte dan pemesanan slot terjadi
+    bersamaan, dan okupansi dapat dibaca tanpa mengunci slot.
+    """
+
+    def __init__(self, direktori: str, jumlah_slot: int):
+        """
+        Inisialisasi slot global.
+
+        Parameter:
+            direktori: Direktori bersama untuk berkas slot
+            jumlah_slot: Jumlah review aktif maksimal lintas proses
+        """
+        Path(direktori).mkdir(parents=True, exist_ok=True)
+        self.jumlah_slot = jumlah_slot
+        self._jalur = [str(Path(direktori) / f"slot_{i}.lock") for i in range(jumlah_slot)]
+        self._jalur_registri = str(Path(direktori) / "registri.lock")
+
+    @staticmethod
+    def _baca_byte(fd: int) -> Optional[int]:
+        """Byte tertunda yang tertulis di slot, atau None jika slot kosong."""
+        isi = os.pread(fd, 32, 0).strip()
+        return int(isi) if isi.isdigit() else None
+
+    def okupansi(self) -> tuple[int, int]:
+        """
+        Menghitung slot terpakai dan total byte tertunda lintas proses.
+
+        Dibaca dari isi berkas slot tanpa mengambil kunci apa pun, sehingga
+        tidak pernah membuat slot bebas tampak terpakai bagi worker lain.
+        Slot milik worker yang mati dapat terhitung sampai pengambilan
+        slot berikutnya membersihkannya.
+
+        Mengembalikan:
+            Tuple (jumlah slot terpakai, total byte tertunda)
+        """
+        terpakai = 0
+        total_byte = 0
+        for jalur in self._jalur:
+            try:
+                fd = os.open(jalur, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                byte = self._baca_byte(fd)
+            finally:
+                os.close(fd)
+            if byte is not None:
+                terpakai += 1
+                total_byte += byte
+        return terpakai, total_byte
+
+    def ambil(self, ukuran_byte: int, maks_byte: int) -> Optional[int]:
+        """
+        Mencoba mengambil satu slot bebas tanpa menunggu.
+
+        Parameter:
+            ukuran_byte: Byte tertunda milik permintaan ini
+            maks_byte: Batas total byte tertunda lintas proses (0 = tanpa batas)
+
+        Mengembalikan:
+            File descriptor slot yang dikunci, atau None jika penuh
+        """
+        fd_registri = os.open(self._jalur_registri, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Kunci registri hanya dipegang selama pemindaian singkat ini
+            fcntl.flock(fd_registri, fcntl.LOCK_EX)
+            terpilih: Optional[int] = None
+            terpakai = 0
+            total_byte = 0
+            for jalur in self._jalur:
+                fd = os.open(jalur, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    terpakai += 1
+                    total_byte += self._baca_byte(fd) or 0
+                    os.close(fd)
+                    continue
+                # Slot bebas; sisa isi berasal dari worker yang mati
+                os.ftruncate(fd, 0)
+                if terpilih is None:
+                    terpilih = fd
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                    os.close(fd)
+
+            if terpilih is None:
+                return None
+            if maks_byte and terpakai and total_byte + ukuran_byte > maks_byte:
+                fcntl.flock(terpilih, fcntl.LOCK_UN)
+                os.close(terpilih)
+                return None
+            os.pwrite(terpilih, str(ukuran_byte).encode(), 0)
+            return terpilih
+        finally:
+            fcntl.flock(fd_registri, fcntl.LOCK_UN)
+            os.close(fd_registri)
+
+    @staticmethod
+    def lepas(fd: int) -> None:
+        """Melepas slot yang dipegang."""
+        try:
+            os.ftruncate(fd, 0)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+class KontrolPenerimaan:
+    """Pembatas review aktif, byte tertunda, dan antrean tunggu."""
+
+    def __init__(
+        self,
+        maks_aktif: int = 4,
+        maks_antrean: int = 8,
+        maks_tunggu_detik: float = 10.0,
+        maks_byte_tertunda: int = 40 * 1024 * 1024,
+        maks_aktif_global: int = 0,
+        maks_byte_tertunda_global: int = 0,
+        direktori_slot: str = "data/slot_review"
+    ):
+        """
+        Inisialisasi kontrol penerimaan.
+
+        Parameter:
+            maks_aktif: Review aktif maksimal di worker ini
+            maks_antrean: Jumlah permintaan maksimal yang boleh menunggu
+            maks_tunggu_detik: Lama maksimal menunggu di antrean
+            maks_byte_tertunda: Total byte unggahan aktif maksimal di worker ini
+            maks_aktif_global: Review aktif maksimal lintas proses (0 = nonaktif)
+            maks_byte_tertunda_global: Total byte aktif lintas proses (0 = tanpa batas)
+            direktori_slot: Direktori berkas slot lintas proses
+        """
+        self.maks_aktif = maks_aktif
+        self.maks_antrean = maks_antrean
+        self.maks_tunggu_detik = maks_tunggu_detik
+        self.maks_byte_tertunda = maks_byte_tertunda
+        self.maks_byte_tertunda_global = maks_byte_tertunda_global
+
+        self._slot_global: Optional[SlotGlobal] = None
+        if maks_aktif_global > 0:
+            if sys.platform == "win32":
+                pencatat.warning("fcntl tidak tersedia, batas review global dinonaktifkan")
+            else:
+                self._slot_global = SlotGlobal(direktori_slot, maks_aktif_global)
+
+        self.aktif = 0
+        self.byte_tertunda = 0
+        self.jumlah_ditolak = 0
+        self._antrean: deque[object] = deque()
+        self._rata_durasi_detik: Optional[float] = None
+        self._tenggat_kuras: Optional[float] = None
+        self._sinyal_kuras: Optional[asyncio.Event] = None
+
+    @property
+    def dikuras(self) -> bool:
+        """True jika worker sedang dikuras dan tidak menerima review baru."""
+        return self._tenggat_kuras is not None
+
+    def sisa_kuras_detik(self) -> Optional[float]:
+        """Sisa waktu sebelum review yang berjalan dihentikan, atau None jika tidak dikuras."""
+        if self._tenggat_kuras is None:
+            return None
+        return max(0.0, self._tenggat_kuras - time.monotonic())
+
+    def _event_kuras(self) -> asyncio.Event:
+        """Event yang diset saat pengurasan dimulai (dibuat di event loop yang berjalan)."""
+        if self._sinyal_kuras is None:
+            self._sinyal_kuras = asyncio.Event()
+            if self.dikuras:
+                self._sinyal_kuras.set()
+        return self._sinyal_kuras
+
+    def mulai_kuras(self, batas_detik: float) -> None:
+        """
+        Menghentikan penerimaan review baru dan memasang tenggat kuras.
+
+        Harus dipanggil dari event loop (mis. lewat call_soon_threadsafe
+        dari penangan sinyal). Panggilan berikutnya diabaikan.
+
+        Parameter:
+            batas_detik: Waktu yang diberikan kepada review yang sedang berjalan
+        """
+        if self.dikuras:
+            return
+        self._tenggat_kuras = time.monotonic() + batas_detik
+        if self._sinyal_kuras is not None:
+            self._sinyal_kuras.set()
+        pencatat.warning(
+            "Worker %s mulai dikuras: aktif=%s, menunggu=%s, tenggat %g detik",
+            os.getpid(), self.aktif, self.menunggu, batas_detik
+        )
+
+    async def selesaikan_sebelum_kuras(self, aw: Awaitable[T]) -> T:
+        """
+        Menjalankan pekerjaan review dan menghentikannya bila tenggat kuras lewat.
+
+        Selama worker tidak dikuras, pekerjaan ditunggu tanpa batas.
+        Setelah pengurasan dimulai, pekerjaan masih diberi waktu sampai
+        tenggat kuras.
+
+        Parameter:
+            aw: Coroutine pekerjaan (mis. panggilan LLM)
+
+        Mengembalikan:
+            Hasil pekerjaan
+
+        Pengecualian:
+            KapasitasPenuh: Kode SEDANG_DIKURAS jika tenggat kuras lewat
+        """
+        tugas = asyncio.ensure_future(aw)
+        try:
+            if not self.dikuras:
+                sinyal = asyncio.ensure_future(self._event_kuras().wait())
+                try:
+                    await asyncio.wait({tugas, sinyal}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    sinyal.cancel()
+            if not tugas.done():
+                await asyncio.wait({tugas}, timeout=self.sisa_kuras_detik())
+            if not tugas.done():
+                raise self._tolak("SEDANG_DIKURAS", COBA_LAGI_SAAT_KURAS_DETIK)
+            return tugas.result()
+        finally:
+            if not tugas.done():
+                tugas.cancel()
+                await asyncio.gather(tugas, return_exceptions=True)
+
+    @property
+    def menunggu(self) -> int:
+        """Jumlah permintaan yang sedang menunggu di antrean."""
+        return len(self._antrean)
+
+    def _muat_lokal(self, ukuran_byte: int) -> bool:
+        """True jika worker ini masih punya tempat untuk permintaan sebesar ukuran_byte."""
+        if self.aktif >= self.maks_aktif:
+            return False
+        # Satu permintaan selalu boleh berjalan walau melebihi anggaran byte
+        return self.aktif == 0 or self.byte_tertunda + ukuran_byte <= self.maks_byte_tertunda
+
+    def _coba_masuk(self, ukuran_byte: int) -> tuple[bool, Optional[int]]:
+        """
+        Mencoba mendapatkan tempat lokal dan slot global.
+
+        Mengembalikan:
+            Tuple (berhasil, file descriptor slot global atau None)
+        """
+        if not self._muat_lokal(ukuran_byte):
+            return False, None
+        if self._slot_global is None:
+            return True, None
+        fd = self._slot_global.ambil(ukuran_byte, self.maks_byte_tertunda_global)
+        return fd is not None, fd
+
+    def coba_lagi_detik(self) -> int:
+        """
+        Memperkirakan jeda Retry-After dari rata-rata durasi review.
+
+        Mengembalikan:
+            Jumlah detik dalam rentang BATAS_COBA_LAGI_DETIK
+        """
+        if self._rata_durasi_detik is None:
+            return 5
+        perkiraan = self._rata_durasi_detik * (self.menunggu + 1) / max(self.maks_aktif, 1)
+        bawah, atas = BATAS_COBA_LAGI_DETIK
+        return max(bawah, min(atas, math.ceil(perkiraan)))
+
+    def _tolak(self, alasan: str, coba_lagi_detik: Optional[int] = None) -> KapasitasPenuh:
+        """Mencatat penolakan dan membuat pengecualiannya."""
+        self.jumlah_ditolak += 1
+        pencatat.warning("Review ditolak (%s): aktif=%s, menunggu=%s", alasan, self.aktif, self.menunggu)
+        return KapasitasPenuh(
+            pesan=(
+                "Server sedang dimulai ulang. Silakan coba lagi sebentar lagi."
+                if alasan == "SEDANG_DIKURAS"
+                else "Server sedang sibuk memproses review lain. Silakan coba lagi sebentar lagi."
+            ),
+            kode=alasan,
+            coba_lagi_detik=coba_lagi_detik or self.coba_lagi_detik()
+        )
+
+    @asynccontextmanager
+    async def izin(self, ukuran_byte: int = 0) -> AsyncIterator[None]:
+        """
+        Memperoleh izin menjalankan satu review.
+
+        Parameter:
+            ukuran_byte: Perkiraan ukuran unggahan (mis. header Content-Length)
+
+        Pengecualian:
+            KapasitasPenuh: Jika antrean penuh, waktu tunggu habis, atau worker dikuras
+        """
+        if self.dikuras:
+            raise self._tolak("SEDANG_DIKURAS", COBA_LAGI_SAAT_KURAS_DETIK)
+
+        berhasil, fd = (False, None)
+        if not self._antrean:
+            berhasil, fd = self._coba_masuk(ukuran_byte)
+
+        if not berhasil:
+            if self.menunggu >= self.maks_antrean:
+                raise self._tolak("ANTREAN_PENUH")
+
+            tiket = object()
+            self._antrean.append(tiket)
+            tenggat = time.monotonic() + self.maks_tunggu_detik
+            try:
+                while True:
+                    await asyncio.sleep(INTERVAL_POLL_DETIK)
+                    if self.dikuras:
+                        raise self._tolak("SEDANG_DIKURAS", COBA_LAGI_SAAT_KURAS_DETIK)
+                    if self._antrean[0] is tiket:
+                        berhasil, fd = self._coba_masuk(ukuran_byte)
+                        if berhasil:
+                            break
+                    if time.monotonic() >= tenggat:
+                        raise self._tolak("WAKTU_TUNGGU_HABIS")
+            finally:
+                self._antrean.remove(tiket)
+
+        self.aktif += 1
+        self.byte_tertunda += ukuran_byte
+        mulai = time.monotonic()
+        try:
+            yield
+        finally:
+            self.aktif -= 1
+            self.byte_tertunda -= ukuran_byte
+            if fd is not None:
+                SlotGlobal.lepas(fd)
+            durasi = time.monotonic() - mulai
+            self._rata_durasi_detik = durasi if self._rata_durasi_detik is None else (
+                0.8 * self._rata_durasi_detik + 0.2 * durasi
+            )
+
+    def status(self) -> dict[str, Any]:
+        """
+        Ringkasan okupansi saat ini.
+
+        Mengembalikan:
+            Dictionary okupansi worker dan (jika aktif) lintas proses
+        """
+        sisa_kuras = self.sisa_kuras_detik()
+        status: dict[str, Any] = {
+            "worker": {
+                "pid": os.getpid(),
+                "aktif": self.aktif,
+                "maks_aktif": self.maks_aktif,
+                "menunggu": self.menunggu,
+                "maks_antrean": self.maks_antrean,
+                "byte_tertunda": self.byte_tertunda,
+                "maks_byte_tertunda": self.maks_byte_tertunda,
+                "jumlah_ditolak": self.jumlah_ditolak,
+                "dikuras": self.dikuras,
+                "sisa_kuras_detik": None if sisa_kuras is None else round(sisa_kuras, 1)
+            }
+        }
+        if self._slot_global is not None:
+            terpakai, total_byte = self._slot_global.okupansi()
+            status["global"] = {
+                "aktif": terpakai,
+                "maks_aktif": self._slot_global.jumlah_slot,
+                "byte_tertunda": total_byte,
+                "maks_byte_tertunda": self.maks_byte_tertunda_global
+            }
+        return status
@@ -0,0 +1,183 @@
+"""
+Modul pengukuran memori worker.
+
+Berisi pembacaan RSS dari /proc, akuntansi memori per tahap review
+(tracemalloc, opsional), puncak RSS per permintaan, dan penjaga yang
+meminta worker didaur ulang saat RSS melewati batas.
+"""
+
+import logging
+import os
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from app.layanan.pelacakan import rentang_aktif
+
+pencatat = logging.getLogger(__name__)
+
+BYTE_PER_MB = 1024 * 1024
+
+
+def rss_byte() -> int:
+    """
+    Membaca RSS proses saat ini.
+
+    Mengembalikan:
+        RSS dalam byte (0 bila /proc tidak tersedia)
+    """
+    try:
+        with open("/proc/self/statm", "rb") as berkas:
+            return int(berkas.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def rss_puncak_proses_byte() -> int:
+    """
+    Membaca puncak RSS proses sejak start (VmHWM).
+
+    Mengembalikan:
+        Puncak RSS dalam byte (0 bila /proc tidak tersedia)
+    """
+    try:
+        with open("/proc/self/status", "rb") as berkas:
+            for baris in berkas:
+                if baris.startswith(b"VmHWM:"):
+                    return int(baris.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def ke_mb(jumlah_byte: int) -> float:
+    """Mengubah byte ke MB dengan dua desimal."""
+    return round(jumlah_byte / BYTE_PER_MB, 2)
+
+
+@dataclass
+class CatatanMemori:
+    """Sampel RSS selama satu permintaan."""
+
+    rss_awal: int
+    puncak_proses_awal: int
+    rss_puncak: int = 0
+
+    def sampel(self, rss: int) -> None:
+        """Memperbarui puncak dengan sampel RSS baru."""
+        self.rss_puncak = max(self.rss_puncak, rss)
+
+
+catatan_memori_aktif: ContextVar[Optional[CatatanMemori]] = ContextVar("catatan_memori_aktif", default=None)
+
+
+@contextmanager
+def lacak_memori_permintaan() -> Iterator[CatatanMemori]:
+    """
+    Mencatat RSS awal, sampel per tahap, dan puncak satu permintaan.
+
+    Puncak dihitung dari sampel di batas tahap (ukur_memori). Bila
+    VmHWM proses naik selama permintaan, puncak baru itu ikut dihitung
+    karena terjadi di tengah tahap; dengan permintaan bersamaan nilai
+    ini dapat berasal dari permintaan lain.
+
+    Mengembalikan:
+        CatatanMemori yang rss_puncak-nya final setelah blok selesai
+    """
+    rss = rss_byte()
+    catatan = CatatanMemori(rss_awal=rss, puncak_proses_awal=rss_puncak_proses_byte(), rss_puncak=rss)
+    token = catatan_memori_aktif.set(catatan)
+    try:
+        yield catatan
+    finally:
+        catatan_memori_aktif.reset(token)
+        catatan.sampel(rss_byte())
+        puncak_proses = rss_puncak_proses_byte()
+        if puncak_proses > catatan.puncak_proses_awal:
+            catatan.sampel(puncak_proses)
+
+
+@contextmanager
+def ukur_memori(tahap: str) -> Iterator[None]:
+    """
+    Mengukur memori satu tahap dan mencatatnya di rentang aktif.
+
+    RSS setelah tahap selalu dicatat. Bila tracemalloc aktif, puncak
+    alokasi Python selama tahap (relatif terhadap awal tahap) juga
+    dicatat; puncak tracemalloc bersifat global, sehingga tahap yang
+    berjalan bersamaan saling memengaruhi.
+
+    Dapat dipakai sebagai context manager maupun dekorator.
+
+    Parameter:
+        tahap: Nama tahap (bagian dari nama atribut rentang)
+    """
+    dilacak = tracemalloc.is_tracing()
+    terpakai_awal = 0
+    if dilacak:
+        terpakai_awal = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        rss = rss_byte()
+        catatan = catatan_memori_aktif.get()
+        if catatan is not None:
+            catatan.sampel(rss)
+        rentang = rentang_aktif()
+        if rentang is not None:
+            rentang.atur_atribut(f"memori_{tahap}_rss_mb", ke_mb(rss))
+            if dilacak:
+                terpakai, puncak = tracemalloc.get_traced_memory()
+                rentang.atur_atribut(f"memori_{tahap}_puncak_kb", round((puncak - terpakai_awal) / 1024, 1))
+                rentang.atur_atribut(f"memori_{tahap}_sisa_kb", round((terpakai - terpakai_awal) / 1024, 1))
+
+
+class PenjagaRss:
+    """Meminta worker didaur ulang sekali saat RSS melewati batas."""
+
+    def __init__(self, batas_mb: int):
+        """
+        Inisialisasi penjaga RSS.
+
+        Parameter:
+            batas_mb: Batas RSS worker (0 = nonaktif)
+        """
+        self.batas_byte = batas_mb * BYTE_PER_MB
+        self.diminta = False
+
+    def periksa(self, rss: int) -> bool:
+        """
+        Memeriksa RSS terhadap batas.
+
+        Parameter:
+            rss: RSS saat ini dalam byte
+
+        Mengembalikan:
+            True tepat satu kali, saat RSS pertama kali melewati batas
+        """
+        if self.diminta or not self.batas_byte or rss <= self.batas_byte:
+            return False
+        self.diminta = True
+        pencatat.warning(
+            "RSS worker %s MB melewati batas %s MB, worker akan didaur ulang",
+            ke_mb(rss), ke_mb(self.batas_byte)
+        )
+        return True
+
+    def status(self) -> dict:
+        """
+        Ringkasan memori worker untuk health check.
+
+        Mengembalikan:
+            Dictionary RSS, puncak RSS proses, batas, dan status daur ulang
+        """
+        return {
+            "rss_mb": ke_mb(rss_byte()),
+            "rss_puncak_proses_mb": ke_mb(rss_puncak_proses_byte()),
+            "batas_rss_mb": ke_mb(self.batas_byte),
+            "tracemalloc_aktif": tracemalloc.is_tracing(),
+            "daur_ulang_diminta": self.diminta,
+        }
@@ -0,0 +1,207 @@
+"""
+Modul mesin ekstraksi teks PDF.
+
+Menyediakan beberapa backend di balik satu antarmuka:
+- pypdf (murni Python, selalu tersedia),
+- pdfminer.six (opsional),
+- pypdfium2 (opsional, binding PDFium, paling cepat).
+
+Mode "otomatis" mencoba mesin yang terpasang dari yang tercepat dan
+berpindah ke mesin berikutnya bila satu mesin gagal pada berkas rusak.
+"""
+
+import importlib.util
+import logging
+import time
+from abc import ABC, abstractmethod
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional
+
+pencatat = logging.getLogger(__name__)
+
+MESIN_OTOMATIS = "otomatis"
+
+
+class MesinPdf(ABC):
+    """Antarmuka satu mesin ekstraksi teks PDF."""
+
+    nama: str = ""
+    modul: str = ""
+
+    @cached_property
+    def _terpasang(self) -> bool:
+        """Hasil find_spec, dihitung sekali per mesin karena dipanggil tiap ekstraksi."""
+        return importlib.util.find_spec(self.modul) is not None
+
+    def tersedia(self) -> bool:
+        """Apakah pustaka mesin ini terpasang."""
+        return self._terpasang
+
+    @abstractmethod
+    def ekstrak(self, jalur: Path) -> list[str]:
+        """
+        Mengekstrak teks per halaman.
+
+        Parameter:
+            jalur: Path ke file PDF
+
+        Mengembalikan:
+            Daftar teks per halaman (halaman kosong berupa string kosong)
+        """
+
+
+class MesinPypdf(MesinPdf):
+    """Mesin berbasis pypdf."""
+
+    nama = "pypdf"
+    modul = "pypdf"
+
+    def ekstrak(self, jalur: Path) -> list[str]:
+        from pypdf import PdfReader
+
+        pembaca = PdfReader(str(jalur))
+        return [halaman.extract_text() or "" for halaman in pembaca.pages]
+
+
+class MesinPdfminer(MesinPdf):
+    """Mesin berbasis pdfminer.six."""
+
+    nama = "pdfminer"
+    modul = "pdfminer"
+
+    def ekstrak(self, jalur: Path) -> list[str]:
+        from pdfminer.high_level import extract_text  # pyright: ignore[reportMissingImports]
+
+        # pdfminer memisahkan halaman dengan form feed
+        teks = extract_text(str(jalur))
+        daftar_halaman = teks.split("\f")
+        if daftar_halaman and not daftar_halaman[-1].strip():
+            daftar_halaman.pop()
+        return daftar_halaman
+
+
+class MesinPypdfium2(MesinPdf):
+    """Mesin berbasis pypdfium2."""
+
+    nama = "pypdfium2"
+    modul = "pypdfium2"
+
+    def ekstrak(self, jalur: Path) -> list[str]:
+        import pypdfium2  # pyright: ignore[reportMissingImports]
+
+        dokumen = pypdfium2.PdfDocument(str(jalur))
+        try:
+            daftar_halaman = []
+            for halaman in dokumen:
+                halaman_teks = halaman.get_textpage()
+                daftar_halaman.append(halaman_teks.get_text_range())
+                halaman_teks.close()
+                halaman.close()
+            return daftar_halaman
+        finally:
+            dokumen.close()
+
+
+# Urutan dari yang tercepat (lihat alat/tolok_ukur_pdf.py)
+DAFTAR_MESIN: dict[str, MesinPdf] = {
+    mesin.nama: mesin for mesin in (MesinPypdfium2(), MesinPypdf(), MesinPdfminer())
+}
+
+
+class PemilihMesinPdf:
+    """Memilih mesin PDF sesuai pengaturan dengan fallback otomatis."""
+
+    def __init__(self, preferensi: str = MESIN_OTOMATIS):
+        """
+        Inisialisasi pemilih mesin.
+
+        Parameter:
+            preferensi: Nama mesin ("pypdf", "pdfminer", "pypdfium2")
+                atau "otomatis"
+
+        Pengecualian:
+            ValueError: Jika nama mesin tidak dikenali
+        """
+        if preferensi != MESIN_OTOMATIS and preferensi not in DAFTAR_MESIN:
+            raise ValueError(
+                f"Mesin PDF tidak dikenali: {preferensi}. "
+                f"Pilihan: {MESIN_OTOMATIS}, {', '.join(DAFTAR_MESIN)}"
+            )
+        self.preferensi = preferensi
+        if preferensi != MESIN_OTOMATIS and not DAFTAR_MESIN[preferensi].tersedia():
+            pencatat.warning("Mesin PDF '%s' tidak terpasang, memakai urutan otomatis", preferensi)
+
+    def urutan(self) -> list[MesinPdf]:
+        """
+        Urutan mesin yang dicoba: preferensi dulu, lalu sisanya dari yang tercepat.
+
+        Mengembalikan:
+            Daftar mesin yang terpasang
+        """
+        semua = [mesin for mesin in DAFTAR_MESIN.values() if mesin.tersedia()]
+        if self.preferensi in DAFTAR_MESIN:
+            semua.sort(key=lambda mesin: mesin.nama != self.preferensi)
+        return semua
+
+    def ekstrak(self, jalur: Path) -> tuple[list[str], str]:
+        """
+        Mengekstrak teks per halaman dengan fallback antar mesin.
+
+        Parameter:
+            jalur: Path ke file PDF
+
+        Mengembalikan:
+            Tuple (teks per halaman, nama mesin yang berhasil)
+
+        Pengecualian:
+            RuntimeError: Jika tidak ada mesin yang terpasang
+            Exception: Galat mesin terakhir jika semua mesin gagal
+        """
+        galat_terakhir: Optional[Exception] = None
+        for mesin in self.urutan():
+            try:
+                return mesin.ekstrak(jalur), mesin.nama
+            except Exception as e:
+                pencatat.warning("Mesin PDF %s gagal pada %s: %s", mesin.nama, jalur.name, e)
+                galat_terakhir = e
+
+        if galat_terakhir is None:
+            raise RuntimeError("Tidak ada mesin PDF yang terpasang")
+        raise galat_terakhir
+
+
+def ukur_mesin(daftar_berkas: list[Path], ulangan: int = 1) -> dict[str, dict[str, Any]]:
+    """
+    Mengukur laju ekstraksi (halaman/detik) setiap mesin yang terpasang.
+
+    Parameter:
+        daftar_berkas: Berkas PDF korpus
+        ulangan: Jumlah pengulangan per berkas
+
+    Mengembalikan:
+        Dictionary nama mesin -> halaman, detik, halaman_per_detik, gagal
+    """
+    laporan: dict[str, dict[str, Any]] = {}
+    for nama, mesin in DAFTAR_MESIN.items():
+        if not mesin.tersedia():
+            continue
+        halaman = 0
+        gagal = 0
+        durasi = 0.0
+        for jalur in daftar_berkas:
+            for _ in range(ulangan):
+                mulai = time.perf_counter()
+                try:
+                    halaman += len(mesin.ekstrak(jalur))
+                except Exception as e:
+                    pencatat.warning("Mesin PDF %s gagal pada %s: %s", nama, jalur.name, e)
+                    gagal += 1
+                durasi += time.perf_counter() - mulai
+        laporan[nama] = {
+            "halaman": halaman,
+            "detik": round(durasi, 3),
+            "halaman_per_detik": round(halaman / durasi, 1) if durasi else 0.0,
+            "gagal": gagal
+        }
+    return laporan
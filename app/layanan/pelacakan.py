@@ -0,0 +1,217 @@
+"""
+Modul pelacakan (tracing) per permintaan.
+
+Menyediakan rentang (span) bergaya OpenTelemetry untuk setiap
+tahap review, ID permintaan yang ikut tercatat di log, dan
+pengekspor berkas JSON Lines sebagai pengganti kolektor OTLP.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+pencatat = logging.getLogger(__name__)
+
+id_permintaan_aktif: ContextVar[str] = ContextVar("id_permintaan_aktif", default="-")
+
+
+@dataclass
+class Rentang:
+    """Satu rentang waktu (span) dalam sebuah jejak permintaan."""
+
+    nama: str
+    id_jejak: str
+    id_rentang: str
+    id_induk: Optional[str] = None
+    waktu_mulai_ns: int = field(default_factory=time.time_ns)
+    waktu_selesai_ns: Optional[int] = None
+    atribut: dict[str, Any] = field(default_factory=dict)
+    status: str = "OK"
+    pesan_status: str = ""
+
+    def atur_atribut(self, kunci: str, nilai: Any) -> None:
+        """
+        Menambahkan atribut ke rentang.
+
+        Parameter:
+            kunci: Nama atribut
+            nilai: Nilai atribut (sebaiknya bertipe sederhana)
+        """
+        self.atribut[kunci] = nilai
+
+    @property
+    def durasi_ms(self) -> float:
+        """Durasi rentang dalam milidetik (0 jika belum selesai)."""
+        if self.waktu_selesai_ns is None:
+            return 0.0
+        return (self.waktu_selesai_ns - self.waktu_mulai_ns) / 1_000_000
+
+    def ke_dict(self) -> dict[str, Any]:
+        """
+        Mengubah rentang menjadi dictionary mirip format OTLP/JSON.
+
+        Mengembalikan:
+            Dictionary yang siap diserialisasi ke JSON
+        """
+        return {
+            "traceId": self.id_jejak,
+            "spanId": self.id_rentang,
+            "parentSpanId": self.id_induk,
+            "name": self.nama,
+            "startTimeUnixNano": self.waktu_mulai_ns,
+            "endTimeUnixNano": self.waktu_selesai_ns,
+            "durasi_ms": round(self.durasi_ms, 3),
+            "attributes": self.atribut,
+            "status": {"code": self.status, "message": self.pesan_status},
+        }
+
+
+_rentang_aktif: ContextVar[Optional[Rentang]] = ContextVar("_rentang_aktif", default=None)
+
+
+class PengeksporBerkas:
+    """Pengekspor rentang ke berkas JSON Lines (satu rentang per baris)."""
+
+    def __init__(self, jalur_berkas: str):
+        """
+        Inisialisasi pengekspor berkas.
+
+        Parameter:
+            jalur_berkas: Path berkas tujuan ekspor
+        """
+        self.jalur_berkas = Path(jalur_berkas)
+        self._kunci = threading.Lock()
+
+    def ekspor(self, rentang: Rentang) -> None:
+        """
+        Menulis satu rentang ke berkas.
+
+        Parameter:
+            rentang: Rentang yang sudah selesai
+        """
+        baris = json.dumps(rentang.ke_dict(), ensure_ascii=False, default=str)
+        try:
+            with self._kunci:
+                self.jalur_berkas.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.jalur_berkas, "a", encoding="utf-8") as berkas:
+                    berkas.write(baris + "\n")
+        except OSError as e:
+            pencatat.warning("Gagal mengekspor jejak: %s", e)
+
+
+class Pelacak:
+    """
+    Pembuat rentang untuk setiap tahap pemrosesan.
+
+    Rentang selalu dibuat (murah) agar ID permintaan dan durasi
+    tersedia; ekspor hanya dilakukan jika pengekspor dipasang.
+    """
+
+    def __init__(self, pengekspor: Optional[PengeksporBerkas] = None):
+        """
+        Inisialisasi pelacak.
+
+        Parameter:
+            pengekspor: Pengekspor rentang (opsional)
+        """
+        self._pengekspor = pengekspor
+
+    def atur_pengekspor(self, pengekspor: Optional[PengeksporBerkas]) -> None:
+        """
+        Memasang atau melepas pengekspor rentang.
+
+        Parameter:
+            pengekspor: Pengekspor baru, atau None untuk menonaktifkan ekspor
+        """
+        self._pengekspor = pengekspor
+
+    @contextmanager
+    def rentang(self, nama: str, **atribut: Any) -> Iterator[Rentang]:
+        """
+        Membuka rentang baru sebagai anak dari rentang aktif.
+
+        Parameter:
+            nama: Nama tahap, misal "llm.tinjau"
+            **atribut: Atribut awal rentang
+
+        Mengembalikan:
+            Context manager yang menghasilkan objek Rentang
+        """
+        induk = _rentang_aktif.get()
+        rentang = Rentang(
+            nama=nama,
+            id_jejak=induk.id_jejak if induk else secrets.token_hex(16),
+            id_rentang=secrets.token_hex(8),
+            id_induk=induk.id_rentang if induk else None,
+            atribut={"id_permintaan": id_permintaan_aktif.get(), **atribut},
+        )
+        token = _rentang_aktif.set(rentang)
+        try:
+            yield rentang
+        except BaseException as e:
+            rentang.status = "ERROR"
+            rentang.pesan_status = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            rentang.waktu_selesai_ns = time.time_ns()
+            _rentang_aktif.reset(token)
+            if self._pengekspor is not None:
+                self._pengekspor.ekspor(rentang)
+
+
+pelacak = Pelacak()
+
+
+def rentang_aktif() -> Optional[Rentang]:
+    """
+    Mendapatkan rentang yang sedang aktif pada konteks ini.
+
+    Mengembalikan:
+        Rentang aktif atau None
+    """
+    return _rentang_aktif.get()
+
+
+def dilacak(nama: str) -> Callable:
+    """
+    Dekorator untuk membungkus fungsi (sinkron maupun async) dalam rentang.
+
+    Parameter:
+        nama: Nama rentang
+
+    Mengembalikan:
+        Dekorator fungsi
+    """
+    def dekorator(fungsi: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fungsi):
+            @functools.wraps(fungsi)
+            async def pembungkus_async(*args: Any, **kwargs: Any) -> Any:
+                with pelacak.rentang(nama):
+                    return await fungsi(*args, **kwargs)
+            return pembungkus_async
+
+        @functools.wraps(fungsi)
+        def pembungkus(*args: Any, **kwargs: Any) -> Any:
+            with pelacak.rentang(nama):
+                return fungsi(*args, **kwargs)
+        return pembungkus
+
+    return dekorator
+
+
+class FilterIdPermintaan(logging.Filter):
+    """Filter logging yang menambahkan ID permintaan ke setiap record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Menyisipkan atribut `id_permintaan` ke record log."""
+        record.id_permintaan = id_permintaan_aktif.get()
+        return True
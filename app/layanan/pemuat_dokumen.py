@@ -4,10 +4,23 @@ Modul pemuat dokumen untuk mengekstrak teks dari file.
 Mendukung format PDF dan DOCX.
 """
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
+from app.layanan.ekstraktor_docx import ekstrak_docx
+from app.layanan.inspeksi_awal import HasilInspeksi, inspeksi_dokumen
+from app.layanan.mesin_pdf import MESIN_OTOMATIS, PemilihMesinPdf
+from app.layanan.normalisasi_teks import (
+    HasilNormalisasi,
+    normalisasi_halaman,
+    normalisasi_teks,
+)
+from app.layanan.memori import ukur_memori
+from app.layanan.pelacakan import Rentang, pelacak
+from app.layanan.profil import diprofil
+from app.layanan.tenggat import Tenggat
 from app.pengecualian import (
     BatasUkuranTerlampaui,
     DokumenTidakValid,
@@ -17,6 +30,15 @@ from app.pengecualian import (
 pencatat = logging.getLogger(__name__)
 
 
+def _galat_tanpa_lapisan_teks() -> DokumenTidakValid:
+    """Galat untuk dokumen tanpa lapisan teks (kemungkinan hasil pindaian)."""
+    return DokumenTidakValid(
+        pesan="Dokumen tidak memiliki lapisan teks (kemungkinan hasil pindaian). "
+              "Unggah dokumen dengan teks yang dapat diseleksi.",
+        kode="TANPA_LAPISAN_TEKS"
+    )
+
+
 class PemuatDokumen:
     """
     Layanan untuk memuat dan mengekstrak teks dari dokumen.
@@ -28,29 +50,51 @@ class PemuatDokumen:
 
     EKSTENSI_DIDUKUNG: set[str] = {".pdf", ".docx"}
 
-    def __init__(self, ukuran_maks_mb: int = 10):
+    def __init__(
+        self,
+        ukuran_maks_mb: int = 10,
+        normalisasi: bool = True,
+        mesin_pdf: str = MESIN_OTOMATIS,
+        inspeksi_awal: bool = True,
+        maks_halaman: int = 0
+    ):
         """
         Inisialisasi pemuat dokumen.
 
         Parameter:
             ukuran_maks_mb: Ukuran maksimal file dalam MB
+            normalisasi: Buang header/footer berulang, nomor halaman,
+                daftar isi, dan spasi berlebih dari teks hasil ekstraksi
+            mesin_pdf: Mesin ekstraksi PDF ("pypdf", "pdfminer",
+                "pypdfium2") atau "otomatis"
+            inspeksi_awal: Periksa enkripsi, lapisan teks, dan jumlah
+                halaman sebelum ekstraksi penuh
+            maks_halaman: Jumlah halaman maksimal (0 = tanpa batas)
         """
         self._ukuran_maks_byte = ukuran_maks_mb * 1024 * 1024
+        self._normalisasi = normalisasi
+        self._mesin_pdf = PemilihMesinPdf(mesin_pdf)
+        self._inspeksi_awal = inspeksi_awal
+        self._maks_halaman = maks_halaman
 
-    async def muat(self, jalur_berkas: Union[str, Path]) -> str:
+    async def muat(self, jalur_berkas: Union[str, Path], tenggat: Optional[Tenggat] = None) -> str:
         """
         Memuat dokumen dan mengekstrak teksnya.
 
         Parameter:
             jalur_berkas: Path ke file dokumen
+            tenggat: Tenggat permintaan; bila diisi, ekstraksi berjalan di
+                thread terpisah dan ditinggalkan saat tenggat habis
 
         Mengembalikan:
             String berisi teks yang diekstrak
 
         Pengecualian:
             FormatTidakDidukung: Jika format file tidak didukung
-            DokumenTidakValid: Jika file tidak ditemukan
-            BatasUkuranTerlampaui: Jika ukuran file melebihi batas
+            DokumenTidakValid: Jika file tidak ditemukan, terenkripsi,
+                atau tidak berisi teks
+            BatasUkuranTerlampaui: Jika ukuran atau jumlah halaman melebihi batas
+            TenggatHabis: Jika tenggat habis sebelum ekstraksi selesai
         """
         jalur = Path(jalur_berkas)
 
@@ -79,63 +123,171 @@ class PemuatDokumen:
                 kode="UKURAN_TERLAMPAUI"
             )
 
-        pencatat.info(f"Memuat dokumen: {jalur.name}")
+        pencatat.debug("Memuat dokumen: %s", jalur.name)
+
+        if tenggat is not None:
+            tenggat.periksa("ekstraksi")
+
+        if tenggat is None:
+            teks = self._periksa_dan_ekstrak(jalur)
+        else:
+            # Thread tidak dapat dihentikan paksa, tetapi permintaan tidak lagi
+            # menunggunya dan event loop tetap bebas selama inspeksi dan ekstraksi
+            teks = await tenggat.batasi(asyncio.to_thread(self._periksa_dan_ekstrak, jalur), "ekstraksi")
 
+        if not teks.strip():
+            raise DokumenTidakValid(
+                pesan="Tidak ada teks yang dapat diekstrak dari dokumen. "
+                      "Pastikan dokumen bukan hasil pindaian (scan).",
+                kode="TEKS_KOSONG"
+            )
+        return teks
+
+    def _periksa_dan_ekstrak(self, jalur: Path) -> str:
+        """Inspeksi awal (bila aktif) lalu ekstraksi penuh, sinkron."""
+        inspeksi = self.periksa_awal(jalur) if self._inspeksi_awal else None
         if jalur.suffix.lower() == ".pdf":
-            return await self._muat_pdf(jalur)
+            teks = self._muat_pdf(jalur)
         else:
-            return await self._muat_docx(jalur)
+            teks = self._muat_docx(jalur)
+
+        # Font tidak ditemukan saat inspeksi dan ekstraksi memastikan tidak ada teks
+        if inspeksi is not None and inspeksi.ada_teks is None and not teks.strip():
+            raise _galat_tanpa_lapisan_teks()
+        return teks
+
+    def periksa_awal(self, jalur: Path) -> HasilInspeksi:
+        """
+        Inspeksi awal dokumen dan tolak yang pasti gagal sebelum ekstraksi.
+
+        Parameter:
+            jalur: Path ke file dokumen
+
+        Mengembalikan:
+            HasilInspeksi
+
+        Pengecualian:
+            DokumenTidakValid: Jika dokumen terenkripsi atau tanpa lapisan teks
+            BatasUkuranTerlampaui: Jika jumlah halaman melebihi batas
+        """
+        with pelacak.rentang("ekstraksi.inspeksi", format=jalur.suffix.lower().lstrip(".")) as rentang:
+            hasil = inspeksi_dokumen(jalur)
+            rentang.atur_atribut("jumlah_halaman", hasil.jumlah_halaman)
+            rentang.atur_atribut("terenkripsi", hasil.terenkripsi)
+            rentang.atur_atribut("ada_teks", hasil.ada_teks)
+            rentang.atur_atribut("perkiraan_karakter", hasil.perkiraan_karakter)
+            rentang.atur_atribut("durasi_inspeksi_ms", hasil.durasi_ms)
 
-    async def _muat_pdf(self, jalur: Path) -> str:
+        pencatat.info(
+            "Inspeksi awal %s: %s halaman, terenkripsi=%s, ada_teks=%s, ~%s karakter (%s ms)",
+            jalur.name, hasil.jumlah_halaman, hasil.terenkripsi, hasil.ada_teks,
+            hasil.perkiraan_karakter, hasil.durasi_ms
+        )
+
+        if hasil.terenkripsi:
+            raise DokumenTidakValid(
+                pesan="Dokumen terenkripsi atau dilindungi kata sandi. "
+                      "Hapus proteksi kata sandi lalu unggah ulang.",
+                kode="DOKUMEN_TERENKRIPSI"
+            )
+        if hasil.ada_teks is False:
+            raise _galat_tanpa_lapisan_teks()
+        if self._maks_halaman and hasil.jumlah_halaman and hasil.jumlah_halaman > self._maks_halaman:
+            raise BatasUkuranTerlampaui(
+                pesan=f"Jumlah halaman ({hasil.jumlah_halaman}) melebihi batas "
+                      f"maksimal ({self._maks_halaman} halaman)",
+                kode="HALAMAN_TERLAMPAUI"
+            )
+        return hasil
+
+    @ukur_memori("ekstraksi")
+    @diprofil("ekstraksi.pdf")
+    def _muat_pdf(self, jalur: Path) -> str:
         """
         Mengekstrak teks dari file PDF.
 
+        Mesin dipilih sesuai pengaturan; bila mesin gagal pada berkas
+        rusak, mesin terpasang berikutnya dicoba.
+
         Parameter:
             jalur: Path ke file PDF
 
         Mengembalikan:
             String berisi teks yang diekstrak
         """
-        from pypdf import PdfReader
-
         try:
-            pembaca = PdfReader(str(jalur))
-            teks_halaman = []
-            
-            for halaman in pembaca.pages:
-                teks = halaman.extract_text()
-                if teks:
-                    teks_halaman.append(teks)
-            
-            teks_gabungan = "\n\n".join(teks_halaman)
-            pencatat.info(f"Berhasil memuat PDF: {len(teks_gabungan)} karakter dari {len(pembaca.pages)} halaman")
+            with pelacak.rentang("ekstraksi.pdf", ukuran_berkas=jalur.stat().st_size) as rentang:
+                semua_halaman, nama_mesin = self._mesin_pdf.ekstrak(jalur)
+                teks_halaman = [teks for teks in semua_halaman if teks]
+
+                if self._normalisasi:
+                    teks_gabungan = self._catat_normalisasi(rentang, normalisasi_halaman(teks_halaman))
+                else:
+                    teks_gabungan = "\n\n".join(teks_halaman)
+                rentang.atur_atribut("mesin", nama_mesin)
+                rentang.atur_atribut("jumlah_halaman", len(semua_halaman))
+                rentang.atur_atribut("jumlah_karakter", len(teks_gabungan))
+            pencatat.info(
+                "Berhasil memuat PDF (%s): %s karakter dari %s halaman",
+                nama_mesin, len(teks_gabungan), len(semua_halaman)
+            )
             return teks_gabungan
         except Exception as e:
-            pencatat.error(f"Gagal memuat PDF: {str(e)}")
+            pencatat.error("Gagal memuat PDF: %s", e)
             raise DokumenTidakValid(
                 pesan=f"Gagal membaca file PDF: {str(e)}",
                 kode="PDF_TIDAK_VALID"
             )
 
-    async def _muat_docx(self, jalur: Path) -> str:
+    @ukur_memori("ekstraksi")
+    @diprofil("ekstraksi.docx")
+    def _muat_docx(self, jalur: Path) -> str:
         """
         Mengekstrak teks dari file DOCX.
 
+        Judul, butir daftar, dan tabel dipertahankan sebagai markup
+        ringan ("#", "- ", "| a | b |") oleh ekstraktor streaming.
+
         Parameter:
             jalur: Path ke file DOCX
 
         Mengembalikan:
             String berisi teks yang diekstrak
         """
-        import docx2txt
-
         try:
-            teks = docx2txt.process(str(jalur))
-            pencatat.info(f"Berhasil memuat DOCX: {len(teks)} karakter")
+            with pelacak.rentang("ekstraksi.docx", ukuran_berkas=jalur.stat().st_size) as rentang:
+                teks = ekstrak_docx(jalur)
+                if self._normalisasi:
+                    teks = self._catat_normalisasi(rentang, normalisasi_teks(teks))
+                rentang.atur_atribut("jumlah_karakter", len(teks))
+            pencatat.info("Berhasil memuat DOCX: %s karakter", len(teks))
             return teks
         except Exception as e:
-            pencatat.error(f"Gagal memuat DOCX: {str(e)}")
+            pencatat.error("Gagal memuat DOCX: %s", e)
             raise DokumenTidakValid(
                 pesan=f"Gagal membaca file DOCX: {str(e)}",
                 kode="DOCX_TIDAK_VALID"
             )
+
+    @staticmethod
+    def _catat_normalisasi(rentang: Rentang, hasil: HasilNormalisasi) -> str:
+        """
+        Mencatat penghematan normalisasi ke rentang dan log.
+
+        Parameter:
+            rentang: Rentang ekstraksi yang sedang aktif
+            hasil: Hasil normalisasi
+
+        Mengembalikan:
+            Teks hasil normalisasi
+        """
+        rentang.atur_atribut("karakter_sebelum_normalisasi", hasil.karakter_awal)
+        rentang.atur_atribut("karakter_hemat", hasil.karakter_hemat)
+        rentang.atur_atribut("token_hemat", hasil.token_hemat)
+        pencatat.info(
+            "Normalisasi teks: %s karakter dibuang (%s%%, ~%s token; berulang=%s, "
+            "nomor halaman=%s, daftar isi=%s)",
+            hasil.karakter_hemat, hasil.persen_hemat, hasil.token_hemat, hasil.baris_berulang,
+            hasil.baris_nomor_halaman, hasil.baris_daftar_isi
+        )
+        return hasil.teks
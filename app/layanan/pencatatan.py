@@ -0,0 +1,214 @@
+"""
+Modul konfigurasi logging aplikasi.
+
+Record log tidak lagi ditulis langsung oleh handler root di event loop.
+Record hanya dimasukkan ke antrean oleh QueueHandler, lalu diformat
+(JSON atau teks) dan ditulis oleh thread QueueListener. Pesan memakai
+argumen gaya `%s` sehingga baru diformat di thread pendengar, dan record
+yang tersaring level tidak pernah diformat sama sekali.
+
+Thread pendengar dibuat ulang di proses anak setelah fork (gunicorn
+--preload), karena thread tidak ikut tersalin saat fork.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+from app.layanan.pelacakan import FilterIdPermintaan
+
+FORMAT_JSON = "json"
+FORMAT_TEKS = "teks"
+FORMAT_LOG: set[str] = {FORMAT_JSON, FORMAT_TEKS}
+POLA_TEKS = "%(asctime)s - %(name)s - %(levelname)s - [%(id_permintaan)s] %(message)s"
+
+# Atribut bawaan LogRecord; atribut lain berasal dari `extra=` dan ikut ditulis
+_ATRIBUT_BAWAAN: set[str] = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "id_permintaan"}
+
+
+class FormatterJson(logging.Formatter):
+    """Formatter satu objek JSON per baris."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Memformat record menjadi JSON.
+
+        Parameter:
+            record: Record log
+
+        Mengembalikan:
+            Satu baris JSON berisi waktu, level, modul, pesan,
+            id_permintaan, atribut `extra`, dan galat (bila ada)
+        """
+        data = {
+            "waktu": self.formatTime(record),
+            "level": record.levelname,
+            "modul": record.name,
+            "pesan": record.getMessage(),
+            "id_permintaan": getattr(record, "id_permintaan", "-"),
+        }
+        for kunci, nilai in record.__dict__.items():
+            if kunci not in _ATRIBUT_BAWAAN:
+                data[kunci] = nilai
+        if record.exc_info:
+            data["galat"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class FilterSampel(logging.Filter):
+    """
+    Meloloskan satu dari setiap N record DEBUG per baris kode.
+
+    Record di atas DEBUG selalu lolos. Penghitung dipisah per lokasi
+    pemanggilan agar baris yang jarang tidak tertutup baris yang ramai.
+    """
+
+    def __init__(self, setiap: int):
+        """
+        Inisialisasi filter sampel.
+
+        Parameter:
+            setiap: Loloskan satu dari setiap `setiap` record (<= 1 = semua)
+        """
+        super().__init__()
+        self.setiap = setiap
+        self._hitungan: defaultdict[tuple[str, int], int] = defaultdict(int)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """True jika record ikut dicatat."""
+        if self.setiap <= 1 or record.levelno > logging.DEBUG:
+            return True
+        kunci = (record.pathname, record.lineno)
+        urutan = self._hitungan[kunci]
+        self._hitungan[kunci] = urutan + 1
+        return urutan % self.setiap == 0
+
+
+class PenanganAntrean(QueueHandler):
+    """QueueHandler yang menunda pemformatan ke thread pendengar."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Meneruskan record apa adanya.
+
+        QueueHandler bawaan memformat pesan di thread pemanggil agar
+        record aman di-pickle. Antrean ini hanya dipakai dalam satu
+        proses, jadi pemformatan dibiarkan untuk thread pendengar.
+        """
+        return record
+
+
+def urai_level_modul(teks: str) -> dict[str, int]:
+    """
+    Mengurai level per modul dari pengaturan.
+
+    Parameter:
+        teks: Daftar "modul=LEVEL" dipisah koma,
+            mis. "httpx=WARNING,app.layanan.penjadwal=DEBUG"
+
+    Mengembalikan:
+        Dictionary nama logger -> level numerik
+
+    Pengecualian:
+        ValueError: Jika format atau nama level tidak dikenali
+    """
+    hasil: dict[str, int] = {}
+    for bagian in filter(None, (potongan.strip() for potongan in teks.split(","))):
+        nama, pemisah, level = bagian.partition("=")
+        nilai = logging.getLevelName(level.strip().upper())
+        if not pemisah or not nama.strip() or not isinstance(nilai, int):
+            raise ValueError(f"Level log modul tidak valid: {bagian!r} (format: modul=LEVEL)")
+        hasil[nama.strip()] = nilai
+    return hasil
+
+
+_penangan: Optional[PenanganAntrean] = None
+_pendengar: Optional[QueueListener] = None
+_penulis: list[logging.Handler] = []
+
+
+def _mulai_pendengar() -> None:
+    """Membuat antrean baru dan menjalankan thread pendengar untuk proses ini."""
+    global _pendengar
+    if _penangan is None:
+        return
+    _penangan.queue = queue.SimpleQueue()
+    _pendengar = QueueListener(_penangan.queue, *_penulis, respect_handler_level=True)
+    _pendengar.start()
+
+
+def hentikan_pencatatan() -> None:
+    """Menulis sisa record di antrean lalu menghentikan thread pendengar."""
+    global _pendengar
+    if _pendengar is not None:
+        _pendengar.stop()
+        _pendengar = None
+
+
+def lepas_pencatatan() -> None:
+    """Menghentikan pendengar dan melepas QueueHandler dari logger root."""
+    global _penangan
+    hentikan_pencatatan()
+    if _penangan is not None:
+        logging.getLogger().removeHandler(_penangan)
+        _penangan = None
+
+
+def pasang_pencatatan(
+    level: str = "INFO",
+    level_modul: str = "",
+    format_log: str = FORMAT_JSON,
+    sampel_debug: int = 1,
+    aliran: Optional[TextIO] = None
+) -> None:
+    """
+    Memasang logging berbasis antrean pada logger root.
+
+    Aman dipanggil ulang; pemasangan sebelumnya diganti.
+
+    Parameter:
+        level: Level logger root
+        level_modul: Level per modul (lihat urai_level_modul)
+        format_log: "json" (satu objek per baris) atau "teks"
+        sampel_debug: Loloskan satu dari setiap N record DEBUG per baris kode
+        aliran: Tujuan tulis log (bawaan: stderr)
+
+    Pengecualian:
+        ValueError: Jika level atau format tidak dikenali
+    """
+    global _penangan
+    if format_log not in FORMAT_LOG:
+        raise ValueError(f"Format log tidak dikenali: {format_log}. Pilihan: {', '.join(sorted(FORMAT_LOG))}")
+    level_root = logging.getLevelName(level.upper())
+    if not isinstance(level_root, int):
+        raise ValueError(f"Level log tidak dikenali: {level}")
+    daftar_level_modul = urai_level_modul(level_modul)
+
+    lepas_pencatatan()
+    root = logging.getLogger()
+
+    penulis = logging.StreamHandler(aliran or sys.stderr)
+    penulis.setFormatter(FormatterJson() if format_log == FORMAT_JSON else logging.Formatter(POLA_TEKS))
+    _penulis[:] = [penulis]
+
+    # Filter dijalankan di thread pemanggil: ID permintaan dibaca dari
+    # contextvar-nya, dan record yang tidak disampel tidak masuk antrean
+    _penangan = PenanganAntrean(queue.SimpleQueue())
+    _penangan.addFilter(FilterIdPermintaan())
+    _penangan.addFilter(FilterSampel(sampel_debug))
+    root.addHandler(_penangan)
+    root.setLevel(level_root)
+    for nama, nilai in daftar_level_modul.items():
+        logging.getLogger(nama).setLevel(nilai)
+
+    _mulai_pendengar()
+
+
+os.register_at_fork(after_in_child=_mulai_pendengar)
+atexit.register(hentikan_pencatatan)
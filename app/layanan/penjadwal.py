@@ -0,0 +1,177 @@
+"""
+Modul penjadwal review di depan panggilan LLM.
+
+Membatasi jumlah panggilan LLM bersamaan per worker dan memilih
+giliran berikutnya berdasarkan:
+- kelas prioritas: interaktif didahulukan daripada massal,
+- penuaan: permintaan massal yang menunggu melebihi batas penuaan
+  diperlakukan seperti interaktif sehingga tidak kelaparan,
+- pembagian adil per klien: di dalam kelas yang sama, klien dengan
+  jatah layanan terkecil (waktu virtual) dilayani lebih dulu.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+pencatat = logging.getLogger(__name__)
+
+PRIORITAS_INTERAKTIF = "interaktif"
+PRIORITAS_MASSAL = "massal"
+PERINGKAT_PRIORITAS: dict[str, int] = {PRIORITAS_INTERAKTIF: 0, PRIORITAS_MASSAL: 1}
+
+
+@dataclass
+class _Penunggu:
+    """Satu permintaan yang menunggu giliran."""
+
+    klien: str
+    prioritas: str
+    waktu_masuk: float
+    giliran: asyncio.Future = field(repr=False)
+
+
+class PenjadwalReview:
+    """Penjadwal prioritas dan adil per klien untuk panggilan LLM."""
+
+    def __init__(self, maks_bersamaan: int = 2, batas_penuaan_detik: float = 30.0):
+        """
+        Inisialisasi penjadwal.
+
+        Parameter:
+            maks_bersamaan: Jumlah panggilan LLM bersamaan di worker ini
+            batas_penuaan_detik: Lama menunggu sebelum permintaan massal
+                dinaikkan setara interaktif
+        """
+        self.maks_bersamaan = maks_bersamaan
+        self.batas_penuaan_detik = batas_penuaan_detik
+        self.aktif = 0
+        self._penunggu: list[_Penunggu] = []
+        # Waktu virtual per klien: jumlah layanan yang sudah diterima
+        self._waktu_virtual: dict[str, float] = {}
+
+    def _waktu_virtual_klien(self, klien: str) -> float:
+        """
+        Waktu virtual klien; klien baru mulai dari minimum klien yang menunggu.
+
+        Klien baru tidak mendapat jatah borongan atas waktu ia tidak aktif.
+        """
+        if klien not in self._waktu_virtual:
+            menunggu = [self._waktu_virtual.get(p.klien, 0.0) for p in self._penunggu]
+            self._waktu_virtual[klien] = min(menunggu, default=0.0)
+        return self._waktu_virtual[klien]
+
+    def _peringkat(self, penunggu: _Penunggu, sekarang: float) -> int:
+        """Peringkat efektif setelah penuaan (lebih kecil = lebih dulu)."""
+        if sekarang - penunggu.waktu_masuk >= self.batas_penuaan_detik:
+            return PERINGKAT_PRIORITAS[PRIORITAS_INTERAKTIF]
+        return PERINGKAT_PRIORITAS[penunggu.prioritas]
+
+    def _pilih_berikutnya(self) -> _Penunggu:
+        """
+        Memilih penunggu berikutnya.
+
+        Urutan: peringkat efektif, waktu virtual klien, lalu waktu masuk.
+        Karena pembanding terakhir adalah waktu masuk, setiap klien
+        dilayani FIFO terhadap permintaannya sendiri.
+        """
+        sekarang = time.monotonic()
+        return min(
+            self._penunggu,
+            key=lambda p: (
+                self._peringkat(p, sekarang),
+                self._waktu_virtual_klien(p.klien),
+                p.waktu_masuk
+            )
+        )
+
+    def _mulai_layanan(self, klien: str) -> None:
+        """Mencatat satu layanan untuk klien."""
+        self.aktif += 1
+        self._waktu_virtual[klien] = self._waktu_virtual_klien(klien) + 1.0
+
+    def _bagikan_giliran(self) -> None:
+        """Memberi giliran ke penunggu selama masih ada slot kosong."""
+        while self._penunggu and self.aktif < self.maks_bersamaan:
+            penunggu = self._pilih_berikutnya()
+            self._penunggu.remove(penunggu)
+            if penunggu.giliran.done():
+                continue
+            self._mulai_layanan(penunggu.klien)
+            penunggu.giliran.set_result(None)
+
+        if not self._penunggu and not self.aktif:
+            # Tidak ada beban: reset agar waktu virtual tidak tumbuh tanpa batas
+            self._waktu_virtual.clear()
+
+    def _selesai(self) -> None:
+        """Melepas satu slot dan membagikan giliran berikutnya."""
+        self.aktif -= 1
+        self._bagikan_giliran()
+
+    @asynccontextmanager
+    async def giliran(self, klien: str, prioritas: str = PRIORITAS_INTERAKTIF) -> AsyncIterator[None]:
+        """
+        Menunggu giliran menjalankan satu panggilan LLM.
+
+        Parameter:
+            klien: Identitas klien untuk pembagian adil
+            prioritas: PRIORITAS_INTERAKTIF atau PRIORITAS_MASSAL
+
+        Pengecualian:
+            ValueError: Jika prioritas tidak dikenali
+        """
+        if prioritas not in PERINGKAT_PRIORITAS:
+            raise ValueError(f"Prioritas tidak dikenali: {prioritas}")
+
+        if self.aktif < self.maks_bersamaan and not self._penunggu:
+            self._mulai_layanan(klien)
+        else:
+            penunggu = _Penunggu(
+                klien=klien,
+                prioritas=prioritas,
+                waktu_masuk=time.monotonic(),
+                giliran=asyncio.get_running_loop().create_future()
+            )
+            self._waktu_virtual_klien(klien)
+            self._penunggu.append(penunggu)
+            try:
+                await penunggu.giliran
+            except asyncio.CancelledError:
+                if penunggu in self._penunggu:
+                    self._penunggu.remove(penunggu)
+                elif penunggu.giliran.done() and not penunggu.giliran.cancelled():
+                    # Giliran sudah diberikan tepat sebelum dibatalkan
+                    self._selesai()
+                raise
+            pencatat.debug(
+                "Giliran %s untuk klien %s setelah %.2f detik",
+                prioritas, klien, time.monotonic() - penunggu.waktu_masuk
+            )
+
+        try:
+            yield
+        finally:
+            self._selesai()
+
+    def status(self) -> dict[str, Any]:
+        """
+        Ringkasan antrean penjadwal.
+
+        Mengembalikan:
+            Dictionary jumlah aktif dan penunggu per prioritas serta per klien
+        """
+        per_prioritas = {prioritas: 0 for prioritas in PERINGKAT_PRIORITAS}
+        per_klien: dict[str, int] = {}
+        for penunggu in self._penunggu:
+            per_prioritas[penunggu.prioritas] += 1
+            per_klien[penunggu.klien] = per_klien.get(penunggu.klien, 0) + 1
+        return {
+            "aktif": self.aktif,
+            "maks_bersamaan": self.maks_bersamaan,
+            "menunggu": per_prioritas,
+            "menunggu_per_klien": per_klien
+        }
@@ -0,0 +1,231 @@
+"""
+Modul profiling permintaan lambat.
+
+Profil cProfile direkam hanya untuk permintaan yang memintanya (mode
+debug atau header rahasia), lalu disimpan ke disk hanya bila durasinya
+melewati ambang. Berkas `.prof` dapat dibuka dengan `python -m pstats`
+atau snakeviz.
+"""
+
+import cProfile
+import functools
+import inspect
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from app.layanan.pelacakan import id_permintaan_aktif
+
+pencatat = logging.getLogger(__name__)
+
+profil_diminta: ContextVar[bool] = ContextVar("profil_diminta", default=False)
+
+# <waktu_ms>_<nama>_<durasi>ms_<id_permintaan>.prof
+POLA_BERKAS_PROFIL = re.compile(r"^(\d+)_([\w.]+)_(\d+)ms_([\w-]*)\.prof$")
+
+
+class PenyimpanProfil:
+    """Menyimpan profil terakhir ke direktori dengan batas jumlah dan ukuran."""
+
+    def __init__(self, direktori: str, maks_profil: int = 20, maks_byte: int = 50 * 1024 * 1024):
+        """
+        Inisialisasi penyimpan profil.
+
+        Parameter:
+            direktori: Direktori tujuan berkas .prof
+            maks_profil: Jumlah profil terbaru yang dipertahankan
+            maks_byte: Total ukuran maksimal seluruh profil
+        """
+        self.direktori = Path(direktori)
+        self.direktori.mkdir(parents=True, exist_ok=True)
+        self.maks_profil = maks_profil
+        self.maks_byte = maks_byte
+        self._kunci = threading.Lock()
+
+    def simpan(self, profil: cProfile.Profile, nama: str, durasi_ms: float, id_permintaan: str) -> str:
+        """
+        Menulis profil lalu menghapus profil tertua di luar batas.
+
+        Parameter:
+            profil: Profil yang sudah dihentikan
+            nama: Nama tahap yang diprofil
+            durasi_ms: Durasi tahap
+            id_permintaan: ID permintaan pemilik profil
+
+        Mengembalikan:
+            ID profil (nama berkas)
+        """
+        id_aman = re.sub(r"[^\w-]", "", id_permintaan)[:64]
+        id_profil = f"{time.time_ns() // 1_000_000}_{nama}_{int(durasi_ms)}ms_{id_aman}.prof"
+        with self._kunci:
+            profil.dump_stats(str(self.direktori / id_profil))
+            self._pangkas()
+        return id_profil
+
+    def _pangkas(self) -> None:
+        """Menghapus profil tertua sampai jumlah dan ukurannya dalam batas."""
+        daftar = sorted(self.direktori.glob("*.prof"), key=lambda jalur: jalur.name, reverse=True)
+        total_byte = 0
+        for urutan, jalur in enumerate(daftar):
+            try:
+                total_byte += jalur.stat().st_size
+                if urutan >= self.maks_profil or total_byte > self.maks_byte:
+                    jalur.unlink()
+            except FileNotFoundError:
+                # Dipangkas bersamaan oleh worker lain
+                continue
+
+    def daftar(self) -> list[dict[str, Any]]:
+        """
+        Mengambil daftar profil tersimpan, terbaru lebih dulu.
+
+        Mengembalikan:
+            List dictionary berisi id, nama, durasi_ms, id_permintaan,
+            ukuran_byte, dan dibuat_pada (epoch ms)
+        """
+        hasil: list[dict[str, Any]] = []
+        for jalur in sorted(self.direktori.glob("*.prof"), key=lambda jalur: jalur.name, reverse=True):
+            cocok = POLA_BERKAS_PROFIL.match(jalur.name)
+            if cocok is None:
+                continue
+            try:
+                ukuran_byte = jalur.stat().st_size
+            except FileNotFoundError:
+                continue
+            hasil.append({
+                "id": jalur.name,
+                "nama": cocok.group(2),
+                "durasi_ms": int(cocok.group(3)),
+                "id_permintaan": cocok.group(4),
+                "ukuran_byte": ukuran_byte,
+                "dibuat_pada": int(cocok.group(1)),
+            })
+        return hasil
+
+    def jalur(self, id_profil: str) -> Optional[Path]:
+        """
+        Mengambil jalur berkas profil.
+
+        Parameter:
+            id_profil: ID profil dari daftar()
+
+        Mengembalikan:
+            Path berkas, atau None bila ID tidak valid atau sudah terhapus
+        """
+        if POLA_BERKAS_PROFIL.match(id_profil) is None:
+            return None
+        jalur = self.direktori / id_profil
+        return jalur if jalur.is_file() else None
+
+
+class Pemrofil:
+    """
+    Perekam profil untuk tahap yang dibungkus dengan rekam()/diprofil.
+
+    Sejak Python 3.12 cProfile hanya dapat aktif satu per proses, sehingga
+    hanya satu tahap yang diprofil pada satu waktu; tahap lain (termasuk
+    tahap bersarang di asyncio.to_thread) berjalan tanpa profil. Profil di
+    thread event loop juga memuat coroutine permintaan lain yang berjalan
+    bersamaan, tetapi tidak memuat kerja di thread lain.
+    """
+
+    def __init__(self, penyimpan: Optional[PenyimpanProfil] = None, ambang_ms: float = 5000.0):
+        """
+        Inisialisasi pemrofil.
+
+        Parameter:
+            penyimpan: Penyimpan profil (None = profiling nonaktif)
+            ambang_ms: Durasi minimal agar profil disimpan
+        """
+        self._penyimpan = penyimpan
+        self.ambang_ms = ambang_ms
+        self._kunci_aktif = threading.Lock()
+
+    @property
+    def penyimpan(self) -> Optional[PenyimpanProfil]:
+        """Penyimpan profil aktif (None bila profiling nonaktif)."""
+        return self._penyimpan
+
+    def atur_penyimpan(self, penyimpan: Optional[PenyimpanProfil], ambang_ms: Optional[float] = None) -> None:
+        """
+        Mengganti penyimpan profil.
+
+        Parameter:
+            penyimpan: Penyimpan baru, atau None untuk menonaktifkan
+            ambang_ms: Ambang durasi baru (None = tetap)
+        """
+        self._penyimpan = penyimpan
+        if ambang_ms is not None:
+            self.ambang_ms = ambang_ms
+
+    @contextmanager
+    def rekam(self, nama: str) -> Iterator[None]:
+        """
+        Memprofil blok bila permintaan aktif meminta profiling.
+
+        Parameter:
+            nama: Nama tahap (bagian dari ID profil)
+        """
+        penyimpan = self._penyimpan
+        if penyimpan is None or not profil_diminta.get() or not self._kunci_aktif.acquire(blocking=False):
+            yield
+            return
+
+        profil = cProfile.Profile()
+        try:
+            profil.enable()
+        except ValueError as e:
+            # Profiler lain (debugger, coverage) sudah aktif di proses ini
+            self._kunci_aktif.release()
+            pencatat.warning("Profil %s dilewati: %s", nama, e)
+            yield
+            return
+
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            profil.disable()
+            self._kunci_aktif.release()
+            durasi_ms = (time.perf_counter() - mulai) * 1000
+            if durasi_ms >= self.ambang_ms:
+                try:
+                    id_profil = penyimpan.simpan(profil, nama, durasi_ms, id_permintaan_aktif.get())
+                    pencatat.info("Profil %s (%.0f ms) disimpan: %s", nama, durasi_ms, id_profil)
+                except OSError as e:
+                    pencatat.warning("Gagal menyimpan profil %s: %s", nama, e)
+
+
+pemrofil = Pemrofil()
+
+
+def diprofil(nama: str) -> Callable:
+    """
+    Dekorator untuk memprofil fungsi (sinkron maupun async).
+
+    Parameter:
+        nama: Nama tahap
+
+    Mengembalikan:
+        Dekorator fungsi
+    """
+    def dekorator(fungsi: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fungsi):
+            @functools.wraps(fungsi)
+            async def pembungkus_async(*args: Any, **kwargs: Any) -> Any:
+                with pemrofil.rekam(nama):
+                    return await fungsi(*args, **kwargs)
+            return pembungkus_async
+
+        @functools.wraps(fungsi)
+        def pembungkus(*args: Any, **kwargs: Any) -> Any:
+            with pemrofil.rekam(nama):
+                return fungsi(*args, **kwargs)
+        return pembungkus
+
+    return dekorator
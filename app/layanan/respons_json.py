@@ -0,0 +1,62 @@
+"""
+Modul respons JSON berbasis orjson.
+
+Berisi kelas respons yang menyerialisasi dengan orjson dan penanda
+JsonMentah untuk potongan JSON yang sudah jadi (mis. baris riwayat
+yang disusun SQLite), sehingga potongan itu masuk ke body apa adanya
+tanpa json.loads lalu json.dumps ulang.
+"""
+
+from typing import Any, Union
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class JsonMentah:
+    """Potongan JSON yang sudah terserialisasi dan diteruskan apa adanya."""
+
+    __slots__ = ("isi",)
+
+    def __init__(self, isi: Union[str, bytes]):
+        """
+        Inisialisasi potongan JSON mentah.
+
+        Parameter:
+            isi: Teks JSON yang valid (tidak divalidasi ulang)
+        """
+        self.isi = isi.encode() if isinstance(isi, str) else isi
+
+
+def _bawaan(nilai: Any) -> Any:
+    """Serialisasi tipe yang tidak dikenal orjson."""
+    if isinstance(nilai, JsonMentah):
+        return orjson.Fragment(nilai.isi)
+    if isinstance(nilai, BaseModel):
+        return nilai.model_dump(mode="json")
+    raise TypeError(f"Tipe {type(nilai).__name__} tidak dapat diserialisasi ke JSON")
+
+
+def serialisasi_json(nilai: Any) -> bytes:
+    """
+    Menyerialisasi nilai ke JSON UTF-8 dengan orjson.
+
+    Parameter:
+        nilai: Nilai yang diserialisasi; boleh memuat JsonMentah dan model Pydantic
+
+    Mengembalikan:
+        Bytes JSON
+
+    Pengecualian:
+        TypeError: Jika nilai memuat tipe yang tidak dapat diserialisasi
+    """
+    return orjson.dumps(nilai, default=_bawaan, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ResponsJson(JSONResponse):
+    """JSONResponse yang menyerialisasi dengan orjson dan mendukung JsonMentah."""
+
+    def render(self, content: Any) -> bytes:
+        """Menyerialisasi isi respons."""
+        return serialisasi_json(content)
@@ -0,0 +1,159 @@
+"""
+Modul review inkremental untuk revisi proposal.
+
+Teks proposal dipecah per bagian (latar belakang, rumusan masalah,
+tujuan, metode, luaran) berdasarkan judulnya. Sidik (hash) tiap bagian
+dibandingkan dengan versi terakhir yang tersimpan sehingga hanya aspek
+yang bagiannya berubah yang perlu dinilai ulang oleh LLM.
+"""
+
+import hashlib
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.agen.pengurai_respons import ASPEK_SKOR
+
+pencatat = logging.getLogger(__name__)
+
+BAGIAN_LAINNYA = "lainnya"
+
+# Dicocokkan berurutan: aspek yang lebih spesifik lebih dulu
+KATA_KUNCI_ASPEK: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("formulasi_masalah", ("rumusan masalah", "perumusan masalah", "identifikasi masalah", "permasalahan")),
+    ("luaran", ("luaran", "target luaran", "hasil yang diharapkan")),
+    ("metodologi", ("metode", "metodologi", "tahapan pelaksanaan")),
+    ("tujuan", ("tujuan",)),
+    ("latar_belakang", ("latar belakang", "pendahuluan")),
+)
+
+# Penomoran judul: "#", "BAB II", "1.2", "1.", "A."
+POLA_PENOMORAN_JUDUL = re.compile(
+    r"^(?:#{1,6}\s+|bab\s+[ivxlc\d]+\.?\s*:?\s+|\d+(?:\.\d+)*\.?\s+|[a-h]\.\s+)",
+    re.IGNORECASE
+)
+# Hanya penomoran ini yang pasti judul; "1." dan "a." bisa berupa butir daftar
+POLA_JUDUL_TEGAS = re.compile(r"^(?:#{1,6}\s+|bab\s+[ivxlc\d]+|\d+\.\d+)", re.IGNORECASE)
+MAKS_PANJANG_JUDUL = 80
+
+
+@dataclass
+class RencanaRevisi:
+    """Rencana review untuk satu unggahan yang terhubung ke kunci proposal."""
+
+    bagian: dict[str, str]
+    sidik: dict[str, str]
+    # None = review penuh; daftar kosong = tidak ada aspek yang berubah
+    aspek_berubah: Optional[list[str]] = None
+    versi_sebelumnya: Optional[dict[str, Any]] = field(default=None, repr=False)
+
+
+def _aspek_judul(baris: str) -> Optional[str]:
+    """
+    Mengenali baris judul dan aspek yang diwakilinya.
+
+    Parameter:
+        baris: Satu baris teks yang sudah dirapikan
+
+    Mengembalikan:
+        Nama aspek, BAGIAN_LAINNYA untuk judul bernomor lain, atau None
+        jika baris bukan judul
+    """
+    if not baris or len(baris) > MAKS_PANJANG_JUDUL or baris.endswith((".", ",", ";")):
+        return None
+
+    penomoran = POLA_PENOMORAN_JUDUL.match(baris)
+    judul = baris[penomoran.end():] if penomoran else baris
+    judul = judul.strip(" :").lower()
+    for aspek, daftar_kata in KATA_KUNCI_ASPEK:
+        if any(judul.startswith(kata) or (penomoran and kata in judul) for kata in daftar_kata):
+            return aspek
+    return BAGIAN_LAINNYA if POLA_JUDUL_TEGAS.match(baris) else None
+
+
+def pecah_bagian(teks: str) -> dict[str, str]:
+    """
+    Memecah teks proposal menjadi bagian per aspek penilaian.
+
+    Teks di bawah judul yang tidak terkait aspek (tinjauan pustaka,
+    jadwal, anggaran) dikumpulkan di BAGIAN_LAINNYA.
+
+    Parameter:
+        teks: Teks proposal hasil ekstraksi
+
+    Mengembalikan:
+        Dictionary aspek -> teks bagian (hanya bagian yang ditemukan)
+    """
+    isi: dict[str, list[str]] = {}
+    aktif = BAGIAN_LAINNYA
+    for baris in teks.splitlines():
+        baris = baris.strip()
+        aspek = _aspek_judul(baris)
+        if aspek is not None:
+            aktif = aspek
+        if baris:
+            isi.setdefault(aktif, []).append(baris)
+    return {aspek: "\n".join(daftar_baris) for aspek, daftar_baris in isi.items()}
+
+
+def sidik_bagian(bagian: dict[str, str]) -> dict[str, str]:
+    """
+    Menghitung sidik tiap bagian; perbedaan spasi diabaikan.
+
+    Parameter:
+        bagian: Hasil pecah_bagian
+
+    Mengembalikan:
+        Dictionary aspek -> hash SHA-256 (heksadesimal)
+    """
+    return {
+        aspek: hashlib.sha256(" ".join(teks.split()).encode("utf-8")).hexdigest()
+        for aspek, teks in bagian.items()
+    }
+
+
+def rencanakan_revisi(
+    teks: str,
+    jenis_proposal: str,
+    versi_sebelumnya: Optional[dict[str, Any]]
+) -> RencanaRevisi:
+    """
+    Menentukan aspek yang perlu dinilai ulang terhadap versi sebelumnya.
+
+    Review penuh dilakukan bila belum ada versi sebelumnya, jenis
+    proposal berbeda, review sebelumnya tanpa detail skor, atau ada
+    aspek yang bagiannya tidak dapat dikenali di salah satu versi.
+
+    Parameter:
+        teks: Teks proposal versi baru
+        jenis_proposal: Jenis proposal versi baru
+        versi_sebelumnya: Hasil DatabaseRiwayat.ambil_versi_terakhir (atau None)
+
+    Mengembalikan:
+        RencanaRevisi
+    """
+    bagian = pecah_bagian(teks)
+    rencana = RencanaRevisi(bagian=bagian, sidik=sidik_bagian(bagian), versi_sebelumnya=versi_sebelumnya)
+    if versi_sebelumnya is None:
+        return rencana
+
+    review = versi_sebelumnya["review"]
+    sidik_lama = versi_sebelumnya["sidik_bagian"]
+    if review["jenis_proposal"] != jenis_proposal:
+        pencatat.info("Jenis proposal berubah, review penuh")
+        return rencana
+    if not review.get("detail_skor"):
+        pencatat.info("Review sebelumnya tanpa detail skor, review penuh")
+        return rencana
+    tidak_dikenali = [aspek for aspek in ASPEK_SKOR if aspek not in rencana.sidik or aspek not in sidik_lama]
+    if tidak_dikenali:
+        pencatat.info("Bagian tidak dikenali (%s), review penuh", ', '.join(tidak_dikenali))
+        return rencana
+
+    rencana.aspek_berubah = [aspek for aspek in ASPEK_SKOR if rencana.sidik[aspek] != sidik_lama[aspek]]
+    pencatat.info(
+        "Revisi terhadap versi %s: aspek berubah %s",
+        versi_sebelumnya["versi"], rencana.aspek_berubah or "tidak ada"
+    )
+    return rencana
@@ -0,0 +1,139 @@
+"""
+Modul tenggat (deadline) per permintaan review.
+
+Satu objek Tenggat dibuat di awal review lalu diteruskan ke setiap
+tahap (ekstraksi, panggilan LLM). Setiap tahap memakai sisa waktunya
+sebagai batas, sehingga pekerjaan berhenti begitu klien (atau nginx)
+sudah tidak menunggu. Tenggat juga dapat dibatalkan lebih awal saat
+klien memutus koneksi.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Optional, TypeVar
+
+from app.pengecualian import TenggatHabis
+
+pencatat = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+KODE_TENGGAT_HABIS = "TENGGAT_HABIS"
+KODE_KLIEN_TERPUTUS = "KLIEN_TERPUTUS"
+
+
+class Tenggat:
+    """Batas waktu absolut satu permintaan review."""
+
+    def __init__(self, batas_detik: Optional[float] = None):
+        """
+        Inisialisasi tenggat.
+
+        Parameter:
+            batas_detik: Lama waktu sejak sekarang (None atau <= 0 = tanpa batas)
+        """
+        self.batas_detik = batas_detik if batas_detik and batas_detik > 0 else None
+        self._akhir = None if self.batas_detik is None else time.monotonic() + self.batas_detik
+        self.alasan_batal: Optional[str] = None
+        self._sinyal_batal: Optional[asyncio.Event] = None
+
+    def sisa(self) -> Optional[float]:
+        """Sisa waktu dalam detik (0 bila dibatalkan), atau None jika tanpa batas."""
+        if self.alasan_batal is not None:
+            return 0.0
+        if self._akhir is None:
+            return None
+        return max(0.0, self._akhir - time.monotonic())
+
+    @property
+    def habis(self) -> bool:
+        """True jika tenggat lewat atau dibatalkan."""
+        return self.sisa() == 0.0
+
+    def batas_waktu(self, bawaan: float) -> float:
+        """
+        Timeout untuk satu operasi: bawaan, dipangkas ke sisa tenggat.
+
+        Parameter:
+            bawaan: Timeout operasi bila tenggat masih longgar
+
+        Mengembalikan:
+            Timeout dalam detik
+        """
+        sisa = self.sisa()
+        return bawaan if sisa is None else min(bawaan, sisa)
+
+    def _event_batal(self) -> asyncio.Event:
+        """Event yang diset saat tenggat dibatalkan (dibuat di event loop yang berjalan)."""
+        if self._sinyal_batal is None:
+            self._sinyal_batal = asyncio.Event()
+            if self.alasan_batal is not None:
+                self._sinyal_batal.set()
+        return self._sinyal_batal
+
+    def batalkan(self, alasan: str = KODE_KLIEN_TERPUTUS) -> None:
+        """
+        Mengakhiri tenggat lebih awal (mis. klien memutus koneksi).
+
+        Parameter:
+            alasan: Kode alasan yang dibawa TenggatHabis
+        """
+        if self.alasan_batal is not None:
+            return
+        self.alasan_batal = alasan
+        if self._sinyal_batal is not None:
+            self._sinyal_batal.set()
+
+    def _galat(self, tahap: str) -> TenggatHabis:
+        """Membuat pengecualian untuk tahap yang terhenti."""
+        if self.alasan_batal == KODE_KLIEN_TERPUTUS:
+            pesan = "Klien memutus koneksi sebelum review selesai."
+        else:
+            pesan = (
+                f"Review melewati batas waktu {self.batas_detik:g} detik. "
+                "Silakan coba lagi dengan mode cepat atau dokumen yang lebih pendek."
+            )
+        pencatat.warning("Review dihentikan pada tahap %s: %s", tahap, self.alasan_batal or KODE_TENGGAT_HABIS)
+        return TenggatHabis(pesan=pesan, kode=self.alasan_batal or KODE_TENGGAT_HABIS, tahap=tahap)
+
+    def periksa(self, tahap: str) -> None:
+        """
+        Memastikan masih ada waktu sebelum memulai sebuah tahap.
+
+        Parameter:
+            tahap: Nama tahap untuk pesan dan log
+
+        Pengecualian:
+            TenggatHabis: Jika tenggat lewat atau dibatalkan
+        """
+        if self.habis:
+            raise self._galat(tahap)
+
+    async def batasi(self, aw: Awaitable[T], tahap: str) -> T:
+        """
+        Menjalankan pekerjaan dan membatalkannya bila tenggat habis lebih dulu.
+
+        Parameter:
+            aw: Coroutine atau future pekerjaan
+            tahap: Nama tahap untuk pesan dan log
+
+        Mengembalikan:
+            Hasil pekerjaan
+
+        Pengecualian:
+            TenggatHabis: Jika tenggat lewat atau dibatalkan sebelum pekerjaan selesai
+        """
+        tugas = asyncio.ensure_future(aw)
+        sinyal = asyncio.ensure_future(self._event_batal().wait())
+        try:
+            if not self.habis:
+                await asyncio.wait({tugas, sinyal}, timeout=self.sisa(), return_when=asyncio.FIRST_COMPLETED)
+            if not tugas.done():
+                raise self._galat(tahap)
+            return tugas.result()
+        finally:
+            sinyal.cancel()
+            if not tugas.done():
+                tugas.cancel()
+                await asyncio.gather(tugas, return_exceptions=True)
@@ -44,3 +44,35 @@ class BatasUkuranTerlampaui(PengecualianDasar):
     """Pengecualian untuk file yang melebihi batas ukuran."""
 
     pass
+
+
+class KapasitasPenuh(PengecualianDasar):
+    """Pengecualian untuk server yang sedang penuh (antrean review terisi)."""
+
+    def __init__(self, pesan: str, kode: str | None = None, coba_lagi_detik: int = 5):
+        """
+        Inisialisasi pengecualian kapasitas penuh.
+
+        Parameter:
+            pesan: Pesan kesalahan
+            kode: Kode kesalahan (opsional)
+            coba_lagi_detik: Saran jeda sebelum klien mencoba lagi (Retry-After)
+        """
+        super().__init__(pesan, kode)
+        self.coba_lagi_detik = coba_lagi_detik
+
+
+class TenggatHabis(PengecualianDasar):
+    """Pengecualian untuk review yang melewati tenggat atau ditinggal klien."""
+
+    def __init__(self, pesan: str, kode: str | None = None, tahap: str = ""):
+        """
+        Inisialisasi pengecualian tenggat habis.
+
+        Parameter:
+            pesan: Pesan kesalahan
+            kode: TENGGAT_HABIS atau KLIEN_TERPUTUS
+            tahap: Tahap review saat tenggat habis (ekstraksi, llm, ...)
+        """
+        super().__init__(pesan, kode)
+        self.tahap = tahap
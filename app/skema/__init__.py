@@ -7,14 +7,24 @@ data input dan output API.
 
 from app.skema.model import (
     HasilEvaluasi,
+    InfoDuplikat,
     JenisProposal,
+    ModeReview,
+    PenggunaanLLM,
+    PerbandinganRevisi,
     PermintaanReview,
+    PrioritasReview,
     ResponReview,
 )
 
 __all__ = [
     "JenisProposal",
+    "ModeReview",
+    "PrioritasReview",
     "PermintaanReview",
     "HasilEvaluasi",
+    "PenggunaanLLM",
+    "PerbandinganRevisi",
+    "InfoDuplikat",
     "ResponReview",
 ]
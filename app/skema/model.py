@@ -19,6 +19,21 @@ class JenisProposal(str, Enum):
     HIBAH = "hibah"
 
 
+class ModeReview(str, Enum):
+    """Enum untuk mode review: lengkap (model besar), cepat (triase), atau konsisten (beberapa sampel)."""
+
+    LENGKAP = "lengkap"
+    CEPAT = "cepat"
+    KONSISTEN = "konsisten"
+
+
+class PrioritasReview(str, Enum):
+    """Enum untuk kelas prioritas review: interaktif atau massal (batch)."""
+
+    INTERAKTIF = "interaktif"
+    MASSAL = "massal"
+
+
 class PermintaanReview(BaseModel):
     """Model untuk permintaan review proposal."""
 
@@ -92,6 +107,105 @@ class HasilEvaluasi(BaseModel):
         ...,
         description="Ringkasan evaluasi"
     )
+    keyakinan: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description="Kesepakatan skor antar sampel pada mode konsisten (0-1)"
+    )
+
+
+class PenggunaanLLM(BaseModel):
+    """Model untuk penggunaan token dan latensi satu panggilan LLM."""
+
+    model: Optional[str] = Field(
+        default=None,
+        description="Model yang menghasilkan review"
+    )
+    token_prompt: Optional[int] = Field(
+        default=None,
+        description="Jumlah token prompt"
+    )
+    token_penyelesaian: Optional[int] = Field(
+        default=None,
+        description="Jumlah token keluaran (completion)"
+    )
+    token_total: Optional[int] = Field(
+        default=None,
+        description="Jumlah total token"
+    )
+    waktu_antrean_detik: Optional[float] = Field(
+        default=None,
+        description="Waktu antre di sisi penyedia (detik)"
+    )
+    waktu_total_detik: Optional[float] = Field(
+        default=None,
+        description="Waktu pemrosesan total di sisi penyedia (detik)"
+    )
+    latensi_ms: Optional[float] = Field(
+        default=None,
+        description="Latensi panggilan yang diukur aplikasi (milidetik)"
+    )
+
+
+class PerbandinganRevisi(BaseModel):
+    """Model untuk perbandingan review sebuah revisi dengan versi sebelumnya."""
+
+    kunci_proposal: str = Field(
+        ...,
+        description="Kunci yang menghubungkan revisi proposal yang sama"
+    )
+    versi: int = Field(
+        ...,
+        description="Nomor versi unggahan ini"
+    )
+    versi_sebelumnya: Optional[int] = Field(
+        default=None,
+        description="Nomor versi pembanding (None untuk versi pertama)"
+    )
+    review_id_sebelumnya: Optional[int] = Field(
+        default=None,
+        description="ID review versi pembanding"
+    )
+    aspek_dinilai_ulang: list[str] = Field(
+        default_factory=list,
+        description="Aspek yang dinilai ulang oleh LLM"
+    )
+    skor_sebelumnya: Optional[int] = Field(
+        default=None,
+        description="Skor total versi pembanding"
+    )
+    skor_sekarang: int = Field(
+        ...,
+        description="Skor total versi ini"
+    )
+    detail_skor_sebelumnya: Optional[DetailSkor] = Field(
+        default=None,
+        description="Detail skor versi pembanding"
+    )
+
+
+class InfoDuplikat(BaseModel):
+    """Model untuk review lama yang teksnya hampir identik dengan unggahan."""
+
+    review_id: int = Field(
+        ...,
+        description="ID review lama yang paling mirip"
+    )
+    nama_berkas: str = Field(
+        ...,
+        description="Nama berkas review lama"
+    )
+    kemiripan: float = Field(
+        ...,
+        ge=0,
+        le=1,
+        description="Perkiraan kemiripan Jaccard teks (0-1)"
+    )
+    dipakai_ulang: bool = Field(
+        default=False,
+        description="Apakah hasil evaluasi review lama dipakai ulang tanpa LLM"
+    )
 
 
 class ResponReview(BaseModel):
@@ -109,3 +223,15 @@ class ResponReview(BaseModel):
         default=None,
         description="Data hasil evaluasi"
     )
+    penggunaan: Optional[PenggunaanLLM] = Field(
+        default=None,
+        description="Penggunaan token dan latensi LLM"
+    )
+    revisi: Optional[PerbandinganRevisi] = Field(
+        default=None,
+        description="Perbandingan dengan versi sebelumnya (jika kunci proposal diisi)"
+    )
+    duplikat: Optional[InfoDuplikat] = Field(
+        default=None,
+        description="Review lama yang hampir identik (jika ditemukan)"
+    )
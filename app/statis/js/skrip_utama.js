@@ -11,6 +11,8 @@
 const UKURAN_MAKS_MB = 10;
 const EKSTENSI_DIDUKUNG = [".pdf", ".docx"];
 const API_BASE_URL = "/api";
+// Percobaan ulang saat server dimulai ulang (503 SEDANG_DIKURAS)
+const MAKS_COBA_ULANG_KURAS = 3;
 
 // ============================================
 // STATE
@@ -277,14 +279,40 @@ async function submitReview(e) {
     const formData = new FormData();
     formData.append("berkas", berkasYangDipilih);
     formData.append("jenis_proposal", jenisProposal);
+    formData.append(
+      "mode",
+      document.getElementById("modeReview")?.value || "lengkap"
+    );
+    const kunciProposal = document
+      .getElementById("kunciProposal")
+      ?.value.trim();
+    if (kunciProposal) {
+      formData.append("kunci_proposal", kunciProposal);
+    }
 
-    // Submit ke API
-    const response = await fetch(`${API_BASE_URL}/review`, {
-      method: "POST",
-      body: formData,
-    });
-
-    const result = await response.json();
+    // Submit ke API; bila worker sedang dimulai ulang, lanjutkan dari checkpoint
+    let response;
+    let result;
+    for (let percobaan = 0; ; percobaan++) {
+      response = await fetch(`${API_BASE_URL}/review`, {
+        method: "POST",
+        body: formData,
+      });
+      result = await response.json();
+
+      if (
+        response.status !== 503 ||
+        result.kode !== "SEDANG_DIKURAS" ||
+        percobaan >= MAKS_COBA_ULANG_KURAS
+      ) {
+        break;
+      }
+      if (result.id_checkpoint) {
+        formData.set("id_checkpoint", result.id_checkpoint);
+      }
+      const jeda = Number(response.headers.get("Retry-After")) || 1;
+      await new Promise((selesai) => setTimeout(selesai, jeda * 1000));
+    }
 
     if (!response.ok) {
       throw new Error(result.detail || "Terjadi kesalahan");
@@ -292,7 +320,7 @@ async function submitReview(e) {
 
     // Tampilkan hasil
     if (result.berhasil && result.data) {
-      tampilkanHasil(result.data);
+      tampilkanHasil(result.data, result.revisi);
     } else {
       throw new Error(result.pesan || "Review gagal");
     }
@@ -311,8 +339,9 @@ async function submitReview(e) {
 /**
  * Tampilkan hasil evaluasi.
  * @param {object} hasil - Objek hasil evaluasi
+ * @param {object} [revisi] - Perbandingan dengan versi sebelumnya
  */
-function tampilkanHasil(hasil) {
+function tampilkanHasil(hasil, revisi = null) {
   const hasilContainer = document.getElementById("hasilContainer");
   if (!hasilContainer) return;
 
@@ -323,9 +352,18 @@ function tampilkanHasil(hasil) {
   if (skorNilai) skorNilai.textContent = hasil.skor;
   if (skorBar) skorBar.style.width = `${hasil.skor}%`;
 
+  // Keyakinan hanya ada pada mode konsisten
+  const skorLabel = document.getElementById("skorLabel");
+  if (skorLabel) {
+    skorLabel.textContent =
+      hasil.keyakinan != null
+        ? `Skor Total dari 100 (keyakinan ${Math.round(hasil.keyakinan * 100)}%)`
+        : "Skor Total dari 100";
+  }
+
   // Update detail skor jika ada
   if (hasil.detail_skor) {
-    updateDetailSkor(hasil.detail_skor);
+    updateDetailSkor(hasil.detail_skor, revisi?.detail_skor_sebelumnya);
   }
 
   // Update kekuatan
@@ -353,8 +391,9 @@ function tampilkanHasil(hasil) {
 /**
  * Update detail skor cards.
  * @param {object} detailSkor - Objek detail skor
+ * @param {object} [detailSebelumnya] - Detail skor versi sebelumnya
  */
-function updateDetailSkor(detailSkor) {
+function updateDetailSkor(detailSkor, detailSebelumnya = null) {
   const detailGrid = document.getElementById("detailSkorGrid");
   if (!detailGrid) return;
 
@@ -370,12 +409,16 @@ function updateDetailSkor(detailSkor) {
   for (const [key, value] of Object.entries(detailSkor)) {
     const label = aspekLabels[key] || key;
     const persen = (value / 20) * 100;
+    const sebelumnya =
+      detailSebelumnya && key in detailSebelumnya
+        ? ` <small>(sebelumnya ${detailSebelumnya[key]})</small>`
+        : "";
 
     html += `
             <div class="detail-card">
                 <div class="detail-card-header">
                     <span class="detail-card-title">${label}</span>
-                    <span class="detail-card-skor">${value}/20</span>
+                    <span class="detail-card-skor">${value}/20${sebelumnya}</span>
                 </div>
                 <div class="detail-bar">
                     <div class="detail-bar-fill" style="width: ${persen}%"></div>
@@ -5,58 +5,313 @@ Modul utama yang menangani routing dan
 endpoint API untuk review proposal.
 """
 
+import asyncio
+import dataclasses
+import json
 import logging
 import os
+import secrets
+import signal
 import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional
+from urllib.parse import parse_qs
 
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
 from fastapi.templating import Jinja2Templates
 
+from app import WAKTU_MULAI_IMPOR
+from app.agen.agen_peninjau import AgenPeninjauProposal
+from app.agen.pengurai_respons import ASPEK_SKOR
+from app.agen.penyedia_llm import PengarahPenyedia, PenyediaLLM
 from app.konfigurasi import dapatkan_pengaturan
 from app.layanan.pemuat_dokumen import PemuatDokumen
+from app.layanan.cache_http import (
+    CACHE_CONTROL_API,
+    CACHE_CONTROL_ASET_BERSIDIK,
+    PARAMETER_SIDIK,
+    PetaAset,
+    belum_diubah_sejak,
+    buat_etag,
+    etag_cocok,
+    waktu_http_stabil,
+)
 from app.layanan.database_riwayat import DatabaseRiwayat
+from app.layanan.indeks_duplikat import buat_tanda
+from app.layanan.kontrol_penerimaan import KontrolPenerimaan
+from app.layanan.memori import PenjagaRss, ke_mb, lacak_memori_permintaan, rss_byte, ukur_memori
+from app.layanan.mesin_pdf import PemilihMesinPdf
+from app.layanan.penjadwal import PenjadwalReview
+from app.layanan.persiapan import LaporanStartup, panaskan_modul
+from app.layanan.respons_json import JsonMentah, ResponsJson
+from app.layanan.profil import PenyimpanProfil, diprofil, pemrofil, profil_diminta
+from app.layanan.revisi_proposal import RencanaRevisi, rencanakan_revisi
+from app.layanan.tenggat import KODE_KLIEN_TERPUTUS, Tenggat
+from app.layanan.pencatatan import pasang_pencatatan
+from app.layanan.pelacakan import (
+    PengeksporBerkas,
+    id_permintaan_aktif,
+    pelacak,
+)
 from app.pengecualian import (
     BatasUkuranTerlampaui,
     DokumenTidakValid,
     FormatTidakDidukung,
     GagalMemproses,
+    KapasitasPenuh,
+    TenggatHabis,
+)
+from app.skema.model import (
+    HasilEvaluasi,
+    InfoDuplikat,
+    JenisProposal,
+    ModeReview,
+    PenggunaanLLM,
+    PerbandinganRevisi,
+    PrioritasReview,
+    ResponReview,
 )
-from app.skema.model import HasilEvaluasi, JenisProposal, ResponReview
 
-# Konfigurasi logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Konfigurasi logging (ditulis thread pendengar, bukan event loop)
+_pengaturan_log = dapatkan_pengaturan()
+pasang_pencatatan(
+    level=_pengaturan_log.level_log,
+    level_modul=_pengaturan_log.level_log_modul,
+    format_log=_pengaturan_log.format_log,
+    sampel_debug=_pengaturan_log.sampel_log_debug
 )
 pencatat = logging.getLogger(__name__)
 
+# Diisi saat impor selesai dan saat lifespan setiap worker
+laporan_startup = LaporanStartup()
+
+
+def _pasang_sinyal_kuras():
+    """
+    Memulai pengurasan worker saat SIGTERM diterima.
+
+    Penangan sinyal server (uvicorn) tetap dipanggil sehingga worker
+    berhenti menerima koneksi baru seperti biasa, sedangkan review yang
+    sedang berjalan diberi waktu sampai BATAS_KURAS_DETIK.
+
+    Mengembalikan:
+        Penangan SIGTERM sebelumnya untuk dipulihkan, atau None jika tidak dipasang
+    """
+    sebelumnya = signal.getsignal(signal.SIGTERM)
+    # Tanpa penangan server (mis. TestClient), SIGTERM dibiarkan menghentikan proses
+    if threading.current_thread() is not threading.main_thread() or not callable(sebelumnya):
+        return None
+
+    loop = asyncio.get_running_loop()
+
+    def tangani(nomor_sinyal, frame):
+        loop.call_soon_threadsafe(kontrol_penerimaan.mulai_kuras, pengaturan.batas_kuras_detik)
+        sebelumnya(nomor_sinyal, frame)
+
+    signal.signal(signal.SIGTERM, tangani)
+    return sebelumnya
+
+
+@asynccontextmanager
+async def siklus_hidup(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Menyiapkan worker sebelum menerima permintaan dan membereskannya saat berhenti.
+
+    Dijalankan di setiap worker setelah fork, sehingga aman dengan
+    `gunicorn --preload`: skema SQLite dan klien HTTP bersama dibuat di
+    sini, bukan saat modul diimpor oleh proses induk. Pemanasan modul
+    dan templat justru dilakukan saat impor (lihat akhir modul).
+
+    Parameter:
+        app: Aplikasi FastAPI
+    """
+    mulai = time.perf_counter()
+    validasi_konfigurasi()
+
+    laporan_startup.dimuat_sebelum_fork = os.getpid() != laporan_startup.pid
+    laporan_startup.pid = os.getpid()
+    database_riwayat.siapkan()
+
+    if pengaturan.tracemalloc_aktif:
+        tracemalloc.start()
+
+    penangan_sebelumnya = _pasang_sinyal_kuras()
+    await pengarah_penyedia.buka()
+    if pengaturan.pemanasan_penyedia_aktif:
+        laporan_startup.pemanasan_penyedia_ms = await pengarah_penyedia.panaskan()
+
+    laporan_startup.durasi_persiapan_ms = round((time.perf_counter() - mulai) * 1000, 2)
+    pencatat.info(
+        f"Worker {laporan_startup.pid} siap dalam {laporan_startup.total_ms} ms "
+        f"(impor {laporan_startup.durasi_impor_ms} ms"
+        f"{' di proses induk' if laporan_startup.dimuat_sebelum_fork else ''}, "
+        f"persiapan {laporan_startup.durasi_persiapan_ms} ms)"
+    )
+    try:
+        yield
+    finally:
+        if penangan_sebelumnya is not None:
+            signal.signal(signal.SIGTERM, penangan_sebelumnya)
+        await pengarah_penyedia.tutup()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
 # Inisialisasi aplikasi
 aplikasi = FastAPI(
     title="AI Proposal Reviewer",
     description="API untuk meninjau proposal akademik menggunakan AI (Groq/Llama 3.3) | Developed by Viona Rahmadani (23076080)",
-    version="1.1.0"
+    version="1.1.0",
+    lifespan=siklus_hidup,
+    default_response_class=ResponsJson
 )
 
 # Dapatkan direktori aplikasi
 DIREKTORI_APP = Path(__file__).parent
 
+
+
+class BerkasStatis(StaticFiles):
+    """StaticFiles yang menandai aset bersidik isi sebagai immutable."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Menambahkan Cache-Control sesuai ada tidaknya sidik isi di URL."""
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            bersidik = PARAMETER_SIDIK in parse_qs(scope.get("query_string", b"").decode())
+            response.headers["Cache-Control"] = CACHE_CONTROL_ASET_BERSIDIK if bersidik else CACHE_CONTROL_API
+        return response
+
+
 # Setup static files & templates
 aplikasi.mount(
     "/statis",
-    StaticFiles(directory=str(DIREKTORI_APP / "statis")),
+    BerkasStatis(directory=str(DIREKTORI_APP / "statis")),
     name="statis"
 )
+peta_aset = PetaAset(DIREKTORI_APP / "statis")
 templat = Jinja2Templates(directory=str(DIREKTORI_APP / "templat"))
+templat.env.globals["url_aset"] = peta_aset.url
 
 # Inisialisasi layanan
 pengaturan = dapatkan_pengaturan()
 
-# Validasi konfigurasi saat startup
-@aplikasi.on_event("startup")
-async def validasi_konfigurasi():
+if pengaturan.jejak_aktif:
+    pelacak.atur_pengekspor(PengeksporBerkas(pengaturan.jalur_berkas_jejak))
+
+if pengaturan.mode_debug or pengaturan.rahasia_profil:
+    pemrofil.atur_penyimpan(
+        PenyimpanProfil(
+            pengaturan.direktori_profil,
+            maks_profil=pengaturan.maks_profil,
+            maks_byte=pengaturan.maks_profil_mb * 1024 * 1024
+        ),
+        ambang_ms=pengaturan.ambang_profil_ms
+    )
+
+# Header berisi RAHASIA_PROFIL untuk memprofil permintaan dan membuka /api/profil
+HEADER_PROFIL = "X-Profil"
+
+
+def _rahasia_profil_cocok(request: Request) -> bool:
+    """True jika header X-Profil berisi rahasia profil yang dikonfigurasi."""
+    rahasia = pengaturan.rahasia_profil
+    return bool(rahasia) and secrets.compare_digest(
+        request.headers.get(HEADER_PROFIL, "").encode(), rahasia.encode()
+    )
+
+
+def _ukuran_konten(request: Request) -> int:
+    """Ukuran dari header Content-Length; 0 (tidak diketahui) bila kosong atau rusak."""
+    try:
+        return max(int(request.headers.get("content-length") or 0), 0)
+    except ValueError:
+        return 0
+
+
+# Middleware yang didaftarkan lebih dulu berada di lapisan dalam, sehingga
+# penolakan 503 tetap tercatat di rentang dan membawa X-Request-ID.
+@aplikasi.middleware("http")
+async def kendalikan_penerimaan(request: Request, call_next):
+    """
+    Membatasi review yang berjalan bersamaan sebelum unggahan dibaca.
+
+    Permintaan ke /api/review menunggu di antrean pendek bila kapasitas
+    penuh, lalu ditolak dengan 503 + Retry-After bila tetap penuh.
+    """
+    if request.method != "POST" or request.url.path != "/api/review":
+        return await call_next(request)
+
+    ukuran_byte = _ukuran_konten(request)
+    try:
+        async with kontrol_penerimaan.izin(ukuran_byte):
+            return await call_next(request)
+    except KapasitasPenuh as e:
+        return ResponsJson(
+            status_code=503,
+            content={"detail": e.pesan, "kode": e.kode},
+            headers={"Retry-After": str(e.coba_lagi_detik)}
+        )
+
+
+# Jalur ringan yang tidak diberi sampel RSS (dua bacaan /proc per permintaan)
+JALUR_TANPA_SAMPEL_MEMORI = ("/statis/", "/api/kesehatan", "/api/kesiapan")
+
+
+@aplikasi.middleware("http")
+async def lacak_permintaan(request: Request, call_next):
+    """
+    Memberi ID pada setiap permintaan dan membungkusnya dalam rentang.
+
+    ID diambil dari header X-Request-ID bila ada, lalu dipropagasikan
+    ke log dan dikembalikan pada header respons.
+    """
+    id_permintaan = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = id_permintaan_aktif.set(id_permintaan)
+    token_profil = profil_diminta.set(pengaturan.mode_debug or _rahasia_profil_cocok(request))
+    sampel_memori = not request.url.path.startswith(JALUR_TANPA_SAMPEL_MEMORI)
+    try:
+        with pelacak.rentang(
+            "http.permintaan",
+            metode=request.method,
+            jalur=request.url.path
+        ) as rentang:
+            if sampel_memori:
+                with lacak_memori_permintaan() as catatan_memori:
+                    response = await call_next(request)
+                rentang.atur_atribut("rss_awal_mb", ke_mb(catatan_memori.rss_awal))
+                rentang.atur_atribut("rss_puncak_mb", ke_mb(catatan_memori.rss_puncak))
+            else:
+                response = await call_next(request)
+            rentang.atur_atribut("status_http", response.status_code)
+        response.headers["X-Request-ID"] = id_permintaan
+        # RSS saat ini, bukan puncak: puncak dapat berasal dari lonjakan
+        # sesaat (atau permintaan lain) yang memorinya sudah dilepas
+        if sampel_memori and not kontrol_penerimaan.dikuras and penjaga_rss.periksa(rss_byte()):
+            # Gunicorn/systemd menjalankan worker pengganti; review yang
+            # sedang berjalan diselesaikan lewat pengurasan SIGTERM
+            os.kill(os.getpid(), signal.SIGTERM)
+        return response
+    finally:
+        profil_diminta.reset(token_profil)
+        id_permintaan_aktif.reset(token)
+
+
+# Didaftarkan terakhir agar menjadi lapisan terluar
+if pengaturan.ukuran_min_kompresi_byte > 0:
+    aplikasi.add_middleware(GZipMiddleware, minimum_size=pengaturan.ukuran_min_kompresi_byte)
+
+
+def validasi_konfigurasi():
     """Validasi konfigurasi saat aplikasi startup."""
     pencatat.info("Memulai validasi konfigurasi...")
     
@@ -67,13 +322,80 @@ async def validasi_konfigurasi():
     if not pengaturan.groq_api_key.startswith("gsk_"):
         pencatat.warning("GROQ_API_KEY tidak memiliki format yang benar")
     
-    pencatat.info(f"API Endpoint: {pengaturan.groq_api_endpoint}")
-    pencatat.info(f"Model: {pengaturan.groq_model}")
-    pencatat.info(f"Max file size: {pengaturan.ukuran_maks_berkas_mb} MB")
+    pencatat.info("API Endpoint: %s", pengaturan.groq_api_endpoint)
+    pencatat.info("Model: %s", pengaturan.groq_model)
+    pencatat.info("Max file size: %s MB", pengaturan.ukuran_maks_berkas_mb)
     pencatat.info("Konfigurasi valid ✓")
 
-pemuat_dokumen = PemuatDokumen(ukuran_maks_mb=pengaturan.ukuran_maks_berkas_mb)
-database_riwayat = DatabaseRiwayat()
+
+def buat_pengarah_penyedia() -> PengarahPenyedia:
+    """
+    Membuat pengarah penyedia LLM dari pengaturan.
+
+    Penyedia utama adalah Groq; penyedia cadangan ditambahkan bila
+    LLM_CADANGAN_ENDPOINT diisi.
+
+    Mengembalikan:
+        Instance PengarahPenyedia yang dipakai bersama oleh semua permintaan
+    """
+    daftar_penyedia = [
+        PenyediaLLM(
+            "groq",
+            pengaturan.groq_api_endpoint,
+            pengaturan.groq_model,
+            api_key=pengaturan.groq_api_key,
+            model_cepat=pengaturan.groq_model_cepat or None
+        )
+    ]
+    if pengaturan.llm_cadangan_endpoint:
+        daftar_penyedia.append(PenyediaLLM(
+            "cadangan",
+            pengaturan.llm_cadangan_endpoint,
+            pengaturan.llm_cadangan_model or pengaturan.groq_model,
+            api_key=pengaturan.llm_cadangan_api_key
+        ))
+        pencatat.info("Penyedia LLM cadangan: %s", pengaturan.llm_cadangan_endpoint)
+
+    return PengarahPenyedia(
+        daftar_penyedia,
+        ambang_p95_ms=pengaturan.ambang_p95_penyedia_ms,
+        ambang_laju_galat=pengaturan.ambang_laju_galat_penyedia,
+        lindung_nilai_aktif=pengaturan.lindung_nilai_aktif,
+        tunda_lindung_nilai_ms=pengaturan.tunda_lindung_nilai_ms
+    )
+
+
+pemuat_dokumen = PemuatDokumen(
+    ukuran_maks_mb=pengaturan.ukuran_maks_berkas_mb,
+    normalisasi=pengaturan.normalisasi_teks_aktif,
+    mesin_pdf=pengaturan.mesin_pdf,
+    inspeksi_awal=pengaturan.inspeksi_awal_aktif,
+    maks_halaman=pengaturan.maks_halaman_dokumen
+)
+# Skema dibuat di lifespan (atau kueri pertama), bukan saat impor
+database_riwayat = DatabaseRiwayat(siapkan=False)
+pengarah_penyedia = buat_pengarah_penyedia()
+kontrol_penerimaan = KontrolPenerimaan(
+    maks_aktif=pengaturan.maks_review_aktif_per_worker,
+    maks_antrean=pengaturan.maks_antrean_review,
+    maks_tunggu_detik=pengaturan.maks_tunggu_antrean_detik,
+    maks_byte_tertunda=pengaturan.maks_byte_tertunda_mb * 1024 * 1024,
+    maks_aktif_global=pengaturan.maks_review_aktif_global,
+    maks_byte_tertunda_global=pengaturan.maks_byte_tertunda_global_mb * 1024 * 1024,
+    direktori_slot=pengaturan.direktori_slot_review
+)
+penjadwal_review = PenjadwalReview(
+    maks_bersamaan=pengaturan.maks_llm_bersamaan_per_worker,
+    batas_penuaan_detik=pengaturan.batas_penuaan_antrean_detik
+)
+penjaga_rss = PenjagaRss(pengaturan.batas_rss_mb)
+
+# Header opsional untuk identitas klien pada penjadwalan adil
+HEADER_KLIEN = "X-Klien-ID"
+# Jeda bila pemantau koneksi menerima pesan selain http.disconnect
+INTERVAL_CEK_PEMUTUSAN_DETIK = 0.5
+# Status nginx untuk klien yang menutup koneksi sebelum respons dikirim
+STATUS_KLIEN_TERPUTUS = 499
 
 
 @aplikasi.get("/", response_class=HTMLResponse)
@@ -94,52 +416,233 @@ async def halaman_utama(request: Request) -> HTMLResponse:
     )
 
 
+def _bandingkan_revisi(
+    kunci_proposal: str,
+    review_id: int,
+    rencana: RencanaRevisi,
+    hasil: HasilEvaluasi
+) -> PerbandinganRevisi | None:
+    """
+    Mencatat versi baru sebuah proposal dan menyusun perbandingannya.
+
+    Parameter:
+        kunci_proposal: Kunci revisi proposal
+        review_id: ID review versi ini
+        rencana: Rencana revisi yang dipakai saat review
+        hasil: Hasil evaluasi versi ini
+
+    Mengembalikan:
+        PerbandinganRevisi, atau None jika versi gagal dicatat
+    """
+    try:
+        versi = database_riwayat.simpan_versi_proposal(kunci_proposal, review_id, rencana.sidik)
+    except Exception as e:
+        pencatat.warning("Gagal mencatat versi proposal: %s", e)
+        return None
+
+    sebelumnya = rencana.versi_sebelumnya
+    review_lama = sebelumnya["review"] if sebelumnya else None
+    return PerbandinganRevisi(
+        kunci_proposal=kunci_proposal,
+        versi=versi,
+        versi_sebelumnya=sebelumnya["versi"] if sebelumnya else None,
+        review_id_sebelumnya=sebelumnya["review_id"] if sebelumnya else None,
+        aspek_dinilai_ulang=list(ASPEK_SKOR) if rencana.aspek_berubah is None else rencana.aspek_berubah,
+        skor_sebelumnya=review_lama["skor"] if review_lama else None,
+        skor_sekarang=hasil.skor,
+        detail_skor_sebelumnya=review_lama["detail_skor"] or None if review_lama else None
+    )
+
+
+async def _pantau_pemutusan(request: Request, tenggat: Tenggat) -> None:
+    """
+    Membatalkan tenggat review bila klien memutus koneksi.
+
+    Badan permintaan sudah dibaca saat endpoint berjalan, sehingga pesan
+    ASGI berikutnya hanyalah http.disconnect. Request.is_disconnected()
+    tidak dipakai karena tidak melihat pemutusan di balik middleware http.
+
+    Parameter:
+        request: Request HTTP yang sedang diproses
+        tenggat: Tenggat review yang dibatalkan
+    """
+    while not tenggat.habis:
+        pesan = await request.receive()
+        if pesan["type"] == "http.disconnect":
+            pencatat.warning("Klien memutus koneksi, review dihentikan")
+            tenggat.batalkan(KODE_KLIEN_TERPUTUS)
+            return
+        await asyncio.sleep(INTERVAL_CEK_PEMUTUSAN_DETIK)
+
+
+def _cari_duplikat(
+    tanda: list[int] | None,
+    jenis_proposal: str,
+    boleh_pakai_ulang: bool
+) -> tuple[InfoDuplikat | None, HasilEvaluasi | None]:
+    """
+    Mencari review lama yang hampir identik dengan unggahan.
+
+    Parameter:
+        tanda: Tanda MinHash teks unggahan (None jika teks kosong)
+        jenis_proposal: Jenis proposal unggahan
+        boleh_pakai_ulang: False bila unggahan dinilai ulang sebagian lewat jalur revisi
+
+    Mengembalikan:
+        Tuple (info duplikat, hasil evaluasi lama yang dipakai ulang);
+        keduanya None jika tidak ada yang cukup mirip
+    """
+    if tanda is None:
+        return None, None
+    try:
+        daftar_mirip = database_riwayat.cari_review_mirip(tanda, pengaturan.ambang_duplikat)
+    except Exception as e:
+        pencatat.warning("Gagal mencari proposal mirip: %s", e)
+        return None, None
+    if not daftar_mirip:
+        return None, None
+
+    # Review berjenis sama didahulukan karena hanya itu yang boleh dipakai ulang
+    terdekat = next(
+        (item for item in daftar_mirip if item["jenis_proposal"] == jenis_proposal),
+        daftar_mirip[0]
+    )
+    info = InfoDuplikat(
+        review_id=terdekat["review_id"],
+        nama_berkas=terdekat["nama_berkas"],
+        kemiripan=round(terdekat["kemiripan"], 3)
+    )
+    pencatat.info(
+        "Proposal hampir identik dengan review ID %s (kemiripan %.2f)",
+        info.review_id, info.kemiripan
+    )
+
+    ambang_pakai_ulang = pengaturan.ambang_pakai_ulang_duplikat
+    if (
+        not boleh_pakai_ulang
+        or ambang_pakai_ulang <= 0
+        or terdekat["kemiripan"] < ambang_pakai_ulang
+        or terdekat["jenis_proposal"] != jenis_proposal
+    ):
+        return info, None
+
+    review_lama = database_riwayat.ambil_review_berdasarkan_id(info.review_id)
+    if review_lama is None:
+        return info, None
+    info.dipakai_ulang = True
+    return info, HasilEvaluasi(
+        skor=review_lama["skor"],
+        detail_skor=review_lama["detail_skor"] or None,
+        daftar_kekuatan=review_lama["daftar_kekuatan"],
+        daftar_kelemahan=review_lama["daftar_kelemahan"],
+        daftar_saran=review_lama["daftar_saran"],
+        ringkasan=review_lama["ringkasan"]
+    )
+
+
 @aplikasi.post("/api/review", response_model=ResponReview)
+@diprofil("review")
 async def review_proposal(
-    berkas: UploadFile = File(..., description="File proposal (PDF/DOCX)"),
-    jenis_proposal: JenisProposal = Form(..., description="Jenis proposal")
-) -> ResponReview:
+    request: Request,
+    berkas: UploadFile | None = File(None, description="File proposal (PDF/DOCX)"),
+    jenis_proposal: JenisProposal = Form(..., description="Jenis proposal"),
+    mode: ModeReview = Form(ModeReview.LENGKAP, description="Mode review (lengkap/cepat/konsisten)"),
+    prioritas: PrioritasReview = Form(
+        PrioritasReview.INTERAKTIF,
+        description="Kelas prioritas (interaktif/massal untuk unggahan batch)"
+    ),
+    kunci_proposal: str | None = Form(
+        None,
+        max_length=200,
+        description="Kunci proposal; unggahan dengan kunci sama dianggap revisi"
+    ),
+    id_checkpoint: str | None = Form(
+        None,
+        max_length=64,
+        description="ID checkpoint dari respons 503 SEDANG_DIKURAS untuk melanjutkan review"
+    )
+) -> ResponReview | ResponsJson:
     """
     Endpoint untuk melakukan review proposal.
 
     Parameter:
+        request: Request HTTP (untuk identitas klien)
         berkas: File proposal yang akan direview
         jenis_proposal: Jenis proposal (pkm/skripsi/hibah)
+        mode: Mode review; "cepat" memakai model kecil lebih dulu,
+            "konsisten" menggabungkan beberapa sampel paralel
+        prioritas: Kelas prioritas penjadwalan panggilan LLM
+        kunci_proposal: Kunci revisi; bila diisi, hanya aspek yang
+            bagiannya berubah dari versi sebelumnya yang dinilai ulang
+        id_checkpoint: Bila diisi, teks diambil dari checkpoint review
+            yang terputus saat worker dikuras; berkas boleh dikosongkan
 
     Mengembalikan:
-        ResponReview berisi hasil evaluasi
+        ResponReview berisi hasil evaluasi, atau 503 berisi id_checkpoint
+        bila worker dikuras sebelum review selesai
     """
-    pencatat.info(f"Menerima permintaan review: {berkas.filename}")
+    checkpoint: dict | None = None
+    if id_checkpoint:
+        checkpoint = database_riwayat.ambil_checkpoint(id_checkpoint)
+        if checkpoint is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Checkpoint review tidak ditemukan atau sudah kedaluwarsa"
+            )
+        nama_berkas = checkpoint["nama_berkas"]
+        ekstensi = Path(nama_berkas).suffix.lower()
+    else:
+        # Validasi filename
+        if berkas is None or not berkas.filename:
+            raise HTTPException(
+                status_code=400,
+                detail="Nama file tidak valid"
+            )
+        nama_berkas = berkas.filename
 
-    # Validasi filename
-    if not berkas.filename:
-        raise HTTPException(
-            status_code=400,
-            detail="Nama file tidak valid"
-        )
+        # Validasi tipe file
+        ekstensi = Path(nama_berkas).suffix.lower()
+        if ekstensi not in PemuatDokumen.EKSTENSI_DIDUKUNG:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Format file tidak didukung: {ekstensi}"
+            )
 
-    # Validasi tipe file
-    ekstensi = Path(berkas.filename).suffix.lower()
-    if ekstensi not in PemuatDokumen.EKSTENSI_DIDUKUNG:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Format file tidak didukung: {ekstensi}"
-        )
+    pencatat.info(
+        "Menerima permintaan review: %s%s",
+        nama_berkas, f" (lanjutan checkpoint {id_checkpoint})" if checkpoint else ""
+    )
 
     jalur_sementara: str | None = None
+    teks_proposal = ""
+    ukuran_berkas: int | None = None
+    tenggat = Tenggat(pengaturan.tenggat_review_detik)
+    pemantau = asyncio.create_task(_pantau_pemutusan(request, tenggat))
 
     try:
-        # Simpan file sementara
-        with tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=ekstensi
-        ) as berkas_sementara:
-            konten = await berkas.read()
-            berkas_sementara.write(konten)
-            jalur_sementara = berkas_sementara.name
-
-        # Muat dan proses dokumen
-        teks_proposal = await pemuat_dokumen.muat(jalur_sementara)
+        if checkpoint is not None:
+            teks_proposal = checkpoint["teks"]
+            ukuran_berkas = checkpoint["ukuran_berkas"]
+        else:
+            assert berkas is not None
+            # Simpan file sementara
+            with pelacak.rentang("review.unggah", nama_berkas=nama_berkas) as rentang, ukur_memori("unggah"):
+                with tempfile.NamedTemporaryFile(
+                    delete=False,
+                    suffix=ekstensi
+                ) as berkas_sementara:
+                    konten = await berkas.read()
+                    berkas_sementara.write(konten)
+                    jalur_sementara = berkas_sementara.name
+                ukuran_berkas = len(konten)
+                # Jangan tahan salinan unggahan selama ekstraksi dan panggilan LLM
+                del konten
+                rentang.atur_atribut("ukuran_berkas", ukuran_berkas)
+
+            # Muat dan proses dokumen
+            with pelacak.rentang("review.ekstraksi") as rentang:
+                teks_proposal = await pemuat_dokumen.muat(jalur_sementara, tenggat)
+                rentang.atur_atribut("jumlah_karakter", len(teks_proposal))
 
         # Cek apakah Groq API dikonfigurasi
         if not pengaturan.groq_api_key:
@@ -169,78 +672,274 @@ async def review_proposal(
             )
 
         # Inisialisasi agent dan lakukan review
-        from app.agen.agen_peninjau import AgenPeninjauProposal
-
         agen = AgenPeninjauProposal(
             api_key=pengaturan.groq_api_key,
             api_endpoint=pengaturan.groq_api_endpoint,
-            model=pengaturan.groq_model
+            model=pengaturan.groq_model,
+            mode_keluaran=pengaturan.mode_keluaran_llm,
+            maks_item_daftar=pengaturan.maks_item_daftar,
+            maks_karakter_butir=pengaturan.maks_karakter_butir,
+            maks_karakter_ringkasan=pengaturan.maks_karakter_ringkasan,
+            maks_token_keluaran=pengaturan.maks_token_keluaran or None,
+            ambang_karakter_cepat=pengaturan.ambang_karakter_cepat,
+            pengarah=pengarah_penyedia,
+            jumlah_sampel=pengaturan.jumlah_sampel_konsisten,
+            toleransi_sampel=pengaturan.toleransi_sampel_konsisten,
+            tenggat=tenggat,
+            laju_token_per_detik=pengaturan.laju_token_keluaran_per_detik
         )
-        hasil = await agen.tinjau(teks_proposal, jenis_proposal.value)
+        klien = request.headers.get(HEADER_KLIEN) or (request.client.host if request.client else "anonim")
 
-        # Format respons
-        hasil_evaluasi = HasilEvaluasi(**hasil)
-        
-        # Simpan ke database riwayat
-        try:
-            ukuran_berkas = len(konten) if 'konten' in locals() else None
-            review_id = database_riwayat.simpan_review(
-                nama_berkas=berkas.filename,
+        rencana: RencanaRevisi | None = None
+        if kunci_proposal:
+            with pelacak.rentang("review.revisi", kunci_proposal=kunci_proposal) as rentang:
+                rencana = rencanakan_revisi(
+                    teks_proposal,
+                    jenis_proposal.value,
+                    database_riwayat.ambil_versi_terakhir(kunci_proposal)
+                )
+                rentang.atur_atribut(
+                    "aspek_berubah",
+                    None if rencana.aspek_berubah is None else ",".join(rencana.aspek_berubah)
+                )
+
+        tanda: list[int] | None = None
+        duplikat: InfoDuplikat | None = None
+        hasil_lama: HasilEvaluasi | None = None
+        if pengaturan.deteksi_duplikat_aktif:
+            with pelacak.rentang("review.duplikat") as rentang:
+                tanda = buat_tanda(teks_proposal)
+                # Review inkremental revisi lebih diutamakan daripada pakai ulang
+                duplikat, hasil_lama = _cari_duplikat(
+                    tanda,
+                    jenis_proposal.value,
+                    boleh_pakai_ulang=rencana is None or rencana.aspek_berubah is None
+                )
+                rentang.atur_atribut("review_id_mirip", duplikat.review_id if duplikat else None)
+                rentang.atur_atribut("dipakai_ulang", hasil_lama is not None)
+
+        if hasil_lama is not None:
+            hasil_evaluasi = hasil_lama
+            # Tanpa panggilan LLM: token NULL agar tidak ikut dirata-rata
+            penggunaan = PenggunaanLLM()
+        else:
+            with pelacak.rentang(
+                "review.llm",
                 jenis_proposal=jenis_proposal.value,
-                hasil=hasil_evaluasi,
-                ukuran_berkas=ukuran_berkas
-            )
-            pencatat.info(f"Review disimpan dengan ID: {review_id}")
+                mode=mode.value,
+                prioritas=prioritas.value
+            ) as rentang:
+                async def jalankan_llm() -> dict:
+                    mulai_antre = time.perf_counter()
+                    async with penjadwal_review.giliran(klien, prioritas.value):
+                        rentang.atur_atribut("waktu_antre_ms", round((time.perf_counter() - mulai_antre) * 1000, 2))
+                        if rencana is not None and rencana.versi_sebelumnya and rencana.aspek_berubah is not None:
+                            return await agen.tinjau_revisi(
+                                {aspek: rencana.bagian[aspek] for aspek in rencana.aspek_berubah},
+                                rencana.versi_sebelumnya["review"],
+                                jenis_proposal.value,
+                                mode=mode.value
+                            )
+                        return await agen.tinjau(teks_proposal, jenis_proposal.value, mode=mode.value)
+
+                # Waktu antre penjadwal ikut dihitung dalam tenggat review; saat
+                # worker dikuras, panggilan LLM juga dihentikan di tenggat kuras
+                hasil = await kontrol_penerimaan.selesaikan_sebelum_kuras(
+                    tenggat.batasi(jalankan_llm(), "llm")
+                )
+
+            hasil_evaluasi = HasilEvaluasi(**hasil)
+            penggunaan = agen.penggunaan_terakhir
+
+        # Simpan ke database riwayat. Tidak dibatalkan oleh tenggat: token LLM
+        # sudah terpakai, dan hasilnya dapat dipakai ulang lewat deteksi duplikat
+        try:
+            sisa_tenggat = tenggat.sisa()
+            with pelacak.rentang(
+                "review.simpan",
+                sisa_tenggat_ms=None if sisa_tenggat is None else round(sisa_tenggat * 1000)
+            ):
+                review_id = database_riwayat.simpan_review(
+                    nama_berkas=nama_berkas,
+                    jenis_proposal=jenis_proposal.value,
+                    hasil=hasil_evaluasi,
+                    ukuran_berkas=ukuran_berkas,
+                    penggunaan=penggunaan
+                )
+            pencatat.info("Review disimpan dengan ID: %s", review_id)
         except Exception as e:
-            pencatat.warning(f"Gagal menyimpan riwayat: {str(e)}")
-        
+            review_id = None
+            pencatat.warning("Gagal menyimpan riwayat: %s", e)
+
+        if tanda is not None and review_id is not None:
+            try:
+                database_riwayat.simpan_tanda_minhash(review_id, tanda)
+            except Exception as e:
+                pencatat.warning("Gagal menyimpan tanda MinHash: %s", e)
+
+        if checkpoint is not None and id_checkpoint:
+            try:
+                database_riwayat.hapus_checkpoint(id_checkpoint)
+            except Exception as e:
+                pencatat.warning("Gagal menghapus checkpoint: %s", e)
+
+        perbandingan = None
+        if rencana is not None and kunci_proposal and review_id is not None:
+            perbandingan = _bandingkan_revisi(kunci_proposal, review_id, rencana, hasil_evaluasi)
+
         return ResponReview(
             berhasil=True,
-            pesan="Review berhasil dilakukan",
-            data=hasil_evaluasi
+            pesan=(
+                "Review diambil dari proposal hampir identik"
+                if duplikat and duplikat.dipakai_ulang
+                else "Review berhasil dilakukan"
+            ),
+            data=hasil_evaluasi,
+            penggunaan=penggunaan,
+            revisi=perbandingan,
+            duplikat=duplikat
         )
 
     except (FormatTidakDidukung, BatasUkuranTerlampaui, DokumenTidakValid) as e:
-        pencatat.error(f"Kesalahan validasi: {e.pesan}")
+        pencatat.error("Kesalahan validasi: %s", e.pesan)
         raise HTTPException(status_code=400, detail=e.pesan)
     except GagalMemproses as e:
-        pencatat.error(f"Kesalahan pemrosesan: {e.pesan}")
+        pencatat.error("Kesalahan pemrosesan: %s", e.pesan)
         raise HTTPException(status_code=500, detail=e.pesan)
+    except TenggatHabis as e:
+        pencatat.error("Review dihentikan pada tahap %s: %s", e.tahap, e.kode)
+        raise HTTPException(
+            status_code=STATUS_KLIEN_TERPUTUS if e.kode == KODE_KLIEN_TERPUTUS else 504,
+            detail=e.pesan
+        )
+    except KapasitasPenuh as e:
+        # Worker dikuras sebelum LLM selesai: teks disimpan agar worker lain melanjutkan
+        konten_respons = {"detail": e.pesan, "kode": e.kode}
+        try:
+            if checkpoint is None:
+                id_checkpoint = uuid.uuid4().hex
+                database_riwayat.simpan_checkpoint(
+                    id_checkpoint, nama_berkas, teks_proposal, ukuran_berkas
+                )
+            konten_respons["id_checkpoint"] = id_checkpoint
+        except Exception as galat:
+            pencatat.warning("Gagal menyimpan checkpoint: %s", galat)
+        return ResponsJson(
+            status_code=503,
+            content=konten_respons,
+            headers={"Retry-After": str(e.coba_lagi_detik)}
+        )
     except Exception as e:
-        pencatat.error(f"Kesalahan internal: {str(e)}")
+        pencatat.error("Kesalahan internal: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Terjadi kesalahan saat memproses proposal"
         )
     finally:
+        pemantau.cancel()
         # Bersihkan file sementara
         if jalur_sementara and os.path.exists(jalur_sementara):
             os.unlink(jalur_sementara)
 
 
 @aplikasi.get("/api/kesehatan")
-async def cek_kesehatan() -> dict[str, str]:
+async def cek_kesehatan() -> dict:
     """
     Endpoint untuk health check.
 
     Mengembalikan:
-        Dict berisi status, versi, dan info aplikasi
+        Dict berisi status, versi, info aplikasi, dan kesehatan penyedia LLM
     """
     return {
         "status": "sehat",
         "versi": "1.1.0",
         "aplikasi": "AI Proposal Reviewer",
         "developer": "Viona Rahmadani (23076080)",
-        "deployment": "Microsoft Azure Cloud Platform"
+        "deployment": "Microsoft Azure Cloud Platform",
+        "penyedia_llm": pengarah_penyedia.status(),
+        "kapasitas_review": kontrol_penerimaan.status(),
+        "penjadwal_llm": penjadwal_review.status(),
+        "memori": penjaga_rss.status(),
+        "startup": {**dataclasses.asdict(laporan_startup), "total_ms": laporan_startup.total_ms}
     }
 
 
+@aplikasi.get("/api/kesiapan")
+async def cek_kesiapan() -> ResponsJson:
+    """
+    Endpoint readiness untuk load balancer.
+
+    Mengembalikan:
+        200 bila worker menerima review baru, 503 bila sedang dikuras
+    """
+    if kontrol_penerimaan.dikuras:
+        return ResponsJson(
+            status_code=503,
+            content={
+                "siap": False,
+                "kode": "SEDANG_DIKURAS",
+                "sisa_kuras_detik": round(kontrol_penerimaan.sisa_kuras_detik() or 0.0, 1)
+            }
+        )
+    return ResponsJson(content={"siap": True})
+
+
 # ============================================
 # ENDPOINTS RIWAYAT REVIEW
 # ============================================
 
+def _respons_tervalidasi(
+    request: Request,
+    etag: str,
+    buat_konten: Callable[[], Any],
+    last_modified: Optional[str] = None
+) -> Response:
+    """
+    Mengembalikan 304 bila validator klien masih cocok, selain itu JSON.
+
+    Konten baru dibuat (dan database baru dibaca) bila klien belum
+    memiliki versi terbaru.
+
+    Parameter:
+        request: Request HTTP (If-None-Match / If-Modified-Since)
+        etag: ETag isi respons saat ini
+        buat_konten: Fungsi pembuat isi respons
+        last_modified: Waktu perubahan terakhir (tanggal HTTP), opsional
+
+    Mengembalikan:
+        Response 304 tanpa body, atau ResponsJson dengan validator cache
+    """
+    header = {"ETag": etag, "Cache-Control": CACHE_CONTROL_API}
+    if last_modified:
+        header["Last-Modified"] = last_modified
+    if_none_match = request.headers.get("if-none-match")
+    if etag_cocok(if_none_match, etag) or (
+        if_none_match is None
+        and last_modified is not None
+        and belum_diubah_sejak(request.headers.get("if-modified-since"), last_modified)
+    ):
+        return Response(status_code=304, headers=header)
+    return ResponsJson(content=buat_konten(), headers=header)
+
+
+def _validator_riwayat(*kunci: object) -> tuple[str, Optional[str]]:
+    """
+    Membuat ETag dan Last-Modified dari penghitung perubahan riwayat.
+
+    Parameter:
+        kunci: Parameter permintaan yang ikut menentukan isi respons
+
+    Mengembalikan:
+        Tuple (ETag, Last-Modified); Last-Modified None bila riwayat
+        berubah pada detik ini
+    """
+    versi, diubah_pada = database_riwayat.ambil_versi_riwayat()
+    return buat_etag(aplikasi.version, versi, *kunci), waktu_http_stabil(diubah_pada)
+
+
 @aplikasi.get("/api/riwayat")
 async def ambil_riwayat(
+    request: Request,
     limit: int = 50,
     offset: int = 0
 ):
@@ -248,25 +947,29 @@ async def ambil_riwayat(
     Endpoint untuk mengambil riwayat review.
 
     Parameter:
+        request: Request HTTP (untuk validasi cache)
         limit: Jumlah maksimal record (default: 50)
         offset: Offset untuk pagination (default: 0)
 
     Mengembalikan:
-        List riwayat review
+        List riwayat review, atau 304 bila riwayat belum berubah
     """
     try:
-        riwayat = database_riwayat.ambil_semua_riwayat(limit, offset)
-        total = database_riwayat.hitung_total_review()
-        
-        return {
-            "berhasil": True,
-            "data": riwayat,
-            "total": total,
-            "limit": limit,
-            "offset": offset
-        }
+        etag, last_modified = _validator_riwayat("riwayat", limit, offset)
+        return _respons_tervalidasi(
+            request,
+            etag,
+            lambda: {
+                "berhasil": True,
+                "data": JsonMentah(database_riwayat.ambil_riwayat_json(limit, offset)),
+                "total": database_riwayat.hitung_total_review(),
+                "limit": limit,
+                "offset": offset
+            },
+            last_modified
+        )
     except Exception as e:
-        pencatat.error(f"Gagal mengambil riwayat: {str(e)}")
+        pencatat.error("Gagal mengambil riwayat: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Gagal mengambil riwayat review"
@@ -274,33 +977,38 @@ async def ambil_riwayat(
 
 
 @aplikasi.get("/api/riwayat/{review_id}")
-async def ambil_review(review_id: int):
+async def ambil_review(review_id: int, request: Request):
     """
     Endpoint untuk mengambil detail review berdasarkan ID.
 
     Parameter:
         review_id: ID review
+        request: Request HTTP (untuk validasi cache)
 
     Mengembalikan:
-        Detail review
+        Detail review, atau 304 bila riwayat belum berubah
     """
-    try:
-        review = database_riwayat.ambil_review_berdasarkan_id(review_id)
-        
-        if not review:
+    def buat_konten() -> dict:
+        review = database_riwayat.ambil_review_json(review_id)
+
+        if review is None:
             raise HTTPException(
                 status_code=404,
                 detail="Review tidak ditemukan"
             )
-        
+
         return {
             "berhasil": True,
-            "data": review
+            "data": JsonMentah(review)
         }
+
+    try:
+        etag, last_modified = _validator_riwayat("review", review_id)
+        return _respons_tervalidasi(request, etag, buat_konten, last_modified)
     except HTTPException:
         raise
     except Exception as e:
-        pencatat.error(f"Gagal mengambil review: {str(e)}")
+        pencatat.error("Gagal mengambil review: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Gagal mengambil detail review"
@@ -334,7 +1042,7 @@ async def hapus_review(review_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        pencatat.error(f"Gagal menghapus review: {str(e)}")
+        pencatat.error("Gagal menghapus review: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Gagal menghapus review"
@@ -342,21 +1050,29 @@ async def hapus_review(review_id: int):
 
 
 @aplikasi.get("/api/statistik")
-async def ambil_statistik():
+async def ambil_statistik(request: Request):
     """
     Endpoint untuk mengambil statistik review.
 
+    Parameter:
+        request: Request HTTP (untuk validasi cache)
+
     Mengembalikan:
-        Statistik review
+        Statistik review, atau 304 bila riwayat belum berubah
     """
     try:
-        statistik = database_riwayat.ambil_statistik()
-        return {
-            "berhasil": True,
-            "data": statistik
-        }
+        etag, last_modified = _validator_riwayat("statistik")
+        return _respons_tervalidasi(
+            request,
+            etag,
+            lambda: {
+                "berhasil": True,
+                "data": database_riwayat.ambil_statistik()
+            },
+            last_modified
+        )
     except Exception as e:
-        pencatat.error(f"Gagal mengambil statistik: {str(e)}")
+        pencatat.error("Gagal mengambil statistik: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Gagal mengambil statistik"
@@ -368,21 +1084,101 @@ async def ambil_statistik():
 # ============================================
 
 @aplikasi.get("/api/pengaturan")
-async def ambil_pengaturan():
+async def ambil_pengaturan(request: Request):
     """
     Endpoint untuk mengambil konfigurasi aplikasi.
 
+    Parameter:
+        request: Request HTTP (untuk validasi cache)
+
     Mengembalikan:
-        Konfigurasi aplikasi (tanpa API key)
+        Konfigurasi aplikasi (tanpa API key), atau 304 bila tidak berubah
     """
-    return {
+    konten = {
         "berhasil": True,
         "data": {
             "model": pengaturan.groq_model,
+            "model_cepat": pengaturan.groq_model_cepat,
             "endpoint": pengaturan.groq_api_endpoint,
+            "mode_keluaran_llm": pengaturan.mode_keluaran_llm,
             "ukuran_maks_mb": pengaturan.ukuran_maks_berkas_mb,
             "mode_debug": pengaturan.mode_debug,
             "api_key_tersedia": bool(pengaturan.groq_api_key)
         }
     }
+    etag = buat_etag(json.dumps(konten, sort_keys=True))
+    return _respons_tervalidasi(request, etag, lambda: konten)
+
+
+def _periksa_akses_profil(request: Request) -> PenyimpanProfil:
+    """
+    Memastikan permintaan boleh mengakses profil.
+
+    Bila RAHASIA_PROFIL diisi, header X-Profil wajib cocok; bila tidak,
+    profil hanya terbuka dalam mode debug.
+
+    Parameter:
+        request: Request HTTP
+
+    Mengembalikan:
+        Penyimpan profil aktif
+
+    Pengecualian:
+        HTTPException: 404 bila profiling nonaktif, 403 bila rahasia salah
+    """
+    penyimpan = pemrofil.penyimpan
+    if penyimpan is None:
+        raise HTTPException(status_code=404, detail="Profiling tidak aktif")
+    if pengaturan.rahasia_profil and not _rahasia_profil_cocok(request):
+        raise HTTPException(status_code=403, detail="Header X-Profil tidak valid")
+    return penyimpan
+
+
+@aplikasi.get("/api/profil")
+async def ambil_daftar_profil(request: Request):
+    """
+    Endpoint untuk mengambil daftar profil permintaan lambat.
+
+    Parameter:
+        request: Request HTTP (untuk header X-Profil)
+
+    Mengembalikan:
+        Daftar profil tersimpan, terbaru lebih dulu
+    """
+    penyimpan = _periksa_akses_profil(request)
+    return {
+        "berhasil": True,
+        "data": penyimpan.daftar(),
+        "ambang_ms": pemrofil.ambang_ms
+    }
+
+
+@aplikasi.get("/api/profil/{id_profil}")
+async def unduh_profil(id_profil: str, request: Request) -> FileResponse:
+    """
+    Endpoint untuk mengunduh satu profil (format pstats).
+
+    Parameter:
+        id_profil: ID profil dari /api/profil
+        request: Request HTTP (untuk header X-Profil)
+
+    Mengembalikan:
+        Berkas .prof untuk `python -m pstats` atau snakeviz
+    """
+    jalur = _periksa_akses_profil(request).jalur(id_profil)
+    if jalur is None:
+        raise HTTPException(status_code=404, detail="Profil tidak ditemukan")
+    return FileResponse(jalur, media_type="application/octet-stream", filename=id_profil)
+
+
+# Modul ekstraksi PDF (baru diimpor saat unggahan pertama) dan templat dimuat
+# saat impor, bukan di lifespan: dengan --preload ini terjadi sekali di proses
+# induk sebelum fork sehingga worker mewarisinya; tanpa --preload setiap worker
+# memuatnya sendiri sebelum menerima trafik
+_mesin_utama = PemilihMesinPdf(pengaturan.mesin_pdf).urutan()[:1]
+laporan_startup.modul_dipanaskan = panaskan_modul(
+    dict.fromkeys(["pypdf", *(mesin.modul for mesin in _mesin_utama)])
+)
+templat.get_template("indeks.html")
 
+laporan_startup.durasi_impor_ms = round((time.perf_counter() - WAKTU_MULAI_IMPOR) * 1000, 2)
@@ -52,10 +52,8 @@ fi
 
 print_step "🔄 Update AI Proposal Reviewer"
 
-# Step 1: Stop service
-print_info "Menghentikan aplikasi..."
-systemctl stop ${APP_NAME}
-print_success "Aplikasi dihentikan"
+# Aplikasi tetap berjalan selama update; worker diganti di langkah terakhir
+PERLU_RESTART=false
 
 # Step 2: Backup .env
 print_info "Backup file .env..."
@@ -81,13 +79,21 @@ sudo -u ${APP_USER} bash -c "source venv/bin/activate && pip install --upgrade p
 print_success "Dependencies updated"
 
 # Step 6: Reload systemd jika ada perubahan
-if [ -f "deploy/proposal-reviewer.service" ]; then
+if [ -f "deploy/proposal-reviewer.service" ] && \
+   ! cmp -s deploy/proposal-reviewer.service /etc/systemd/system/${APP_NAME}.service; then
     print_info "Update systemd service..."
-    cp deploy/proposal-reviewer.service /etc/systemd/system/
+    cp deploy/proposal-reviewer.service /etc/systemd/system/${APP_NAME}.service
     systemctl daemon-reload
+    # Perubahan ExecStart hanya berlaku setelah proses induk gunicorn diganti
+    PERLU_RESTART=true
     print_success "Systemd service updated"
 fi
 
+# Dengan --preload, HUP mem-fork worker dari kode lama di proses induk
+if systemctl show -p Environment ${APP_NAME} | grep -q -- "--preload"; then
+    PERLU_RESTART=true
+fi
+
 # Step 7: Reload nginx jika ada perubahan
 if [ -f "deploy/nginx.conf" ]; then
     print_info "Checking nginx config..."
@@ -95,9 +101,18 @@ if [ -f "deploy/nginx.conf" ]; then
     print_success "Nginx reloaded"
 fi
 
-# Step 8: Start service
-print_info "Menjalankan aplikasi..."
-systemctl start ${APP_NAME}
+# Step 8: Ganti worker
+if ! systemctl is-active --quiet ${APP_NAME}; then
+    print_info "Menjalankan aplikasi..."
+    systemctl start ${APP_NAME}
+elif [ "$PERLU_RESTART" = true ]; then
+    print_info "Restart aplikasi (unit systemd berubah atau --preload aktif)..."
+    systemctl restart ${APP_NAME}
+else
+    # HUP: gunicorn menyalakan worker baru, lalu menguras worker lama
+    print_info "Reload aplikasi tanpa downtime..."
+    systemctl reload ${APP_NAME}
+fi
 sleep 3
 
 # Check status
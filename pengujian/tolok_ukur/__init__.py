@@ -0,0 +1,7 @@
+"""
+Paket tolok ukur (benchmark) kinerja.
+
+Berisi pengukuran jalur-jalur utama (ekstraksi, parsing,
+persistensi, dan endpoint review) beserta garis dasar untuk
+mendeteksi regresi kinerja.
+"""
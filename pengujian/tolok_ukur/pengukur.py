@@ -0,0 +1,167 @@
+"""
+Modul pengukur waktu dan garis dasar tolok ukur.
+
+Menyediakan pengukuran berulang (median/p95) serta pembanding
+terhadap garis dasar tersimpan dengan ambang regresi.
+
+Variabel lingkungan:
+    AMBANG_REGRESI: Toleransi perlambatan relatif (default 0.5 = 50%)
+    PERBARUI_GARIS_DASAR: Isi "1" untuk menulis ulang garis dasar
+"""
+
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+JALUR_GARIS_DASAR = Path(__file__).parent / "garis_dasar.json"
+
+
+@dataclass
+class HasilUkur:
+    """Hasil pengukuran satu tolok ukur (semua dalam milidetik)."""
+
+    nama: str
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    ulangan: int
+
+
+def _ringkas(nama: str, durasi: list[float]) -> HasilUkur:
+    """Meringkas daftar durasi (detik) menjadi HasilUkur."""
+    urut = sorted(d * 1000 for d in durasi)
+    indeks_p95 = max(int(round(0.95 * len(urut))) - 1, 0)
+    return HasilUkur(
+        nama=nama,
+        median_ms=round(statistics.median(urut), 4),
+        p95_ms=round(urut[indeks_p95], 4),
+        min_ms=round(urut[0], 4),
+        ulangan=len(urut)
+    )
+
+
+def ukur(
+    nama: str,
+    fungsi: Callable[[], Any],
+    ulangan: int = 5,
+    pemanasan: int = 1
+) -> HasilUkur:
+    """
+    Mengukur fungsi sinkron secara berulang.
+
+    Parameter:
+        nama: Nama tolok ukur
+        fungsi: Fungsi tanpa argumen yang diukur
+        ulangan: Jumlah pengukuran
+        pemanasan: Jumlah eksekusi awal yang tidak dihitung
+
+    Mengembalikan:
+        HasilUkur
+    """
+    for _ in range(pemanasan):
+        fungsi()
+    durasi = []
+    for _ in range(ulangan):
+        mulai = time.perf_counter()
+        fungsi()
+        durasi.append(time.perf_counter() - mulai)
+    return _ringkas(nama, durasi)
+
+
+async def ukur_async(
+    nama: str,
+    fungsi: Callable[[], Awaitable[Any]],
+    ulangan: int = 5,
+    pemanasan: int = 1
+) -> HasilUkur:
+    """
+    Mengukur coroutine function secara berulang.
+
+    Parameter:
+        nama: Nama tolok ukur
+        fungsi: Fungsi async tanpa argumen yang diukur
+        ulangan: Jumlah pengukuran
+        pemanasan: Jumlah eksekusi awal yang tidak dihitung
+
+    Mengembalikan:
+        HasilUkur
+    """
+    for _ in range(pemanasan):
+        await fungsi()
+    durasi = []
+    for _ in range(ulangan):
+        mulai = time.perf_counter()
+        await fungsi()
+        durasi.append(time.perf_counter() - mulai)
+    return _ringkas(nama, durasi)
+
+
+class GarisDasar:
+    """Penyimpan garis dasar dan pemeriksa regresi kinerja."""
+
+    def __init__(
+        self,
+        jalur: Path = JALUR_GARIS_DASAR,
+        ambang: Optional[float] = None,
+        perbarui: Optional[bool] = None
+    ):
+        """
+        Inisialisasi garis dasar.
+
+        Parameter:
+            jalur: Path berkas JSON garis dasar
+            ambang: Toleransi perlambatan relatif
+            perbarui: Tulis ulang garis dasar alih-alih membandingkan
+        """
+        self.jalur = jalur
+        self.ambang = ambang if ambang is not None else float(os.getenv("AMBANG_REGRESI", "0.5"))
+        self.perbarui = perbarui if perbarui is not None else os.getenv("PERBARUI_GARIS_DASAR") == "1"
+        self.data: dict[str, dict[str, Any]] = (
+            json.loads(jalur.read_text(encoding="utf-8")) if jalur.exists() else {}
+        )
+        self.hasil_sesi: list[HasilUkur] = []
+
+    def periksa(self, hasil: HasilUkur) -> Optional[str]:
+        """
+        Membandingkan hasil dengan garis dasar.
+
+        Parameter:
+            hasil: Hasil pengukuran
+
+        Mengembalikan:
+            Pesan regresi jika median melebihi ambang, selain itu None
+        """
+        self.hasil_sesi.append(hasil)
+        print(
+            f"[tolok ukur] {hasil.nama}: median {hasil.median_ms:.3f} ms, "
+            f"p95 {hasil.p95_ms:.3f} ms ({hasil.ulangan}x)"
+        )
+        if self.perbarui:
+            self.data[hasil.nama] = asdict(hasil)
+            return None
+
+        dasar = self.data.get(hasil.nama)
+        if dasar is None:
+            return None
+
+        batas = dasar["median_ms"] * (1 + self.ambang)
+        if hasil.median_ms > batas:
+            return (
+                f"Regresi kinerja pada {hasil.nama}: median {hasil.median_ms:.3f} ms "
+                f"> batas {batas:.3f} ms (garis dasar {dasar['median_ms']:.3f} ms, "
+                f"ambang {self.ambang:.0%})"
+            )
+        return None
+
+    def simpan(self) -> None:
+        """Menulis garis dasar ke berkas jika mode perbarui aktif."""
+        if not self.perbarui:
+            return
+        self.jalur.write_text(
+            json.dumps(dict(sorted(self.data.items())), indent=2) + "\n",
+            encoding="utf-8"
+        )
@@ -0,0 +1,322 @@
+"""
+Modul tolok ukur jalur-jalur utama aplikasi.
+
+Menjalankan:
+    python -m pytest -s pengujian/tolok_ukur/uji_tolok_ukur.py
+
+Variabel lingkungan:
+    TOLOK_UKUR_BARIS: Daftar jumlah baris riwayat, dipisah koma
+        (default "10000"; gunakan "10000,100000,1000000" untuk uji penuh)
+    TOLOK_UKUR_LATENSI_LLM: Latensi server LLM tiruan dalam detik (default 0.05)
+    AMBANG_REGRESI / PERBARUI_GARIS_DASAR: lihat pengukur.py
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import random
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from alat.korpus_sintetis import buat_docx, buat_halaman, buat_pdf
+from alat.server_llm_tiruan import HASIL_CONTOH, ServerLLMTiruan
+from app.agen.agen_peninjau import AgenPeninjauProposal
+from app.konfigurasi import dapatkan_pengaturan
+from app.layanan.database_riwayat import DatabaseRiwayat
+from app.layanan.ekstraktor_docx import ekstrak_docx
+from app.layanan.indeks_duplikat import JUMLAH_BIN, buat_tanda, kunci_pita, tanda_ke_bytes
+from app.layanan.pemuat_dokumen import PemuatDokumen
+from app.layanan.respons_json import JsonMentah, ResponsJson
+from pengujian.tolok_ukur.pengukur import GarisDasar, ukur, ukur_async
+
+JUMLAH_HALAMAN: list[int] = [5, 50, 200]
+JUMLAH_BARIS: list[int] = [
+    int(nilai) for nilai in os.getenv("TOLOK_UKUR_BARIS", "10000").split(",")
+]
+LATENSI_LLM = float(os.getenv("TOLOK_UKUR_LATENSI_LLM", "0.05"))
+
+
+@pytest.fixture(scope="module")
+def garis_dasar() -> Iterator[GarisDasar]:
+    """Fixture garis dasar bersama untuk satu modul."""
+    dasar = GarisDasar()
+    yield dasar
+    dasar.simpan()
+
+
+@pytest.fixture(scope="module")
+def korpus(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Fixture korpus PDF/DOCX sintetis dengan berbagai jumlah halaman."""
+    direktori = tmp_path_factory.mktemp("korpus")
+    berkas: dict[str, Path] = {}
+    for halaman in JUMLAH_HALAMAN:
+        berkas[f"pdf-{halaman}"] = buat_pdf(direktori / f"proposal_{halaman}.pdf", halaman)
+        berkas[f"docx-{halaman}"] = buat_docx(direktori / f"proposal_{halaman}.docx", halaman)
+    return berkas
+
+
+def _isi_riwayat(jalur_db: Path, jumlah_baris: int) -> DatabaseRiwayat:
+    """Membuat database riwayat berisi sejumlah baris sintetis."""
+    database = DatabaseRiwayat(jalur_db=str(jalur_db))
+    jenis = ["pkm", "skripsi", "hibah"]
+    detail = json.dumps(HASIL_CONTOH["detail_skor"])
+    daftar = json.dumps(HASIL_CONTOH["daftar_kekuatan"])
+    with sqlite3.connect(jalur_db) as conn:
+        conn.executemany(
+            """
+            INSERT INTO riwayat_review (
+                nama_berkas, jenis_proposal, skor, detail_skor,
+                daftar_kekuatan, daftar_kelemahan, daftar_saran, ringkasan,
+                ukuran_berkas, token_total, latensi_ms
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    f"proposal_{i}.pdf", jenis[i % 3], i % 101, detail,
+                    daftar, daftar, daftar, HASIL_CONTOH["ringkasan"],
+                    1024 * (i % 500), 1500 + i % 700, 800.0 + (i * 37) % 5000
+                )
+                for i in range(jumlah_baris)
+            )
+        )
+    return database
+
+
+class TestTolokUkurEkstraksi:
+    """Tolok ukur PemuatDokumen.muat untuk PDF dan DOCX."""
+
+    @pytest.mark.parametrize("format_berkas", ["pdf", "docx"])
+    @pytest.mark.parametrize("halaman", JUMLAH_HALAMAN)
+    def test_muat(
+        self,
+        format_berkas: str,
+        halaman: int,
+        korpus: dict[str, Path],
+        garis_dasar: GarisDasar
+    ) -> None:
+        """Mengukur ekstraksi teks per format dan jumlah halaman."""
+        pemuat = PemuatDokumen(ukuran_maks_mb=50)
+        jalur = korpus[f"{format_berkas}-{halaman}"]
+
+        hasil = ukur(
+            f"pemuat.muat[{format_berkas}-{halaman}]",
+            lambda: asyncio.run(pemuat.muat(jalur)),
+            ulangan=3 if halaman >= 200 else 5
+        )
+
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
+
+    def test_ekstraktor_docx_lebih_cepat_dari_docx2txt(self, korpus: dict[str, Path]) -> None:
+        """Membandingkan ekstraktor streaming dengan docx2txt pada DOCX terbesar."""
+        docx2txt = pytest.importorskip("docx2txt")
+        jalur = korpus[f"docx-{max(JUMLAH_HALAMAN)}"]
+
+        streaming = ukur("ekstraktor_docx", lambda: ekstrak_docx(jalur), ulangan=3)
+        pembanding = ukur("docx2txt.process", lambda: docx2txt.process(str(jalur)), ulangan=3)
+
+        assert streaming.median_ms < pembanding.median_ms, (
+            f"ekstraktor_docx {streaming.median_ms} ms >= docx2txt {pembanding.median_ms} ms"
+        )
+
+
+class TestTolokUkurParsing:
+    """Tolok ukur AgenPeninjauProposal._parse_hasil."""
+
+    VARIAN: dict[str, str] = {
+        "json": json.dumps(HASIL_CONTOH),
+        "markdown": "```json\n" + json.dumps(HASIL_CONTOH, indent=2) + "\n```",
+        "prosa": "Berikut hasil evaluasi:\n" + json.dumps(HASIL_CONTOH) + "\nSemoga membantu." * 200,
+    }
+
+    @pytest.mark.parametrize("varian", list(VARIAN))
+    def test_parse_hasil(self, varian: str, garis_dasar: GarisDasar) -> None:
+        """Mengukur parsing respons LLM dalam beberapa bentuk."""
+        agen = AgenPeninjauProposal(api_key="gsk_tolok_ukur")
+        teks = self.VARIAN[varian]
+
+        def jalankan() -> None:
+            for _ in range(100):
+                agen._parse_hasil(teks)
+
+        hasil = ukur(f"agen.parse_hasil[{varian}]x100", jalankan, ulangan=7)
+
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
+
+
+class TestTolokUkurRiwayat:
+    """Tolok ukur kueri DatabaseRiwayat pada berbagai ukuran tabel."""
+
+    @pytest.fixture(scope="class", params=JUMLAH_BARIS)
+    def database(
+        self,
+        request: pytest.FixtureRequest,
+        tmp_path_factory: pytest.TempPathFactory
+    ) -> tuple[int, DatabaseRiwayat]:
+        """Fixture database riwayat berisi baris sintetis."""
+        jumlah = request.param
+        jalur_db = tmp_path_factory.mktemp("riwayat") / "riwayat.db"
+        return jumlah, _isi_riwayat(jalur_db, jumlah)
+
+    def test_ambil_semua_riwayat(
+        self,
+        database: tuple[int, DatabaseRiwayat],
+        garis_dasar: GarisDasar
+    ) -> None:
+        """Mengukur halaman riwayat pertama dan halaman tengah."""
+        jumlah, db = database
+
+        hasil = ukur(
+            f"db.ambil_semua_riwayat[{jumlah}]",
+            lambda: (db.ambil_semua_riwayat(50, 0), db.ambil_semua_riwayat(50, jumlah // 2))
+        )
+
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
+
+    def test_ambil_statistik(
+        self,
+        database: tuple[int, DatabaseRiwayat],
+        garis_dasar: GarisDasar
+    ) -> None:
+        """Mengukur agregasi statistik."""
+        jumlah, db = database
+
+        hasil = ukur(f"db.ambil_statistik[{jumlah}]", db.ambil_statistik)
+
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
+
+    def test_cari_review_mirip(
+        self,
+        database: tuple[int, DatabaseRiwayat],
+        garis_dasar: GarisDasar
+    ) -> None:
+        """Mengukur pencarian proposal hampir identik lewat indeks LSH."""
+        jumlah, db = database
+        acak = random.Random(42)
+        tanda_acak = [[acak.getrandbits(25) for _ in range(JUMLAH_BIN)] for _ in range(jumlah)]
+        with sqlite3.connect(db.jalur_db) as conn:
+            conn.execute("DELETE FROM minhash_review")
+            conn.execute("DELETE FROM lsh_review")
+            conn.executemany(
+                "INSERT INTO minhash_review (review_id, tanda) VALUES (?, ?)",
+                ((i + 1, tanda_ke_bytes(tanda)) for i, tanda in enumerate(tanda_acak))
+            )
+            conn.executemany(
+                "INSERT INTO lsh_review (pita, kunci, review_id) VALUES (?, ?, ?)",
+                (
+                    (pita, kunci, i + 1)
+                    for i, tanda in enumerate(tanda_acak)
+                    for pita, kunci in enumerate(kunci_pita(tanda))
+                )
+            )
+        tanda = buat_tanda("\n".join("\n".join(baris) for baris in buat_halaman(20)))
+        assert tanda is not None
+        db.simpan_tanda_minhash(jumlah // 2, tanda)
+
+        hasil = ukur(
+            f"db.cari_review_mirip[{jumlah}]",
+            lambda: db.cari_review_mirip(tanda, ambang=0.8),
+            ulangan=20
+        )
+
+        assert db.cari_review_mirip(tanda, ambang=0.8)[0]["review_id"] == jumlah // 2
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
+
+    def test_halaman_riwayat_json_lebih_cepat(
+        self,
+        database: tuple[int, DatabaseRiwayat],
+        garis_dasar: GarisDasar
+    ) -> None:
+        """Membandingkan body /api/riwayat lama (dict + jsonable_encoder) dengan JSON mentah."""
+        jumlah, db = database
+
+        def lama() -> bytes:
+            isi = {"berhasil": True, "data": db.ambil_semua_riwayat(50, 0), "total": jumlah}
+            return bytes(JSONResponse(jsonable_encoder(isi)).body)
+
+        def baru() -> bytes:
+            isi = {"berhasil": True, "data": JsonMentah(db.ambil_riwayat_json(50, 0)), "total": jumlah}
+            return bytes(ResponsJson(isi).body)
+
+        assert json.loads(lama()) == json.loads(baru())
+        pembanding = ukur(f"riwayat.body_dict[{jumlah}]", lama, ulangan=20)
+        hasil = ukur(f"riwayat.body_json_mentah[{jumlah}]", baru, ulangan=20)
+
+        assert hasil.median_ms < pembanding.median_ms, (
+            f"JSON mentah {hasil.median_ms} ms >= dict {pembanding.median_ms} ms"
+        )
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
+
+
+class TestTolokUkurEndpoint:
+    """Tolok ukur end-to-end /api/review dengan server LLM tiruan."""
+
+    JUMLAH_SERENTAK = 20
+
+    @pytest.fixture
+    def aplikasi(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[object]:
+        """Fixture aplikasi FastAPI yang diarahkan ke server LLM tiruan."""
+        with ServerLLMTiruan(latensi_detik=LATENSI_LLM) as server:
+            monkeypatch.chdir(tmp_path)
+            monkeypatch.setenv("GROQ_API_KEY", "gsk_tolok_ukur")
+            monkeypatch.setenv("GROQ_API_ENDPOINT", server.url)
+            # Batas kapasitas dilonggarkan agar yang diukur adalah throughput, bukan 503
+            monkeypatch.setenv("MAKS_REVIEW_AKTIF_PER_WORKER", str(self.JUMLAH_SERENTAK))
+            monkeypatch.setenv("MAKS_LLM_BERSAMAAN_PER_WORKER", str(self.JUMLAH_SERENTAK))
+            dapatkan_pengaturan.cache_clear()
+
+            if "app.utama" in sys.modules:
+                modul = importlib.reload(sys.modules["app.utama"])
+            else:
+                modul = importlib.import_module("app.utama")
+            yield modul.aplikasi
+
+        dapatkan_pengaturan.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_throughput_review(
+        self,
+        aplikasi: object,
+        korpus: dict[str, Path],
+        garis_dasar: GarisDasar
+    ) -> None:
+        """Mengukur waktu per review saat permintaan serentak."""
+        konten = korpus["pdf-5"].read_bytes()
+        transport = httpx.ASGITransport(app=aplikasi)  # type: ignore[arg-type]
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://uji") as klien:
+            async def kirim_serentak() -> None:
+                respons = await asyncio.gather(*[
+                    klien.post(
+                        "/api/review",
+                        files={"berkas": ("proposal.pdf", konten, "application/pdf")},
+                        data={"jenis_proposal": "pkm"}
+                    )
+                    for _ in range(self.JUMLAH_SERENTAK)
+                ])
+                assert all(r.status_code == 200 for r in respons), [(r.status_code, r.text[:200]) for r in respons if r.status_code != 200]
+
+            hasil = await ukur_async(
+                f"api.review[serentak-{self.JUMLAH_SERENTAK}]",
+                kirim_serentak,
+                ulangan=3
+            )
+
+        # Normalisasi ke waktu per review agar sebanding antar konfigurasi
+        hasil.median_ms = round(hasil.median_ms / self.JUMLAH_SERENTAK, 4)
+        hasil.p95_ms = round(hasil.p95_ms / self.JUMLAH_SERENTAK, 4)
+        hasil.min_ms = round(hasil.min_ms / self.JUMLAH_SERENTAK, 4)
+        print(f"[tolok ukur] throughput: {1000 / hasil.median_ms:.1f} review/detik")
+
+        assert (pesan := garis_dasar.periksa(hasil)) is None, pesan
@@ -6,6 +6,7 @@ agent dan layanan pemuat dokumen.
 """
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -109,6 +110,266 @@ class TestAgenPeninjauProposal:
         with pytest.raises(ValueError):
             await agen.tinjau("   \n\t  ", "pkm")
 
+    def test_baca_penggunaan(self, agen) -> None:
+        """Menguji pembacaan blok usage dari respons Groq."""
+        penggunaan = agen._baca_penggunaan(
+            {
+                "model": "llama-3.3-70b-versatile",
+                "usage": {
+                    "prompt_tokens": 1200,
+                    "completion_tokens": 350,
+                    "total_tokens": 1550,
+                    "queue_time": 0.02,
+                    "total_time": 1.4
+                }
+            },
+            latensi_ms=1650.456
+        )
+
+        assert penggunaan.token_prompt == 1200
+        assert penggunaan.token_total == 1550
+        assert penggunaan.waktu_antrean_detik == 0.02
+        assert penggunaan.latensi_ms == 1650.46
+
+    def test_payload_keluaran_terstruktur(self) -> None:
+        """Menguji response_format JSON schema dan max_tokens dari batas field."""
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+        from app.agen.keluaran_terstruktur import hitung_maks_token
+
+        agen = AgenPeninjauProposal(
+            api_key="gsk_dummy",
+            mode_keluaran="json_schema",
+            maks_item_daftar=3,
+            maks_karakter_butir=100,
+            maks_karakter_ringkasan=300
+        )
+
+        payload = agen._buat_payload("prompt")
+        skema = payload["response_format"]["json_schema"]["schema"]
+
+        assert payload["max_tokens"] == hitung_maks_token(3, 100, 300)
+        assert payload["max_tokens"] < 2000
+        assert skema["additionalProperties"] is False
+        assert skema["properties"]["daftar_saran"]["maxItems"] == 3
+        assert skema["properties"]["ringkasan"]["maxLength"] == 300
+        assert "detail_skor" in skema["required"]
+
+    def test_mode_keluaran_tidak_dikenal(self) -> None:
+        """Menguji mode keluaran yang tidak dikenali ditolak."""
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        with pytest.raises(ValueError):
+            AgenPeninjauProposal(api_key="gsk_dummy", mode_keluaran="xml")
+
+    def test_ambil_generasi_gagal(self, agen) -> None:
+        """Menguji keluaran dari galat json_validate_failed diambil kembali."""
+        import httpx
+
+        respons = httpx.Response(400, json={"error": {
+            "code": "json_validate_failed",
+            "failed_generation": '{"skor": 70, "ringkasan": "ok",}'
+        }})
+
+        teks = agen._ambil_generasi_gagal(respons)
+
+        assert teks is not None
+        assert agen._parse_hasil(teks)["skor"] == 70
+
+    @pytest.mark.asyncio
+    async def test_tinjau_dengan_server_tiruan(self) -> None:
+        """Menguji alur tinjau lengkap terhadap server LLM tiruan."""
+        from alat.server_llm_tiruan import ServerLLMTiruan
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        with ServerLLMTiruan() as server:
+            agen = AgenPeninjauProposal(api_key="gsk_dummy", api_endpoint=server.url, maks_item_daftar=1)
+            hasil = await agen.tinjau("Latar belakang penelitian ini ...", "pkm")
+
+        assert hasil["skor"] == 78
+        assert len(hasil["daftar_saran"]) == 1
+        assert agen.penggunaan_terakhir is not None
+        assert agen.penggunaan_terakhir.token_total
+
+    @pytest.mark.asyncio
+    async def test_proposal_pendek_memakai_model_cepat(self) -> None:
+        """Menguji proposal pendek dirutekan ke model cepat tanpa eskalasi."""
+        from alat.server_llm_tiruan import ServerLLMTiruan
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        with ServerLLMTiruan() as server:
+            agen = AgenPeninjauProposal(
+                api_key="gsk_dummy",
+                api_endpoint=server.url,
+                model="besar",
+                model_cepat="kecil",
+                ambang_karakter_cepat=1000
+            )
+            await agen.tinjau("Proposal singkat.", "pkm")
+            assert agen.penggunaan_terakhir is not None
+            assert agen.penggunaan_terakhir.model == "kecil"
+
+            await agen.tinjau("x" * 2000, "pkm")
+            assert agen.penggunaan_terakhir.model == "besar"
+            assert server.jumlah_permintaan == 2
+
+    @pytest.mark.asyncio
+    async def test_eskalasi_saat_hasil_model_cepat_rusak(self) -> None:
+        """Menguji hasil model cepat yang rusak dieskalasi ke model besar."""
+        from alat.server_llm_tiruan import ServerLLMTiruan
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        class ServerModelKecilRusak(ServerLLMTiruan):
+            def buat_respons(self, permintaan: dict[str, Any], durasi: float) -> dict[str, Any]:
+                respons = super().buat_respons(permintaan, durasi)
+                if permintaan.get("model") == "kecil":
+                    respons["choices"][0]["message"]["content"] = "Maaf, tidak bisa."
+                return respons
+
+        with ServerModelKecilRusak() as server:
+            agen = AgenPeninjauProposal(
+                api_key="gsk_dummy",
+                api_endpoint=server.url,
+                model="besar",
+                model_cepat="kecil"
+            )
+            hasil = await agen.tinjau("Proposal lengkap ...", "pkm", mode="cepat")
+
+        assert hasil["skor"] == 78
+        assert server.jumlah_permintaan == 2
+        assert agen.penggunaan_terakhir is not None
+        assert agen.penggunaan_terakhir.model == "besar"
+
+    def test_alasan_eskalasi(self) -> None:
+        """Menguji deteksi hasil model cepat yang meragukan."""
+        from alat.server_llm_tiruan import HASIL_CONTOH
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        assert AgenPeninjauProposal._alasan_eskalasi(HASIL_CONTOH) is None
+        assert AgenPeninjauProposal._alasan_eskalasi({**HASIL_CONTOH, "skor": 95}) == "skor_tidak_konsisten"
+        assert AgenPeninjauProposal._alasan_eskalasi({**HASIL_CONTOH, "daftar_saran": []}) == "isi_tidak_lengkap"
+
+    @pytest.mark.asyncio
+    async def test_mode_konsisten_menggabungkan_sampel(self) -> None:
+        """Menguji skor median dan keyakinan dari sampel yang tidak sepakat."""
+        import json
+
+        from alat.server_llm_tiruan import HASIL_CONTOH, ServerLLMTiruan
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        class ServerSkorBerbeda(ServerLLMTiruan):
+            # next() pada iterator daftar aman dipanggil dari beberapa thread
+            skor_metodologi = iter([10, 14, 18])
+
+            def buat_respons(self, permintaan: dict[str, Any], durasi: float) -> dict[str, Any]:
+                respons = super().buat_respons(permintaan, durasi)
+                metodologi = next(self.skor_metodologi)
+                hasil = {**HASIL_CONTOH, "detail_skor": {**HASIL_CONTOH["detail_skor"], "metodologi": metodologi}}
+                respons["choices"][0]["message"]["content"] = json.dumps(hasil)
+                return respons
+
+        with ServerSkorBerbeda() as server:
+            agen = AgenPeninjauProposal(api_key="gsk_dummy", api_endpoint=server.url, jumlah_sampel=3)
+            hasil = await agen.tinjau("Proposal lengkap ...", "pkm", mode="konsisten")
+
+        assert server.jumlah_permintaan == 3
+        assert hasil["detail_skor"]["metodologi"] == 14
+        assert hasil["skor"] == sum(hasil["detail_skor"].values())
+        # Rentang metodologi 8, aspek lain 0: 1 - (8 / 5) / 20
+        assert hasil["keyakinan"] == 0.92
+        assert agen.penggunaan_terakhir is not None
+        assert agen.penggunaan_terakhir.token_total is not None
+        assert agen.penggunaan_terakhir.token_total > 0
+
+    @pytest.mark.asyncio
+    async def test_mode_konsisten_berhenti_dini(self) -> None:
+        """Menguji sampel lambat dibatalkan begitu dua sampel sepakat."""
+        import time
+
+        from alat.server_llm_tiruan import ServerLLMTiruan
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+
+        class ServerSatuLambat(ServerLLMTiruan):
+            jeda = iter([0.0, 0.0, 2.0])
+
+            def buat_respons(self, permintaan: dict[str, Any], durasi: float) -> dict[str, Any]:
+                time.sleep(next(self.jeda))
+                return super().buat_respons(permintaan, durasi)
+
+        with ServerSatuLambat() as server:
+            agen = AgenPeninjauProposal(api_key="gsk_dummy", api_endpoint=server.url, jumlah_sampel=3)
+            mulai = time.perf_counter()
+            hasil = await agen.tinjau("Proposal lengkap ...", "pkm", mode="konsisten")
+            durasi = time.perf_counter() - mulai
+
+        assert durasi < 1.5
+        assert hasil["skor"] == 78
+        assert hasil["keyakinan"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_mode_konsisten_penggunaan_per_sampel(self) -> None:
+        """Menguji penggunaan tiap sampel diambil dari panggilannya sendiri, bukan atribut bersama."""
+        import asyncio
+
+        from alat.server_llm_tiruan import HASIL_CONTOH
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+        from app.skema.model import PenggunaanLLM
+
+        agen = AgenPeninjauProposal(api_key="gsk_dummy", jumlah_sampel=3)
+        urutan = iter([(100, 0.03, 10), (20, 0.0, 14), (3, 0.01, 18)])
+
+        async def panggil_tiruan(prompt: str, jenis_proposal: str, tingkat: str):
+            token, jeda, metodologi = next(urutan)
+            penggunaan = PenggunaanLLM(model="besar", token_total=token)
+            # Atribut bersama ditulis lalu ada titik await sebelum kembali,
+            # sehingga sampel lain sempat menimpanya
+            agen.penggunaan_terakhir = penggunaan
+            await asyncio.sleep(jeda)
+            hasil = {**HASIL_CONTOH, "detail_skor": {**HASIL_CONTOH["detail_skor"], "metodologi": metodologi}}
+            return hasil, penggunaan
+
+        agen._panggil_llm = panggil_tiruan  # type: ignore[method-assign]
+        await agen.tinjau("Proposal lengkap ...", "pkm", mode="konsisten")
+
+        assert agen.penggunaan_terakhir is not None
+        assert agen.penggunaan_terakhir.token_total == 123
+
+    @pytest.mark.asyncio
+    async def test_tenggat_memangkas_dan_menghentikan_panggilan(self) -> None:
+        """Menguji max_tokens mengikuti sisa tenggat dan panggilan berhenti saat tenggat habis."""
+        from alat.server_llm_tiruan import ServerLLMTiruan
+        from app.agen.agen_peninjau import AgenPeninjauProposal
+        from app.layanan.tenggat import Tenggat
+        from app.pengecualian import TenggatHabis
+
+        class ServerPencatat(ServerLLMTiruan):
+            daftar_maks_token: list[int] = []
+
+            def buat_respons(self, permintaan: dict[str, Any], durasi: float) -> dict[str, Any]:
+                self.daftar_maks_token.append(permintaan["max_tokens"])
+                return super().buat_respons(permintaan, durasi)
+
+        with ServerPencatat() as server:
+            agen = AgenPeninjauProposal(
+                api_key="gsk_dummy", api_endpoint=server.url, tenggat=Tenggat(6), laju_token_per_detik=100
+            )
+            await agen.tinjau("Proposal lengkap ...", "pkm")
+
+            # Sisa waktu terlalu sedikit: panggilan tidak dimulai sama sekali
+            agen = AgenPeninjauProposal(api_key="gsk_dummy", api_endpoint=server.url, tenggat=Tenggat(1.2))
+            with pytest.raises(TenggatHabis):
+                await agen.tinjau("Proposal lengkap ...", "pkm")
+
+        assert len(ServerPencatat.daftar_maks_token) == 1
+        assert 400 < ServerPencatat.daftar_maks_token[0] <= 500
+
+        with ServerLLMTiruan(latensi_detik=3.0) as server:
+            agen = AgenPeninjauProposal(
+                api_key="gsk_dummy", api_endpoint=server.url, tenggat=Tenggat(1.5), laju_token_per_detik=10000
+            )
+            with pytest.raises(TenggatHabis) as exc_info:
+                await agen.tinjau("Proposal lengkap ...", "pkm")
+        assert exc_info.value.tahap == "llm"
+
 
 class TestSkemaModel:
     """Kelas pengujian untuk model skema."""
@@ -0,0 +1,63 @@
+"""
+Modul pengujian untuk alat uji beban dan server LLM tiruan.
+
+Berisi unit tests untuk distribusi latensi, injeksi galat,
+streaming, dan ringkasan hasil uji beban.
+"""
+
+import httpx
+import pytest
+
+from alat.server_llm_tiruan import DistribusiLatensi, ServerLLMTiruan
+from alat.uji_beban import CatatanPermintaan, ringkas_hasil
+
+
+class TestServerLLMTiruan:
+    """Kelas pengujian untuk ServerLLMTiruan."""
+
+    def test_distribusi_latensi(self) -> None:
+        """Menguji parsing spesifikasi distribusi latensi."""
+        assert DistribusiLatensi("0.25").sampel() == 0.25
+        seragam = DistribusiLatensi("seragam:0.1,0.2", seed=1)
+        assert all(0.1 <= seragam.sampel() <= 0.2 for _ in range(50))
+
+        with pytest.raises(ValueError):
+            DistribusiLatensi("gamma:1")
+
+    def test_injeksi_429(self) -> None:
+        """Menguji laju 429 penuh selalu mengembalikan Retry-After."""
+        with ServerLLMTiruan(laju_429=1.0) as server:
+            respons = httpx.post(server.url, json={"messages": []})
+
+        assert respons.status_code == 429
+        assert respons.headers["Retry-After"] == "1"
+
+    def test_streaming(self) -> None:
+        """Menguji mode streaming mengirim potongan SSE hingga [DONE]."""
+        with ServerLLMTiruan() as server:
+            respons = httpx.post(server.url, json={"messages": [], "stream": True})
+
+        baris = [b for b in respons.text.splitlines() if b.startswith("data: ")]
+        assert len(baris) > 2
+        assert baris[-1] == "data: [DONE]"
+
+
+class TestUjiBeban:
+    """Kelas pengujian untuk ringkasan uji beban."""
+
+    def test_ringkas_hasil(self) -> None:
+        """Menguji persentil, throughput, dan laju galat per endpoint."""
+        catatan = [
+            CatatanPermintaan("/api/review", 200, float(i)) for i in range(1, 101)
+        ] + [
+            CatatanPermintaan("/api/review", 503, 5.0),
+            CatatanPermintaan("/api/review", None, 120000.0, "timeout"),
+        ]
+
+        ringkasan = ringkas_hasil(catatan, durasi_detik=10.0)["/api/review"]
+
+        assert ringkasan["jumlah"] == 102
+        assert ringkasan["throughput_rps"] == 10.0
+        assert ringkasan["latensi_ms"]["p95"] == 95.0
+        assert ringkasan["per_status"]["timeout"] == 1
+        assert ringkasan["laju_galat"] == round(2 / 102, 4)
@@ -0,0 +1,67 @@
+"""
+Modul pengujian untuk validasi cache HTTP.
+
+Berisi unit tests untuk ETag, If-Modified-Since,
+dan URL aset statis bersidik isi.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.layanan.cache_http import (
+    PetaAset,
+    belum_diubah_sejak,
+    buat_etag,
+    etag_cocok,
+    format_waktu_http,
+    waktu_http_stabil,
+)
+
+
+class TestCacheHttp:
+    """Kelas pengujian untuk modul cache_http."""
+
+    def test_etag_cocok(self) -> None:
+        """Menguji pencocokan If-None-Match lemah, daftar, dan wildcard."""
+        etag = buat_etag(3, 50, 0)
+        assert etag.startswith('W/"')
+        assert etag == buat_etag(3, 50, 0)
+        assert etag != buat_etag(4, 50, 0)
+
+        assert etag_cocok(etag, etag)
+        assert etag_cocok(etag.removeprefix("W/"), etag)
+        assert etag_cocok(f'"lain", {etag}', etag)
+        assert etag_cocok("*", etag)
+        assert not etag_cocok(None, etag)
+        assert not etag_cocok(buat_etag(4, 50, 0), etag)
+
+    def test_belum_diubah_sejak(self) -> None:
+        """Menguji If-Modified-Since terhadap waktu perubahan dari SQLite."""
+        last_modified = format_waktu_http("2026-10-19 10:00:00")
+        assert last_modified == "Mon, 19 Oct 2026 10:00:00 GMT"
+
+        assert belum_diubah_sejak(last_modified, last_modified)
+        assert belum_diubah_sejak("Mon, 19 Oct 2026 11:00:00 GMT", last_modified)
+        assert not belum_diubah_sejak("Mon, 19 Oct 2026 09:59:59 GMT", last_modified)
+        assert not belum_diubah_sejak("bukan tanggal", last_modified)
+        assert not belum_diubah_sejak(None, last_modified)
+
+    def test_last_modified_hanya_setelah_detiknya_lewat(self) -> None:
+        """Menguji Last-Modified tidak dikirim selama detik perubahan belum lewat."""
+        sekarang = datetime(2026, 10, 19, 10, 0, 0, 400_000, tzinfo=timezone.utc)
+
+        assert waktu_http_stabil("2026-10-19 10:00:00", sekarang) is None
+        assert waktu_http_stabil("2026-10-19 09:59:59", sekarang) == "Mon, 19 Oct 2026 09:59:59 GMT"
+        assert waktu_http_stabil("2026-10-19 10:00:00", sekarang.replace(second=1, microsecond=0)) is not None
+
+    def test_url_aset_bersidik(self, tmp_path: Path) -> None:
+        """Menguji sidik URL aset mengikuti isi berkas."""
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "a.css").write_text("body {}")
+        (tmp_path / "css" / "b.css").write_text("body { color: red }")
+        peta = PetaAset(tmp_path)
+
+        url_a = peta.url("css/a.css")
+        assert url_a.startswith("/statis/css/a.css?v=")
+        assert url_a == PetaAset(tmp_path).url("css/a.css")
+        assert url_a.split("=")[1] != peta.url("css/b.css").split("=")[1]
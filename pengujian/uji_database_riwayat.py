@@ -0,0 +1,216 @@
+"""
+Modul pengujian untuk DatabaseRiwayat.
+
+Berisi unit tests untuk penyimpanan riwayat,
+migrasi skema, dan statistik review.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.layanan.database_riwayat import DatabaseRiwayat
+from app.skema.model import DetailSkor, HasilEvaluasi, PenggunaanLLM
+
+
+def buat_hasil(skor: int = 80) -> HasilEvaluasi:
+    """Membuat HasilEvaluasi contoh untuk pengujian."""
+    return HasilEvaluasi(
+        skor=skor,
+        detail_skor=DetailSkor(
+            latar_belakang=16,
+            formulasi_masalah=16,
+            tujuan=16,
+            metodologi=16,
+            luaran=16
+        ),
+        daftar_kekuatan=["Kekuatan 1"],
+        daftar_kelemahan=["Kelemahan 1"],
+        daftar_saran=["Saran 1"],
+        ringkasan="Ringkasan"
+    )
+
+
+class TestDatabaseRiwayat:
+    """Kelas pengujian untuk DatabaseRiwayat."""
+
+    @pytest.fixture
+    def database(self, tmp_path: Path) -> DatabaseRiwayat:
+        """Fixture untuk database sementara."""
+        return DatabaseRiwayat(jalur_db=str(tmp_path / "riwayat.db"))
+
+    def test_simpan_dan_ambil_dengan_penggunaan(self, database: DatabaseRiwayat) -> None:
+        """Menguji penggunaan token tersimpan dan terbaca kembali."""
+        review_id = database.simpan_review(
+            nama_berkas="proposal.pdf",
+            jenis_proposal="pkm",
+            hasil=buat_hasil(),
+            ukuran_berkas=1024,
+            penggunaan=PenggunaanLLM(
+                model="llama-3.3-70b-versatile",
+                token_prompt=1500,
+                token_penyelesaian=400,
+                token_total=1900,
+                latensi_ms=2300.0
+            )
+        )
+
+        review = database.ambil_review_berdasarkan_id(review_id)
+
+        assert review is not None
+        assert review["detail_skor"]["metodologi"] == 16
+        assert review["penggunaan"]["token_total"] == 1900
+        assert review["penggunaan"]["model"] == "llama-3.3-70b-versatile"
+
+    def test_migrasi_tabel_lama(self, tmp_path: Path) -> None:
+        """Menguji kolom baru ditambahkan pada database versi lama."""
+        jalur_db = tmp_path / "lama.db"
+        with sqlite3.connect(jalur_db) as conn:
+            conn.execute("""
+                CREATE TABLE riwayat_review (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nama_berkas TEXT NOT NULL,
+                    jenis_proposal TEXT NOT NULL,
+                    skor INTEGER NOT NULL,
+                    detail_skor TEXT NOT NULL,
+                    daftar_kekuatan TEXT NOT NULL,
+                    daftar_kelemahan TEXT NOT NULL,
+                    daftar_saran TEXT NOT NULL,
+                    ringkasan TEXT NOT NULL,
+                    tanggal_review TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    ukuran_berkas INTEGER
+                )
+            """)
+
+        DatabaseRiwayat(jalur_db=str(jalur_db))
+
+        with sqlite3.connect(jalur_db) as conn:
+            kolom = {row[1] for row in conn.execute("PRAGMA table_info(riwayat_review)")}
+        for nama_kolom, _ in DatabaseRiwayat.KOLOM_MIGRASI:
+            assert nama_kolom in kolom
+
+    def test_statistik_latensi_dan_token(self, database: DatabaseRiwayat) -> None:
+        """Menguji agregasi p50/p95 latensi dan token per jenis."""
+        for i in range(1, 21):
+            database.simpan_review(
+                nama_berkas=f"proposal_{i}.pdf",
+                jenis_proposal="pkm" if i % 2 else "skripsi",
+                hasil=buat_hasil(),
+                penggunaan=PenggunaanLLM(token_total=100 * i, latensi_ms=float(i * 100))
+            )
+        # Review yang dipakai ulang tanpa panggilan LLM tidak ikut dirata-rata
+        database.simpan_review(
+            nama_berkas="duplikat.pdf",
+            jenis_proposal="pkm",
+            hasil=buat_hasil(),
+            penggunaan=PenggunaanLLM()
+        )
+
+        statistik = database.ambil_statistik()
+
+        assert statistik["total_review"] == 21
+        assert statistik["latensi_llm"]["p50_ms"] == 1000.0
+        assert statistik["latensi_llm"]["p95_ms"] == 1900.0
+        assert statistik["latensi_llm_per_jenis"]["pkm"] == {"p50_ms": 900.0, "p95_ms": 1900.0}
+        assert statistik["latensi_llm_per_jenis"]["skripsi"] == {"p50_ms": 1000.0, "p95_ms": 2000.0}
+        assert statistik["token_per_jenis"]["pkm"]["jumlah_review"] == 10
+        assert statistik["token_per_jenis"]["pkm"]["rata_rata_token_total"] == 1000.0
+        assert statistik["token_per_jenis"]["skripsi"]["total_token"] == 11000
+
+    def test_migrasi_token_nol_menjadi_null(self, database: DatabaseRiwayat) -> None:
+        """Menguji review lama bertoken 0 diberi token NULL, sekali saja per database."""
+        token_nol = PenggunaanLLM(token_prompt=0, token_penyelesaian=0, token_total=0)
+        database.simpan_review(nama_berkas="lama.pdf", jenis_proposal="pkm", hasil=buat_hasil(), penggunaan=token_nol)
+        # Database sebelum migrasi data
+        with sqlite3.connect(database.jalur_db) as conn:
+            conn.execute("PRAGMA user_version = 0")
+
+        DatabaseRiwayat(jalur_db=database.jalur_db)
+        assert database.ambil_statistik()["token_per_jenis"] == {}
+
+        # Migrasi tidak diulang pada startup berikutnya
+        database.simpan_review(nama_berkas="baru.pdf", jenis_proposal="pkm", hasil=buat_hasil(), penggunaan=token_nol)
+        DatabaseRiwayat(jalur_db=database.jalur_db)
+        assert database.ambil_statistik()["token_per_jenis"]["pkm"]["jumlah_review"] == 1
+
+    def test_siapkan_ditunda(self, tmp_path: Path) -> None:
+        """Menguji siapkan=False tidak menyentuh disk sampai kueri pertama."""
+        jalur_db = tmp_path / "data" / "riwayat.db"
+        database = DatabaseRiwayat(jalur_db=str(jalur_db), siapkan=False)
+
+        assert not jalur_db.parent.exists()
+        assert database.hitung_total_review() == 0
+        assert jalur_db.exists()
+
+    def test_versi_proposal(self, database: DatabaseRiwayat) -> None:
+        """Menguji penomoran versi dan versi terakhir melewati review terhapus."""
+        id_v1 = database.simpan_review(nama_berkas="v1.pdf", jenis_proposal="pkm", hasil=buat_hasil(70))
+        id_v2 = database.simpan_review(nama_berkas="v2.pdf", jenis_proposal="pkm", hasil=buat_hasil(80))
+
+        assert database.ambil_versi_terakhir("pkm-budi") is None
+        assert database.simpan_versi_proposal("pkm-budi", id_v1, {"tujuan": "a"}) == 1
+        assert database.simpan_versi_proposal("pkm-budi", id_v2, {"tujuan": "b"}) == 2
+        assert database.simpan_versi_proposal("pkm-ani", id_v1, {}) == 1
+
+        terakhir = database.ambil_versi_terakhir("pkm-budi")
+        assert terakhir is not None
+        assert terakhir["versi"] == 2
+        assert terakhir["sidik_bagian"] == {"tujuan": "b"}
+        assert terakhir["review"]["skor"] == 80
+
+        database.hapus_review(id_v2)
+        terakhir = database.ambil_versi_terakhir("pkm-budi")
+        assert terakhir is not None
+        assert terakhir["versi"] == 1
+
+    def test_checkpoint_review(self, database: DatabaseRiwayat) -> None:
+        """Menguji checkpoint tersimpan, kedaluwarsa, dan terhapus."""
+        database.simpan_checkpoint("abc", "proposal.pdf", "Teks proposal", 1234)
+        database.simpan_checkpoint("lama", "lama.pdf", "Teks lama")
+        with sqlite3.connect(database.jalur_db) as conn:
+            conn.execute(
+                "UPDATE checkpoint_review SET dibuat_pada = datetime('now', '-2 days') WHERE id = 'lama'"
+            )
+
+        assert database.ambil_checkpoint("abc") == {
+            "nama_berkas": "proposal.pdf",
+            "teks": "Teks proposal",
+            "ukuran_berkas": 1234
+        }
+        assert database.ambil_checkpoint("lama") is None
+
+        database.hapus_checkpoint("abc")
+        assert database.ambil_checkpoint("abc") is None
+
+    def test_versi_riwayat_naik_saat_berubah(self, database: DatabaseRiwayat) -> None:
+        """Menguji penghitung perubahan naik pada simpan dan hapus, bukan pada baca."""
+        versi_awal, _ = database.ambil_versi_riwayat()
+
+        review_id = database.simpan_review(nama_berkas="a.pdf", jenis_proposal="pkm", hasil=buat_hasil())
+        database.ambil_semua_riwayat()
+        versi_simpan, diubah_pada = database.ambil_versi_riwayat()
+        assert versi_simpan > versi_awal
+        assert diubah_pada
+
+        database.hapus_review(review_id)
+        assert database.ambil_versi_riwayat()[0] > versi_simpan
+
+    def test_riwayat_json_sama_dengan_dict(self, database: DatabaseRiwayat) -> None:
+        """Menguji baris JSON dari SQLite identik dengan bentuk dictionary."""
+        database.simpan_review(nama_berkas="tanpa_penggunaan.pdf", jenis_proposal="pkm", hasil=buat_hasil(70))
+        review_id = database.simpan_review(
+            nama_berkas="proposal \"ü\".pdf",
+            jenis_proposal="hibah",
+            hasil=buat_hasil(),
+            ukuran_berkas=2048,
+            penggunaan=PenggunaanLLM(model="llama", token_total=1900, latensi_ms=2300.5)
+        )
+
+        assert json.loads(database.ambil_riwayat_json(10, 0)) == database.ambil_semua_riwayat(10, 0)
+        teks_review = database.ambil_review_json(review_id)
+        assert teks_review is not None
+        assert json.loads(teks_review) == database.ambil_review_berdasarkan_id(review_id)
+        assert database.ambil_review_json(9999) is None
+        assert database.ambil_riwayat_json(10, 10) == "[]"
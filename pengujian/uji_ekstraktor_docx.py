@@ -0,0 +1,149 @@
+"""
+Modul pengujian untuk ekstraktor DOCX streaming.
+
+Berisi unit tests untuk judul, daftar, tabel, gaya kustom dari
+styles.xml, dan integrasi dengan PemuatDokumen.
+"""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from app.layanan.ekstraktor_docx import ekstrak_docx
+from app.layanan.pemuat_dokumen import PemuatDokumen
+
+NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _paragraf(teks: str, gaya: str = "", ilvl: int = -1) -> str:
+    """Membuat XML satu paragraf dengan gaya dan level daftar opsional."""
+    properti = ""
+    if gaya:
+        properti += f'<w:pStyle w:val="{gaya}"/>'
+    if ilvl >= 0:
+        properti += f'<w:numPr><w:ilvl w:val="{ilvl}"/><w:numId w:val="1"/></w:numPr>'
+    ppr = f"<w:pPr>{properti}</w:pPr>" if properti else ""
+    return f"<w:p>{ppr}<w:r><w:t xml:space=\"preserve\">{teks}</w:t></w:r></w:p>"
+
+
+def _tabel(baris: list[list[str]]) -> str:
+    """Membuat XML tabel sederhana."""
+    isi = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{_paragraf(sel)}</w:tc>" for sel in sel_baris) + "</w:tr>"
+        for sel_baris in baris
+    )
+    return f"<w:tbl>{isi}</w:tbl>"
+
+
+def _buat_docx(jalur: Path, isi_body: str, styles: str = "") -> Path:
+    """Menulis berkas DOCX minimal berisi body dan styles.xml opsional."""
+    with zipfile.ZipFile(jalur, "w") as arsip:
+        arsip.writestr("word/document.xml", f"<w:document {NS}><w:body>{isi_body}</w:body></w:document>")
+        if styles:
+            arsip.writestr("word/styles.xml", f"<w:styles {NS}>{styles}</w:styles>")
+    return jalur
+
+
+class TestEkstraktorDocx:
+    """Kelas pengujian untuk ekstraktor DOCX."""
+
+    def test_judul_daftar_dan_tabel(self, tmp_path: Path) -> None:
+        """Menguji struktur dipertahankan sebagai markup ringan."""
+        jalur = _buat_docx(tmp_path / "proposal.docx", "".join([
+            _paragraf("BAB I PENDAHULUAN", "Heading1"),
+            _paragraf("1.1 Latar Belakang", "Heading2"),
+            _paragraf("Paragraf isi."),
+            _paragraf("Tujuan pertama", ilvl=0),
+            _paragraf("Rincian tujuan", ilvl=1),
+            _tabel([["Kegiatan", "Biaya"], ["Survei", "Rp 2.000.000"]]),
+        ]))
+
+        teks = ekstrak_docx(jalur)
+
+        assert "# BAB I PENDAHULUAN" in teks
+        assert "## 1.1 Latar Belakang" in teks
+        assert "- Tujuan pertama\n  - Rincian tujuan" in teks
+        assert "| Kegiatan | Biaya |\n| Survei | Rp 2.000.000 |" in teks
+        # Isi sel tidak muncul dua kali sebagai paragraf biasa
+        assert teks.count("Survei") == 1
+
+    def test_gaya_kustom_dari_styles(self, tmp_path: Path) -> None:
+        """Menguji gaya judul terlokalisasi dikenali dari styles.xml."""
+        styles = (
+            '<w:style w:type="paragraph" w:styleId="JudulBab"><w:name w:val="heading 1"/></w:style>'
+            '<w:style w:type="paragraph" w:styleId="SubBagian">'
+            '<w:name w:val="Sub Bagian"/><w:pPr><w:outlineLvl w:val="2"/></w:pPr></w:style>'
+        )
+        jalur = _buat_docx(
+            tmp_path / "kustom.docx",
+            _paragraf("METODE", "JudulBab") + _paragraf("Tahapan", "SubBagian") + _paragraf("Biasa", "Normal"),
+            styles
+        )
+
+        teks = ekstrak_docx(jalur)
+
+        assert teks.splitlines() == ["# METODE", "", "### Tahapan", "Biasa"]
+
+    def test_tab_dan_baris_baru(self, tmp_path: Path) -> None:
+        """Menguji tab dan pemisah baris dalam run; page break diabaikan."""
+        isi = (
+            '<w:p><w:r><w:t>Nama</w:t><w:tab/><w:t>Nilai</w:t>'
+            '<w:br/><w:t>Kedua</w:t><w:br w:type="page"/></w:r></w:p>'
+        )
+        jalur = _buat_docx(tmp_path / "run.docx", isi)
+
+        assert ekstrak_docx(jalur) == "Nama\tNilai\nKedua"
+
+    @pytest.mark.asyncio
+    async def test_pemuat_menggunakan_ekstraktor(self, tmp_path: Path) -> None:
+        """Menguji PemuatDokumen memuat DOCX dengan struktur judul."""
+        jalur = _buat_docx(
+            tmp_path / "pemuat.docx",
+            _paragraf("BAB II TINJAUAN PUSTAKA", "Heading1") + _paragraf("Isi tinjauan.")
+        )
+
+        teks = await PemuatDokumen().muat(jalur)
+
+        assert teks == "# BAB II TINJAUAN PUSTAKA\nIsi tinjauan."
+
+    @pytest.mark.asyncio
+    async def test_pemuat_mempertahankan_daftar_bersarang(self, tmp_path: Path) -> None:
+        """Menguji indentasi daftar bersarang dan tab tetap utuh setelah normalisasi."""
+        isi = (
+            _paragraf("Tujuan pertama", ilvl=0)
+            + _paragraf("Rincian   tujuan", ilvl=1)
+            + '<w:p><w:r><w:t>Nama</w:t><w:tab/><w:t>Nilai</w:t></w:r></w:p>'
+        )
+        jalur = _buat_docx(tmp_path / "bersarang.docx", isi)
+
+        teks = await PemuatDokumen().muat(jalur)
+
+        assert teks.splitlines() == ["- Tujuan pertama", "  - Rincian tujuan", "Nama\tNilai"]
+
+    def test_definisi_tab_stop_diabaikan(self, tmp_path: Path) -> None:
+        """Menguji w:tab di dalam w:pPr/w:tabs tidak menjadi karakter tab."""
+        isi = (
+            '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+            '<w:r><w:t>Nama</w:t><w:tab/><w:t>Nilai</w:t></w:r></w:p>'
+        )
+        jalur = _buat_docx(tmp_path / "tabstop.docx", isi)
+
+        assert ekstrak_docx(jalur) == "Nama\tNilai"
+
+    def test_paragraf_bersarang_kotak_teks(self, tmp_path: Path) -> None:
+        """Menguji paragraf di dalam kotak teks tidak menghapus teks paragraf induk."""
+        isi = (
+            '<w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr>'
+            '<w:r><w:t>Sebelum</w:t></w:r>'
+            '<w:r><w:pict><w:txbxContent>'
+            + _paragraf("Isi kotak")
+            + '</w:txbxContent></w:pict></w:r>'
+            '<w:r><w:t>Sesudah</w:t></w:r></w:p>'
+            + _paragraf("Berikutnya")
+        )
+        jalur = _buat_docx(tmp_path / "kotak.docx", isi)
+
+        assert ekstrak_docx(jalur).splitlines() == [
+            "## Sebelum", "Isi kotak", "Sesudah", "Berikutnya"
+        ]
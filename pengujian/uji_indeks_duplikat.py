@@ -0,0 +1,92 @@
+"""
+Modul pengujian untuk indeks MinHash/LSH proposal hampir identik.
+
+Berisi unit tests untuk tanda MinHash, perkiraan kemiripan, dan
+pencarian kandidat lewat DatabaseRiwayat.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from alat.korpus_sintetis import buat_halaman
+from app.layanan.database_riwayat import DatabaseRiwayat
+from app.layanan.indeks_duplikat import (
+    JUMLAH_BIN,
+    buat_tanda,
+    bytes_ke_tanda,
+    perkirakan_kemiripan,
+    tanda_ke_bytes,
+)
+from app.skema.model import HasilEvaluasi
+
+
+def _teks(jumlah_halaman: int = 5, seed: int = 42) -> str:
+    """Membuat teks proposal sintetis."""
+    return "\n".join("\n".join(baris) for baris in buat_halaman(jumlah_halaman, seed))
+
+
+def _ubah_sebagian(teks: str, setiap: int) -> str:
+    """Mengganti satu dari setiap `setiap` kata, seperti templat yang diisi ulang."""
+    kata = teks.split()
+    return " ".join("diganti" if indeks % setiap == 0 else isi for indeks, isi in enumerate(kata))
+
+
+def _hasil(skor: int) -> HasilEvaluasi:
+    """Membuat HasilEvaluasi contoh."""
+    return HasilEvaluasi(
+        skor=skor,
+        daftar_kekuatan=["Kekuatan"],
+        daftar_kelemahan=["Kelemahan"],
+        daftar_saran=["Saran"],
+        ringkasan="Ringkasan"
+    )
+
+
+class TestIndeksDuplikat:
+    """Kelas pengujian untuk indeks duplikat."""
+
+    def test_kemiripan_tanda(self) -> None:
+        """Menguji teks identik, hampir identik, dan berbeda dibedakan."""
+        asli = buat_tanda(_teks())
+        assert asli is not None and len(asli) == JUMLAH_BIN
+
+        # Format dan huruf besar tidak memengaruhi tanda
+        assert buat_tanda(_teks().upper().replace("\n", "  ")) == asli
+
+        hampir = buat_tanda(_ubah_sebagian(_teks(), 40))
+        berbeda = buat_tanda(_teks(seed=7))
+        assert hampir is not None and berbeda is not None
+        assert perkirakan_kemiripan(asli, hampir) > 0.7
+        assert perkirakan_kemiripan(asli, berbeda) < 0.1
+
+    def test_teks_kosong_dan_serialisasi(self) -> None:
+        """Menguji teks tanpa kata tidak bertanda dan tanda bolak-balik BLOB."""
+        assert buat_tanda(" \n ... ") is None
+
+        tanda = buat_tanda("proposal singkat")
+        assert tanda is not None
+        assert bytes_ke_tanda(tanda_ke_bytes(tanda)) == tanda
+
+    def test_cari_review_mirip(self, tmp_path: Path) -> None:
+        """Menguji kandidat LSH diurutkan menurut kemiripan dan ikut terhapus."""
+        database = DatabaseRiwayat(jalur_db=str(tmp_path / "riwayat.db"))
+        id_asli = database.simpan_review(nama_berkas="asli.pdf", jenis_proposal="pkm", hasil=_hasil(70))
+        id_lain = database.simpan_review(nama_berkas="lain.pdf", jenis_proposal="pkm", hasil=_hasil(60))
+        tanda_asli = buat_tanda(_teks())
+        tanda_lain = buat_tanda(_teks(seed=7))
+        assert tanda_asli is not None and tanda_lain is not None
+        database.simpan_tanda_minhash(id_asli, tanda_asli)
+        database.simpan_tanda_minhash(id_lain, tanda_lain)
+
+        tanda_baru = buat_tanda(_ubah_sebagian(_teks(), 40))
+        assert tanda_baru is not None
+        mirip = database.cari_review_mirip(tanda_baru, ambang=0.5)
+
+        assert [item["review_id"] for item in mirip] == [id_asli]
+        assert mirip[0]["nama_berkas"] == "asli.pdf"
+        assert mirip[0]["kemiripan"] == pytest.approx(perkirakan_kemiripan(tanda_baru, tanda_asli))
+        assert database.cari_review_mirip(tanda_baru, ambang=0.99) == []
+
+        database.hapus_review(id_asli)
+        assert database.cari_review_mirip(tanda_asli, ambang=0.5) == []
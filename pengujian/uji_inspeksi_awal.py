@@ -0,0 +1,162 @@
+"""
+Modul pengujian untuk inspeksi awal dokumen.
+
+Berisi unit tests untuk deteksi enkripsi, lapisan teks, batas
+jumlah halaman, dan metadata DOCX.
+"""
+
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+from pypdf import PdfWriter
+
+from alat.korpus_sintetis import buat_docx, buat_pdf
+from app.layanan.inspeksi_awal import TANDA_OLE, inspeksi_dokumen
+from app.layanan import pemuat_dokumen
+from app.layanan.pemuat_dokumen import PemuatDokumen
+from app.layanan.tenggat import Tenggat
+from app.pengecualian import BatasUkuranTerlampaui, DokumenTidakValid
+
+
+def _enkripsi(sumber: Path, tujuan: Path, kata_sandi_pengguna: str) -> Path:
+    """Menyalin PDF dengan enkripsi kata sandi."""
+    penulis = PdfWriter(clone_from=str(sumber))
+    penulis.encrypt(kata_sandi_pengguna, "pemilik")
+    penulis.write(tujuan)
+    return tujuan
+
+
+def _pdf_teks_di_form_xobject(jalur: Path) -> Path:
+    """Menulis PDF satu halaman yang teksnya hanya ada di dalam Form XObject."""
+    isi_form = b"BT /F1 12 Tf 50 800 Td (Latar belakang penelitian) Tj ET"
+    objek = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /XObject << /Fm1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length 7 >>\nstream\n/Fm1 Do\nendstream",
+        b"<< /Type /XObject /Subtype /Form /BBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 6 0 R >> >> /Length %d >>\nstream\n" % len(isi_form)
+        + isi_form + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    keluaran = bytearray(b"%PDF-1.4\n")
+    offset: list[int] = []
+    for nomor, isi_objek in enumerate(objek, start=1):
+        offset.append(len(keluaran))
+        keluaran += b"%d 0 obj\n" % nomor + isi_objek + b"\nendobj\n"
+    posisi_xref = len(keluaran)
+    keluaran += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objek) + 1)
+    keluaran += b"".join(b"%010d 00000 n \n" % nilai for nilai in offset)
+    keluaran += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objek) + 1, posisi_xref
+    )
+    jalur.write_bytes(bytes(keluaran))
+    return jalur
+
+
+class TestInspeksiAwal:
+    """Kelas pengujian untuk inspeksi awal."""
+
+    def test_pdf_bertek(self, tmp_path: Path) -> None:
+        """Menguji PDF biasa dilaporkan lengkap dengan perkiraan ukuran teks."""
+        hasil = inspeksi_dokumen(buat_pdf(tmp_path / "proposal.pdf", 10))
+
+        assert hasil.jumlah_halaman == 10
+        assert hasil.ada_teks is True
+        assert not hasil.terenkripsi
+        assert hasil.perkiraan_karakter and hasil.perkiraan_karakter > 10_000
+
+    @pytest.mark.asyncio
+    async def test_pdf_terenkripsi_ditolak(self, tmp_path: Path) -> None:
+        """Menguji PDF berkata sandi ditolak sebelum ekstraksi."""
+        jalur = _enkripsi(buat_pdf(tmp_path / "asli.pdf", 2), tmp_path / "rahasia.pdf", "rahasia")
+
+        with pytest.raises(DokumenTidakValid) as info:
+            await PemuatDokumen().muat(jalur)
+
+        assert info.value.kode == "DOKUMEN_TERENKRIPSI"
+
+    @pytest.mark.asyncio
+    async def test_pdf_kata_sandi_pemilik_saja_diterima(self, tmp_path: Path) -> None:
+        """Menguji PDF yang hanya berkata sandi pemilik tetap diproses."""
+        jalur = _enkripsi(buat_pdf(tmp_path / "asli.pdf", 2), tmp_path / "terbatas.pdf", "")
+
+        assert inspeksi_dokumen(jalur).terenkripsi is False
+        assert await PemuatDokumen().muat(jalur)
+
+    @pytest.mark.asyncio
+    async def test_pdf_tanpa_lapisan_teks_ditolak(self, tmp_path: Path) -> None:
+        """Menguji PDF tanpa font (hasil pindaian) ditolak setelah ekstraksi memastikan tanpa teks."""
+        penulis = PdfWriter()
+        for _ in range(3):
+            penulis.add_blank_page(width=595, height=842)
+        jalur = tmp_path / "pindaian.pdf"
+        penulis.write(jalur)
+
+        assert inspeksi_dokumen(jalur).ada_teks is None
+        with pytest.raises(DokumenTidakValid) as info:
+            await PemuatDokumen().muat(jalur)
+
+        assert info.value.kode == "TANPA_LAPISAN_TEKS"
+
+    @pytest.mark.asyncio
+    async def test_pdf_font_di_form_xobject_diterima(self, tmp_path: Path) -> None:
+        """Menguji font yang hanya ada di Form XObject tetap dihitung sebagai lapisan teks."""
+        jalur = _pdf_teks_di_form_xobject(tmp_path / "formulir.pdf")
+
+        assert inspeksi_dokumen(jalur).ada_teks is True
+        assert "Latar belakang penelitian" in await PemuatDokumen().muat(jalur)
+
+    @pytest.mark.asyncio
+    async def test_batas_halaman(self, tmp_path: Path) -> None:
+        """Menguji dokumen melebihi batas halaman ditolak."""
+        jalur = buat_pdf(tmp_path / "panjang.pdf", 12)
+
+        with pytest.raises(BatasUkuranTerlampaui) as info:
+            await PemuatDokumen(maks_halaman=10).muat(jalur)
+
+        assert info.value.kode == "HALAMAN_TERLAMPAUI"
+
+    @pytest.mark.asyncio
+    async def test_inspeksi_di_luar_event_loop_dengan_tenggat(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Menguji inspeksi berjalan di thread ekstraksi dan penolakannya tetap diteruskan."""
+        thread_inspeksi: list[int] = []
+
+        def inspeksi_tercatat(jalur: Path):
+            thread_inspeksi.append(threading.get_ident())
+            return inspeksi_dokumen(jalur)
+
+        monkeypatch.setattr(pemuat_dokumen, "inspeksi_dokumen", inspeksi_tercatat)
+        jalur = buat_pdf(tmp_path / "panjang.pdf", 12)
+
+        assert await PemuatDokumen().muat(jalur, tenggat=Tenggat(30))
+        with pytest.raises(BatasUkuranTerlampaui):
+            await PemuatDokumen(maks_halaman=10).muat(jalur, tenggat=Tenggat(30))
+
+        assert len(thread_inspeksi) == 2
+        assert threading.get_ident() not in thread_inspeksi
+
+    def test_docx_metadata_dan_enkripsi(self, tmp_path: Path) -> None:
+        """Menguji jumlah halaman dari docProps dan DOCX terenkripsi (kontainer OLE)."""
+        jalur = buat_docx(tmp_path / "proposal.docx", 3)
+        with zipfile.ZipFile(jalur, "a") as arsip:
+            arsip.writestr(
+                "docProps/app.xml",
+                "<Properties><Pages>42</Pages><CharactersWithSpaces>90000</CharactersWithSpaces></Properties>"
+            )
+        terenkripsi = tmp_path / "rahasia.docx"
+        terenkripsi.write_bytes(TANDA_OLE + b"\x00" * 512)
+
+        hasil = inspeksi_dokumen(jalur)
+
+        assert hasil.jumlah_halaman == 42
+        assert hasil.perkiraan_karakter == 90000
+        assert hasil.ada_teks is True
+        assert inspeksi_dokumen(terenkripsi).terenkripsi is True
@@ -0,0 +1,152 @@
+"""
+Modul pengujian untuk kontrol penerimaan review.
+
+Berisi unit tests untuk batas review aktif, antrean tunggu,
+anggaran byte tertunda, dan slot lintas proses.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.layanan.kontrol_penerimaan import KontrolPenerimaan, SlotGlobal
+from app.pengecualian import KapasitasPenuh
+
+
+class TestKontrolPenerimaan:
+    """Kelas pengujian untuk kontrol penerimaan."""
+
+    @pytest.mark.asyncio
+    async def test_antrean_penuh_ditolak_cepat(self) -> None:
+        """Menguji permintaan ditolak langsung bila slot dan antrean penuh."""
+        kontrol = KontrolPenerimaan(maks_aktif=1, maks_antrean=0)
+
+        async with kontrol.izin():
+            with pytest.raises(KapasitasPenuh) as exc_info:
+                async with kontrol.izin():
+                    pass
+
+        assert exc_info.value.kode == "ANTREAN_PENUH"
+        assert exc_info.value.coba_lagi_detik >= 1
+        assert kontrol.aktif == 0
+        assert kontrol.jumlah_ditolak == 1
+
+    @pytest.mark.asyncio
+    async def test_antrean_dilayani_berurutan(self) -> None:
+        """Menguji permintaan yang menunggu masuk sesuai urutan kedatangan."""
+        kontrol = KontrolPenerimaan(maks_aktif=1, maks_antrean=3, maks_tunggu_detik=2.0)
+        urutan: list[int] = []
+
+        async def review(nomor: int) -> None:
+            async with kontrol.izin():
+                urutan.append(nomor)
+                await asyncio.sleep(0.03)
+
+        await asyncio.gather(*(review(nomor) for nomor in range(4)))
+
+        assert urutan == [0, 1, 2, 3]
+        assert kontrol.menunggu == 0
+
+    @pytest.mark.asyncio
+    async def test_waktu_tunggu_habis(self) -> None:
+        """Menguji permintaan di antrean ditolak setelah waktu tunggu habis."""
+        kontrol = KontrolPenerimaan(maks_aktif=1, maks_antrean=1, maks_tunggu_detik=0.1)
+
+        async with kontrol.izin():
+            with pytest.raises(KapasitasPenuh) as exc_info:
+                async with kontrol.izin():
+                    pass
+
+        assert exc_info.value.kode == "WAKTU_TUNGGU_HABIS"
+        assert kontrol.menunggu == 0
+
+    @pytest.mark.asyncio
+    async def test_anggaran_byte_tertunda(self) -> None:
+        """Menguji unggahan besar menunggu sampai byte tertunda cukup."""
+        kontrol = KontrolPenerimaan(maks_aktif=4, maks_antrean=0, maks_byte_tertunda=100)
+
+        async with kontrol.izin(80):
+            async with kontrol.izin(20):
+                assert kontrol.byte_tertunda == 100
+            with pytest.raises(KapasitasPenuh):
+                async with kontrol.izin(30):
+                    pass
+
+        # Satu unggahan yang melebihi anggaran tetap boleh berjalan sendirian
+        async with kontrol.izin(500):
+            assert kontrol.aktif == 1
+
+    @pytest.mark.asyncio
+    async def test_slot_global_lintas_instance(self, tmp_path) -> None:
+        """Menguji batas global dibagi antar instance (mewakili worker berbeda)."""
+        direktori = str(tmp_path / "slot")
+        worker_a = KontrolPenerimaan(maks_antrean=0, maks_aktif_global=1, direktori_slot=direktori)
+        worker_b = KontrolPenerimaan(maks_antrean=0, maks_aktif_global=1, direktori_slot=direktori)
+
+        async with worker_a.izin(10):
+            assert worker_b.status()["global"]["aktif"] == 1
+            assert worker_b.status()["global"]["byte_tertunda"] == 10
+            with pytest.raises(KapasitasPenuh):
+                async with worker_b.izin():
+                    pass
+
+        async with worker_b.izin():
+            assert worker_a.status()["global"]["aktif"] == 1
+
+    @pytest.mark.asyncio
+    async def test_anggaran_byte_global(self, tmp_path: Path) -> None:
+        """Menguji anggaran byte lintas instance dan okupansi dari isi slot."""
+        direktori = str(tmp_path / "slot")
+        opsi = {"maks_antrean": 0, "maks_aktif_global": 3, "maks_byte_tertunda_global": 50, "direktori_slot": direktori}
+        worker_a = KontrolPenerimaan(**opsi)
+        worker_b = KontrolPenerimaan(**opsi)
+
+        async with worker_a.izin(30):
+            with pytest.raises(KapasitasPenuh):
+                async with worker_b.izin(30):
+                    pass
+            async with worker_b.izin(20):
+                assert worker_a.status()["global"]["byte_tertunda"] == 50
+
+        # Isi slot milik worker yang mati dibersihkan saat slot berikutnya diambil
+        (Path(direktori) / "slot_2.lock").write_text("99")
+        slot = SlotGlobal(direktori, 3)
+        assert slot.okupansi() == (1, 99)
+        fd = slot.ambil(5, 50)
+        assert fd is not None
+        assert slot.okupansi() == (1, 5)
+        SlotGlobal.lepas(fd)
+        assert slot.okupansi() == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_pengurasan(self) -> None:
+        """Menguji review baru ditolak dan review berjalan dihentikan di tenggat kuras."""
+        kontrol = KontrolPenerimaan(maks_aktif=2, maks_antrean=2)
+
+        async def llm(durasi: float) -> str:
+            await asyncio.sleep(durasi)
+            return "selesai"
+
+        async def review(durasi: float) -> str:
+            async with kontrol.izin():
+                return await kontrol.selesaikan_sebelum_kuras(llm(durasi))
+
+        cepat = asyncio.ensure_future(review(0.05))
+        lambat = asyncio.ensure_future(review(5.0))
+        await asyncio.sleep(0.01)
+        kontrol.mulai_kuras(batas_detik=0.2)
+
+        assert kontrol.status()["worker"]["dikuras"] is True
+        with pytest.raises(KapasitasPenuh) as exc_info:
+            async with kontrol.izin():
+                pass
+        assert exc_info.value.kode == "SEDANG_DIKURAS"
+
+        # Review yang selesai sebelum tenggat tetap berhasil
+        assert await cepat == "selesai"
+        with pytest.raises(KapasitasPenuh) as exc_info:
+            await lambat
+        assert exc_info.value.kode == "SEDANG_DIKURAS"
+        assert exc_info.value.coba_lagi_detik == 1
+        assert kontrol.aktif == 0
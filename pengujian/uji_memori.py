@@ -0,0 +1,66 @@
+"""
+Modul pengujian untuk pengukuran memori worker.
+
+Berisi unit tests untuk akuntansi memori per tahap, puncak RSS per
+permintaan, dan penjaga batas RSS.
+"""
+
+import tracemalloc
+
+from app.layanan.memori import (
+    BYTE_PER_MB,
+    PenjagaRss,
+    lacak_memori_permintaan,
+    rss_byte,
+    ukur_memori,
+)
+from app.layanan.pelacakan import Pelacak
+
+
+class TestMemori:
+    """Kelas pengujian untuk modul memori."""
+
+    def test_ukur_memori_mencatat_tahap(self) -> None:
+        """Menguji puncak alokasi tahap tercatat di rentang saat tracemalloc aktif."""
+        pelacak_uji = Pelacak()
+        tracemalloc.start()
+        try:
+            with pelacak_uji.rentang("uji") as rentang:
+                with ukur_memori("ekstraksi"):
+                    sementara = bytearray(4 * BYTE_PER_MB)
+                    del sementara
+        finally:
+            tracemalloc.stop()
+
+        assert rentang.atribut["memori_ekstraksi_puncak_kb"] >= 4 * 1024
+        assert rentang.atribut["memori_ekstraksi_sisa_kb"] < 1024
+        assert rentang.atribut["memori_ekstraksi_rss_mb"] > 0
+
+        # Tanpa tracemalloc hanya RSS yang dicatat
+        with pelacak_uji.rentang("uji") as rentang:
+            with ukur_memori("prompt"):
+                pass
+        assert [kunci for kunci in rentang.atribut if kunci.startswith("memori_")] == ["memori_prompt_rss_mb"]
+
+    def test_puncak_rss_permintaan(self) -> None:
+        """Menguji sampel tahap menaikkan puncak RSS permintaan."""
+        with lacak_memori_permintaan() as catatan:
+            with ukur_memori("unggah"):
+                pass
+
+        assert catatan.rss_awal > 0
+        assert catatan.rss_puncak >= catatan.rss_awal
+
+        # Sampel yang lebih besar menggantikan puncak
+        catatan.sampel(catatan.rss_puncak + BYTE_PER_MB)
+        assert catatan.rss_puncak > rss_byte()
+
+    def test_penjaga_rss_sekali(self) -> None:
+        """Menguji daur ulang diminta sekali saat RSS melewati batas."""
+        assert not PenjagaRss(batas_mb=0).periksa(10 * 1024 * BYTE_PER_MB)
+
+        penjaga = PenjagaRss(batas_mb=100)
+        assert not penjaga.periksa(100 * BYTE_PER_MB)
+        assert penjaga.periksa(101 * BYTE_PER_MB)
+        assert not penjaga.periksa(200 * BYTE_PER_MB)
+        assert penjaga.status()["daur_ulang_diminta"] is True
@@ -0,0 +1,101 @@
+"""
+Modul pengujian untuk mesin ekstraksi PDF.
+
+Berisi unit tests untuk pemilihan mesin, fallback saat mesin gagal,
+dan laporan laju per mesin.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from alat.korpus_sintetis import buat_pdf
+from app.layanan import mesin_pdf
+from app.layanan.mesin_pdf import MESIN_OTOMATIS, MesinPdf, PemilihMesinPdf, ukur_mesin
+from app.layanan.pemuat_dokumen import PemuatDokumen
+
+
+class MesinRusak(MesinPdf):
+    """Mesin tiruan yang selalu gagal."""
+
+    nama = "rusak"
+    modul = "json"
+
+    def ekstrak(self, jalur: Path) -> list[str]:
+        raise ValueError("xref rusak")
+
+
+@pytest.fixture
+def berkas_pdf(tmp_path: Path) -> Path:
+    """PDF sintetis tiga halaman."""
+    return buat_pdf(tmp_path / "proposal.pdf", 3)
+
+
+class TestMesinPdf:
+    """Kelas pengujian untuk mesin ekstraksi PDF."""
+
+    def test_otomatis_memakai_mesin_terpasang(self, berkas_pdf: Path) -> None:
+        """Menguji mode otomatis hanya mengurutkan mesin yang terpasang."""
+        pemilih = PemilihMesinPdf(MESIN_OTOMATIS)
+
+        halaman, nama = pemilih.ekstrak(berkas_pdf)
+
+        assert all(mesin.tersedia() for mesin in pemilih.urutan())
+        assert nama == pemilih.urutan()[0].nama
+        assert len(halaman) == 3
+
+    def test_fallback_saat_mesin_gagal(
+        self,
+        berkas_pdf: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Menguji mesin berikutnya dicoba bila mesin pilihan gagal."""
+        monkeypatch.setitem(mesin_pdf.DAFTAR_MESIN, "rusak", MesinRusak())
+        pemilih = PemilihMesinPdf("rusak")
+
+        halaman, nama = pemilih.ekstrak(berkas_pdf)
+
+        assert pemilih.urutan()[0].nama == "rusak"
+        assert nama != "rusak"
+        assert len(halaman) == 3
+
+    def test_semua_mesin_gagal(self, berkas_pdf: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Menguji galat mesin terakhir diteruskan bila semua mesin gagal."""
+        monkeypatch.setattr(mesin_pdf, "DAFTAR_MESIN", {"rusak": MesinRusak()})
+
+        with pytest.raises(ValueError, match="xref rusak"):
+            PemilihMesinPdf().ekstrak(berkas_pdf)
+
+    def test_antarmuka_abstrak(self) -> None:
+        """Menguji mesin tanpa implementasi ekstrak tidak bisa dibuat."""
+        with pytest.raises(TypeError):
+            MesinPdf()  # pyright: ignore[reportAbstractUsage]
+
+    def test_ketersediaan_diperiksa_sekali(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Menguji find_spec hanya dipanggil sekali per mesin."""
+        panggilan: list[str] = []
+        find_spec_asli = mesin_pdf.importlib.util.find_spec
+
+        def find_spec_tercatat(nama: str, *args, **kwargs):
+            panggilan.append(nama)
+            return find_spec_asli(nama, *args, **kwargs)
+
+        monkeypatch.setattr(mesin_pdf.importlib.util, "find_spec", find_spec_tercatat)
+        mesin = MesinRusak()
+
+        assert mesin.tersedia() and mesin.tersedia()
+        assert panggilan == ["json"]
+
+    def test_mesin_tidak_dikenal(self) -> None:
+        """Menguji nama mesin tidak dikenal ditolak saat inisialisasi."""
+        with pytest.raises(ValueError):
+            PemuatDokumen(mesin_pdf="ghostscript")
+
+    def test_laporan_laju(self, berkas_pdf: Path) -> None:
+        """Menguji laporan halaman/detik untuk setiap mesin terpasang."""
+        laporan = ukur_mesin([berkas_pdf])
+
+        assert "pypdf" in laporan
+        assert laporan["pypdf"]["halaman"] == 3
+        assert laporan["pypdf"]["halaman_per_detik"] > 0
+        assert laporan["pypdf"]["gagal"] == 0
@@ -0,0 +1,59 @@
+"""
+Modul pengujian untuk normalisasi teks hasil ekstraksi.
+
+Berisi unit tests untuk pembuangan header/footer berulang,
+nomor halaman, daftar isi, dan spasi berlebih.
+"""
+
+from alat.korpus_sintetis import buat_halaman
+from app.layanan.normalisasi_teks import normalisasi_halaman, normalisasi_teks
+
+
+class TestNormalisasiTeks:
+    """Kelas pengujian untuk normalisasi teks."""
+
+    def test_buang_header_dan_nomor_halaman(self) -> None:
+        """Menguji header berjalan dan nomor halaman dibuang dari setiap halaman."""
+        halaman = ["\n".join(baris) for baris in buat_halaman(10)]
+
+        hasil = normalisasi_halaman(halaman)
+
+        assert "Universitas Negeri Padang" not in hasil.teks
+        assert hasil.baris_berulang == 10
+        assert hasil.baris_nomor_halaman == 10
+        assert "BAB I PENDAHULUAN" in hasil.teks
+        assert hasil.karakter_hemat > 0
+        assert hasil.token_hemat > 0
+
+    def test_header_dengan_nomor_berbeda_dianggap_sama(self) -> None:
+        """Menguji footer yang hanya berbeda angka tetap terdeteksi berulang."""
+        halaman = [f"Isi halaman {nomor} yang berbeda-beda {'x' * nomor}\nProposal PKM 2024 - Hal {nomor}" for nomor in range(1, 6)]
+
+        hasil = normalisasi_halaman(halaman)
+
+        assert "Proposal PKM" not in hasil.teks
+        assert hasil.teks.count("Isi halaman") == 5
+
+    def test_angka_di_tengah_halaman_dipertahankan(self) -> None:
+        """Menguji angka tunggal di dalam tabel tidak dianggap nomor halaman."""
+        teks = "Judul\nTabel 1 Anggaran\nBiaya\n1500000\nTotal\nPenutup\n7"
+
+        hasil = normalisasi_teks(teks)
+
+        assert "1500000" in hasil.teks
+        assert hasil.baris_nomor_halaman == 1
+
+    def test_daftar_isi_dan_spasi(self) -> None:
+        """Menguji entri daftar isi dibuang dan spasi berlebih diringkas, tab dipertahankan."""
+        teks = (
+            "DAFTAR ISI\n"
+            "BAB I PENDAHULUAN ........................ 1\n"
+            "1.1 Latar Belakang . . . . . . . . . 2\n\n\n\n"
+            "BAB I   PENDAHULUAN\n"
+            "Latar    belakang\tpenelitian ini.\n"
+        )
+
+        hasil = normalisasi_teks(teks)
+
+        assert hasil.baris_daftar_isi == 3
+        assert hasil.teks == "BAB I PENDAHULUAN\nLatar belakang\tpenelitian ini."
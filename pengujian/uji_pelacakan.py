@@ -0,0 +1,77 @@
+"""
+Modul pengujian untuk pelacakan (tracing) per permintaan.
+
+Berisi unit tests untuk rentang, pengekspor berkas,
+dan propagasi ID permintaan ke log.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from app.layanan.pelacakan import (
+    FilterIdPermintaan,
+    Pelacak,
+    PengeksporBerkas,
+    dilacak,
+    id_permintaan_aktif,
+    pelacak,
+)
+
+
+class TestPelacak:
+    """Kelas pengujian untuk Pelacak dan PengeksporBerkas."""
+
+    def test_rentang_bersarang_diekspor(self, tmp_path: Path) -> None:
+        """Menguji rentang anak mewarisi ID jejak dan tercatat di berkas."""
+        jalur = tmp_path / "jejak.jsonl"
+        pelacak_uji = Pelacak(PengeksporBerkas(str(jalur)))
+
+        with pelacak_uji.rentang("induk") as induk:
+            with pelacak_uji.rentang("anak", jumlah_halaman=3) as anak:
+                anak.atur_atribut("jumlah_karakter", 120)
+
+        baris = [json.loads(b) for b in jalur.read_text().splitlines()]
+
+        assert [b["name"] for b in baris] == ["anak", "induk"]
+        assert baris[0]["traceId"] == induk.id_jejak
+        assert baris[0]["parentSpanId"] == induk.id_rentang
+        assert baris[0]["attributes"]["jumlah_halaman"] == 3
+        assert baris[0]["attributes"]["jumlah_karakter"] == 120
+
+    def test_rentang_mencatat_kesalahan(self, tmp_path: Path) -> None:
+        """Menguji status ERROR saat terjadi pengecualian di dalam rentang."""
+        jalur = tmp_path / "jejak.jsonl"
+        pelacak_uji = Pelacak(PengeksporBerkas(str(jalur)))
+
+        with pytest.raises(ValueError):
+            with pelacak_uji.rentang("gagal"):
+                raise ValueError("rusak")
+
+        data = json.loads(jalur.read_text())
+        assert data["status"]["code"] == "ERROR"
+        assert "rusak" in data["status"]["message"]
+
+    @pytest.mark.asyncio
+    async def test_dekorator_dilacak_async(self) -> None:
+        """Menguji dekorator dilacak pada fungsi async."""
+        @dilacak("uji.async")
+        async def fungsi() -> int:
+            return 42
+
+        assert await fungsi() == 42
+
+    def test_id_permintaan_masuk_log(self) -> None:
+        """Menguji filter menyisipkan ID permintaan ke record log."""
+        record = logging.LogRecord("uji", logging.INFO, __file__, 1, "pesan", None, None)
+        token = id_permintaan_aktif.set("abc123")
+        try:
+            FilterIdPermintaan().filter(record)
+            with pelacak.rentang("uji") as rentang:
+                assert rentang.atribut["id_permintaan"] == "abc123"
+        finally:
+            id_permintaan_aktif.reset(token)
+
+        assert getattr(record, "id_permintaan") == "abc123"
@@ -0,0 +1,102 @@
+"""
+Modul pengujian untuk logging berbasis antrean.
+
+Berisi unit tests untuk format JSON, sampel record DEBUG,
+level per modul, dan penulisan lewat thread pendengar.
+"""
+
+import io
+import json
+import logging
+import sys
+from typing import Iterator
+
+import pytest
+
+from app.layanan.pelacakan import id_permintaan_aktif
+from app.layanan.pencatatan import (
+    FilterSampel,
+    FormatterJson,
+    lepas_pencatatan,
+    pasang_pencatatan,
+    urai_level_modul,
+)
+
+
+@pytest.fixture
+def aliran() -> Iterator[io.StringIO]:
+    """Tujuan tulis log; pemasangan dilepas dan level root dipulihkan setelah uji."""
+    level_awal = logging.getLogger().level
+    yield io.StringIO()
+    lepas_pencatatan()
+    logging.getLogger().setLevel(level_awal)
+
+
+def _record(pesan: str, *args: object, level: int = logging.DEBUG, baris: int = 1) -> logging.LogRecord:
+    """Membuat LogRecord contoh."""
+    return logging.LogRecord("uji", level, __file__, baris, pesan, args, None)
+
+
+class TestPencatatan:
+    """Kelas pengujian untuk pemasangan logging."""
+
+    def test_formatter_json(self) -> None:
+        """Menguji record diformat satu objek JSON berisi extra dan galat."""
+        record = _record("Review %s selesai", "abc", level=logging.INFO)
+        record.durasi_ms = 12.5
+        try:
+            raise ValueError("rusak")
+        except ValueError:
+            record.exc_info = sys.exc_info()
+
+        data = json.loads(FormatterJson().format(record))
+
+        assert data["pesan"] == "Review abc selesai"
+        assert data["level"] == "INFO"
+        assert data["modul"] == "uji"
+        assert data["id_permintaan"] == "-"
+        assert data["durasi_ms"] == 12.5
+        assert "ValueError: rusak" in data["galat"]
+
+    def test_sampel_debug_per_baris(self) -> None:
+        """Menguji hanya satu dari N record DEBUG per baris yang lolos."""
+        sampel = FilterSampel(setiap=4)
+
+        lolos = [sampel.filter(_record("ramai", baris=10)) for _ in range(8)]
+        assert lolos == [True, False, False, False, True, False, False, False]
+        # Baris lain dan level di atas DEBUG tidak terpengaruh
+        assert sampel.filter(_record("jarang", baris=20))
+        assert all(sampel.filter(_record("info", level=logging.INFO, baris=10)) for _ in range(3))
+
+    def test_urai_level_modul(self) -> None:
+        """Menguji level per modul diurai dan level tak dikenal ditolak."""
+        assert urai_level_modul("") == {}
+        assert urai_level_modul("httpx=warning, app.x=DEBUG") == {
+            "httpx": logging.WARNING,
+            "app.x": logging.DEBUG,
+        }
+        with pytest.raises(ValueError):
+            urai_level_modul("httpx=BISING")
+        with pytest.raises(ValueError):
+            urai_level_modul("httpx")
+
+    def test_ditulis_lewat_antrean(self, aliran: io.StringIO) -> None:
+        """Menguji record ditulis thread pendengar lengkap dengan ID permintaan."""
+        pasang_pencatatan(level="INFO", level_modul="uji.bising=DEBUG", aliran=aliran)
+        token = id_permintaan_aktif.set("req-1")
+        try:
+            logging.getLogger("uji.tenang").debug("tidak tercatat")
+            logging.getLogger("uji.tenang").info("Skor %d", 78)
+            logging.getLogger("uji.bising").debug("tercatat")
+        finally:
+            id_permintaan_aktif.reset(token)
+        lepas_pencatatan()
+
+        baris = [json.loads(b) for b in aliran.getvalue().splitlines()]
+        assert [b["pesan"] for b in baris] == ["Skor 78", "tercatat"]
+        assert all(b["id_permintaan"] == "req-1" for b in baris)
+
+    def test_format_tidak_dikenal(self) -> None:
+        """Menguji format log yang tidak dikenal ditolak sebelum memasang apa pun."""
+        with pytest.raises(ValueError):
+            pasang_pencatatan(format_log="xml")
@@ -0,0 +1,70 @@
+"""
+Modul pengujian untuk pengurai respons JSON dari LLM.
+
+Berisi unit tests untuk ekstraksi objek JSON, perbaikan
+kesalahan umum LLM, dan validasi ke HasilEvaluasi.
+"""
+
+import json
+
+import pytest
+
+from app.agen.pengurai_respons import (
+    ekstrak_objek_json,
+    perbaiki_json,
+    urai_hasil_evaluasi,
+)
+from app.pengecualian import GagalMemproses
+
+
+class TestPenguraiRespons:
+    """Kelas pengujian untuk pengurai respons."""
+
+    def test_ekstrak_objek_dari_prosa(self) -> None:
+        """Menguji kurung di dalam string tidak mengacaukan pencocokan."""
+        teks = 'Hasil: {"ringkasan": "pakai {kurung}", "skor": 70} selesai {lain}'
+
+        fragmen, lengkap = ekstrak_objek_json(teks)
+
+        assert lengkap is True
+        assert json.loads(fragmen or "")["skor"] == 70
+
+    @pytest.mark.parametrize("rusak, diharapkan", [
+        ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}),
+        ('{"a": True, "b": None}', {"a": True, "b": None}),
+        ('{"a": [1, {"b": "teks terpo', {"a": [1, {"b": "teks terpo"}]}),
+        ('{"a": 1, "kunci_terpotong', {"a": 1}),
+        ('{"a": 1, "b":', {"a": 1}),
+        ('{"a": 1, "skor": 7', {"a": 1}),
+        ('{"skor": 78, "b": tr', {"skor": 78}),
+        ('{"a": [1, nul', {"a": [1]}),
+        ('{"a": true', {}),
+    ])
+    def test_perbaiki_json(self, rusak: str, diharapkan: dict) -> None:
+        """Menguji perbaikan koma berlebih, literal Python, dan keluaran terpotong."""
+        assert json.loads(perbaiki_json(rusak)) == diharapkan
+
+    def test_urai_code_block_dan_normalisasi(self) -> None:
+        """Menguji code block, skor berbentuk teks, dan skor total dari detail."""
+        teks = (
+            "```json\n"
+            '{"detail_skor": {"latar_belakang": "16/20", "formulasi_masalah": 15, '
+            '"tujuan": 17, "metodologi": 14, "luaran": 25}, '
+            '"kekuatan": "Data relevan", "ringkasan": "Baik"}\n'
+            "```"
+        )
+
+        hasil = urai_hasil_evaluasi(teks)
+
+        assert hasil.detail_skor is not None
+        assert hasil.detail_skor.latar_belakang == 16
+        assert hasil.detail_skor.luaran == 20
+        assert hasil.skor == 82
+        assert hasil.daftar_kekuatan == ["Data relevan"]
+
+    def test_urai_gagal(self) -> None:
+        """Menguji respons tanpa JSON menghasilkan GagalMemproses."""
+        with pytest.raises(GagalMemproses) as exc_info:
+            urai_hasil_evaluasi("Maaf, saya tidak dapat meninjau dokumen ini.")
+
+        assert exc_info.value.kode == "FORMAT_TIDAK_VALID"
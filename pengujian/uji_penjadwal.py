@@ -0,0 +1,97 @@
+"""
+Modul pengujian untuk penjadwal review.
+
+Berisi unit tests untuk prioritas interaktif, pembagian adil
+per klien, penuaan permintaan massal, dan pembatalan.
+"""
+
+import asyncio
+
+import pytest
+
+from app.layanan.penjadwal import PRIORITAS_INTERAKTIF, PRIORITAS_MASSAL, PenjadwalReview
+
+
+async def _jalankan(penjadwal: PenjadwalReview, permintaan: list[tuple[str, str]]) -> list[str]:
+    """
+    Menjalankan permintaan saat slot tunggal sedang dipegang, lalu melepasnya.
+
+    Mengembalikan:
+        Urutan label "klien:prioritas" sesuai giliran yang diterima
+    """
+    urutan: list[str] = []
+
+    async def tugas(klien: str, prioritas: str) -> None:
+        async with penjadwal.giliran(klien, prioritas):
+            urutan.append(f"{klien}:{prioritas}")
+            await asyncio.sleep(0)
+
+    async with penjadwal.giliran("penahan"):
+        semua = [asyncio.create_task(tugas(klien, prioritas)) for klien, prioritas in permintaan]
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*semua)
+    return urutan
+
+
+class TestPenjadwalReview:
+    """Kelas pengujian untuk penjadwal review."""
+
+    @pytest.mark.asyncio
+    async def test_interaktif_mendahului_massal(self) -> None:
+        """Menguji permintaan interaktif mendahului batch yang datang lebih awal."""
+        penjadwal = PenjadwalReview(maks_bersamaan=1)
+        permintaan = [("dosen", PRIORITAS_MASSAL)] * 3 + [("mahasiswa", PRIORITAS_INTERAKTIF)]
+
+        urutan = await _jalankan(penjadwal, permintaan)
+
+        assert urutan[0] == "mahasiswa:interaktif"
+        assert penjadwal.aktif == 0
+
+    @pytest.mark.asyncio
+    async def test_adil_antar_klien(self) -> None:
+        """Menguji klien dengan banyak permintaan tidak memonopoli giliran."""
+        penjadwal = PenjadwalReview(maks_bersamaan=1)
+        permintaan = [("a", PRIORITAS_MASSAL)] * 4 + [("b", PRIORITAS_MASSAL)] * 2
+
+        urutan = await _jalankan(penjadwal, permintaan)
+
+        assert [label.split(":")[0] for label in urutan] == ["a", "b", "a", "b", "a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_penuaan_mencegah_kelaparan(self) -> None:
+        """Menguji permintaan massal yang lama menunggu dinaikkan setara interaktif."""
+        penjadwal = PenjadwalReview(maks_bersamaan=1, batas_penuaan_detik=0.0)
+        permintaan = [("dosen", PRIORITAS_MASSAL), ("mahasiswa", PRIORITAS_INTERAKTIF)]
+
+        urutan = await _jalankan(penjadwal, permintaan)
+
+        assert urutan == ["dosen:massal", "mahasiswa:interaktif"]
+
+    @pytest.mark.asyncio
+    async def test_pembatalan_melepas_antrean(self) -> None:
+        """Menguji permintaan yang dibatalkan saat menunggu keluar dari antrean."""
+        penjadwal = PenjadwalReview(maks_bersamaan=1)
+
+        async def menunggu() -> None:
+            async with penjadwal.giliran("b"):
+                pass
+
+        async with penjadwal.giliran("a"):
+            tugas = asyncio.create_task(menunggu())
+            await asyncio.sleep(0.01)
+            assert penjadwal.status()["menunggu"][PRIORITAS_INTERAKTIF] == 1
+            tugas.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await tugas
+
+        assert penjadwal.status()["menunggu"][PRIORITAS_INTERAKTIF] == 0
+        assert penjadwal.aktif == 0
+
+    @pytest.mark.asyncio
+    async def test_prioritas_tidak_dikenal(self) -> None:
+        """Menguji prioritas tidak dikenal ditolak."""
+        penjadwal = PenjadwalReview()
+
+        with pytest.raises(ValueError):
+            async with penjadwal.giliran("a", "mendesak"):
+                pass
@@ -0,0 +1,168 @@
+"""
+Modul pengujian untuk penyedia LLM dan pengarah penyedia.
+
+Berisi unit tests untuk statistik bergulir, urutan penyedia,
+failover, dan permintaan lindung nilai terhadap server LLM tiruan.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from alat.server_llm_tiruan import ServerLLMTiruan
+from app.agen.penyedia_llm import PengarahPenyedia, PenyediaLLM, StatistikPenyedia
+
+# Port yang tidak didengarkan siapa pun (koneksi ditolak)
+ENDPOINT_MATI = "http://127.0.0.1:9/openai/v1/chat/completions"
+PAYLOAD = {"model": "abaikan", "messages": [{"role": "user", "content": "halo"}]}
+
+
+class TestPengarahPenyedia:
+    """Kelas pengujian untuk pengarah penyedia LLM."""
+
+    def test_statistik_p95_dan_laju_galat(self) -> None:
+        """Menguji p95 hanya dari panggilan sukses dan laju galat dari semua panggilan."""
+        statistik = StatistikPenyedia()
+        for latensi in range(1, 21):
+            statistik.catat(float(latensi * 100), sukses=True)
+        statistik.catat(50000.0, sukses=False)
+
+        assert statistik.p95_ms() == 1900.0
+        assert statistik.laju_galat() == pytest.approx(1 / 21)
+
+    def test_urutan_mendahulukan_penyedia_sehat(self) -> None:
+        """Menguji penyedia utama yang lambat dipindah ke belakang."""
+        utama = PenyediaLLM("utama", ENDPOINT_MATI, "besar")
+        cadangan = PenyediaLLM("cadangan", ENDPOINT_MATI, "kecil")
+        pengarah = PengarahPenyedia([utama, cadangan], ambang_p95_ms=1000.0, sampel_minimum=3)
+
+        assert pengarah.urutan() == [utama, cadangan]
+        for _ in range(3):
+            pengarah.statistik["utama"].catat(5000.0, sukses=True)
+
+        assert pengarah.urutan() == [cadangan, utama]
+        assert pengarah.status()[0]["sehat"] is False
+
+    @pytest.mark.asyncio
+    async def test_failover_saat_galat(self) -> None:
+        """Menguji status 500 dan koneksi ditolak dialihkan ke penyedia berikutnya."""
+        with ServerLLMTiruan(laju_galat=1.0) as rusak, ServerLLMTiruan() as sehat:
+            pengarah = PengarahPenyedia([
+                PenyediaLLM("mati", ENDPOINT_MATI, "besar"),
+                PenyediaLLM("rusak", rusak.url, "besar"),
+                PenyediaLLM("sehat", sehat.url, "kecil"),
+            ])
+            respons, penyedia, percobaan = await pengarah.kirim(PAYLOAD)
+
+        assert respons.status_code == 200
+        assert respons.json()["model"] == "kecil"
+        assert penyedia.nama == "sehat"
+        assert percobaan == 3
+        assert pengarah.statistik["rusak"].laju_galat() == 1.0
+
+    @pytest.mark.asyncio
+    async def test_semua_gagal_mengembalikan_respons_terakhir(self) -> None:
+        """Menguji respons galat terakhir dikembalikan bila semua penyedia gagal."""
+        with ServerLLMTiruan(laju_429=1.0) as server:
+            pengarah = PengarahPenyedia([PenyediaLLM("utama", server.url, "besar")])
+            respons, _, percobaan = await pengarah.kirim(PAYLOAD)
+
+        assert respons.status_code == 429
+        assert percobaan == 1
+
+    @pytest.mark.asyncio
+    async def test_lindung_nilai_saat_utama_lambat(self) -> None:
+        """Menguji permintaan cadangan menang bila utama melewati tunda lindung nilai."""
+        with ServerLLMTiruan(latensi_detik=2.0) as lambat, ServerLLMTiruan() as cepat:
+            pengarah = PengarahPenyedia(
+                [PenyediaLLM("lambat", lambat.url, "besar"), PenyediaLLM("cepat", cepat.url, "kecil")],
+                lindung_nilai_aktif=True,
+                tunda_lindung_nilai_ms=100.0
+            )
+            mulai = time.perf_counter()
+            respons, penyedia, _ = await pengarah.kirim(PAYLOAD)
+            durasi = time.perf_counter() - mulai
+
+        assert penyedia.nama == "cepat"
+        assert respons.status_code == 200
+        assert durasi < 1.5
+
+    @pytest.mark.asyncio
+    async def test_lindung_nilai_saat_utama_gagal_cepat(self) -> None:
+        """Menguji cadangan langsung dicoba bila utama gagal sebelum tunda lindung nilai."""
+        with ServerLLMTiruan(laju_galat=1.0) as rusak, ServerLLMTiruan() as sehat:
+            for endpoint_utama in (ENDPOINT_MATI, rusak.url):
+                pengarah = PengarahPenyedia(
+                    [PenyediaLLM("utama", endpoint_utama, "besar"), PenyediaLLM("sehat", sehat.url, "kecil")],
+                    lindung_nilai_aktif=True,
+                    tunda_lindung_nilai_ms=5000.0
+                )
+                mulai = time.perf_counter()
+                respons, penyedia, percobaan = await pengarah.kirim(PAYLOAD)
+
+                assert respons.status_code == 200
+                assert penyedia.nama == "sehat"
+                assert percobaan == 2
+                assert time.perf_counter() - mulai < 2.0
+
+            # Keduanya gagal: respons galat terakhir tetap dikembalikan
+            pengarah = PengarahPenyedia(
+                [PenyediaLLM("mati", ENDPOINT_MATI, "besar"), PenyediaLLM("rusak", rusak.url, "besar")],
+                lindung_nilai_aktif=True,
+                tunda_lindung_nilai_ms=5000.0
+            )
+            respons, penyedia, percobaan = await pengarah.kirim(PAYLOAD)
+
+        assert respons.status_code >= 500
+        assert penyedia.nama == "rusak"
+        assert percobaan == 2
+
+    @pytest.mark.asyncio
+    async def test_lindung_nilai_dibatalkan_selama_tunda(self) -> None:
+        """Menguji permintaan utama ikut dibatalkan bila pemanggil dibatalkan selama tunda."""
+        with ServerLLMTiruan(latensi_detik=2.0) as lambat, ServerLLMTiruan() as cepat:
+            pengarah = PengarahPenyedia(
+                [PenyediaLLM("lambat", lambat.url, "besar"), PenyediaLLM("cepat", cepat.url, "kecil")],
+                lindung_nilai_aktif=True,
+                tunda_lindung_nilai_ms=5000.0
+            )
+            tugas_sebelum = asyncio.all_tasks()
+            pemanggil = asyncio.create_task(pengarah.kirim(PAYLOAD))
+            await asyncio.sleep(0.2)
+            tugas_utama = asyncio.all_tasks() - tugas_sebelum - {pemanggil}
+            assert len(tugas_utama) == 1
+
+            pemanggil.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await pemanggil
+
+            assert all(tugas.cancelled() for tugas in tugas_utama)
+            assert cepat.jumlah_permintaan == 0
+
+    @pytest.mark.asyncio
+    async def test_klien_bersama_dan_pemanasan(self) -> None:
+        """Menguji klien dibuat oleh buka(), dipakai ulang, lalu ditutup."""
+        with ServerLLMTiruan() as server:
+            penyedia = PenyediaLLM("utama", server.url, "besar")
+            mati = PenyediaLLM("mati", ENDPOINT_MATI, "besar")
+            pengarah = PengarahPenyedia([penyedia, mati])
+
+            assert await penyedia.panaskan() is None
+            await pengarah.buka()
+            klien = penyedia._klien
+            assert klien is not None
+
+            pemanasan = await pengarah.panaskan()
+            for _ in range(2):
+                respons = await penyedia.kirim(PAYLOAD)
+                assert respons.status_code == 200
+            assert penyedia._klien is klien
+
+            await pengarah.tutup()
+
+        assert pemanasan["utama"] is not None
+        assert pemanasan["mati"] is None
+        assert penyedia._klien is None
+        assert klien.is_closed
+        assert server.jumlah_permintaan == 2
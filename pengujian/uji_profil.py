@@ -0,0 +1,112 @@
+"""
+Modul pengujian untuk profiling permintaan lambat.
+
+Berisi unit tests untuk perekaman profil sesuai permintaan dan ambang,
+serta batas jumlah dan ukuran penyimpan profil.
+"""
+
+import asyncio
+import cProfile
+import pstats
+import time
+from pathlib import Path
+
+from app.layanan.pelacakan import id_permintaan_aktif
+from app.layanan.profil import Pemrofil, PenyimpanProfil, profil_diminta
+
+
+def _sibuk(detik: float) -> None:
+    """Menghabiskan waktu CPU selama `detik`."""
+    batas = time.perf_counter() + detik
+    while time.perf_counter() < batas:
+        pass
+
+
+def _profil_kecil() -> cProfile.Profile:
+    """Membuat profil berisi satu pemanggilan singkat."""
+    profil = cProfile.Profile()
+    profil.runcall(_sibuk, 0.001)
+    return profil
+
+
+class TestProfil:
+    """Kelas pengujian untuk Pemrofil dan PenyimpanProfil."""
+
+    def test_rekam_sesuai_permintaan_dan_ambang(self, tmp_path: Path) -> None:
+        """Menguji profil hanya disimpan bila diminta dan melewati ambang."""
+        penyimpan = PenyimpanProfil(str(tmp_path))
+        pemrofil_uji = Pemrofil(penyimpan, ambang_ms=20)
+
+        with pemrofil_uji.rekam("review"):
+            _sibuk(0.03)
+        assert penyimpan.daftar() == []
+
+        token = profil_diminta.set(True)
+        token_id = id_permintaan_aktif.set("req/1")
+        try:
+            with pemrofil_uji.rekam("cepat"):
+                pass
+            with pemrofil_uji.rekam("review"):
+                # Tahap bersarang di thread yang sama tidak diprofil terpisah
+                with pemrofil_uji.rekam("ekstraksi"):
+                    _sibuk(0.03)
+        finally:
+            id_permintaan_aktif.reset(token_id)
+            profil_diminta.reset(token)
+
+        daftar = penyimpan.daftar()
+        assert [profil["nama"] for profil in daftar] == ["review"]
+        assert daftar[0]["id_permintaan"] == "req1"
+        assert daftar[0]["durasi_ms"] >= 20
+
+        jalur = penyimpan.jalur(daftar[0]["id"])
+        assert jalur is not None
+        assert "_sibuk" in pstats.Stats(str(jalur)).get_stats_profile().func_profiles
+
+    def test_rekam_bersarang_lintas_thread(self, tmp_path: Path) -> None:
+        """Menguji tahap di asyncio.to_thread berjalan tanpa profil kedua saat tahap luar aktif."""
+        penyimpan = PenyimpanProfil(str(tmp_path))
+        pemrofil_uji = Pemrofil(penyimpan, ambang_ms=0)
+
+        def ekstraksi() -> str:
+            with pemrofil_uji.rekam("ekstraksi"):
+                _sibuk(0.005)
+                return "teks"
+
+        async def review() -> str:
+            with pemrofil_uji.rekam("review"):
+                return await asyncio.to_thread(ekstraksi)
+
+        token = profil_diminta.set(True)
+        try:
+            assert asyncio.run(review()) == "teks"
+            # Kunci dilepas setelah tahap luar selesai
+            assert asyncio.run(asyncio.to_thread(ekstraksi)) == "teks"
+        finally:
+            profil_diminta.reset(token)
+
+        assert sorted(profil["nama"] for profil in penyimpan.daftar()) == ["ekstraksi", "review"]
+
+    def test_penyimpan_dibatasi(self, tmp_path: Path) -> None:
+        """Menguji profil tertua dihapus saat jumlah atau ukuran melewati batas."""
+        penyimpan = PenyimpanProfil(str(tmp_path), maks_profil=2)
+        id_profil = []
+        for urutan in range(3):
+            id_profil.append(penyimpan.simpan(_profil_kecil(), "review", 10 + urutan, f"req{urutan}"))
+            time.sleep(0.002)
+
+        assert [profil["id"] for profil in penyimpan.daftar()] == id_profil[:0:-1]
+        assert penyimpan.jalur(id_profil[0]) is None
+
+        ukuran = penyimpan.daftar()[0]["ukuran_byte"]
+        penyimpan.maks_byte = ukuran
+        penyimpan.simpan(_profil_kecil(), "review", 5, "req3")
+        assert len(penyimpan.daftar()) == 1
+
+    def test_jalur_menolak_id_tidak_valid(self, tmp_path: Path) -> None:
+        """Menguji ID profil di luar pola tidak pernah dipetakan ke berkas."""
+        penyimpan = PenyimpanProfil(str(tmp_path / "profil"))
+        (tmp_path / "rahasia.prof").write_bytes(b"x")
+
+        assert penyimpan.jalur("../rahasia.prof") is None
+        assert penyimpan.jalur("1_review_5ms_tidak-ada.prof") is None
@@ -0,0 +1,60 @@
+"""
+Modul pengujian untuk respons JSON berbasis orjson.
+
+Berisi unit tests untuk serialisasi, JSON mentah yang diteruskan
+apa adanya, dan penanganan tipe yang tidak dikenal.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from app.layanan.respons_json import JsonMentah, ResponsJson, serialisasi_json
+from app.skema.model import JenisProposal, PenggunaanLLM
+
+
+class TestResponsJson:
+    """Kelas pengujian untuk ResponsJson."""
+
+    def test_sama_dengan_json_standar(self) -> None:
+        """Menguji hasil orjson setara dengan json standar untuk data biasa."""
+        data = {"berhasil": True, "teks": "Proposal ü \"kutip\"", "skor": [1, 2.5, None], 3: "kunci angka"}
+
+        assert json.loads(serialisasi_json(data)) == json.loads(json.dumps(data))
+
+    def test_json_mentah_diteruskan(self) -> None:
+        """Menguji JsonMentah disisipkan apa adanya di posisi mana pun."""
+        halaman = '[{"id":1,"detail_skor":{"tujuan":16}}]'
+        isi = {
+            "berhasil": True,
+            "data": JsonMentah(halaman),
+            "bersarang": [JsonMentah(b"{}"), {"dalam": JsonMentah("null")}],
+            "total": 1,
+        }
+
+        assert json.loads(bytes(ResponsJson(isi).body)) == {
+            "berhasil": True,
+            "data": json.loads(halaman),
+            "bersarang": [{}, {"dalam": None}],
+            "total": 1,
+        }
+        assert serialisasi_json(JsonMentah(halaman)) == halaman.encode()
+
+    def test_tipe_khusus(self) -> None:
+        """Menguji model Pydantic, enum, dan datetime; tipe lain ditolak."""
+        isi = {
+            "penggunaan": PenggunaanLLM(model="llama", token_total=10),
+            "jenis": JenisProposal.PKM,
+            "waktu": datetime(2026, 10, 19, 10, 0),
+        }
+
+        hasil = json.loads(serialisasi_json(isi))
+        assert hasil["penggunaan"]["token_total"] == 10
+        assert hasil["jenis"] == JenisProposal.PKM.value
+        assert hasil["waktu"] == "2026-10-19T10:00:00"
+
+        with pytest.raises(TypeError):
+            serialisasi_json({"berkas": object()})
+        with pytest.raises(TypeError):
+            serialisasi_json({"data": JsonMentah("[]"), "berkas": object()})
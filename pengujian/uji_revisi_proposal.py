@@ -0,0 +1,104 @@
+"""
+Modul pengujian untuk review inkremental revisi proposal.
+
+Berisi unit tests untuk pemecahan bagian, perencanaan aspek yang
+berubah, dan penilaian ulang sebagian oleh agent.
+"""
+
+from typing import Any
+
+import pytest
+
+from alat.server_llm_tiruan import ServerLLMTiruan
+from app.agen.agen_peninjau import AgenPeninjauProposal
+from app.layanan.revisi_proposal import BAGIAN_LAINNYA, pecah_bagian, rencanakan_revisi, sidik_bagian
+
+PROPOSAL_V1 = """# BAB I PENDAHULUAN
+## 1.1 Latar Belakang
+Banyak UMKM belum memakai pencatatan digital.
+## 1.2 Rumusan Masalah
+Bagaimana membangun aplikasi kasir sederhana?
+## 1.3 Tujuan
+1. Mengembangkan aplikasi kasir
+2. Menguji kegunaan aplikasi
+# BAB II TINJAUAN PUSTAKA
+Penelitian terdahulu tentang kasir digital.
+# BAB III METODE PENELITIAN
+Metode waterfall.
+# BAB IV LUARAN YANG DIHARAPKAN
+Aplikasi kasir dan artikel ilmiah."""
+
+PROPOSAL_V2 = PROPOSAL_V1.replace("Metode waterfall.", "Metode prototyping dengan tiga iterasi dan uji SUS.")
+
+
+def _versi_sebelumnya(teks: str, jenis: str = "pkm") -> dict[str, Any]:
+    """Membuat versi tersimpan tiruan seperti DatabaseRiwayat.ambil_versi_terakhir."""
+    return {
+        "versi": 1,
+        "review_id": 7,
+        "sidik_bagian": sidik_bagian(pecah_bagian(teks)),
+        "review": {
+            "jenis_proposal": jenis,
+            "skor": 50,
+            "detail_skor": {aspek: 10 for aspek in ("latar_belakang", "formulasi_masalah", "tujuan", "metodologi", "luaran")},
+            "daftar_kekuatan": ["Masalah relevan"],
+            "daftar_kelemahan": ["Metode belum rinci"],
+            "daftar_saran": ["Rinci metode"],
+            "ringkasan": "Cukup baik."
+        }
+    }
+
+
+class TestRevisiProposal:
+    """Kelas pengujian untuk review revisi proposal."""
+
+    def test_pecah_bagian_per_aspek(self) -> None:
+        """Menguji judul dipetakan ke aspek dan butir bernomor tetap di bagiannya."""
+        bagian = pecah_bagian(PROPOSAL_V1)
+
+        assert "Mengembangkan aplikasi kasir" in bagian["tujuan"]
+        assert "Menguji kegunaan" in bagian["tujuan"]
+        assert bagian["metodologi"].endswith("Metode waterfall.")
+        assert "Penelitian terdahulu" in bagian[BAGIAN_LAINNYA]
+        assert "Aplikasi kasir dan artikel" in bagian["luaran"]
+
+    def test_rencana_hanya_aspek_berubah(self) -> None:
+        """Menguji hanya aspek dengan bagian berubah yang dinilai ulang."""
+        assert rencanakan_revisi(PROPOSAL_V1, "pkm", None).aspek_berubah is None
+        assert rencanakan_revisi(PROPOSAL_V1, "pkm", _versi_sebelumnya(PROPOSAL_V1)).aspek_berubah == []
+
+        rencana = rencanakan_revisi(PROPOSAL_V2, "pkm", _versi_sebelumnya(PROPOSAL_V1))
+
+        assert rencana.aspek_berubah == ["metodologi"]
+
+    def test_rencana_review_penuh(self) -> None:
+        """Menguji review penuh bila jenis berubah atau bagian tidak dikenali."""
+        assert rencanakan_revisi(PROPOSAL_V2, "skripsi", _versi_sebelumnya(PROPOSAL_V1)).aspek_berubah is None
+        tanpa_judul = "Proposal tanpa judul bagian sama sekali."
+        assert rencanakan_revisi(tanpa_judul, "pkm", _versi_sebelumnya(PROPOSAL_V1)).aspek_berubah is None
+
+    @pytest.mark.asyncio
+    async def test_tinjau_revisi_menilai_ulang_sebagian(self) -> None:
+        """Menguji skor aspek tidak berubah diambil dari review sebelumnya."""
+        sebelumnya = _versi_sebelumnya(PROPOSAL_V1)["review"]
+        rencana = rencanakan_revisi(PROPOSAL_V2, "pkm", _versi_sebelumnya(PROPOSAL_V1))
+
+        with ServerLLMTiruan() as server:
+            agen = AgenPeninjauProposal(api_key="gsk_dummy", api_endpoint=server.url)
+            hasil = await agen.tinjau_revisi(
+                {aspek: rencana.bagian[aspek] for aspek in rencana.aspek_berubah or []},
+                sebelumnya,
+                "pkm"
+            )
+            assert server.jumlah_permintaan == 1
+
+            tanpa_perubahan = await agen.tinjau_revisi({}, sebelumnya, "pkm")
+            assert server.jumlah_permintaan == 1
+
+        # Server tiruan memberi metodologi 14; aspek lain tetap 10
+        assert hasil["detail_skor"]["metodologi"] == 14
+        assert hasil["detail_skor"]["luaran"] == 10
+        assert hasil["skor"] == 54
+        assert tanpa_perubahan["skor"] == 50
+        assert agen.penggunaan_terakhir is not None
+        assert agen.penggunaan_terakhir.token_total is None
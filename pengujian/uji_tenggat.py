@@ -0,0 +1,85 @@
+"""
+Modul pengujian untuk tenggat per permintaan review.
+
+Berisi unit tests untuk sisa waktu, pembatalan oleh klien, dan
+pembatasan pekerjaan asinkron.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.layanan.tenggat import KODE_KLIEN_TERPUTUS, KODE_TENGGAT_HABIS, Tenggat
+from app.pengecualian import TenggatHabis
+
+
+class TestTenggat:
+    """Kelas pengujian untuk Tenggat."""
+
+    def test_sisa_dan_batas_waktu(self) -> None:
+        """Menguji tenggat tanpa batas dan timeout yang dipangkas ke sisa waktu."""
+        tanpa_batas = Tenggat(0)
+        assert tanpa_batas.sisa() is None
+        assert tanpa_batas.batas_waktu(120.0) == 120.0
+        tanpa_batas.periksa("llm")
+
+        tenggat = Tenggat(10)
+        sisa = tenggat.sisa()
+        assert sisa is not None and 9 < sisa <= 10
+        assert tenggat.batas_waktu(120.0) <= 10
+        assert tenggat.batas_waktu(2.0) == 2.0
+
+    @pytest.mark.asyncio
+    async def test_batasi_pekerjaan(self) -> None:
+        """Menguji pekerjaan cepat selesai dan pekerjaan lambat dibatalkan di tenggat."""
+        tenggat = Tenggat(0.2)
+        dibatalkan = asyncio.Event()
+
+        async def pekerjaan(durasi: float) -> str:
+            try:
+                await asyncio.sleep(durasi)
+            except asyncio.CancelledError:
+                dibatalkan.set()
+                raise
+            return "selesai"
+
+        assert await tenggat.batasi(pekerjaan(0.01), "ekstraksi") == "selesai"
+        with pytest.raises(TenggatHabis) as exc_info:
+            await tenggat.batasi(pekerjaan(5.0), "llm")
+
+        assert exc_info.value.kode == KODE_TENGGAT_HABIS
+        assert exc_info.value.tahap == "llm"
+        assert dibatalkan.is_set()
+        with pytest.raises(TenggatHabis):
+            tenggat.periksa("simpan")
+
+    @pytest.mark.asyncio
+    async def test_batalkan_saat_klien_terputus(self) -> None:
+        """Menguji pembatalan menghentikan pekerjaan yang sedang ditunggu segera."""
+        tenggat = Tenggat()
+        asyncio.get_running_loop().call_later(0.05, tenggat.batalkan)
+
+        mulai = time.perf_counter()
+        with pytest.raises(TenggatHabis) as exc_info:
+            await tenggat.batasi(asyncio.sleep(5.0), "llm")
+
+        assert time.perf_counter() - mulai < 1.0
+        assert exc_info.value.kode == KODE_KLIEN_TERPUTUS
+        assert tenggat.habis
+
+    @pytest.mark.asyncio
+    async def test_ekstraksi_dengan_tenggat(self, tmp_path) -> None:
+        """Menguji ekstraksi bertenggat memberi teks yang sama dan berhenti bila tenggat habis."""
+        from alat.korpus_sintetis import buat_pdf
+        from app.layanan.pemuat_dokumen import PemuatDokumen
+
+        jalur = buat_pdf(tmp_path / "proposal.pdf", 3)
+        pemuat = PemuatDokumen()
+        assert await pemuat.muat(jalur, Tenggat(30)) == await pemuat.muat(jalur)
+
+        tenggat = Tenggat(30)
+        tenggat.batalkan()
+        with pytest.raises(TenggatHabis) as exc_info:
+            await pemuat.muat(jalur, tenggat)
+        assert exc_info.value.tahap == "ekstraksi"